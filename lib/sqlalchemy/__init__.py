@@ -14,6 +14,7 @@ from .engine import AdaptedConnection as AdaptedConnection
 from .engine import BaseRow as BaseRow
 from .engine import BindTyping as BindTyping
 from .engine import ChunkedIteratorResult as ChunkedIteratorResult
+from .engine import ColumnarFrozenResult as ColumnarFrozenResult
 from .engine import Compiled as Compiled
 from .engine import Connection as Connection
 from .engine import create_engine as create_engine
@@ -52,6 +53,7 @@ from .pool import Pool as Pool
 from .pool import PoolProxiedConnection as PoolProxiedConnection
 from .pool import PoolResetState as PoolResetState
 from .pool import QueuePool as QueuePool
+from .pool import RoutingPool as RoutingPool
 from .pool import SingletonThreadPool as SingletonThreadPool
 from .pool import StaticPool as StaticPool
 from .schema import BaseDDLElement as BaseDDLElement
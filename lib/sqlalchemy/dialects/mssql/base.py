@@ -2959,6 +2959,9 @@ class MSDialect(default.DefaultDialect):
 
     returns_native_bytes = True
 
+    # NULL is ordered as lower than all other values
+    default_nulls_first = True
+
     supports_comments = True
     supports_default_metavalue = False
     """dialect supports INSERT... VALUES (DEFAULT) syntax -
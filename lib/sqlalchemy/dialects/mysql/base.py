@@ -2425,6 +2425,9 @@ class MySQLDialect(default.DefaultDialect):
     name = "mysql"
     supports_statement_cache = True
 
+    # NULL is ordered as lower than all other values
+    default_nulls_first = True
+
     supports_alter = True
 
     # MySQL has no true "boolean" type; we
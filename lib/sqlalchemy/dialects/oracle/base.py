@@ -1406,6 +1406,9 @@ class OracleDialect(default.DefaultDialect):
     supports_alter = True
     max_identifier_length = 128
 
+    # NULL is ordered as greater than all other values
+    default_nulls_first = False
+
     _supports_offset_fetch = True
 
     insert_returning = True
@@ -174,6 +174,9 @@ class AsyncAdapt_oracledb_cursor(AsyncAdapt_dbapi_cursor):
     def setinputsizes(self, *args: Any, **kwargs: Any) -> Any:
         return self._cursor.setinputsizes(*args, **kwargs)
 
+    def prepare(self, *args: Any, **kwargs: Any) -> Any:
+        return self._cursor.prepare(*args, **kwargs)
+
     def _aenter_cursor(self, cursor: AsyncCursor) -> AsyncCursor:
         try:
             return cursor.__enter__()
@@ -100,6 +100,7 @@ class _PGExecutionContext_common_psycopg(PGExecutionContext):
 class _PGDialect_common_psycopg(PGDialect):
     supports_statement_cache = True
     supports_server_side_cursors = True
+    supports_threaded_cursor_fetch = True
 
     default_paramstyle = "pyformat"
 
@@ -167,6 +167,29 @@ client using this setting passed to :func:`_asyncio.create_async_engine`::
 
     https://github.com/MagicStack/asyncpg/issues/727
 
+.. _asyncpg_insert_copy:
+
+Bulk INSERT using COPY
+----------------------
+
+When the :paramref:`_engine.Connection.execution_options.insert_copy`
+execution option is used, an INSERT statement executed with many parameter
+sets delivers its rows using asyncpg's ``copy_records_to_table()`` method,
+which makes use of PostgreSQL's ``COPY FROM STDIN`` command in binary
+format::
+
+    async with engine.begin() as conn:
+        await conn.execute(
+            insert(data_table).execution_options(insert_copy=True),
+            [{"x": i, "y": f"y{i}"} for i in range(100000)],
+        )
+
+.. versionadded:: 2.1
+
+.. seealso::
+
+    :ref:`engine_insert_copy`
+
 """  # noqa
 
 from __future__ import annotations
@@ -487,6 +510,15 @@ class _AsyncpgConnection(Protocol):
 
     async def reload_schema_state(self) -> None: ...
 
+    async def copy_records_to_table(
+        self,
+        table_name: str,
+        *,
+        records: Any,
+        columns: Optional[Sequence[str]] = None,
+        schema_name: Optional[str] = None,
+    ) -> str: ...
+
     async def prepare(
         self, operation: Any, *, name: Optional[str] = None
     ) -> Any: ...
@@ -623,9 +655,46 @@ class AsyncAdapt_asyncpg_cursor(AsyncAdapt_dbapi_cursor):
             except Exception as error:
                 self._handle_exception(error)
 
+    async def _copy_records_async(
+        self, table_name, columns, records, schema_name
+    ):
+        adapt_connection = self._adapt_connection
+
+        self._description = None
+        async with adapt_connection._execute_mutex:
+            await adapt_connection._check_type_cache_invalidation(
+                self._invalidate_schema_cache_asof
+            )
+
+            if not adapt_connection._started:
+                await adapt_connection._start_transaction()
+
+            try:
+                status = await self._connection.copy_records_to_table(
+                    table_name,
+                    records=records,
+                    columns=columns,
+                    schema_name=schema_name,
+                )
+            except Exception as error:
+                self._handle_exception(error)
+
+            reg = re.match(r"COPY (\d+)", status)
+            if reg:
+                self._rowcount = int(reg.group(1))
+            else:
+                self._rowcount = -1
+
     def execute(self, operation, parameters=None):
         await_(self._prepare_and_execute(operation, parameters))
 
+    def _copy_records(self, table_name, columns, records, schema_name=None):
+        await_(
+            self._copy_records_async(
+                table_name, columns, records, schema_name
+            )
+        )
+
     def executemany(self, operation, seq_of_parameters):
         return await_(self._executemany(operation, seq_of_parameters))
 
@@ -1019,6 +1088,7 @@ class PGDialect_asyncpg(PGDialect):
 
     default_paramstyle = "numeric_dollar"
     supports_sane_multi_rowcount = False
+    supports_copy_insert = True
     execution_ctx_cls = PGExecutionContext_asyncpg
     statement_compiler = PGCompiler_asyncpg
     preparer = PGIdentifierPreparer_asyncpg
@@ -1140,6 +1210,18 @@ class PGDialect_asyncpg(PGDialect):
         util.coerce_kw_type(opts, "prepared_statement_cache_size", int)
         return ([], opts)
 
+    def do_copy_insert(self, cursor, table, columns, rows, context):
+        schema = table.schema
+        if context.compiled.schema_translate_map:
+            schema_translate_map = context.execution_options.get(
+                "schema_translate_map", {}
+            )
+            schema = schema_translate_map.get(schema, schema)
+
+        cursor._copy_records(
+            table.name, [col.name for col in columns], rows, schema
+        )
+
     def do_ping(self, dbapi_connection):
         dbapi_connection.ping()
         return True
@@ -2989,6 +2989,9 @@ class PGDialect(default.DefaultDialect):
     max_identifier_length = 63
     supports_sane_rowcount = True
 
+    # NULL is ordered as greater than all other values
+    default_nulls_first = False
+
     bind_typing = interfaces.BindTyping.RENDER_CASTS
 
     supports_native_enum = True
@@ -1892,6 +1892,9 @@ class SQLiteDialect(default.DefaultDialect):
     name = "sqlite"
     supports_alter = False
 
+    # NULL is ordered as lower than all other values
+    default_nulls_first = True
+
     # SQlite supports "DEFAULT VALUES" but *does not* support
     # "VALUES (DEFAULT)"
     supports_default_values = True
@@ -23,6 +23,11 @@ from .base import NestedTransaction as NestedTransaction
 from .base import RootTransaction as RootTransaction
 from .base import Transaction as Transaction
 from .base import TwoPhaseTransaction as TwoPhaseTransaction
+from .cache import CacheProfiler as CacheProfiler
+from .cache import CompiledCache as CompiledCache
+from .cache import CompiledCacheEntry as CompiledCacheEntry
+from .cache import CompiledCacheStats as CompiledCacheStats
+from .cache import StatementCacheProfile as StatementCacheProfile
 from .create import create_engine as create_engine
 from .create import create_pool_from_url as create_pool_from_url
 from .create import engine_from_config as engine_from_config
@@ -44,6 +49,7 @@ from .reflection import Inspector as Inspector
 from .reflection import ObjectKind as ObjectKind
 from .reflection import ObjectScope as ObjectScope
 from .result import ChunkedIteratorResult as ChunkedIteratorResult
+from .result import ColumnarFrozenResult as ColumnarFrozenResult
 from .result import FilterResult as FilterResult
 from .result import FrozenResult as FrozenResult
 from .result import IteratorResult as IteratorResult
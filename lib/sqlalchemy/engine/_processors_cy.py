@@ -11,7 +11,9 @@ from datetime import date as date_cls
 from datetime import datetime as datetime_cls
 from datetime import time as time_cls
 from typing import Any
+from typing import List
 from typing import Optional
+from typing import Sequence
 
 # START GENERATED CYTHON IMPORT
 # This section is automatically generated by the script tools/cython_imports.py
@@ -74,6 +76,54 @@ def str_to_date(value: Optional[str]) -> Optional[date_cls]:
     return date_cls.fromisoformat(value)
 
 
+@cython.annotation_typing(False)
+def int_to_boolean_batch(values: Sequence[Any]) -> List[Optional[bool]]:
+    return [
+        None if value is None else (True if value else False)
+        for value in values
+    ]
+
+
+@cython.annotation_typing(False)
+def to_str_batch(values: Sequence[Any]) -> List[Optional[str]]:
+    return [None if value is None else str(value) for value in values]
+
+
+@cython.annotation_typing(False)
+def to_float_batch(values: Sequence[Any]) -> List[Optional[float]]:
+    return [None if value is None else float(value) for value in values]
+
+
+@cython.annotation_typing(False)
+def str_to_datetime_batch(
+    values: Sequence[Optional[str]],
+) -> List[Optional[datetime_cls]]:
+    fromisoformat = datetime_cls.fromisoformat
+    return [
+        None if value is None else fromisoformat(value) for value in values
+    ]
+
+
+@cython.annotation_typing(False)
+def str_to_time_batch(
+    values: Sequence[Optional[str]],
+) -> List[Optional[time_cls]]:
+    fromisoformat = time_cls.fromisoformat
+    return [
+        None if value is None else fromisoformat(value) for value in values
+    ]
+
+
+@cython.annotation_typing(False)
+def str_to_date_batch(
+    values: Sequence[Optional[str]],
+) -> List[Optional[date_cls]]:
+    fromisoformat = date_cls.fromisoformat
+    return [
+        None if value is None else fromisoformat(value) for value in values
+    ]
+
+
 @cython.cclass
 class to_decimal_processor_factory:
     type_: type
@@ -90,3 +140,11 @@ class to_decimal_processor_factory:
             return None
         else:
             return self.type_(self.format_ % value)
+
+    def process_batch(self, values: Sequence[Any]) -> List[Any]:
+        type_ = self.type_
+        format_ = self.format_
+        return [
+            None if value is None else type_(format_ % value)
+            for value in values
+        ]
@@ -10,11 +10,13 @@
 from __future__ import annotations
 
 import contextlib
+import functools
 import sys
 import typing
 from typing import Any
 from typing import Callable
 from typing import cast
+from typing import IO
 from typing import Iterable
 from typing import Iterator
 from typing import List
@@ -27,6 +29,11 @@ from typing import Type
 from typing import TypeVar
 from typing import Union
 
+from . import cache as _cache
+from .cache import CacheProfiler
+from .cache import CompiledCache
+from .cache import CompiledCacheStats
+from .cache import StatementCacheProfile
 from .interfaces import BindTyping
 from .interfaces import ConnectionEventsTarget
 from .interfaces import DBAPICursor
@@ -78,6 +85,7 @@ if typing.TYPE_CHECKING:
     from ..sql.functions import FunctionElement
     from ..sql.schema import DefaultGenerator
     from ..sql.schema import HasSchemaAttr
+    from ..sql.schema import MetaData
     from ..sql.schema import SchemaItem
     from ..sql.selectable import TypedReturnsRows
 
@@ -133,6 +141,9 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
     _transaction: Optional[RootTransaction]
     _nested_transaction: Optional[NestedTransaction]
 
+    # set within a Connection.pipeline() block
+    _pipeline: Optional[_ConnectionPipeline] = None
+
     def __init__(
         self,
         engine: Engine,
@@ -140,6 +151,7 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
         _has_events: Optional[bool] = None,
         _allow_revalidate: bool = True,
         _allow_autobegin: bool = True,
+        _deadline: Optional[float] = None,
     ):
         """Construct a new Connection."""
         self.engine = engine
@@ -147,7 +159,9 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
 
         if connection is None:
             try:
-                self._dbapi_connection = engine.raw_connection()
+                self._dbapi_connection = engine.raw_connection(
+                    deadline=_deadline
+                )
             except dialect.loaded_dbapi.Error as err:
                 Connection._handle_dbapi_exception_noconnection(
                     err, dialect, engine
@@ -248,8 +262,11 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
         no_parameters: bool = False,
         stream_results: bool = False,
         max_row_buffer: int = ...,
+        max_buffer_bytes: int = ...,
+        prefetch: int = ...,
         yield_per: int = ...,
         insertmanyvalues_page_size: int = ...,
+        insert_copy: bool = False,
         schema_translate_map: Optional[SchemaTranslateMapType] = ...,
         preserve_rowcount: bool = False,
         **opt: Any,
@@ -445,6 +462,49 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
 
             :ref:`engine_stream_results`
 
+        :param max_buffer_bytes: Available on: :class:`_engine.Connection`,
+          :class:`_sql.Executable`.  When used with
+          :paramref:`_engine.Connection.execution_options.stream_results`,
+          sizes the row buffer by the approximate number of bytes taken up
+          by fetched rows rather than growing it by a fixed number of rows.
+          Each time the buffer is refilled, the size of the next fetch is
+          chosen so that the buffer occupies approximately this many bytes.
+          If :paramref:`_engine.Connection.execution_options.max_row_buffer`
+          is also given, it places an upper bound on the number of rows
+          buffered.  Has no effect once :meth:`_engine.Result.yield_per` is
+          in use.
+
+          .. versionadded:: 2.1
+
+          .. seealso::
+
+            :meth:`_events.ConnectionEvents.row_buffer_resize`
+
+            :ref:`engine_stream_results_sr`
+
+        :param prefetch: Available on: :class:`_engine.Connection`,
+          :class:`_sql.Executable`.  Integer number of batches of rows to
+          fetch ahead of the consumer of a :class:`_engine.CursorResult`.
+          When set, rows are fetched from the DBAPI cursor using
+          ``cursor.fetchmany()`` within a background thread, so that network
+          I/O with the database overlaps with the processing of rows that
+          were already received.   The size of each batch is taken from the
+          :paramref:`_engine.Connection.execution_options.yield_per` or
+          :paramref:`_engine.Connection.execution_options.max_row_buffer`
+          options, defaulting to 1000 rows.   Typically used along with
+          :paramref:`_engine.Connection.execution_options.stream_results`.
+
+          The option is only supported by dialects whose DBAPI cursors may be
+          used from a thread other than the one in which they were created;
+          for other dialects, including all asyncio dialects, using the
+          option raises :class:`.ArgumentError`.
+
+          .. versionadded:: 2.1
+
+          .. seealso::
+
+            :ref:`engine_stream_results_prefetch`
+
 
         :param yield_per: Available on: :class:`_engine.Connection`,
           :class:`_sql.Executable`.  Integer value applied which will
@@ -478,6 +538,21 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
 
                 :ref:`engine_insertmanyvalues`
 
+        :param insert_copy: Available on: :class:`_engine.Connection`,
+          :class:`_engine.Engine`, :class:`_sql.Executable`.  Boolean; when
+          True, an INSERT statement executed with many parameter sets
+          delivers its rows using the bulk copy facility of the database,
+          such as PostgreSQL's ``COPY FROM STDIN``, for dialects which
+          support it.  The INSERT is executed normally if RETURNING is
+          used, or if any of the values inserted is a SQL expression rather
+          than a bound parameter.
+
+          .. versionadded:: 2.1
+
+          .. seealso::
+
+            :ref:`engine_insert_copy`
+
         :param schema_translate_map: Available on: :class:`_engine.Connection`,
           :class:`_engine.Engine`, :class:`_sql.Executable`.
 
@@ -504,6 +579,23 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
 
           .. versionadded:: 2.0.28
 
+        :param pool_route: Available on: :class:`_engine.Engine`.
+
+          Select the route used when checking out connections from a
+          :class:`.RoutingPool`, either ``"write"``, the default, for the
+          primary database, or ``"read"`` for a read replica.  As this option
+          takes effect when a connection is checked out from the pool, it's
+          set on an :class:`_engine.Engine` using
+          :meth:`_engine.Engine.execution_options`; it has no effect on a
+          :class:`_engine.Connection` that's already been procured.   Pools
+          other than :class:`.RoutingPool` ignore this option.
+
+          .. versionadded:: 2.1
+
+          .. seealso::
+
+            :ref:`pool_replicas`
+
         .. seealso::
 
             :meth:`_engine.Engine.execution_options`
@@ -792,6 +884,131 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
             )
         pool_proxied_connection.detach()
 
+    @contextlib.contextmanager
+    def pipeline(self) -> Iterator[Connection]:
+        """Return a context manager which sends the statements executed
+        within its block in a "pipeline", for those dialects which support
+        it.
+
+        In pipeline mode, statements are sent to the database without
+        waiting for the result of each one, so that a series of statements
+        incurs fewer network round trips.  DML statements such as UPDATE
+        and DELETE which don't return rows don't wait for their results;
+        their :attr:`_engine.CursorResult.rowcount` becomes available when
+        the pipeline is next synced.  A statement that returns rows, such
+        as a SELECT or a DML statement with RETURNING, syncs the pipeline
+        before its result is returned.  The pipeline is also synced when
+        the transaction is committed, and when the block ends::
+
+            with engine.begin() as conn:
+                with conn.pipeline():
+                    for id_, value in values:
+                        conn.execute(
+                            table.update()
+                            .where(table.c.id == id_)
+                            .values(data=value)
+                        )
+
+        As errors are reported by the database only when the pipeline is
+        synced, an error raised by a statement may be raised by a later
+        operation within the block, or when the block ends.  The
+        transaction should be considered unusable in this case and
+        should be rolled back.
+
+        For dialects that don't support pipeline mode, as indicated by
+        the :attr:`.Dialect.supports_pipeline` attribute, statements are
+        executed normally and the context manager has no effect.   At the
+        time of this writing, pipeline mode is supported by the sync
+        version of the ``postgresql+psycopg`` dialect, for libpq version 14
+        and above.
+
+        .. versionadded:: 2.1
+
+        .. seealso::
+
+            :ref:`pipeline_mode`
+
+            :paramref:`_orm.Session.flush_pipeline`
+
+        """
+        if self._pipeline is not None or not self.dialect.supports_pipeline:
+            yield self
+            return
+
+        dbapi_connection = self.connection.dbapi_connection
+        try:
+            pipeline_ctx = self.dialect.do_pipeline(dbapi_connection)
+            state = _ConnectionPipeline(pipeline_ctx.__enter__())
+        except BaseException as e:
+            self._handle_dbapi_exception(e, None, None, None, None)
+
+        self._pipeline = state
+        try:
+            yield self
+            self._sync_pipeline()
+        except BaseException:
+            self._pipeline = None
+            state.complete(discard=True)
+            with util.safe_reraise():
+                pipeline_ctx.__exit__(*sys.exc_info())
+            raise
+        else:
+            self._pipeline = None
+            try:
+                pipeline_ctx.__exit__(None, None, None)
+            except BaseException as e:
+                self._handle_dbapi_exception(e, None, None, None, None)
+
+    def _sync_pipeline(self, run_callbacks: bool = True) -> None:
+        state = self._pipeline
+        if state is None:
+            return
+        try:
+            self.dialect.do_pipeline_sync(state.pipeline)
+        except BaseException as e:
+            state.complete(discard=True)
+            self._handle_dbapi_exception(e, None, None, None, None)
+
+        state.complete()
+
+        if run_callbacks:
+            callbacks, state.callbacks = state.callbacks, []
+            for fn, arg in callbacks:
+                fn(*arg)
+
+    def _defer_to_pipeline_sync(
+        self, fn: Callable[..., Any], *arg: Any
+    ) -> None:
+        """Invoke the given function when the current pipeline is synced,
+        or immediately if no pipeline is in progress.
+
+        Used for checks that require the rowcount of statements executed
+        within a pipeline.
+
+        """
+        if self._pipeline is not None:
+            self._pipeline.callbacks.append((fn, arg))
+        else:
+            fn(*arg)
+
+    def _pipeline_result(
+        self, context: ExecutionContext
+    ) -> CursorResult[Unpack[TupleAny]]:
+        state = self._pipeline
+        assert state is not None
+
+        if context._can_defer_in_pipeline():
+            result = context._setup_pipeline_result()
+            state.pending.append((context, result))
+            return result
+
+        # the statement returns rows or otherwise requires its results
+        # right away; wait for the pipeline to deliver them.   An error
+        # raised here may have been caused by an earlier statement
+        self.dialect.do_pipeline_sync(state.pipeline)
+        state.complete()
+        return context._setup_result_proxy()
+
     def _autobegin(self) -> None:
         if self._allow_autobegin and not self.__in_begin:
             self.begin()
@@ -1115,6 +1332,9 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
             self.__in_begin = False
 
     def _rollback_impl(self) -> None:
+        if self._pipeline is not None:
+            self._pipeline.complete(discard=True)
+
         if self._has_events or self.engine._has_events:
             self.dispatch.rollback(self)
 
@@ -1133,6 +1353,9 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
                 self._handle_dbapi_exception(e, None, None, None, None)
 
     def _commit_impl(self) -> None:
+        if self._pipeline is not None:
+            self._sync_pipeline()
+
         if self._has_events or self.engine._has_events:
             self.dispatch.commit(self)
 
@@ -1629,7 +1852,15 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
             "compiled_cache", self.engine._compiled_cache
         )
 
-        compiled_sql, extracted_params, cache_hit = elem._compile_w_cache(
+        cache_profiler = self.engine._cache_profiler
+        if cache_profiler is not None:
+            compile_w_cache = functools.partial(
+                cache_profiler._compile_w_cache, elem, exec_opts
+            )
+        else:
+            compile_w_cache = elem._compile_w_cache
+
+        compiled_sql, extracted_params, cache_hit = compile_w_cache(
             dialect=dialect,
             compiled_cache=compiled_cache,
             column_keys=keys,
@@ -1840,6 +2071,8 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
 
         if context.execute_style is ExecuteStyle.INSERTMANYVALUES:
             return self._exec_insertmany_context(dialect, context)
+        elif context.execute_style is ExecuteStyle.COPY:
+            return self._exec_copy_context(dialect, context)
         else:
             return self._exec_single_context(
                 dialect, context, statement, parameters
@@ -1978,7 +2211,10 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
 
             context.post_exec()
 
-            result = context._setup_result_proxy()
+            if self._pipeline is not None:
+                result = self._pipeline_result(context)
+            else:
+                result = context._setup_result_proxy()
 
         except BaseException as e:
             self._handle_dbapi_exception(
@@ -2004,6 +2240,10 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
         else:
             generic_setinputsizes = None
 
+        if self._pipeline is not None:
+            # rows are fetched from each batch as it's executed
+            self._sync_pipeline(run_callbacks=False)
+
         cursor, str_statement, parameters = (
             context.cursor,
             context.statement,
@@ -2156,6 +2396,88 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
 
         return result
 
+    def _exec_copy_context(
+        self,
+        dialect: Dialect,
+        context: ExecutionContext,
+    ) -> CursorResult[Unpack[TupleAny]]:
+        """continue the _execute_context() method for an INSERT whose
+        parameter sets are delivered using the bulk copy facility of the
+        database, via the dialect's do_copy_insert() method.
+
+        """
+        cursor, str_statement, parameters = (
+            context.cursor,
+            context.statement,
+            context.parameters,
+        )
+
+        if self._has_events or self.engine._has_events:
+            for fn in self.dispatch.before_cursor_execute:
+                str_statement, parameters = fn(
+                    self,
+                    cursor,
+                    str_statement,
+                    parameters,
+                    context,
+                    True,
+                )
+
+        if self._echo:
+            self._log_info(str_statement)
+
+            stats = context._get_cache_stats() + " (copy)"
+
+            if not self.engine.hide_parameters:
+                self._log_info(
+                    "[%s] %r",
+                    stats,
+                    sql_util._repr_params(
+                        parameters,
+                        batches=10,
+                        ismulti=True,
+                    ),
+                )
+            else:
+                self._log_info(
+                    "[%s] [SQL parameters hidden due to hide_parameters=True]",
+                    stats,
+                )
+
+        try:
+            copy_insert = context.compiled._copy_insert  # type: ignore
+            dialect.do_copy_insert(
+                cursor,
+                copy_insert.table,
+                copy_insert.columns,
+                parameters,
+                context,
+            )
+
+            if self._has_events or self.engine._has_events:
+                self.dispatch.after_cursor_execute(
+                    self,
+                    cursor,
+                    str_statement,
+                    parameters,
+                    context,
+                    True,
+                )
+
+            context.post_exec()
+
+            # each row is inserted, so the rowcount is known
+            context._rowcount = len(parameters)  # type: ignore[attr-defined]
+
+            result = context._setup_result_proxy()
+
+        except BaseException as e:
+            self._handle_dbapi_exception(
+                e, str_statement, parameters, cursor, context
+            )
+
+        return result
+
     def _cursor_execute(
         self,
         cursor: DBAPICursor,
@@ -2332,6 +2654,10 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
                 context.handle_dbapi_exception(e)
 
             if not self._is_disconnect:
+                if self._dbapi_connection is not None:
+                    # ensure a pre-ping limited to idle connections still
+                    # pings this connection on its next checkout
+                    self._dbapi_connection._set_requires_ping()
                 if cursor:
                     self._safe_close_cursor(cursor)
                 # "autorollback" was mostly relevant in 1.x series.
@@ -2455,6 +2781,38 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
         visitorcallable(self.dialect, self, **kwargs).traverse_single(element)
 
 
+class _ConnectionPipeline:
+    """Tracks the state of a :meth:`_engine.Connection.pipeline` block."""
+
+    __slots__ = ("pipeline", "pending", "callbacks")
+
+    pending: List[Tuple[ExecutionContext, CursorResult[Unpack[TupleAny]]]]
+    """Execution contexts and results for statements whose rowcount is not
+    yet available."""
+
+    callbacks: List[Tuple[Callable[..., Any], Tuple[Any, ...]]]
+    """Functions to be invoked when the pipeline is next synced."""
+
+    def __init__(self, pipeline: Any):
+        self.pipeline = pipeline
+        self.pending = []
+        self.callbacks = []
+
+    def complete(self, discard: bool = False) -> None:
+        """Collect the rowcount of pending statements and close their
+        cursors, once the pipeline has been synced.
+
+        If ``discard`` is set, the pipeline failed or is abandoned; the
+        statements and callbacks are discarded.
+
+        """
+        pending, self.pending = self.pending, []
+        if discard:
+            self.callbacks = []
+        for context, result in pending:
+            context._complete_pipeline_result(result, discard=discard)
+
+
 class ExceptionContextImpl(ExceptionContext):
     """Implement the :class:`.ExceptionContext` interface."""
 
@@ -2930,6 +3288,7 @@ class Engine(
     dispatch: dispatcher[ConnectionEventsTarget]
 
     _compiled_cache: Optional[CompiledCacheType]
+    _cache_profiler: Optional[CacheProfiler] = None
 
     _execution_options: _ExecuteOptions = _EMPTY_EXECUTION_OPTS
     _has_events: bool = False
@@ -2955,6 +3314,8 @@ class Engine(
         query_cache_size: int = 500,
         execution_options: Optional[Mapping[str, Any]] = None,
         hide_parameters: bool = False,
+        query_cache: Optional[CompiledCacheType] = None,
+        cache_profiling: bool = False,
     ):
         self.pool = pool
         self.url = url
@@ -2963,17 +3324,21 @@ class Engine(
             self.logging_name = logging_name
         self.echo = echo
         self.hide_parameters = hide_parameters
-        if query_cache_size != 0:
-            self._compiled_cache = util.LRUCache(
+        if query_cache is not None:
+            self._compiled_cache = query_cache
+        elif query_cache_size != 0:
+            self._compiled_cache = CompiledCache(
                 query_cache_size, size_alert=self._lru_size_alert
             )
         else:
             self._compiled_cache = None
+        if cache_profiling:
+            self._cache_profiler = CacheProfiler()
         log.instance_logger(self, echoflag=echo)
         if execution_options:
             self.update_execution_options(**execution_options)
 
-    def _lru_size_alert(self, cache: util.LRUCache[Any, Any]) -> None:
+    def _lru_size_alert(self, cache: CompiledCache) -> None:
         if self._should_log_info():
             self.logger.info(
                 "Compiled cache size pruning from %d items to %d.  "
@@ -3006,6 +3371,218 @@ class Engine(
         if self._compiled_cache:
             self._compiled_cache.clear()
 
+    @property
+    def query_cache(self) -> Optional[CompiledCacheType]:
+        """Return the compiled cache used by this :class:`_engine.Engine`,
+        or ``None`` if caching is disabled.
+
+        This is normally a :class:`.CompiledCache` established by the
+        :paramref:`_engine.create_engine.query_cache_size` parameter,
+        or the object passed to the
+        :paramref:`_engine.create_engine.query_cache` parameter.
+
+        .. versionadded:: 2.1
+
+        .. seealso::
+
+            :meth:`_engine.Engine.query_cache_stats`
+
+        """
+        return self._compiled_cache
+
+    def query_cache_stats(self) -> Optional[CompiledCacheStats]:
+        """Return hit, miss and eviction statistics for the compiled
+        cache used by this :class:`_engine.Engine`.
+
+        Returns ``None`` if caching is disabled, or if a custom cache
+        that is not a :class:`.CompiledCache` was passed to the
+        :paramref:`_engine.create_engine.query_cache` parameter.
+
+        E.g.::
+
+            stats = engine.query_cache_stats()
+            print(
+                "hits %d misses %d evictions %d"
+                % (stats.hits, stats.misses, stats.evictions)
+            )
+
+        Per-entry statistics, including the time taken to compile each
+        statement, are available from the
+        :meth:`.CompiledCache.entry_stats` method of
+        :attr:`_engine.Engine.query_cache`.
+
+        .. versionadded:: 2.1
+
+        """
+        if isinstance(self._compiled_cache, CompiledCache):
+            return self._compiled_cache.stats()
+        else:
+            return None
+
+    @property
+    def cache_profiler(self) -> Optional[CacheProfiler]:
+        """Return the :class:`.CacheProfiler` recording cache key and
+        compilation statistics for this :class:`_engine.Engine`, or
+        ``None`` if the :paramref:`_sa.create_engine.cache_profiling`
+        parameter is not in use.
+
+        .. versionadded:: 2.1
+
+        """
+        return self._cache_profiler
+
+    def cache_profile_report(self) -> Optional[List[StatementCacheProfile]]:
+        """Return cache key generation and compilation statistics for
+        each statement executed by this :class:`_engine.Engine`.
+
+        Returns a list of :class:`.StatementCacheProfile` objects in order
+        of the most total time spent generating cache keys and compiling
+        first, or ``None`` if the
+        :paramref:`_sa.create_engine.cache_profiling` parameter is not in
+        use.  This is a structured form of the ``[generated in ...]``,
+        ``[cached since ...]`` etc. information that's logged with each
+        statement, which also indicates the element within a statement
+        that prevented it from being cached, if any.
+
+        E.g.::
+
+            engine = create_engine("sqlite://", cache_profiling=True)
+
+            # ... run the application
+
+            for profile in engine.cache_profile_report():
+                print(
+                    "%s: %d executions, %.5fs generating cache keys, "
+                    "%.5fs compiling"
+                    % (
+                        profile.statement,
+                        profile.executions,
+                        profile.cache_key_time,
+                        profile.compile_time,
+                    )
+                )
+                if profile.uncacheable_element:
+                    print(
+                        "not cached due to %s: %s"
+                        % (
+                            profile.uncacheable_element,
+                            profile.cache_disable_reason,
+                        )
+                    )
+
+        .. versionadded:: 2.1
+
+        .. seealso::
+
+            :class:`.CacheProfiler`
+
+        """
+        if self._cache_profiler is not None:
+            return self._cache_profiler.report()
+        else:
+            return None
+
+    def save_query_cache(self, file: Union[str, IO[bytes]]) -> int:
+        """Write a snapshot of the compiled cache used by this
+        :class:`_engine.Engine` to a file, so that a new process may warm
+        its cache using :meth:`_engine.Engine.load_query_cache`.
+
+        E.g.::
+
+            # at shutdown, or periodically
+            engine.save_query_cache("/var/cache/myapp/query_cache.bin")
+
+        The snapshot stores the structure of each cached statement along
+        with its compiled SQL string.  References to
+        :class:`_schema.Table` objects and ORM mapped classes are stored by
+        name, so that they may be resolved against the application's own
+        objects when the snapshot is loaded.  Parameter values are not
+        stored.  Statements that can't be serialized are omitted.
+
+        The snapshot is specific to the SQLAlchemy version, dialect,
+        driver and database server version in use.
+
+        .. versionadded:: 2.1
+
+        :param file: filename or binary file object to write to.
+
+        :return: number of statements written to the snapshot.
+
+        """
+        if self._compiled_cache is None:
+            raise exc.InvalidRequestError(
+                "Compiled cache is disabled for this Engine"
+            )
+
+        if isinstance(file, str):
+            with open(file, "wb") as file_:
+                return _cache._save_snapshot(
+                    self._compiled_cache, self.dialect, file_
+                )
+        else:
+            return _cache._save_snapshot(
+                self._compiled_cache, self.dialect, file
+            )
+
+    def load_query_cache(
+        self,
+        file: Union[str, IO[bytes]],
+        metadata: Union[MetaData, Iterable[MetaData]],
+    ) -> int:
+        """Warm the compiled cache used by this :class:`_engine.Engine`
+        from a snapshot written by :meth:`_engine.Engine.save_query_cache`.
+
+        Each statement in the snapshot is compiled ahead of time and placed
+        into the cache, so that the first execution of that statement by
+        the application will find it already present.  This is typically
+        run at application startup, before requests are served::
+
+            engine = create_engine("postgresql+psycopg2://...")
+            engine.load_query_cache(
+                "/var/cache/myapp/query_cache.bin", Base.metadata
+            )
+
+        A connection is procured in order to initialize the dialect, if
+        it has not been initialized already, as the snapshot is validated
+        against the SQLAlchemy version, dialect, driver and database
+        server version in use; if any of these differ, a warning is emitted
+        and the snapshot is not loaded.   Statements referring to tables
+        or mapped classes that are no longer present, or which no longer
+        compile to the same SQL string as when the snapshot was taken, are
+        skipped.
+
+        .. warning:: The snapshot is loaded using Python ``pickle``, and
+           must therefore only be loaded from a trusted source.
+
+        .. versionadded:: 2.1
+
+        :param file: filename or binary file object to read from.
+
+        :param metadata: :class:`_schema.MetaData` collection, or an
+         iterable of them, used to resolve tables referred to by the
+         snapshot.
+
+        :return: number of statements placed into the cache.
+
+        """
+        if self._compiled_cache is None:
+            raise exc.InvalidRequestError(
+                "Compiled cache is disabled for this Engine"
+            )
+
+        with self.connect():
+            pass
+
+        if isinstance(file, str):
+            with open(file, "rb") as file_:
+                return _cache._load_snapshot(
+                    self._compiled_cache, self.dialect, file_, metadata
+                )
+        else:
+            return _cache._load_snapshot(
+                self._compiled_cache, self.dialect, file, metadata
+            )
+
     def update_execution_options(self, **opt: Any) -> None:
         r"""Update the default execution_options dictionary
         of this :class:`_engine.Engine`.
@@ -3035,7 +3612,9 @@ class Engine(
         logging_token: str = ...,
         isolation_level: IsolationLevel = ...,
         insertmanyvalues_page_size: int = ...,
+        insert_copy: bool = False,
         schema_translate_map: Optional[SchemaTranslateMapType] = ...,
+        pool_route: str = ...,
         **opt: Any,
     ) -> OptionEngine: ...
 
@@ -3248,7 +3827,7 @@ class Engine(
         with self.begin() as conn:
             conn._run_ddl_visitor(visitorcallable, element, **kwargs)
 
-    def connect(self) -> Connection:
+    def connect(self, deadline: Optional[float] = None) -> Connection:
         """Return a new :class:`_engine.Connection` object.
 
         The :class:`_engine.Connection` acts as a Python context manager, so
@@ -3265,15 +3844,40 @@ class Engine(
         emit the :meth:`_events.ConnectionEvents.rollback` event if one was
         started and is still in progress.
 
+        :param deadline: optional point in time, as a value of
+         ``time.monotonic()``, by which a connection must be obtained from
+         the connection pool.  If the deadline has already passed,
+         :class:`.exc.TimeoutError` is raised immediately, rather than
+         checking out a connection that would be of no use; otherwise the
+         pool waits for a connection no later than the deadline, or its
+         own timeout, whichever is sooner.  This allows an application to
+         apply the time remaining for a request as a whole to the
+         acquisition of a connection::
+
+            deadline = time.monotonic() + 2.0
+
+            # ...
+
+            with engine.connect(deadline=deadline) as connection:
+                ...
+
+         .. versionadded:: 2.1
+
+         .. seealso::
+
+            :ref:`pool_fair_queue`
+
         .. seealso::
 
             :meth:`_engine.Engine.begin`
 
         """
 
-        return self._connection_cls(self)
+        return self._connection_cls(self, _deadline=deadline)
 
-    def raw_connection(self) -> PoolProxiedConnection:
+    def raw_connection(
+        self, deadline: Optional[float] = None
+    ) -> PoolProxiedConnection:
         """Return a "raw" DBAPI connection from the connection pool.
 
         The returned object is a proxied version of the DBAPI
@@ -3290,12 +3894,22 @@ class Engine(
         present, the DBAPI connection is available using
         the :attr:`_engine.Connection.connection` accessor.
 
+        :param deadline: optional deadline, as a value of
+         ``time.monotonic()``, as described at
+         :paramref:`_engine.Engine.connect.deadline`.
+
+         .. versionadded:: 2.1
+
         .. seealso::
 
             :ref:`dbapi_connections`
 
         """
-        return self.pool.connect()
+        if "pool_route" in self._execution_options:
+            return self.pool._connect_route(
+                self._execution_options["pool_route"], deadline
+            )
+        return self.pool.connect(deadline=deadline)
 
 
 class OptionEngineMixin(log.Identified):
@@ -3303,6 +3917,7 @@ class OptionEngineMixin(log.Identified):
 
     dispatch: dispatcher[ConnectionEventsTarget]
     _compiled_cache: Optional[CompiledCacheType]
+    _cache_profiler: Optional[CacheProfiler]
     dialect: Dialect
     pool: Pool
     url: URL
@@ -3318,6 +3933,7 @@ class OptionEngineMixin(log.Identified):
         self.logging_name = proxied.logging_name
         self.echo = proxied.echo
         self._compiled_cache = proxied._compiled_cache
+        self._cache_profiler = proxied._cache_profiler
         self.hide_parameters = proxied.hide_parameters
         log.instance_logger(self, echoflag=self.echo)
 
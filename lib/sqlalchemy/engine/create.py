@@ -16,6 +16,7 @@ from typing import Dict
 from typing import List
 from typing import Optional
 from typing import overload
+from typing import Sequence
 from typing import Type
 from typing import Union
 
@@ -35,6 +36,7 @@ if typing.TYPE_CHECKING:
     from .base import Engine
     from .interfaces import _ExecuteOptions
     from .interfaces import _ParamStyle
+    from .interfaces import CompiledCacheType
     from .interfaces import IsolationLevel
     from .url import URL
     from ..log import _EchoFlagType
@@ -49,6 +51,7 @@ if typing.TYPE_CHECKING:
 def create_engine(
     url: Union[str, URL],
     *,
+    cache_profiling: bool = ...,
     connect_args: Dict[Any, Any] = ...,
     convert_unicode: bool = ...,
     creator: Union[_CreatorFnType, _CreatorWRecFnType] = ...,
@@ -59,6 +62,7 @@ def create_engine(
     future: Literal[True],
     hide_parameters: bool = ...,
     implicit_returning: Literal[True] = ...,
+    in_clause_padding: bool = ...,
     insertmanyvalues_page_size: int = ...,
     isolation_level: IsolationLevel = ...,
     json_deserializer: Callable[..., Any] = ...,
@@ -71,14 +75,27 @@ def create_engine(
     paramstyle: Optional[_ParamStyle] = ...,
     pool: Optional[Pool] = ...,
     poolclass: Optional[Type[Pool]] = ...,
+    pool_collect_metrics: bool = ...,
+    pool_ejection_time: float = ...,
+    pool_fair_queue: bool = ...,
+    pool_idle_timeout: Optional[float] = ...,
     pool_logging_name: str = ...,
+    pool_maintenance_interval: Optional[float] = ...,
+    pool_min_idle: int = ...,
     pool_pre_ping: bool = ...,
+    pool_pre_ping_idle_threshold: Optional[float] = ...,
+    pool_queue_shards: Optional[int] = ...,
     pool_size: int = ...,
     pool_recycle: int = ...,
+    pool_replicas: Sequence[
+        Union[str, URL, _CreatorFnType, _CreatorWRecFnType]
+    ] = ...,
     pool_reset_on_return: Optional[_ResetStyleArgType] = ...,
     pool_timeout: float = ...,
     pool_use_lifo: bool = ...,
     plugins: List[str] = ...,
+    prepared_statement_threshold: Optional[int] = ...,
+    query_cache: Optional[CompiledCacheType] = ...,
     query_cache_size: int = ...,
     use_insertmanyvalues: bool = ...,
     **kwargs: Any,
@@ -168,6 +185,20 @@ def create_engine(url: Union[str, _url.URL], **kwargs: Any) -> Engine:
 
         :ref:`connections_toplevel`
 
+    :param cache_profiling=False: if True, the :class:`_engine.Engine`
+     will record the time spent generating cache keys and compiling each
+     statement it executes, along with whether or not the statement made
+     use of the compiled cache and, if it could not, the element within
+     the statement that prevented it.  The statistics are available from
+     :meth:`_engine.Engine.cache_profile_report`.  This adds overhead to
+     each execution and is intended for diagnosing caching issues.
+
+     .. versionadded:: 2.1
+
+     .. seealso::
+
+        :class:`.CacheProfiler`
+
     :param connect_args: a dictionary of options which will be
         passed directly to the DBAPI's ``connect()`` method as
         additional keyword arguments.  See the example
@@ -273,6 +304,17 @@ def create_engine(url: Union[str, _url.URL], **kwargs: Any) -> Engine:
         :paramref:`.Table.implicit_returning` parameter.
 
 
+    :param in_clause_padding=False: when True, the list of values passed to
+     an "expanding" IN parameter, such as that generated by
+     :meth:`_sql.ColumnOperators.in_`, is padded to the next power of two
+     in length by repeating its last value, when the statement is executed.
+     This limits the number of distinct SQL strings produced for IN
+     expressions of varying length, so that plan and prepared statement
+     caches on the database server are more effective.  Values rendered
+     inline using ``literal_execute`` are not padded.
+
+     .. versionadded:: 2.1
+
     :param insertmanyvalues_page_size: number of rows to format into an
      INSERT statement when the statement uses "insertmanyvalues" mode, which is
      a paged form of bulk insert that is used for many backends when using
@@ -415,6 +457,47 @@ def create_engine(url: Union[str, _url.URL], **kwargs: Any) -> Engine:
         instantiate the pool in this case, you just indicate what type
         of pool to be used.
 
+    :param pool_collect_metrics=False: if True, the connection pool will
+        record counts and timings of its activity, available from the
+        :attr:`_pool.Pool.metrics` attribute of :attr:`_engine.Engine.pool`.
+        Sets the :paramref:`_pool.Pool.collect_metrics` parameter.
+
+        .. versionadded:: 2.1
+
+        .. seealso::
+
+            :ref:`pool_metrics`
+
+    :param pool_ejection_time=30: when using
+        :class:`~sqlalchemy.pool.RoutingPool`, the number of seconds for which
+        a read replica is excluded from routing after it fails to provide a
+        connection.  See :paramref:`.RoutingPool.ejection_time`.
+
+        .. versionadded:: 2.1
+
+    :param pool_fair_queue=False: if True, a
+        :class:`~sqlalchemy.pool.QueuePool` gives connections to waiting
+        threads strictly in the order in which they began waiting.  See
+        :paramref:`.QueuePool.fair_queue`.
+
+        .. versionadded:: 2.1
+
+        .. seealso::
+
+            :ref:`pool_fair_queue`
+
+    :param pool_idle_timeout=None: a number of seconds after which
+        connections that are idle in the pool are closed by pool maintenance,
+        as long as at least :paramref:`_sa.create_engine.pool_min_idle`
+        connections remain.  Sets the :paramref:`.QueuePool.idle_timeout`
+        parameter.
+
+        .. versionadded:: 2.1
+
+        .. seealso::
+
+            :ref:`pool_maintenance`
+
     :param pool_logging_name:  String identifier which will be used within
        the "name" field of logging records generated within the
        "sqlalchemy.pool" logger. Defaults to a hexstring of the object's
@@ -425,6 +508,31 @@ def create_engine(url: Union[str, _url.URL], **kwargs: Any) -> Engine:
             :ref:`dbengine_logging` - further detail on how to configure
             logging.
 
+    :param pool_maintenance_interval=None: a number of seconds; if set,
+        pool maintenance is run in the background at this interval,
+        establishing connections up to
+        :paramref:`_sa.create_engine.pool_min_idle`, replacing connections
+        before they reach :paramref:`_sa.create_engine.pool_recycle`, and
+        closing connections idle beyond
+        :paramref:`_sa.create_engine.pool_idle_timeout`.  Sets the
+        :paramref:`.QueuePool.maintenance_interval` parameter.
+
+        .. versionadded:: 2.1
+
+        .. seealso::
+
+            :ref:`pool_maintenance`
+
+    :param pool_min_idle=0: the number of idle connections that pool
+        maintenance keeps available in the pool.  Sets the
+        :paramref:`.QueuePool.min_idle` parameter.
+
+        .. versionadded:: 2.1
+
+        .. seealso::
+
+            :ref:`pool_maintenance`
+
     :param pool_pre_ping: boolean, if True will enable the connection pool
         "pre-ping" feature that tests connections for liveness upon
         each checkout.
@@ -435,6 +543,19 @@ def create_engine(url: Union[str, _url.URL], **kwargs: Any) -> Engine:
 
             :ref:`pool_disconnects_pessimistic`
 
+    :param pool_pre_ping_idle_threshold: when used with
+        :paramref:`_sa.create_engine.pool_pre_ping`, a number of seconds;
+        connections which were used more recently than this period, and
+        which didn't raise an error when last used, are not pinged upon
+        checkout.  Sets the :paramref:`_pool.Pool.pre_ping_idle_threshold`
+        parameter.
+
+        .. versionadded:: 2.1
+
+        .. seealso::
+
+            :ref:`pool_disconnects_pessimistic_idle`
+
     :param pool_size=5: the number of connections to keep open
         inside the connection pool. This used with
         :class:`~sqlalchemy.pool.QueuePool` as
@@ -443,6 +564,17 @@ def create_engine(url: Union[str, _url.URL], **kwargs: Any) -> Engine:
         of 0 indicates no limit; to disable pooling, set ``poolclass`` to
         :class:`~sqlalchemy.pool.NullPool` instead.
 
+    :param pool_queue_shards=None: a number of "shards" among which the
+        idle connections of a :class:`~sqlalchemy.pool.QueuePool` are
+        distributed, reducing lock contention when many threads check out
+        connections concurrently.  See :paramref:`.QueuePool.queue_shards`.
+
+        .. versionadded:: 2.1
+
+        .. seealso::
+
+            :ref:`pool_queue_shards`
+
     :param pool_recycle=-1: this setting causes the pool to recycle
         connections after the given number of seconds has passed. It
         defaults to -1, or no timeout. For example, setting to 3600
@@ -456,6 +588,18 @@ def create_engine(url: Union[str, _url.URL], **kwargs: Any) -> Engine:
 
             :ref:`pool_setting_recycle`
 
+    :param pool_replicas: when using :class:`~sqlalchemy.pool.RoutingPool`,
+        a sequence of read replicas of the database, each given as a URL or
+        as a callable returning a DBAPI connection, to which checkouts
+        requested with the ``pool_route="read"`` execution option are routed.
+        See :paramref:`.RoutingPool.replicas`.
+
+        .. versionadded:: 2.1
+
+        .. seealso::
+
+            :ref:`pool_replicas`
+
     :param pool_reset_on_return='rollback': set the
         :paramref:`_pool.Pool.reset_on_return` parameter of the underlying
         :class:`_pool.Pool` object, which can be set to the values
@@ -493,14 +637,51 @@ def create_engine(url: Union[str, _url.URL], **kwargs: Any) -> Engine:
 
         .. versionadded:: 1.2.3
 
+    :param prepared_statement_threshold: number of times a statement must
+     be executed from the compiled cache, across all connections, before it
+     is executed using a server-side prepared statement.  Statements which
+     are executed less often, which are evicted from the compiled cache, or
+     which are not cached, are executed without preparation.  Requires a
+     dialect which supports directing the use of prepared statements, such
+     as ``postgresql+psycopg`` and ``oracle+oracledb``, and a compiled cache
+     to be in use.
+
+     .. versionadded:: 2.1
+
+     .. seealso::
+
+        :ref:`engine_prepared_statements`
+
+    :param query_cache: a cache object to be used to cache the SQL string
+     form of queries, in place of the cache established by the
+     :paramref:`_sa.create_engine.query_cache_size` parameter.  This is
+     typically a :class:`.CompiledCache` configured with an approximate
+     memory limit, however any mutable mapping object may be used.
+
+     .. versionadded:: 2.1
+
+     .. seealso::
+
+        :class:`.CompiledCache`
+
+        :meth:`_engine.Engine.query_cache_stats`
+
     :param query_cache_size: size of the cache used to cache the SQL string
      form of queries.  Set to zero to disable caching.
 
-     The cache is pruned of its least recently used items when its size reaches
-     N * 1.5.  Defaults to 500, meaning the cache will always store at least
-     500 SQL statements when filled, and will grow up to 750 items at which
-     point it is pruned back down to 500 by removing the 250 least recently
-     used items.
+     The cache is pruned when its size reaches N * 1.5.  Defaults to 500,
+     meaning the cache will always store at least 500 SQL statements when
+     filled, and will grow up to 750 items at which point it is pruned back
+     down to 500 by removing the 250 items of lowest retention priority,
+     which considers how recently and how often each statement was used
+     along with its compile time and approximate size; see
+     :class:`.CompiledCache` for details.
+
+     .. versionchanged:: 2.1 The cache established by
+        :paramref:`_sa.create_engine.query_cache_size` is a
+        :class:`.CompiledCache`, which takes the compile cost and size of
+        statements into account when pruning, rather than pruning only the
+        least recently used statements.
 
      Caching is accomplished on a per-statement basis by generating a
      cache key that represents the statement's structure, then generating
@@ -862,6 +1043,15 @@ _pool_translate_kwargs = immutabledict(
         "events": "pool_events",  # deprecated
         "reset_on_return": "pool_reset_on_return",
         "pre_ping": "pool_pre_ping",
+        "pre_ping_idle_threshold": "pool_pre_ping_idle_threshold",
+        "collect_metrics": "pool_collect_metrics",
+        "min_idle": "pool_min_idle",
+        "idle_timeout": "pool_idle_timeout",
+        "maintenance_interval": "pool_maintenance_interval",
+        "queue_shards": "pool_queue_shards",
+        "fair_queue": "pool_fair_queue",
+        "replicas": "pool_replicas",
+        "ejection_time": "pool_ejection_time",
         "use_lifo": "pool_use_lifo",
     }
 )
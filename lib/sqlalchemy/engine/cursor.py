@@ -15,6 +15,9 @@ from __future__ import annotations
 import collections
 import functools
 import operator
+import queue
+import sys
+import threading
 import typing
 from typing import Any
 from typing import cast
@@ -952,6 +955,9 @@ class ResultFetchStrategy:
     ) -> None:
         return
 
+    def has_buffered_rows(self) -> bool:
+        return False
+
     def fetchone(
         self,
         result: CursorResult[Unpack[TupleAny]],
@@ -1238,6 +1244,9 @@ class BufferedRowCursorFetchStrategy(CursorFetchStrategy):
         self._rowbuffer.clear()
         super().hard_close(result, dbapi_cursor)
 
+    def has_buffered_rows(self):
+        return bool(self._rowbuffer)
+
     def fetchone(self, result, dbapi_cursor, hard_close=False):
         if not self._rowbuffer:
             self._buffer_rows(result, dbapi_cursor)
@@ -1283,6 +1292,335 @@ class BufferedRowCursorFetchStrategy(CursorFetchStrategy):
             self.handle_exception(result, dbapi_cursor, e)
 
 
+def _approximate_rows_bytes(rows, sample_size=10):
+    """estimate the in-memory size of a list of rows, by measuring
+    a sample of rows spread evenly across the list.
+
+    """
+    num_rows = len(rows)
+    if not num_rows:
+        return 0
+
+    getsizeof = sys.getsizeof
+    step = max(1, num_rows // sample_size)
+    sample = rows[::step]
+    sample_bytes = sum(
+        getsizeof(row) + sum(getsizeof(elem) for elem in row)
+        for row in sample
+    )
+    return sample_bytes * num_rows // len(sample)
+
+
+class AdaptiveBufferedRowCursorFetchStrategy(BufferedRowCursorFetchStrategy):
+    """A buffered row strategy that sizes its buffer based on the
+    approximate number of bytes taken up by the rows fetched.
+
+    This strategy is used when the ``max_buffer_bytes`` execution option
+    is present along with ``stream_results``.  Each time the buffer is
+    refilled, the approximate in-memory size of the rows fetched is
+    measured, and the size of the next ``cursor.fetchmany()`` call is chosen
+    so that the buffer takes up approximately ``max_buffer_bytes`` bytes.
+    When ``max_row_buffer`` is also present, it places an upper bound on the
+    number of rows buffered::
+
+        with engine.connect() as conn:
+
+            result = conn.execution_options(
+                stream_results=True, max_buffer_bytes=8 * 1024 * 1024
+                ).execute(text("select * from table"))
+
+    The sizes chosen may be observed using the
+    :meth:`_events.ConnectionEvents.row_buffer_resize` event.
+
+    .. versionadded:: 2.1
+
+    .. seealso::
+
+        :ref:`engine_stream_results_sr`
+
+    """
+
+    __slots__ = ("_max_buffer_bytes", "_row_limit")
+
+    def __init__(
+        self,
+        dbapi_cursor,
+        execution_options,
+        initial_buffer=None,
+    ):
+        super().__init__(
+            dbapi_cursor,
+            execution_options,
+            growth_factor=0,
+            initial_buffer=initial_buffer,
+        )
+        self._max_buffer_bytes = execution_options["max_buffer_bytes"]
+        self._row_limit = execution_options.get("max_row_buffer", None)
+
+        if self._rowbuffer:
+            self._bufsize = self._size_for_rows(list(self._rowbuffer))
+        else:
+            self._bufsize = 1
+
+    @classmethod
+    def create(cls, result):
+        return AdaptiveBufferedRowCursorFetchStrategy(
+            result.cursor,
+            result.context.execution_options,
+        )
+
+    def _size_for_rows(self, rows):
+        row_bytes = max(1, _approximate_rows_bytes(rows) // len(rows))
+        size = max(1, self._max_buffer_bytes // row_bytes)
+        if self._row_limit is not None:
+            size = min(size, self._row_limit)
+        return size
+
+    def _buffer_rows(self, result, dbapi_cursor):
+        if not self._max_buffer_bytes:
+            super()._buffer_rows(result, dbapi_cursor)
+            return
+
+        size = self._bufsize
+        try:
+            new_rows = dbapi_cursor.fetchmany(size)
+        except BaseException as e:
+            self.handle_exception(result, dbapi_cursor, e)
+
+        if not new_rows:
+            return
+
+        num_bytes = _approximate_rows_bytes(new_rows)
+        self._rowbuffer = collections.deque(new_rows)
+        self._bufsize = self._size_for_rows(new_rows)
+
+        connection = result.connection
+        if connection._has_events or connection.engine._has_events:
+            connection.dispatch.row_buffer_resize(
+                connection,
+                dbapi_cursor,
+                result.context,
+                len(new_rows),
+                num_bytes,
+                self._bufsize,
+            )
+
+    def yield_per(self, result, dbapi_cursor, num):
+        # a fixed yield_per size takes precedence over the byte target
+        self._max_buffer_bytes = None
+        super().yield_per(result, dbapi_cursor, num)
+
+
+class _PrefetchError:
+    __slots__ = ("error",)
+
+    def __init__(self, error):
+        self.error = error
+
+
+class PrefetchCursorFetchStrategy(CursorFetchStrategy):
+    """A cursor fetch strategy that fetches batches of rows from the DBAPI
+    cursor in a background thread.
+
+    This strategy is used when the ``prefetch`` execution option is present.
+    Upon the first fetch, a helper thread is started which calls
+    ``cursor.fetchmany()`` repeatedly, placing each batch of rows into a
+    queue that holds at most ``prefetch`` batches, so that network I/O
+    with the database overlaps with the processing of rows that have
+    already been received::
+
+        with engine.connect() as conn:
+
+            result = conn.execution_options(
+                stream_results=True, prefetch=2, max_row_buffer=500
+                ).execute(text("select * from table"))
+
+    The size of each batch is that of the ``yield_per`` or ``max_row_buffer``
+    execution options, defaulting to 1000.  Exceptions raised by the DBAPI
+    within the helper thread are re-raised in the thread consuming the
+    result, where they are handled in the usual way including the
+    invalidation of the connection for disconnect situations.   Closing the
+    result stops the helper thread, waiting for a fetch that's in progress
+    to complete before the cursor is closed.
+
+    The strategy can only be used with dialects which indicate that their
+    cursors may be used from a thread other than the one in which they
+    were created, via the
+    :attr:`.Dialect.supports_threaded_cursor_fetch` attribute.
+
+    .. versionadded:: 2.1
+
+    """
+
+    __slots__ = (
+        "_prefetch",
+        "_batch_size",
+        "_rowbuffer",
+        "_queue",
+        "_thread",
+        "_stop",
+        "_exhausted",
+    )
+
+    _poll_interval = 0.1
+
+    def __init__(self, dbapi_cursor, execution_options):
+        self._prefetch = execution_options["prefetch"]
+        self._batch_size = execution_options.get(
+            "yield_per", execution_options.get("max_row_buffer", 1000)
+        )
+        self._rowbuffer = collections.deque()
+        self._queue = queue.Queue(maxsize=self._prefetch)
+        self._thread = None
+        self._stop = threading.Event()
+        self._exhausted = False
+
+    def _start(self, result, dbapi_cursor):
+        self._thread = thread = threading.Thread(
+            target=self._fetch_rows,
+            args=(result.connection, dbapi_cursor),
+            name="sqlalchemy-prefetch",
+            daemon=True,
+        )
+        thread.start()
+
+    def _fetch_rows(self, connection, dbapi_cursor):
+        """run within the helper thread; fetch batches of rows from the
+        cursor until the cursor is exhausted or the strategy is stopped.
+
+        """
+        stop = self._stop
+        put = self._queue.put
+        poll_interval = self._poll_interval
+
+        while not stop.is_set():
+            try:
+                size = self._batch_size
+                if size < 1:
+                    rows = dbapi_cursor.fetchall()
+                else:
+                    rows = dbapi_cursor.fetchmany(size)
+            except BaseException as err:
+                item = _PrefetchError(err)
+            else:
+                item = rows
+
+            while not stop.is_set():
+                try:
+                    put(item, timeout=poll_interval)
+                except queue.Full:
+                    # the consumer may have abandoned the result without
+                    # closing it; don't block forever on a connection
+                    # that is no longer usable
+                    if connection.invalidated or connection.closed:
+                        return
+                else:
+                    break
+
+            if not item or isinstance(item, _PrefetchError):
+                return
+
+    def _stop_thread(self):
+        thread = self._thread
+        if thread is None:
+            return
+
+        self._stop.set()
+
+        # unblock the helper thread if it's waiting on a full queue
+        try:
+            while True:
+                self._queue.get_nowait()
+        except queue.Empty:
+            pass
+
+        # wait for a fetch in progress to complete, so that the cursor
+        # isn't closed while the helper thread is still using it
+        if thread is not threading.current_thread():
+            thread.join()
+        self._thread = None
+
+    def _next_batch(self, result, dbapi_cursor):
+        if self._exhausted:
+            return None
+
+        if self._thread is None:
+            self._start(result, dbapi_cursor)
+
+        item = self._queue.get()
+        if isinstance(item, _PrefetchError):
+            self._exhausted = True
+            self._stop_thread()
+            try:
+                # re-raise in this thread, as exception handling makes use
+                # of sys.exc_info()
+                raise item.error
+            except BaseException as err:
+                self.handle_exception(result, dbapi_cursor, err)
+        elif not item:
+            self._exhausted = True
+            self._stop_thread()
+            return None
+        return item
+
+    def yield_per(self, result, dbapi_cursor, num):
+        self._batch_size = num
+
+    def soft_close(self, result, dbapi_cursor):
+        self._stop_thread()
+        self._rowbuffer.clear()
+        super().soft_close(result, dbapi_cursor)
+
+    def hard_close(self, result, dbapi_cursor):
+        self._stop_thread()
+        self._rowbuffer.clear()
+        super().hard_close(result, dbapi_cursor)
+
+    def has_buffered_rows(self):
+        return bool(self._rowbuffer)
+
+    def fetchone(self, result, dbapi_cursor, hard_close=False):
+        if not self._rowbuffer:
+            new_rows = self._next_batch(result, dbapi_cursor)
+            if not new_rows:
+                result._soft_close(hard=hard_close)
+                return None
+            self._rowbuffer.extend(new_rows)
+        return self._rowbuffer.popleft()
+
+    def fetchmany(self, result, dbapi_cursor, size=None):
+        if size is None:
+            size = self._batch_size
+            if size < 1:
+                return self.fetchall(result, dbapi_cursor)
+
+        rb = self._rowbuffer
+        close = False
+        while len(rb) < size:
+            new_rows = self._next_batch(result, dbapi_cursor)
+            if not new_rows:
+                # defer closing since it clears the row buffer
+                close = True
+                break
+            rb.extend(new_rows)
+
+        res = [rb.popleft() for _ in range(min(size, len(rb)))]
+        if close:
+            result._soft_close()
+        return res
+
+    def fetchall(self, result, dbapi_cursor):
+        ret = list(self._rowbuffer)
+        self._rowbuffer.clear()
+        while True:
+            new_rows = self._next_batch(result, dbapi_cursor)
+            if not new_rows:
+                break
+            ret.extend(new_rows)
+        result._soft_close()
+        return ret
+
+
 class FullyBufferedCursorFetchStrategy(CursorFetchStrategy):
     """A cursor strategy that buffers rows fully upon creation.
 
@@ -1314,6 +1652,9 @@ class FullyBufferedCursorFetchStrategy(CursorFetchStrategy):
         self._rowbuffer.clear()
         super().hard_close(result, dbapi_cursor)
 
+    def has_buffered_rows(self):
+        return bool(self._rowbuffer)
+
     def fetchone(self, result, dbapi_cursor, hard_close=False):
         if self._rowbuffer:
             return self._rowbuffer.popleft()
@@ -2146,10 +2487,25 @@ class CursorResult(Result[Unpack[_Ts]]):
     def _raw_row_iterator(self):
         return self._fetchiter_impl()
 
+    def _has_buffered_rows(self):
+        return self.cursor_strategy.has_buffered_rows()
+
+    @property
+    def _default_nulls_first(  # type: ignore[override]
+        self,
+    ) -> Optional[bool]:
+        return self.dialect.default_nulls_first
+
     def merge(
-        self, *others: Result[Unpack[TupleAny]]
+        self,
+        *others: Result[Unpack[TupleAny]],
+        order_by: Optional[Sequence[Any]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
     ) -> MergedResult[Unpack[TupleAny]]:
-        merged_result = super().merge(*others)
+        merged_result = super().merge(
+            *others, order_by=order_by, limit=limit, offset=offset
+        )
         if self.context._has_rowcount:
             merged_result.rowcount = sum(
                 cast("CursorResult[Any]", result).rowcount
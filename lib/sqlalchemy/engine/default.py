@@ -242,12 +242,25 @@ class DefaultDialect(Dialect):
     insertmanyvalues_page_size: int = 1000
     insertmanyvalues_max_parameters = 32700
 
+    in_clause_padding = False
+
+    supports_copy_insert = False
+
     supports_is_distinct_from = True
 
+    default_nulls_first: Optional[bool] = None
+
     supports_server_side_cursors = False
 
     server_side_cursors = False
 
+    supports_threaded_cursor_fetch = False
+
+    supports_pipeline = False
+
+    supports_server_side_prepare = False
+    prepared_statement_threshold: Optional[int] = None
+
     # extra record-level locking features (#4860)
     supports_for_update_of = False
 
@@ -305,8 +318,22 @@ class DefaultDialect(Dialect):
         # Linting.NO_LINTING constant
         compiler_linting: Linting = int(compiler.NO_LINTING),  # type: ignore
         server_side_cursors: bool = False,
+        prepared_statement_threshold: Optional[int] = None,
+        in_clause_padding: bool = False,
         **kwargs: Any,
     ):
+        if prepared_statement_threshold is not None:
+            if not self.supports_server_side_prepare:
+                raise exc.ArgumentError(
+                    "Dialect %s does not support "
+                    "prepared_statement_threshold" % self
+                )
+            elif prepared_statement_threshold < 1:
+                raise exc.ArgumentError(
+                    "prepared_statement_threshold must be at least 1"
+                )
+            self.prepared_statement_threshold = prepared_statement_threshold
+
         if server_side_cursors:
             if not self.supports_server_side_cursors:
                 raise exc.ArgumentError(
@@ -372,6 +399,8 @@ class DefaultDialect(Dialect):
         if insertmanyvalues_page_size is not _NoArg.NO_ARG:
             self.insertmanyvalues_page_size = insertmanyvalues_page_size
 
+        self.in_clause_padding = in_clause_padding
+
     @property
     @util.deprecated(
         "2.0",
@@ -742,6 +771,14 @@ class DefaultDialect(Dialect):
             else:
                 raise
 
+    def do_pipeline(self, dbapi_connection):
+        raise NotImplementedError(
+            "The %s dialect does not support pipeline mode" % self.name
+        )
+
+    def do_pipeline_sync(self, pipeline):
+        pipeline.sync()
+
     def do_ping(self, dbapi_connection: DBAPIConnection) -> bool:
         cursor = None
 
@@ -932,6 +969,9 @@ class DefaultDialect(Dialect):
     def do_execute(self, cursor, statement, parameters, context=None):
         cursor.execute(statement, parameters)
 
+    def do_copy_insert(self, cursor, table, columns, rows, context):
+        raise NotImplementedError()
+
     def do_execute_no_params(self, cursor, statement, context=None):
         cursor.execute(statement)
 
@@ -1209,6 +1249,10 @@ class DefaultExecutionContext(ExecutionContext):
 
     _rowcount: Optional[int] = None
 
+    # set when the result of this execution is pending within a
+    # Connection.pipeline() block
+    _pipeline_deferred = False
+
     # a hook for SQLite's translation of
     # result column names
     # NOTE: pyhive is using this hook, can't remove it :(
@@ -1223,6 +1267,8 @@ class DefaultExecutionContext(ExecutionContext):
 
     cache_hit = NO_CACHE_KEY
 
+    prepare_statement: Optional[bool] = None
+
     root_connection: Connection
     _dbapi_connection: PoolProxiedConnection
     dialect: Dialect
@@ -1306,6 +1352,13 @@ class DefaultExecutionContext(ExecutionContext):
         self.compiled = compiled
         self.cache_hit = cache_hit
 
+        threshold = dialect.prepared_statement_threshold
+        if threshold is not None:
+            # only statements retained in a compiled cache are prepared
+            self.prepare_statement = (
+                cache_hit is CACHE_HIT or cache_hit is CACHE_MISS
+            ) and compiled._use_prepared(threshold)
+
         self.execution_options = execution_options
 
         self.result_column_struct = (
@@ -1396,7 +1449,14 @@ class DefaultExecutionContext(ExecutionContext):
             ]
 
             if len(parameters) > 1:
-                if self.isinsert and compiled._insertmanyvalues:
+                if (
+                    self.isinsert
+                    and compiled._copy_insert is not None
+                    and execution_options.get("insert_copy", False)
+                    and connection._pipeline is None
+                ):
+                    self.execute_style = ExecuteStyle.COPY
+                elif self.isinsert and compiled._insertmanyvalues:
                     self.execute_style = ExecuteStyle.INSERTMANYVALUES
 
                     imv = compiled._insertmanyvalues
@@ -1459,7 +1519,24 @@ class DefaultExecutionContext(ExecutionContext):
         # into a dict or list to be sent to the DBAPI's
         # execute() or executemany() method.
 
-        if compiled.positional:
+        if self.execute_style is ExecuteStyle.COPY:
+            # rows for the bulk copy are tuples in column order,
+            # regardless of paramstyle
+            copy_keys = compiled._copy_insert.keys  # type: ignore
+            self.parameters = [
+                tuple(
+                    [
+                        (
+                            flattened_processors[key](compiled_params[key])
+                            if key in flattened_processors
+                            else compiled_params[key]
+                        )
+                        for key in copy_keys
+                    ]
+                )
+                for compiled_params in self.compiled_parameters
+            ]
+        elif compiled.positional:
             core_positional_parameters: MutableSequence[Sequence[Any]] = []
             assert positiontup is not None
             for compiled_params in self.compiled_parameters:
@@ -1613,6 +1690,7 @@ class DefaultExecutionContext(ExecutionContext):
         return self.execute_style in (
             ExecuteStyle.EXECUTEMANY,
             ExecuteStyle.INSERTMANYVALUES,
+            ExecuteStyle.COPY,
         )
 
     @util.memoized_property
@@ -1797,6 +1875,10 @@ class DefaultExecutionContext(ExecutionContext):
 
     @util.non_memoized_property
     def rowcount(self) -> int:
+        if self._pipeline_deferred:
+            # rowcount isn't available until the pipeline is synced
+            self.root_connection._sync_pipeline(run_callbacks=False)
+
         if self._rowcount is not None:
             return self._rowcount
         else:
@@ -1812,6 +1894,43 @@ class DefaultExecutionContext(ExecutionContext):
     def supports_sane_multi_rowcount(self):
         return self.dialect.supports_sane_multi_rowcount
 
+    def _can_defer_in_pipeline(self) -> bool:
+        """Return True if the result of this execution may remain pending
+        within a pipeline, i.e. it is a DML statement that returns no rows
+        and for which only the rowcount is needed."""
+
+        if not self.is_crud or self._is_server_side:
+            return False
+        if self.execute_style is ExecuteStyle.INSERTMANYVALUES:
+            return False
+
+        compiled = cast(SQLCompiler, self.compiled)
+        return not (
+            compiled.effective_returning
+            or compiled.has_out_parameters
+            or (self.isinsert and compiled.postfetch_lastrowid)
+        )
+
+    def _setup_pipeline_result(self):
+        """Set up a result for a DML statement whose result is pending
+        within a pipeline.
+
+        The cursor remains open so that its rowcount may be retrieved once
+        the pipeline is synced, which occurs within
+        :meth:`._complete_pipeline_result`.
+
+        """
+        self._pipeline_deferred = True
+        return _cursor.CursorResult(self, _cursor._NO_CURSOR_DML, None)
+
+    def _complete_pipeline_result(self, result, discard=False):
+        self._pipeline_deferred = False
+        if discard:
+            self._rowcount = -1
+        elif self._rowcount is None:
+            self._rowcount = self.cursor.rowcount
+        result._soft_close()
+
     def _setup_result_proxy(self):
         exec_opt = self.execution_options
 
@@ -1825,10 +1944,13 @@ class DefaultExecutionContext(ExecutionContext):
             yp = exec_opt.get("yield_per", None)
             sr = self._is_server_side or exec_opt.get("stream_results", False)
             strategy = self.cursor_fetch_strategy
-            if sr and strategy is _cursor._DEFAULT_FETCH:
-                strategy = _cursor.BufferedRowCursorFetchStrategy(
-                    self.cursor, self.execution_options
-                )
+            if strategy is _cursor._DEFAULT_FETCH:
+                if exec_opt.get("prefetch") and self._can_prefetch():
+                    strategy = _cursor.PrefetchCursorFetchStrategy(
+                        self.cursor, self.execution_options
+                    )
+                elif sr:
+                    strategy = self._buffered_row_fetch_strategy()
             cursor_description: _DBAPICursorDescription = (
                 strategy.alternate_cursor_description
                 or self.cursor.description
@@ -1854,6 +1976,27 @@ class DefaultExecutionContext(ExecutionContext):
 
         return result
 
+    def _can_prefetch(self):
+        dialect = self.dialect
+        if dialect.supports_threaded_cursor_fetch and not dialect.is_async:
+            return True
+
+        raise exc.ArgumentError(
+            "Dialect %s does not support fetching rows from a background "
+            "thread; the 'prefetch' execution option can't be used"
+            % dialect.name
+        )
+
+    def _buffered_row_fetch_strategy(self):
+        if self.execution_options.get("max_buffer_bytes"):
+            return _cursor.AdaptiveBufferedRowCursorFetchStrategy(
+                self.cursor, self.execution_options
+            )
+        else:
+            return _cursor.BufferedRowCursorFetchStrategy(
+                self.cursor, self.execution_options
+            )
+
     def _setup_out_parameters(self, result):
         compiled = cast(SQLCompiler, self.compiled)
 
@@ -1911,9 +2054,7 @@ class DefaultExecutionContext(ExecutionContext):
             # return an "empty" primary key collection when accessed.
 
         if self._is_server_side and strategy is _cursor._DEFAULT_FETCH:
-            strategy = _cursor.BufferedRowCursorFetchStrategy(
-                self.cursor, self.execution_options
-            )
+            strategy = self._buffered_row_fetch_strategy()
 
         if strategy is _cursor._NO_CURSOR_DML:
             cursor_description = None
@@ -370,6 +370,39 @@ class ConnectionEvents(event.Events[ConnectionEventsTarget]):
 
         """
 
+    def row_buffer_resize(
+        self,
+        conn: Connection,
+        cursor: DBAPICursor,
+        context: ExecutionContext,
+        rows_fetched: int,
+        bytes_fetched: int,
+        new_size: int,
+    ) -> None:
+        """Intercept the sizing of the row buffer used by a result that
+        makes use of the
+        :paramref:`_engine.Connection.execution_options.max_buffer_bytes`
+        execution option.
+
+        The event is invoked each time the row buffer is refilled from the
+        DBAPI cursor, after the approximate size of the rows fetched has
+        been measured and the number of rows to fetch for the next buffer
+        has been chosen.
+
+        :param conn: :class:`_engine.Connection` object
+        :param cursor: DBAPI cursor object
+        :param context: :class:`.ExecutionContext` object in use.
+        :param rows_fetched: number of rows that were just fetched into
+         the buffer.
+        :param bytes_fetched: approximate number of bytes of memory taken
+         up by the rows that were just fetched.
+        :param new_size: number of rows that will be requested from the
+         cursor the next time the buffer is refilled.
+
+        .. versionadded:: 2.1
+
+        """
+
     @event._legacy_signature(
         "2.0", ["conn", "branch"], converter=lambda conn: (conn, False)
     )
@@ -63,10 +63,12 @@ if TYPE_CHECKING:
     from ..sql.compiler import SQLCompiler
     from ..sql.elements import BindParameter
     from ..sql.elements import ClauseElement
+    from ..sql.elements import ColumnElement
     from ..sql.schema import Column
     from ..sql.schema import DefaultGenerator
     from ..sql.schema import SchemaItem
     from ..sql.schema import Sequence as Sequence_SchemaItem
+    from ..sql.selectable import TableClause
     from ..sql.sqltypes import Integer
     from ..sql.type_api import _TypeMemoDict
     from ..sql.type_api import TypeEngine
@@ -105,6 +107,19 @@ class ExecuteStyle(Enum):
 
     """
 
+    COPY = 3
+    """indicates the parameter sets of an INSERT will be delivered using the
+    bulk copy facility of the database, such as PostgreSQL's
+    ``COPY FROM STDIN``, by way of :meth:`.Dialect.do_copy_insert`.
+
+    .. versionadded:: 2.1
+
+    .. seealso::
+
+        :ref:`engine_insert_copy`
+
+    """
+
 
 class DBAPIConnection(Protocol):
     """protocol representing a :pep:`249` database connection.
@@ -267,8 +282,11 @@ class _CoreKnownExecutionOptions(TypedDict, total=False):
     no_parameters: bool
     stream_results: bool
     max_row_buffer: int
+    max_buffer_bytes: int
+    prefetch: int
     yield_per: int
     insertmanyvalues_page_size: int
+    insert_copy: bool
     schema_translate_map: Optional[SchemaTranslateMapType]
     preserve_rowcount: bool
 
@@ -787,6 +805,60 @@ class Dialect(EventTarget):
     """deprecated; indicates if the dialect should attempt to use server
     side cursors by default"""
 
+    default_nulls_first: Optional[bool]
+    """indicates if NULL values are ordered before all other values by an
+    ascending ORDER BY that doesn't indicate NULLS FIRST or NULLS LAST,
+    the reverse being the case for a descending ORDER BY; ``None`` if
+    this is not known.
+
+    This is used when rows that are ordered by the database are merged
+    in Python, such as by the horizontal sharding extension.
+
+    .. versionadded:: 2.1
+
+    """
+
+    supports_threaded_cursor_fetch: bool
+    """indicates if a DBAPI cursor produced by the dialect may have its
+    rows fetched from a thread other than the one in which it was
+    created, as is required by the
+    :paramref:`_engine.Connection.execution_options.prefetch` execution
+    option.
+
+    .. versionadded:: 2.1
+
+    """
+
+    supports_server_side_prepare: bool
+    """indicates if the dialect can direct the DBAPI to use, or not to use,
+    a server-side prepared statement for an individual execution, as is
+    required by the
+    :paramref:`_sa.create_engine.prepared_statement_threshold` parameter.
+
+    .. versionadded:: 2.1
+
+    """
+
+    prepared_statement_threshold: Optional[int]
+    """The number of times a statement is executed from the compiled cache
+    before it's executed using a server-side prepared statement, as set by
+    the :paramref:`_sa.create_engine.prepared_statement_threshold`
+    parameter, or ``None`` if the DBAPI's own behavior is used.
+
+    .. versionadded:: 2.1
+
+    """
+
+    supports_pipeline: bool
+    """indicates if the dialect supports sending statements in a
+    "pipeline", where statements are sent to the database without waiting
+    for the result of each one, as is used by
+    :meth:`_engine.Connection.pipeline`.
+
+    .. versionadded:: 2.1
+
+    """
+
     supports_sane_rowcount: bool
     """Indicate whether the dialect properly implements rowcount for
       ``UPDATE`` and ``DELETE`` statements.
@@ -899,6 +971,21 @@ class Dialect(EventTarget):
 
     """
 
+    supports_copy_insert: bool
+    """if True, the dialect implements :meth:`.Dialect.do_copy_insert`, so
+    that INSERT statements executed with many parameter sets may be
+    delivered using the bulk copy facility of the database when the
+    :paramref:`_engine.Connection.execution_options.insert_copy` execution
+    option is used.
+
+    .. versionadded:: 2.1
+
+    .. seealso::
+
+        :ref:`engine_insert_copy`
+
+    """
+
     insertmanyvalues_implicit_sentinel: InsertmanyvaluesSentinelOpts
     """Options indicating the database supports a form of bulk INSERT where
     the autoincrement integer primary key can be reliably used as an ordering
@@ -927,6 +1014,15 @@ class Dialect(EventTarget):
 
     """  # noqa: E501
 
+    in_clause_padding: bool
+    """if True, lists of values passed to "expanding" IN parameters are
+    padded to the next power of two in length, as set by the
+    :paramref:`_sa.create_engine.in_clause_padding` parameter.
+
+    .. versionadded:: 2.1
+
+    """
+
     insertmanyvalues_max_parameters: int
     """Alternate to insertmanyvalues_page_size, will additionally limit
     page size based on number of parameters total in the statement.
@@ -2007,6 +2103,34 @@ class Dialect(EventTarget):
         usable."""
         raise NotImplementedError()
 
+    def do_pipeline(self, dbapi_connection: DBAPIConnection) -> Any:
+        """Return a context manager which places the given DBAPI connection
+        into pipeline mode for its duration.
+
+        The object returned by entering the context manager is passed to
+        :meth:`.Dialect.do_pipeline_sync`.  Exiting the context manager
+        is expected to sync the pipeline and leave pipeline mode.
+
+        This hook is called by :meth:`_engine.Connection.pipeline` for
+        dialects where :attr:`.Dialect.supports_pipeline` is ``True``.
+
+        .. versionadded:: 2.1
+
+        """
+        raise NotImplementedError()
+
+    def do_pipeline_sync(self, pipeline: Any) -> None:
+        """Sync a pipeline established by :meth:`.Dialect.do_pipeline`,
+        waiting for the results of all statements sent so far.
+
+        An error raised by any of those statements is expected to be raised
+        by this method.
+
+        .. versionadded:: 2.1
+
+        """
+        raise NotImplementedError()
+
     def do_set_input_sizes(
         self,
         cursor: DBAPICursor,
@@ -2172,6 +2296,41 @@ class Dialect(EventTarget):
 
         raise NotImplementedError()
 
+    def do_copy_insert(
+        self,
+        cursor: DBAPICursor,
+        table: TableClause,
+        columns: Sequence[ColumnElement[Any]],
+        rows: Sequence[Sequence[Any]],
+        context: ExecutionContext,
+    ) -> None:
+        """Insert the given rows into a table using the bulk copy facility
+        of the database, such as PostgreSQL's ``COPY FROM STDIN``.
+
+        This method is used for :attr:`.ExecuteStyle.COPY` executions,
+        for dialects where :attr:`.Dialect.supports_copy_insert` is
+        ``True``.
+
+        :param cursor: DBAPI cursor.
+
+        :param table: the :class:`_sql.TableClause` that's the target of
+         the INSERT statement.
+
+        :param columns: the columns which receive a value from each row.
+
+        :param rows: a sequence of tuples, one for each parameter set,
+         each of which contains one value per column, in the same order as
+         ``columns``.  The values have already been converted by the bind
+         processors of their datatypes.
+
+        :param context: the :class:`.ExecutionContext` in use.
+
+        .. versionadded:: 2.1
+
+        """
+
+        raise NotImplementedError()
+
     def do_execute(
         self,
         cursor: DBAPICursor,
@@ -2945,6 +3104,21 @@ class ExecutionContext:
     no_parameters: bool
     """True if the execution style does not use parameters"""
 
+    prepare_statement: Optional[bool]
+    """True if the statement should be executed using a server-side prepared
+    statement, False if it should not, or ``None`` to use the DBAPI's own
+    behavior.
+
+    This is set for compiled statements when the
+    :paramref:`_sa.create_engine.prepared_statement_threshold` parameter is
+    in use, and is consulted by dialects that set
+    :attr:`.Dialect.supports_server_side_prepare` within methods such as
+    :meth:`.Dialect.do_execute`.
+
+    .. versionadded:: 2.1
+
+    """
+
     isinsert: bool
     """True if the statement is an INSERT."""
 
@@ -3048,6 +3222,17 @@ class ExecutionContext:
     def _setup_result_proxy(self) -> CursorResult[Any]:
         raise NotImplementedError()
 
+    def _can_defer_in_pipeline(self) -> bool:
+        raise NotImplementedError()
+
+    def _setup_pipeline_result(self) -> CursorResult[Any]:
+        raise NotImplementedError()
+
+    def _complete_pipeline_result(
+        self, result: CursorResult[Any], discard: bool = False
+    ) -> None:
+        raise NotImplementedError()
+
     def fire_sequence(self, seq: Sequence_SchemaItem, type_: Integer) -> int:
         """given a :class:`.Sequence`, invoke it and return the next int
         value"""
@@ -15,24 +15,65 @@ They all share one common characteristic: None is passed through unchanged.
 from __future__ import annotations
 
 import datetime
+from typing import Any
 from typing import Callable
+from typing import Dict
+from typing import List
 from typing import Optional
 from typing import Pattern
+from typing import Sequence
 from typing import TypeVar
 from typing import Union
 
 from ._processors_cy import int_to_boolean as int_to_boolean  # noqa: F401
+from ._processors_cy import int_to_boolean_batch
 from ._processors_cy import str_to_date as str_to_date  # noqa: F401
+from ._processors_cy import str_to_date_batch
 from ._processors_cy import str_to_datetime as str_to_datetime  # noqa: F401
+from ._processors_cy import str_to_datetime_batch
 from ._processors_cy import str_to_time as str_to_time  # noqa: F401
+from ._processors_cy import str_to_time_batch
 from ._processors_cy import to_float as to_float  # noqa: F401
+from ._processors_cy import to_float_batch
 from ._processors_cy import to_str as to_str  # noqa: F401
+from ._processors_cy import to_str_batch
 
 if True:
     from ._processors_cy import (  # noqa: F401
         to_decimal_processor_factory as to_decimal_processor_factory,
     )
 
+_BatchProcessorType = Callable[[Sequence[Any]], List[Any]]
+
+_batch_processors: Dict[Callable[[Any], Any], _BatchProcessorType] = {
+    int_to_boolean: int_to_boolean_batch,
+    to_str: to_str_batch,
+    to_float: to_float_batch,
+    str_to_datetime: str_to_datetime_batch,
+    str_to_time: str_to_time_batch,
+    str_to_date: str_to_date_batch,
+}
+
+
+def batch_processor(
+    processor: Callable[[Any], Any]
+) -> Optional[_BatchProcessorType]:
+    """Return the batch form of the given result processor, if any.
+
+    A batch processor accepts a sequence of values for a single column,
+    such as those of a chunk of rows delivered by ``cursor.fetchmany()``,
+    and returns a list of the converted values, with the same result as
+    calling the processor for each value individually.
+
+    """
+    if isinstance(processor, to_decimal_processor_factory):
+        return processor.process_batch
+    try:
+        return _batch_processors.get(processor)
+    except TypeError:
+        # unhashable processor
+        return None
+
 
 _DT = TypeVar(
     "_DT", bound=Union[datetime.datetime, datetime.time, datetime.date]
@@ -9,10 +9,15 @@
 
 from __future__ import annotations
 
+import array
 from enum import Enum
 import functools
+import heapq
 import itertools
 import operator
+import pickle
+import struct
+import sys
 import typing
 from typing import Any
 from typing import Callable
@@ -34,10 +39,12 @@ from typing import TypeVar
 from typing import Union
 
 from ._util_cy import tuplegetter as tuplegetter
+from .processors import batch_processor
 from .row import Row
 from .row import RowMapping
 from .. import exc
 from .. import util
+from ..sql import util as sql_util
 from ..sql.base import _generative
 from ..sql.base import HasMemoized
 from ..sql.base import InPlaceGenerative
@@ -393,6 +400,55 @@ def result_tuple(
     )
 
 
+_column_array_typecodes = {
+    frozenset([int]): "q",
+    frozenset([float]): "d",
+}
+
+
+def _process_column(
+    proc: _ResultProcessorType[Any], values: Sequence[Any]
+) -> List[Any]:
+    """apply a result processor to a sequence of values for a single
+    column, using the processor's batch form if it has one.
+
+    """
+    batch = batch_processor(proc)
+    if batch is not None:
+        return batch(values)
+    else:
+        return list(map(proc, values))
+
+
+def _as_column_array(values: Sequence[Any], as_numpy: bool) -> Sequence[Any]:
+    """convert a sequence of column values into a compact array, if all
+    values are of a single primitive type, else a list.
+
+    """
+    column: Sequence[Any]
+
+    typecode = _column_array_typecodes.get(frozenset(map(type, values)))
+    if typecode is not None:
+        try:
+            column = array.array(typecode, values)
+        except OverflowError:
+            column = list(values)
+    else:
+        column = list(values)
+
+    if as_numpy:
+        import numpy
+
+        if isinstance(column, array.array):
+            return numpy.frombuffer(column, dtype=column.typecode)  # type: ignore  # noqa: E501
+        else:
+            arr = numpy.empty(len(column), dtype=object)
+            arr[:] = column
+            return arr  # type: ignore[no-any-return]
+
+    return column
+
+
 # a symbol that indicates to internal Result methods that
 # "no row is returned".  We can't use None for those cases where a scalar
 # filter is applied to rows.
@@ -465,6 +521,9 @@ class ResultInternal(InPlaceGenerative, Generic[_R]):
                         metadata, processors, key_to_index, (scalar_obj,)
                     )
 
+        elif not self._generate_rows and not self._post_creational_filter:
+            return self._scalar_getter
+
         else:
             process_row = Row  # type: ignore
 
@@ -501,6 +560,129 @@ class ResultInternal(InPlaceGenerative, Generic[_R]):
 
         return make_row
 
+    @HasMemoized_ro_memoized_attribute
+    def _rows_getter(self) -> Optional[Callable[[List[Any]], List[_R]]]:
+        """return a callable that converts a list of raw rows, such as
+        a chunk delivered by ``cursor.fetchmany()``, into a list of result
+        objects.
+
+        Result processors which provide a batch form, see
+        :func:`.processors.batch_processor`, are invoked once per column
+        for the whole list of rows, rather than once per value.
+
+        """
+        make_row = self._row_getter
+
+        if make_row is None:
+            return None
+
+        batch_rows = self._batch_rows_getter
+        if batch_rows is not None:
+            return batch_rows
+
+        def make_rows(rows: List[Any]) -> List[_R]:
+            return [make_row(row) for row in rows]
+
+        return make_rows
+
+    @property
+    def _batch_rows_getter(
+        self,
+    ) -> Optional[Callable[[List[Any]], List[_R]]]:
+        real_result: Result[Unpack[TupleAny]] = (
+            self._real_result
+            if self._real_result
+            else cast("Result[Unpack[TupleAny]]", self)
+        )
+
+        if real_result._source_supports_scalars:
+            return None
+
+        metadata = self._metadata
+        processors = metadata._effective_processors
+        if not processors:
+            return None
+
+        num_columns = len(processors)
+        tf = metadata._tuplefilter
+        if tf:
+            processors = tf(processors)
+
+        column_processors = [
+            (index, proc, batch_processor(proc))
+            for index, proc in enumerate(processors)
+            if proc is not None
+        ]
+        if not any(batch for _, _, batch in column_processors):
+            return None
+
+        def process_columns(rows: List[Any]) -> List[Any]:
+            columns: List[Any] = list(zip(*rows))
+            if tf:
+                columns = list(tf(columns))
+            else:
+                # omit sentinel columns, if any
+                del columns[num_columns:]
+
+            for index, proc, batch in column_processors:
+                if batch is not None:
+                    columns[index] = batch(columns[index])
+                else:
+                    columns[index] = [proc(value) for value in columns[index]]
+            return columns
+
+        if not self._generate_rows and not self._post_creational_filter:
+            # scalar values, see _scalar_getter
+
+            def make_scalars(rows: List[Any]) -> List[_R]:
+                if not rows:
+                    return []
+                return process_columns(rows)[0]  # type: ignore
+
+            return make_scalars
+
+        make_row = functools.partial(
+            Row, metadata, None, metadata._key_to_index
+        )
+        log_row = real_result._row_logging_fn
+
+        def make_rows(rows: List[Any]) -> List[_R]:
+            if not rows:
+                return []
+            made_rows = [
+                make_row(data) for data in zip(*process_columns(rows))
+            ]
+            if log_row:
+                made_rows = [log_row(row) for row in made_rows]
+            return made_rows  # type: ignore
+
+        return make_rows
+
+    @property
+    def _scalar_getter(self) -> Callable[..., _R]:
+        """return a callable that retrieves a single, processed column
+        value from a raw row, without creating an intermediary
+        :class:`_engine.Row`.
+
+        """
+        metadata = self._metadata
+
+        if metadata._translated_indexes:
+            index = metadata._translated_indexes[0]
+        else:
+            index = 0
+
+        processors = metadata._effective_processors
+        proc = processors[index] if processors else None
+
+        if proc is None:
+            return operator.itemgetter(index)
+
+        def get_scalar(row: _InterimRowType[Row[Unpack[TupleAny]]]) -> _R:
+            return proc(row[index])  # type: ignore
+
+        return get_scalar
+
     @HasMemoized_ro_memoized_attribute
     def _iterator_getter(self) -> Callable[..., Iterator[_R]]:
         make_row = self._row_getter
@@ -537,20 +719,20 @@ class ResultInternal(InPlaceGenerative, Generic[_R]):
         return iterrows
 
     def _raw_all_rows(self) -> List[_R]:
-        make_row = self._row_getter
-        assert make_row is not None
+        make_rows = self._rows_getter
+        assert make_rows is not None
         rows = self._fetchall_impl()
-        return [make_row(row) for row in rows]
+        return make_rows(rows)
 
     def _allrows(self) -> List[_R]:
         post_creational_filter = self._post_creational_filter
 
-        make_row = self._row_getter
+        make_rows = self._rows_getter
 
         rows = self._fetchall_impl()
         made_rows: List[_InterimRowType[_R]]
-        if make_row:
-            made_rows = [make_row(row) for row in rows]
+        if make_rows:
+            made_rows = make_rows(rows)  # type: ignore
         else:
             made_rows = rows  # type: ignore
 
@@ -627,7 +809,7 @@ class ResultInternal(InPlaceGenerative, Generic[_R]):
 
     @HasMemoized_ro_memoized_attribute
     def _manyrow_getter(self) -> Callable[..., List[_R]]:
-        make_row = self._row_getter
+        make_rows = self._rows_getter
 
         post_creational_filter = self._post_creational_filter
 
@@ -635,13 +817,13 @@ class ResultInternal(InPlaceGenerative, Generic[_R]):
             uniques, strategy = self._unique_strategy
 
             def filterrows(
-                make_row: Optional[Callable[..., _R]],
+                make_rows: Optional[Callable[[List[Any]], List[_R]]],
                 rows: List[Any],
                 strategy: Optional[Callable[[List[Any]], Any]],
                 uniques: Set[Any],
             ) -> List[_R]:
-                if make_row:
-                    rows = [make_row(row) for row in rows]
+                if make_rows:
+                    rows = make_rows(rows)
 
                 if strategy:
                     made_rows = (
@@ -678,9 +860,9 @@ class ResultInternal(InPlaceGenerative, Generic[_R]):
                     else:
                         rows = _manyrows(num)
                         num = len(rows)
-                        assert make_row is not None
+                        assert make_rows is not None
                         collect.extend(
-                            filterrows(make_row, rows, strategy, uniques)
+                            filterrows(make_rows, rows, strategy, uniques)
                         )
                         num_required = num - len(collect)
                 else:
@@ -694,7 +876,7 @@ class ResultInternal(InPlaceGenerative, Generic[_R]):
                         break
 
                     collect.extend(
-                        filterrows(make_row, rows, strategy, uniques)
+                        filterrows(make_rows, rows, strategy, uniques)
                     )
                     num_required = num - len(collect)
 
@@ -716,8 +898,8 @@ class ResultInternal(InPlaceGenerative, Generic[_R]):
                     num = real_result._yield_per
 
                 rows: List[_InterimRowType[Any]] = self._fetchmany_impl(num)
-                if make_row:
-                    rows = [make_row(row) for row in rows]
+                if make_rows:
+                    rows = make_rows(rows)
                 if post_creational_filter:
                     rows = [post_creational_filter(row) for row in rows]
                 return rows  # type: ignore
@@ -873,7 +1055,17 @@ class ResultInternal(InPlaceGenerative, Generic[_R]):
                 if self._metadata._tuplefilter:
                     filters = self._metadata._tuplefilter(filters)
 
-                strategy = operator.methodcaller("_filter_on_values", filters)
+                if (
+                    not self._generate_rows
+                    and not self._post_creational_filter
+                ):
+                    # scalar values are produced directly from raw rows,
+                    # see _row_getter
+                    strategy = filters[0]
+                else:
+                    strategy = operator.methodcaller(
+                        "_filter_on_values", filters
+                    )
         return uniques, strategy
 
 
@@ -941,6 +1133,8 @@ class Result(_WithKeys, ResultInternal[Row[Unpack[_Ts]]]):
 
     _attributes: util.immutabledict[Any, Any] = util.immutabledict()
 
+    _default_nulls_first: Optional[bool] = None
+
     def __init__(self, cursor_metadata: ResultMetaData):
         self._metadata = cursor_metadata
 
@@ -1269,6 +1463,16 @@ class Result(_WithKeys, ResultInternal[Row[Unpack[_Ts]]]):
         """
         raise NotImplementedError()
 
+    def _has_buffered_rows(self) -> bool:
+        """Return True if the next row can be delivered from a local
+        buffer without emitting IO on the underlying cursor.
+
+        This is used by the asyncio extension in order to skip the
+        greenlet context switch for rows that are already buffered.
+
+        """
+        return False
+
     def __iter__(self) -> Iterator[Row[Unpack[_Ts]]]:
         return self._iter_impl()
 
@@ -1383,6 +1587,120 @@ class Result(_WithKeys, ResultInternal[Row[Unpack[_Ts]]]):
 
         return self._manyrow_getter(self, size)
 
+    def fetch_columnar(
+        self, size: Optional[int] = None, *, as_numpy: bool = False
+    ) -> Optional[Tuple[Sequence[Any], ...]]:
+        """Fetch the next chunk of rows, returned as a tuple of columns
+        rather than a sequence of :class:`_engine.Row` objects.
+
+        Each element of the returned tuple contains the values for one column
+        of the chunk, in the same order as :meth:`_engine.Result.keys`.
+        Columns consisting only of ``int`` values are delivered as an
+        ``array.array`` of typecode ``"q"``, columns consisting only of
+        ``float`` values as an ``array.array`` of typecode ``"d"``; all other
+        columns, including those that contain ``None``, are delivered as
+        plain lists.   Result processors are applied one column at a time
+        and no :class:`_engine.Row` objects are created.
+
+        E.g.::
+
+            result = conn.execution_options(yield_per=10000).execute(stmt)
+            while (chunk := result.fetch_columnar()) is not None:
+                ids, amounts = chunk
+                ...
+
+        When all rows are exhausted, returns ``None``.
+
+        .. versionadded:: 2.1
+
+        :param size: maximum number of rows to be present in the chunk.
+         If None, makes use of the value set by
+         :meth:`_engine.Result.yield_per`, or the
+         :meth:`_engine.Result.fetchmany` default otherwise.
+
+        :param as_numpy: if True, each column is returned as a
+         ``numpy.ndarray``; the ``array.array`` columns are wrapped without
+         copying using ``numpy.frombuffer()``, other columns use an
+         ``object`` dtype.  Requires that NumPy is installed.
+
+        .. seealso::
+
+            :meth:`_engine.Result.columns_as_arrays`
+
+            :ref:`engine_stream_results`
+
+        """
+        self._assert_no_unique_for_columnar()
+
+        if size is None:
+            size = self._yield_per
+
+        rows = self._fetchmany_impl(size)
+        if not rows:
+            return None
+        return self._columnar_from_rows(rows, as_numpy)
+
+    def columns_as_arrays(
+        self, *, as_numpy: bool = False
+    ) -> Tuple[Sequence[Any], ...]:
+        """Fetch all remaining rows, returned as a tuple of columns.
+
+        This is the columnar version of :meth:`_engine.Result.all`; see
+        :meth:`_engine.Result.fetch_columnar` for a description of the
+        column formats delivered.   If no rows remain, a tuple of empty
+        lists is returned.
+
+        Closes the result set after invocation.
+
+        .. versionadded:: 2.1
+
+        :param as_numpy: if True, each column is returned as a
+         ``numpy.ndarray``.
+
+        .. seealso::
+
+            :meth:`_engine.Result.fetch_columnar`
+
+        """
+        self._assert_no_unique_for_columnar()
+        return self._columnar_from_rows(self._fetchall_impl(), as_numpy)
+
+    def _assert_no_unique_for_columnar(self) -> None:
+        if self._unique_filter_state:
+            raise exc.InvalidRequestError(
+                "Columnar fetching can't be combined with Result.unique()"
+            )
+
+    def _columnar_from_rows(
+        self, rows: Sequence[Any], as_numpy: bool
+    ) -> Tuple[Sequence[Any], ...]:
+        metadata = self._metadata
+        processors = metadata._effective_processors
+
+        columns: Sequence[Sequence[Any]]
+        if self._source_supports_scalars:
+            columns = [rows]
+        elif not rows:
+            columns = [() for _ in metadata._keys]
+        elif metadata._tuplefilter:
+            tf = metadata._tuplefilter
+            columns = tf(list(zip(*rows)))
+            if processors:
+                processors = tf(processors)
+        else:
+            # rows may contain additional trailing columns not present
+            # in the metadata, such as the sentinel columns of an
+            # insertmanyvalues batch
+            columns = list(zip(*rows))[0 : len(metadata._keys)]
+
+        if processors:
+            columns = [
+                col if proc is None else _process_column(proc, col)
+                for proc, col in zip(processors, columns)
+            ]
+
+        return tuple(_as_column_array(col, as_numpy) for col in columns)
+
     def all(self) -> Sequence[Row[Unpack[_Ts]]]:
         """Return all rows in a sequence.
 
@@ -1593,7 +1911,11 @@ class Result(_WithKeys, ResultInternal[Row[Unpack[_Ts]]]):
         return FrozenResult(self)
 
     def merge(
-        self, *others: Result[Unpack[TupleAny]]
+        self,
+        *others: Result[Unpack[TupleAny]],
+        order_by: Optional[Sequence[Any]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
     ) -> MergedResult[Unpack[TupleAny]]:
         """Merge this :class:`_engine.Result` with other compatible result
         objects.
@@ -1607,8 +1929,57 @@ class Result(_WithKeys, ResultInternal[Row[Unpack[_Ts]]]):
         set of result / cursor metadata, otherwise the behavior is
         undefined.
 
+        :param order_by: a sequence of keys by which the rows of each
+         result are already ordered, such as the ORDER BY expressions of the
+         statement that produced them.  Each key is any value accepted by
+         :attr:`_engine.Row._mapping`, such as a string name, integer index
+         or :class:`_schema.Column`, and may be given in terms of
+         :func:`_sql.desc`, :func:`_sql.nulls_first` and
+         :func:`_sql.nulls_last`.   When present, rows are merged
+         incrementally in order among all the results, rather than returning
+         the rows of each result one result after the other.   Values are
+         compared using Python comparison, which must agree with the
+         ordering used by the database, such as for string collations.
+         Where NULLS FIRST or NULLS LAST is not indicated, ``None`` is
+         ordered as per the :attr:`.Dialect.default_nulls_first` attribute
+         of the dialect which produced this result; if this is not known,
+         as is the case for results that don't originate from a cursor,
+         an :class:`.InvalidRequestError` is raised if a ``None`` value
+         is to be ordered.
+
+         .. versionadded:: 2.1
+
+        :param limit: maximum number of rows to be returned by the merged
+         result.  Once this many rows have been returned, no further rows
+         are fetched from the results being merged.
+
+         .. versionadded:: 2.1
+
+        :param offset: number of rows of the merged result to be skipped
+         before rows are returned.
+
+         .. versionadded:: 2.1
+
         """
-        return MergedResult(self._metadata, (self,) + others)
+        sort_key: Optional[Callable[[Row[Unpack[TupleAny]]], Any]]
+        if order_by:
+            orderings = []
+            for elem in order_by:
+                key, descending, nulls_first = sql_util.unwrap_ordering(elem)
+                getter = self._metadata._getter(key)
+                assert getter is not None
+                orderings.append((getter, descending, nulls_first))
+            sort_key = _merge_sort_key(orderings, self._default_nulls_first)
+        else:
+            sort_key = None
+
+        return MergedResult(
+            self._metadata,
+            (self,) + others,
+            sort_key=sort_key,
+            limit=limit,
+            offset=offset,
+        )
 
 
 class FilterResult(ResultInternal[_R]):
@@ -1743,7 +2114,13 @@ class ScalarResult(FilterResult[_R]):
             self._post_creational_filter = None
         else:
             self._metadata = real_result._metadata._reduce([index])
-            self._post_creational_filter = operator.itemgetter(0)
+            if real_result._row_logging_fn:
+                # rows are logged, so need to be created in full
+                self._post_creational_filter = operator.itemgetter(0)
+            else:
+                # scalar values are retrieved from raw rows directly
+                # without creating Row objects; see _row_getter
+                self._post_creational_filter = None
 
         self._unique_filter_state = real_result._unique_filter_state
 
@@ -2186,6 +2563,9 @@ class FrozenResult(Generic[Unpack[_Ts]]):
         :func:`_orm.loading.merge_frozen_result` - ORM function to merge
         a frozen result back into a :class:`_orm.Session`.
 
+        :class:`_engine.ColumnarFrozenResult` - stores data column by column
+        in a compact form that may be loaded from shared memory.
+
     """
 
     data: Sequence[Any]
@@ -2229,6 +2609,215 @@ class FrozenResult(Generic[Unpack[_Ts]]):
         return result
 
 
+_COLUMNAR_MAGIC = b"SAFR"
+_COLUMNAR_VERSION = 1
+
+# magic, version, byteorder ("<" or ">"), header length
+_columnar_preamble = struct.Struct("<4sBcxxQ")
+
+
+def _align(offset: int) -> int:
+    return offset + (-offset % 8)
+
+
+class ColumnarFrozenResult(FrozenResult[Unpack[_Ts]]):
+    """A :class:`_engine.FrozenResult` that stores its data column by
+    column, and which may be serialized to a compact binary form that
+    is loaded without copying numeric data.
+
+    Columns which consist entirely of integer or floating point values
+    are stored as packed arrays, in the same way as with
+    :meth:`_engine.Result.columns_as_arrays`; all other columns are
+    stored as lists of objects.
+
+    The :meth:`_engine.ColumnarFrozenResult.dumps` method returns the
+    serialized form as bytes, and the
+    :meth:`_engine.ColumnarFrozenResult.loads` method accepts any object
+    supporting the buffer protocol, such as ``bytes``, a :class:`mmap.mmap`,
+    or the ``buf`` of a :class:`multiprocessing.shared_memory.SharedMemory`.
+    Packed columns of the loaded result refer to the given buffer directly,
+    so that a result written to a file or shared memory segment once may be
+    used by several processes, each of which don't hold their own copy of
+    the numeric data::
+
+        frozen = ColumnarFrozenResult(connection.execute(query))
+
+        with open("/dev/shm/report_cache", "wb") as file_:
+            file_.write(frozen.dumps())
+
+        # in another process
+        with open("/dev/shm/report_cache", "rb") as file_:
+            buf = mmap.mmap(file_.fileno(), 0, access=mmap.ACCESS_READ)
+
+        frozen = ColumnarFrozenResult.loads(buf)
+        rows = frozen().all()
+
+    As the loaded result refers to the buffer, the buffer may not be
+    released or closed while the result is in use.
+
+    :class:`_engine.ColumnarFrozenResult` objects are also picklable, using
+    the same serialized form, and may be passed to
+    :func:`_orm.loading.merge_frozen_result` in the same way as a
+    :class:`_engine.FrozenResult`.
+
+    .. versionadded:: 2.1
+
+    """
+
+    _columns: Sequence[Sequence[Any]]
+
+    def __init__(self, result: Result[Unpack[_Ts]]):
+        self.metadata = result._metadata._for_freeze()
+        self._source_supports_scalars = result._source_supports_scalars
+        self._attributes = result._attributes
+
+        columns: Sequence[Sequence[Any]]
+        if self._source_supports_scalars:
+            columns = [list(result._raw_row_iterator())]
+        else:
+            rows = result.fetchall()
+            if rows:
+                columns = list(zip(*rows))
+            else:
+                columns = [() for _ in self.metadata._keys]
+
+        self._columns = [_as_column_array(col, False) for col in columns]
+
+    @property
+    def data(self) -> Sequence[Any]:  # type: ignore[override]
+        if self._source_supports_scalars:
+            return list(self._columns[0])
+        else:
+            return list(zip(*self._columns))
+
+    def rewrite_rows(self) -> Sequence[Sequence[Any]]:
+        if self._source_supports_scalars:
+            return [[elem] for elem in self._columns[0]]
+        else:
+            return [list(row) for row in zip(*self._columns)]
+
+    def __call__(self) -> Result[Unpack[_Ts]]:
+        iterator: Iterator[Any]
+        if self._source_supports_scalars:
+            iterator = iter(self._columns[0])
+        else:
+            iterator = zip(*self._columns)
+
+        result: IteratorResult[Unpack[_Ts]] = IteratorResult(
+            self.metadata, iterator
+        )
+        result._attributes = self._attributes
+        result._source_supports_scalars = self._source_supports_scalars
+        return result
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (ColumnarFrozenResult.loads, (self.dumps(),))
+
+    def dumps(self) -> bytes:
+        """Return the serialized form of this
+        :class:`_engine.ColumnarFrozenResult`.
+
+        .. seealso::
+
+            :meth:`_engine.ColumnarFrozenResult.loads`
+
+        """
+        descriptors: List[Any] = []
+        buffers: List[Tuple[int, memoryview]] = []
+        offset = 0
+
+        for column in self._columns:
+            if isinstance(column, (array.array, memoryview)):
+                raw = memoryview(column)
+                offset = _align(offset)
+                descriptors.append(("a", raw.format, offset, raw.nbytes))
+                buffers.append((offset, raw.cast("B")))
+                offset += raw.nbytes
+            else:
+                descriptors.append(("o", list(column)))
+
+        header = pickle.dumps(
+            {
+                "metadata": self.metadata,
+                "attributes": self._attributes,
+                "scalars": self._source_supports_scalars,
+                "columns": descriptors,
+            },
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+
+        header_start = _columnar_preamble.size
+        data_start = _align(header_start + len(header))
+        out = bytearray(data_start + offset)
+        _columnar_preamble.pack_into(
+            out,
+            0,
+            _COLUMNAR_MAGIC,
+            _COLUMNAR_VERSION,
+            b"<" if sys.byteorder == "little" else b">",
+            len(header),
+        )
+        out[header_start : header_start + len(header)] = header
+        for start, raw in buffers:
+            out[data_start + start : data_start + start + raw.nbytes] = raw
+
+        return bytes(out)
+
+    @classmethod
+    def loads(cls, buffer: Any) -> ColumnarFrozenResult[Unpack[TupleAny]]:
+        """Load a :class:`_engine.ColumnarFrozenResult` from the serialized
+        form returned by :meth:`_engine.ColumnarFrozenResult.dumps`.
+
+        :param buffer: an object supporting the buffer protocol, such as
+         ``bytes``, :class:`mmap.mmap` or :class:`memoryview`.   Packed
+         columns of the returned result refer to this buffer without
+         copying it, if the buffer was produced on a platform of the same
+         byte order.
+
+        """
+        view = memoryview(buffer).cast("B")
+
+        try:
+            magic, version, byteorder, header_len = (
+                _columnar_preamble.unpack_from(view)
+            )
+        except struct.error:
+            magic = version = None
+
+        if magic != _COLUMNAR_MAGIC or version != _COLUMNAR_VERSION:
+            raise exc.ArgumentError(
+                "Buffer does not contain a serialized ColumnarFrozenResult"
+            )
+
+        header_start = _columnar_preamble.size
+        header = pickle.loads(view[header_start : header_start + header_len])
+        data_start = _align(header_start + header_len)
+        native = byteorder == (b"<" if sys.byteorder == "little" else b">")
+
+        columns: List[Sequence[Any]] = []
+        for descriptor in header["columns"]:
+            if descriptor[0] == "o":
+                columns.append(descriptor[1])
+                continue
+
+            _, typecode, offset, nbytes = descriptor
+            raw = view[data_start + offset : data_start + offset + nbytes]
+            if native:
+                columns.append(raw.cast(typecode))
+            else:
+                column = array.array(typecode)
+                column.frombytes(raw)
+                column.byteswap()
+                columns.append(column)
+
+        fr: ColumnarFrozenResult[Unpack[TupleAny]] = cls.__new__(cls)
+        fr.metadata = header["metadata"]
+        fr._attributes = header["attributes"]
+        fr._source_supports_scalars = header["scalars"]
+        fr._columns = columns
+        return fr
+
+
 class IteratorResult(Result[Unpack[_Ts]]):
     """A :class:`_engine.Result` that gets data from a Python iterator of
     :class:`_engine.Row` objects or similar row-like data.
@@ -2313,6 +2902,11 @@ class IteratorResult(Result[Unpack[_Ts]]):
 
         return list(itertools.islice(self.iterator, 0, size))
 
+    def _has_buffered_rows(self) -> bool:
+        # list and tuple iterators report their exact remaining length;
+        # generators and other lazy iterators report zero
+        return operator.length_hint(self.iterator) > 0
+
 
 def null_result() -> IteratorResult[Any]:
     return IteratorResult(SimpleResultMetaData([]), iter([]))
@@ -2348,9 +2942,29 @@ class ChunkedIteratorResult(IteratorResult[Unpack[_Ts]]):
         self.chunks = chunks
         self._source_supports_scalars = source_supports_scalars
         self.raw = raw
-        self.iterator = itertools.chain.from_iterable(self.chunks(None))
+        self.iterator = itertools.chain.from_iterable(
+            self._track_chunks(None)
+        )
         self.dynamic_yield_per = dynamic_yield_per
 
+    def _track_chunks(
+        self, size: Optional[int]
+    ) -> Iterator[Iterator[_InterimRowType[_R]]]:
+        # hold onto the iterator of the chunk currently being consumed
+        # so that _has_buffered_rows() can tell when the next row is
+        # already in memory.  a list is used so that generative copies
+        # sharing the same iterator also share the same chunk
+        self._current_chunk = current = [iter(())]
+
+        def track(
+            chunks: Iterator[Sequence[_InterimRowType[_R]]],
+        ) -> Iterator[Iterator[_InterimRowType[_R]]]:
+            for chunk in chunks:
+                current[0] = it = iter(chunk)
+                yield it
+
+        return track(self.chunks(size))
+
     @_generative
     def yield_per(self, num: int) -> Self:
         # TODO: this throws away the iterator which may be holding
@@ -2360,20 +2974,26 @@ class ChunkedIteratorResult(IteratorResult[Unpack[_Ts]]):
         # keep track.
 
         self._yield_per = num
-        self.iterator = itertools.chain.from_iterable(self.chunks(num))
+        self.iterator = itertools.chain.from_iterable(self._track_chunks(num))
         return self
 
     def _soft_close(self, hard: bool = False, **kw: Any) -> None:
         super()._soft_close(hard=hard, **kw)
         self.chunks = lambda size: []  # type: ignore
+        self._current_chunk = [iter(())]
 
     def _fetchmany_impl(
         self, size: Optional[int] = None
     ) -> List[_InterimRowType[Row[Unpack[TupleAny]]]]:
         if self.dynamic_yield_per:
-            self.iterator = itertools.chain.from_iterable(self.chunks(size))
+            self.iterator = itertools.chain.from_iterable(
+                self._track_chunks(size)
+            )
         return super()._fetchmany_impl(size=size)
 
+    def _has_buffered_rows(self) -> bool:
+        return operator.length_hint(self._current_chunk[0]) > 0
+
 
 class MergedResult(IteratorResult[Unpack[_Ts]]):
     """A :class:`_engine.Result` that is merged from any number of
@@ -2392,14 +3012,40 @@ class MergedResult(IteratorResult[Unpack[_Ts]]):
         self,
         cursor_metadata: ResultMetaData,
         results: Sequence[Result[Unpack[_Ts]]],
+        *,
+        sort_key: Optional[Callable[[Row[Unpack[TupleAny]]], Any]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
     ):
         self._results = results
-        super().__init__(
-            cursor_metadata,
-            itertools.chain.from_iterable(
+
+        iterator: Iterator[_InterimSupportsScalarsRowType]
+        if sort_key is not None:
+            # a k-way merge; each result is consumed only as far as
+            # needed to produce the next row
+            iterator = map(
+                operator.itemgetter(1),
+                heapq.merge(
+                    *[self._keyed_rows(r, sort_key) for r in results],
+                    key=operator.itemgetter(0),
+                ),
+            )
+        else:
+            iterator = itertools.chain.from_iterable(
                 r._raw_row_iterator() for r in results
-            ),
-        )
+            )
+
+        if limit is not None or offset is not None:
+            start = offset or 0
+            stop = start + limit if limit is not None else None
+            if results[0]._unique_filter_state:
+                # rows that repeat, such as for joined eager loading of
+                # collections, count once towards the limit
+                iterator = _islice_unique(iterator, start, stop)
+            else:
+                iterator = itertools.islice(iterator, start, stop)
+
+        super().__init__(cursor_metadata, iterator)
 
         self._unique_filter_state = results[0]._unique_filter_state
         self._yield_per = results[0]._yield_per
@@ -2411,8 +3057,111 @@ class MergedResult(IteratorResult[Unpack[_Ts]]):
             *[r._attributes for r in results]
         )
 
+    @staticmethod
+    def _keyed_rows(
+        result: Result[Unpack[TupleAny]],
+        sort_key: Callable[[Row[Unpack[TupleAny]]], Any],
+    ) -> Iterator[Tuple[Any, _InterimSupportsScalarsRowType]]:
+        make_row = result._row_getter
+        for raw_row in result._raw_row_iterator():
+            yield (
+                sort_key(make_row(raw_row) if make_row else raw_row),
+                raw_row,
+            )
+
     def _soft_close(self, hard: bool = False, **kw: Any) -> None:
         for r in self._results:
             r._soft_close(hard=hard, **kw)
         if hard:
             self.closed = True
+
+
+class _MergeSortValue:
+    """A value as compared by an ORDER BY term, for use with the sort key
+    of a :class:`.MergedResult`."""
+
+    __slots__ = ("value", "descending", "nulls_first")
+
+    def __init__(
+        self, value: Any, descending: bool, nulls_first: Optional[bool]
+    ):
+        self.value = value
+        self.descending = descending
+        self.nulls_first = nulls_first
+
+    def __eq__(self, other: Any) -> bool:
+        return bool(self.value == other.value)
+
+    def __lt__(self, other: _MergeSortValue) -> bool:
+        left, right = self.value, other.value
+        if left is None or right is None:
+            if left is right:
+                return False
+            elif self.nulls_first is None:
+                raise exc.InvalidRequestError(
+                    "Can't merge rows ordered by a NULL value without "
+                    "knowing the ordering of NULL values; indicate NULLS "
+                    "FIRST or NULLS LAST using nulls_first() or nulls_last()"
+                )
+            return (left is None) is self.nulls_first
+        elif self.descending:
+            return bool(left > right)
+        else:
+            return bool(left < right)
+
+
+def _merge_sort_key(
+    orderings: Sequence[
+        Tuple[Callable[[Row[Unpack[TupleAny]]], Any], bool, Optional[bool]]
+    ],
+    default_nulls_first: Optional[bool] = None,
+) -> Callable[[Row[Unpack[TupleAny]]], Any]:
+    """Produce a sort key for :class:`.MergedResult`, given a sequence of
+    ``(getter, descending, nulls_first)`` tuples, where ``getter`` returns
+    a value from a :class:`.Row`.
+
+    When ``nulls_first`` is ``None``, ``None`` is ordered as per
+    ``default_nulls_first``, which is as described for
+    :attr:`.Dialect.default_nulls_first`; if that is also ``None``,
+    ordering a ``None`` value raises.
+
+    """
+    terms = []
+    for getter, descending, nulls_first in orderings:
+        if nulls_first is None and default_nulls_first is not None:
+            nulls_first = default_nulls_first is not descending
+        terms.append((getter, descending, nulls_first))
+
+    def sort_key(row: Row[Unpack[TupleAny]]) -> Tuple[_MergeSortValue, ...]:
+        return tuple(
+            [
+                _MergeSortValue(getter(row), descending, nulls_first)
+                for getter, descending, nulls_first in terms
+            ]
+        )
+
+    return sort_key
+
+
+def _islice_unique(
+    iterator: Iterator[_InterimSupportsScalarsRowType],
+    start: int,
+    stop: Optional[int],
+) -> Iterator[_InterimSupportsScalarsRowType]:
+    """Like ``itertools.islice()``, where repeated rows are counted
+    only once."""
+
+    seen: Set[Any] = set()
+    skipped: Set[Any] = set()
+    for row in iterator:
+        if row in seen:
+            if row not in skipped:
+                yield row
+            continue
+        if stop is not None and len(seen) >= stop:
+            return
+        seen.add(row)
+        if len(seen) <= start:
+            skipped.add(row)
+        else:
+            yield row
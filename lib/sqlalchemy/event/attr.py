@@ -617,6 +617,8 @@ class _JoinedListener(_CompoundListener[_ET]):
         local: _EmptyListener[_ET],
     ):
         self._exec_once = False
+        self._exec_w_sync_once = False
+        self._is_asyncio = False
         self.parent_dispatch = parent_dispatch
         self.name = name
         self.local = local
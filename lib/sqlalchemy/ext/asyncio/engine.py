@@ -13,6 +13,7 @@ from typing import AsyncIterator
 from typing import Callable
 from typing import Dict
 from typing import Generator
+from typing import List
 from typing import NoReturn
 from typing import Optional
 from typing import overload
@@ -47,6 +48,9 @@ from ...util.typing import TypeVarTuple
 from ...util.typing import Unpack
 
 if TYPE_CHECKING:
+    from ...engine.cache import CacheProfiler
+    from ...engine.cache import CompiledCacheStats
+    from ...engine.cache import StatementCacheProfile
     from ...engine.cursor import CursorResult
     from ...engine.interfaces import _CoreAnyExecuteParams
     from ...engine.interfaces import _CoreSingleExecuteParams
@@ -417,8 +421,11 @@ class AsyncConnection(
         no_parameters: bool = False,
         stream_results: bool = False,
         max_row_buffer: int = ...,
+        max_buffer_bytes: int = ...,
+        prefetch: int = ...,
         yield_per: int = ...,
         insertmanyvalues_page_size: int = ...,
+        insert_copy: bool = False,
         schema_translate_map: Optional[SchemaTranslateMapType] = ...,
         preserve_rowcount: bool = False,
         **opt: Any,
@@ -991,10 +998,22 @@ class AsyncConnection(
     classmethods=[],
     methods=[
         "clear_compiled_cache",
+        "query_cache_stats",
+        "cache_profile_report",
         "update_execution_options",
         "get_execution_options",
     ],
-    attributes=["url", "pool", "dialect", "engine", "name", "driver", "echo"],
+    attributes=[
+        "url",
+        "pool",
+        "dialect",
+        "engine",
+        "name",
+        "driver",
+        "echo",
+        "query_cache",
+        "cache_profiler",
+    ],
 )
 class AsyncEngine(ProxyComparable[Engine], AsyncConnectable):
     """An asyncio proxy for a :class:`_engine.Engine`.
@@ -1103,6 +1122,7 @@ class AsyncEngine(ProxyComparable[Engine], AsyncConnectable):
         logging_token: str = ...,
         isolation_level: IsolationLevel = ...,
         insertmanyvalues_page_size: int = ...,
+        insert_copy: bool = False,
         schema_translate_map: Optional[SchemaTranslateMapType] = ...,
         **opt: Any,
     ) -> AsyncEngine: ...
@@ -1172,6 +1192,94 @@ class AsyncEngine(ProxyComparable[Engine], AsyncConnectable):
 
         return self._proxied.clear_compiled_cache()
 
+    def query_cache_stats(self) -> Optional[CompiledCacheStats]:
+        r"""Return hit, miss and eviction statistics for the compiled
+        cache used by this :class:`_engine.Engine`.
+
+        .. container:: class_bases
+
+            Proxied for the :class:`_engine.Engine` class on
+            behalf of the :class:`_asyncio.AsyncEngine` class.
+
+        Returns ``None`` if caching is disabled, or if a custom cache
+        that is not a :class:`.CompiledCache` was passed to the
+        :paramref:`_engine.create_engine.query_cache` parameter.
+
+        E.g.::
+
+            stats = engine.query_cache_stats()
+            print(
+                "hits %d misses %d evictions %d"
+                % (stats.hits, stats.misses, stats.evictions)
+            )
+
+        Per-entry statistics, including the time taken to compile each
+        statement, are available from the
+        :meth:`.CompiledCache.entry_stats` method of
+        :attr:`_engine.Engine.query_cache`.
+
+        .. versionadded:: 2.1
+
+
+        """  # noqa: E501
+
+        return self._proxied.query_cache_stats()
+
+    def cache_profile_report(self) -> Optional[List[StatementCacheProfile]]:
+        r"""Return cache key generation and compilation statistics for
+        each statement executed by this :class:`_engine.Engine`.
+
+        .. container:: class_bases
+
+            Proxied for the :class:`_engine.Engine` class on
+            behalf of the :class:`_asyncio.AsyncEngine` class.
+
+        Returns a list of :class:`.StatementCacheProfile` objects in order
+        of the most total time spent generating cache keys and compiling
+        first, or ``None`` if the
+        :paramref:`_sa.create_engine.cache_profiling` parameter is not in
+        use.  This is a structured form of the ``[generated in ...]``,
+        ``[cached since ...]`` etc. information that's logged with each
+        statement, which also indicates the element within a statement
+        that prevented it from being cached, if any.
+
+        E.g.::
+
+            engine = create_engine("sqlite://", cache_profiling=True)
+
+            # ... run the application
+
+            for profile in engine.cache_profile_report():
+                print(
+                    "%s: %d executions, %.5fs generating cache keys, "
+                    "%.5fs compiling"
+                    % (
+                        profile.statement,
+                        profile.executions,
+                        profile.cache_key_time,
+                        profile.compile_time,
+                    )
+                )
+                if profile.uncacheable_element:
+                    print(
+                        "not cached due to %s: %s"
+                        % (
+                            profile.uncacheable_element,
+                            profile.cache_disable_reason,
+                        )
+                    )
+
+        .. versionadded:: 2.1
+
+        .. seealso::
+
+            :class:`.CacheProfiler`
+
+
+        """  # noqa: E501
+
+        return self._proxied.cache_profile_report()
+
     def update_execution_options(self, **opt: Any) -> None:
         r"""Update the default execution_options dictionary
         of this :class:`_engine.Engine`.
@@ -1325,6 +1433,51 @@ class AsyncEngine(ProxyComparable[Engine], AsyncConnectable):
     def echo(self, attr: Any) -> None:
         self._proxied.echo = attr
 
+    @property
+    def query_cache(self) -> Any:
+        r"""Return the compiled cache used by this :class:`_engine.Engine`,
+        or ``None`` if caching is disabled.
+
+        .. container:: class_bases
+
+            Proxied for the :class:`_engine.Engine` class
+            on behalf of the :class:`_asyncio.AsyncEngine` class.
+
+        This is normally a :class:`.CompiledCache` established by the
+        :paramref:`_engine.create_engine.query_cache_size` parameter,
+        or the object passed to the
+        :paramref:`_engine.create_engine.query_cache` parameter.
+
+        .. versionadded:: 2.1
+
+        .. seealso::
+
+            :meth:`_engine.Engine.query_cache_stats`
+
+
+        """  # noqa: E501
+
+        return self._proxied.query_cache
+
+    @property
+    def cache_profiler(self) -> Optional[CacheProfiler]:
+        r"""Return the :class:`.CacheProfiler` recording cache key and
+        compilation statistics for this :class:`_engine.Engine`, or
+        ``None`` if the :paramref:`_sa.create_engine.cache_profiling`
+        parameter is not in use.
+
+        .. container:: class_bases
+
+            Proxied for the :class:`_engine.Engine` class
+            on behalf of the :class:`_asyncio.AsyncEngine` class.
+
+        .. versionadded:: 2.1
+
+
+        """  # noqa: E501
+
+        return self._proxied.cache_profiler
+
     # END PROXY METHODS AsyncEngine
 
 
@@ -6,6 +6,7 @@
 # the MIT License: https://www.opensource.org/licenses/mit-license.php
 from __future__ import annotations
 
+import asyncio
 import operator
 from typing import Any
 from typing import AsyncIterator
@@ -66,6 +67,51 @@ class AsyncCommon(FilterResult[_R]):
         """
         return self._real_result.closed
 
+    async def _onerow(self) -> Any:
+        if (
+            not self._unique_filter_state
+            and self._real_result._has_buffered_rows()
+        ):
+            # the next row is already local to the result; fetching it
+            # won't emit IO, so skip the greenlet context switch
+            return self._onerow_getter(self)
+        return await greenlet_spawn(self._onerow_getter, self)
+
+    async def _iter_partitions(
+        self, size: Optional[int], read_ahead: bool
+    ) -> AsyncIterator[Sequence[_R]]:
+        getter = self._manyrow_getter
+
+        if not read_ahead:
+            while True:
+                partition = await greenlet_spawn(getter, self, size)
+                if partition:
+                    yield partition
+                else:
+                    break
+            return
+
+        pending: Optional[asyncio.Future[Sequence[_R]]] = (
+            asyncio.ensure_future(greenlet_spawn(getter, self, size))
+        )
+        try:
+            while pending is not None:
+                partition = await pending
+                if partition:
+                    pending = asyncio.ensure_future(
+                        greenlet_spawn(getter, self, size)
+                    )
+                    yield partition
+                else:
+                    pending = None
+        finally:
+            if pending is not None:
+                # iteration was abandoned; let the fetch already in
+                # progress complete before the cursor is used again
+                await asyncio.wait((pending,))
+                if not pending.cancelled():
+                    pending.exception()
+
 
 class AsyncResult(_WithKeys, AsyncCommon[Row[Unpack[_Ts]]]):
     """An asyncio wrapper around a :class:`_result.Result` object.
@@ -184,8 +230,8 @@ class AsyncResult(_WithKeys, AsyncCommon[Row[Unpack[_Ts]]]):
         """
         return self._column_slices(col_expressions)
 
-    async def partitions(
-        self, size: Optional[int] = None
+    def partitions(
+        self, size: Optional[int] = None, *, read_ahead: bool = False
     ) -> AsyncIterator[Sequence[Row[Unpack[_Ts]]]]:
         """Iterate through sub-lists of rows of the size given.
 
@@ -197,19 +243,30 @@ class AsyncResult(_WithKeys, AsyncCommon[Row[Unpack[_Ts]]]):
                 async for partition in result.partitions(100):
                     print("list of rows: %s" % partition)
 
+        Each partition is fetched using a single greenlet context switch,
+        so that the cost of the asyncio adaption is paid per partition
+        rather than per row.
+
         Refer to :meth:`_engine.Result.partitions` in the synchronous
         SQLAlchemy API for a complete behavioral description.
 
-        """
+        :param size: indicate the maximum number of rows to be present
+         in each list yielded.
 
-        getter = self._manyrow_getter
+        :param read_ahead: when ``True``, the fetch of the next partition
+         is started as an asyncio task before the current partition is
+         yielded, so that the driver may receive the next batch of rows
+         while the consumer processes the current one.  The fetch proceeds
+         whenever the consumer awaits on the event loop.  If iteration is
+         abandoned early, the iterator should be closed using ``aclose()``
+         before the connection is used for other operations; the partition
+         that was read ahead is discarded.
 
-        while True:
-            partition = await greenlet_spawn(getter, self, size)
-            if partition:
-                yield partition
-            else:
-                break
+         .. versionadded:: 2.1
+
+        """
+
+        return self._iter_partitions(size, read_ahead)
 
     async def fetchall(self) -> Sequence[Row[Unpack[_Ts]]]:
         """A synonym for the :meth:`_asyncio.AsyncResult.all` method.
@@ -236,7 +293,7 @@ class AsyncResult(_WithKeys, AsyncCommon[Row[Unpack[_Ts]]]):
          or ``None`` if no rows remain.
 
         """
-        row = await greenlet_spawn(self._onerow_getter, self)
+        row = await self._onerow()
         if row is _NO_ROW:
             return None
         else:
@@ -281,7 +338,7 @@ class AsyncResult(_WithKeys, AsyncCommon[Row[Unpack[_Ts]]]):
         return self
 
     async def __anext__(self) -> Row[Unpack[_Ts]]:
-        row = await greenlet_spawn(self._onerow_getter, self)
+        row = await self._onerow()
         if row is _NO_ROW:
             raise StopAsyncIteration()
         else:
@@ -541,7 +598,10 @@ class AsyncScalarResult(AsyncCommon[_R]):
             self._post_creational_filter = None
         else:
             self._metadata = real_result._metadata._reduce([index])
-            self._post_creational_filter = operator.itemgetter(0)
+            if real_result._row_logging_fn:
+                self._post_creational_filter = operator.itemgetter(0)
+            else:
+                self._post_creational_filter = None
 
         self._unique_filter_state = real_result._unique_filter_state
 
@@ -558,8 +618,8 @@ class AsyncScalarResult(AsyncCommon[_R]):
         self._unique_filter_state = (set(), strategy)
         return self
 
-    async def partitions(
-        self, size: Optional[int] = None
+    def partitions(
+        self, size: Optional[int] = None, *, read_ahead: bool = False
     ) -> AsyncIterator[Sequence[_R]]:
         """Iterate through sub-lists of elements of the size given.
 
@@ -569,14 +629,7 @@ class AsyncScalarResult(AsyncCommon[_R]):
 
         """
 
-        getter = self._manyrow_getter
-
-        while True:
-            partition = await greenlet_spawn(getter, self, size)
-            if partition:
-                yield partition
-            else:
-                break
+        return self._iter_partitions(size, read_ahead)
 
     async def fetchall(self) -> Sequence[_R]:
         """A synonym for the :meth:`_asyncio.AsyncScalarResult.all` method."""
@@ -607,7 +660,7 @@ class AsyncScalarResult(AsyncCommon[_R]):
         return self
 
     async def __anext__(self) -> _R:
-        row = await greenlet_spawn(self._onerow_getter, self)
+        row = await self._onerow()
         if row is _NO_ROW:
             raise StopAsyncIteration()
         else:
@@ -688,8 +741,8 @@ class AsyncMappingResult(_WithKeys, AsyncCommon[RowMapping]):
         r"""Establish the columns that should be returned in each row."""
         return self._column_slices(col_expressions)
 
-    async def partitions(
-        self, size: Optional[int] = None
+    def partitions(
+        self, size: Optional[int] = None, *, read_ahead: bool = False
     ) -> AsyncIterator[Sequence[RowMapping]]:
         """Iterate through sub-lists of elements of the size given.
 
@@ -699,14 +752,7 @@ class AsyncMappingResult(_WithKeys, AsyncCommon[RowMapping]):
 
         """
 
-        getter = self._manyrow_getter
-
-        while True:
-            partition = await greenlet_spawn(getter, self, size)
-            if partition:
-                yield partition
-            else:
-                break
+        return self._iter_partitions(size, read_ahead)
 
     async def fetchall(self) -> Sequence[RowMapping]:
         """A synonym for the :meth:`_asyncio.AsyncMappingResult.all` method."""
@@ -722,7 +768,7 @@ class AsyncMappingResult(_WithKeys, AsyncCommon[RowMapping]):
 
         """
 
-        row = await greenlet_spawn(self._onerow_getter, self)
+        row = await self._onerow()
         if row is _NO_ROW:
             return None
         else:
@@ -756,7 +802,7 @@ class AsyncMappingResult(_WithKeys, AsyncCommon[RowMapping]):
         return self
 
     async def __anext__(self) -> RowMapping:
-        row = await greenlet_spawn(self._onerow_getter, self)
+        row = await self._onerow()
         if row is _NO_ROW:
             raise StopAsyncIteration()
         else:
@@ -807,8 +853,8 @@ class AsyncTupleResult(AsyncCommon[_R], util.TypingOnly):
 
     if TYPE_CHECKING:
 
-        async def partitions(
-            self, size: Optional[int] = None
+        def partitions(
+            self, size: Optional[int] = None, *, read_ahead: bool = False
         ) -> AsyncIterator[Sequence[_R]]:
             """Iterate through sub-lists of elements of the size given.
 
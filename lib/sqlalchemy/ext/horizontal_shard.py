@@ -25,10 +25,18 @@ the source distribution.
 """
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import Executor
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as _FutureTimeoutError
+import operator
+import time
 from typing import Any
 from typing import Callable
 from typing import Dict
 from typing import Iterable
+from typing import List
 from typing import Optional
 from typing import Protocol
 from typing import Tuple
@@ -41,14 +49,28 @@ from .. import event
 from .. import exc
 from .. import inspect
 from .. import util
+from ..engine.result import _merge_sort_key
+from ..engine.result import MergedResult
 from ..orm import PassiveFlag
 from ..orm._typing import OrmExecuteOptionsParameter
 from ..orm.interfaces import ORMOption
 from ..orm.mapper import Mapper
+from ..orm.properties import ColumnProperty
 from ..orm.query import Query
 from ..orm.session import _BindArguments
 from ..orm.session import _PKIdentityArgument
 from ..orm.session import Session
+from ..sql import coercions
+from ..sql import operators
+from ..sql import roles
+from ..sql import sqltypes
+from ..sql import util as sql_util
+from ..sql.elements import BinaryExpression
+from ..sql.elements import ClauseElement
+from ..sql.elements import Label
+from ..sql.selectable import Select
+from ..util.concurrency import await_
+from ..util.concurrency import greenlet_spawn
 from ..util.typing import Self
 from ..util.typing import TupleAny
 from ..util.typing import TypeVarTuple
@@ -60,6 +82,7 @@ if TYPE_CHECKING:
     from ..engine.base import Engine
     from ..engine.base import OptionEngine
     from ..engine.result import Result
+    from ..engine.row import Row
     from ..orm import LoaderCallableStatus
     from ..orm._typing import _O
     from ..orm.bulk_persistence import BulkUDCompileState
@@ -69,9 +92,8 @@ if TYPE_CHECKING:
     from ..orm.session import ORMExecuteState
     from ..orm.state import InstanceState
     from ..sql import Executable
-    from ..sql.elements import ClauseElement
 
-__all__ = ["ShardedSession", "ShardedQuery"]
+__all__ = ["ShardedSession", "ShardedQuery", "ShardTimeoutError"]
 
 _T = TypeVar("_T", bound=Any)
 _Ts = TypeVarTuple("_Ts")
@@ -80,6 +102,18 @@ _Ts = TypeVarTuple("_Ts")
 ShardIdentifier = str
 
 
+class ShardTimeoutError(exc.SQLAlchemyError):
+    """Raised when a statement executed against a shard does not complete
+    within the :paramref:`.ShardedSession.shard_timeout`.
+
+    This is distinct from :class:`.exc.TimeoutError`, which is raised
+    for a connection pool checkout timeout.
+
+    .. versionadded:: 2.1
+
+    """
+
+
 class ShardChooser(Protocol):
     def __call__(
         self,
@@ -141,6 +175,10 @@ class ShardedSession(Session):
     shard_chooser: ShardChooser
     identity_chooser: IdentityChooser
     execute_chooser: Callable[[ORMExecuteState], Iterable[Any]]
+    parallel_execution: bool
+    shard_executor: Optional[Executor]
+    shard_timeout: Optional[float]
+    partial_results: bool
 
     def __init__(
         self,
@@ -156,6 +194,10 @@ class ShardedSession(Session):
             Callable[[Query[_T], Iterable[_T]], Iterable[Any]]
         ] = None,
         query_chooser: Optional[Callable[[Executable], Iterable[Any]]] = None,
+        parallel_execution: bool = False,
+        shard_executor: Optional[Executor] = None,
+        shard_timeout: Optional[float] = None,
+        partial_results: bool = False,
         **kwargs: Any,
     ) -> None:
         """Construct a ShardedSession.
@@ -182,9 +224,77 @@ class ShardedSession(Session):
           .. versionchanged:: 1.4  The ``execute_chooser`` parameter
              supersedes the ``query_chooser`` parameter.
 
+          .. versionchanged:: 2.1  When a SELECT statement against multiple
+             shards includes ORDER BY, the rows of each shard are merged
+             incrementally by that ordering, where each expression in the
+             ORDER BY is a column or column attribute that's present in the
+             rows returned; otherwise, the rows of each shard follow one
+             another as before.   LIMIT and OFFSET are applied to the
+             merged rows, with each shard being asked for at most LIMIT +
+             OFFSET rows.  The ordering of NULL values must be known, either
+             through NULLS FIRST or NULLS LAST, through the
+             :attr:`.Dialect.default_nulls_first` attribute shared by the
+             dialects of the shards, or because the column is not nullable.
+             As values are compared in Python, string expressions, whose
+             ordering in the database follows its collation, are merged
+             only if the ``python_ordering`` execution option is set to
+             ``True``, indicating that Python's ordering of the values
+             matches that of the database; otherwise the rows of each shard
+             follow one another.
+
         :param shards: A dictionary of string shard names
           to :class:`~sqlalchemy.engine.Engine` objects.
 
+        :param parallel_execution: when ``True``, a SELECT statement that
+          the ``execute_chooser`` directs to more than one shard is executed
+          against those shards concurrently, rather than one shard after
+          another.  For sync engines, the statements are run in a thread
+          pool; for engines used with :class:`_asyncio.AsyncSession`, they
+          are run as concurrent tasks using ``asyncio.gather()``.  Results
+          are merged into a single result as is the case otherwise.
+
+          Each shard's connection is procured before the statements are
+          dispatched, and shards which share the same DBAPI connection are
+          executed one after the other within the same thread or task.
+          When using threads, the DBAPI connections must allow use from a
+          thread other than the one that created them.   Autoflush, if
+          enabled, takes place once before the statements are dispatched;
+          the rows of each result are loaded into objects only as the
+          merged result is consumed, within the calling thread.
+
+          .. versionadded:: 2.1
+
+        :param shard_executor: a :class:`concurrent.futures.Executor`, such
+          as a :class:`concurrent.futures.ThreadPoolExecutor`, used to run
+          statements when ``parallel_execution`` is enabled with sync
+          engines.  When omitted, a new thread pool is created for each
+          statement executed against multiple shards.  Supplying a
+          long-lived executor avoids the cost of starting new threads for
+          each statement.
+
+          .. versionadded:: 2.1
+
+        :param shard_timeout: when ``parallel_execution`` is enabled,
+          number of seconds to wait for the statement executed against each
+          shard to complete, counted from when the statements are
+          dispatched.   A shard that does not respond in time raises
+          :class:`.ShardTimeoutError`, unless ``partial_results`` is set.
+          The connection of a shard that timed out is invalidated, so that
+          the transaction of the :class:`.ShardedSession` must be rolled
+          back before that shard can be used again.   When using threads,
+          the DBAPI connection is closed only once the statement still in
+          progress on it has completed.
+
+          .. versionadded:: 2.1
+
+        :param partial_results: when ``parallel_execution`` is enabled and
+          this is set to ``True``, shards whose statement raises an error or
+          times out are omitted from the merged result, and a warning is
+          emitted for each one, rather than raising.   An error is still
+          raised if no shard returned a result.
+
+          .. versionadded:: 2.1
+
         """
         super().__init__(query_cls=query_cls, **kwargs)
 
@@ -249,6 +359,10 @@ class ShardedSession(Session):
                 "execute_chooser or query_chooser is required"
             )
         self.execute_chooser = execute_chooser
+        self.parallel_execution = parallel_execution
+        self.shard_executor = shard_executor
+        self.shard_timeout = shard_timeout
+        self.partial_results = partial_results
         self.__shards: Dict[ShardIdentifier, _SessionBind] = {}
         if shards is not None:
             for k in shards:
@@ -449,13 +563,15 @@ def execute_and_instances(
     assert isinstance(session, ShardedSession)
 
     def iter_for_shard(
-        shard_id: ShardIdentifier,
+        shard_id: ShardIdentifier, statement: Optional[Executable] = None
     ) -> Result[Unpack[TupleAny]]:
         bind_arguments = dict(orm_context.bind_arguments)
         bind_arguments["shard_id"] = shard_id
 
         orm_context.update_execution_options(identity_token=shard_id)
-        return orm_context.invoke_statement(bind_arguments=bind_arguments)
+        return orm_context.invoke_statement(
+            statement, bind_arguments=bind_arguments
+        )
 
     for orm_opt in orm_context._non_compile_orm_options:
         # TODO: if we had an ORMOption that gets applied at ORM statement
@@ -477,8 +593,432 @@ def execute_and_instances(
     if shard_id is not None:
         return iter_for_shard(shard_id)
     else:
-        partial = []
-        for shard_id in session.execute_chooser(orm_context):
-            result_ = iter_for_shard(shard_id)
-            partial.append(result_)
-        return partial[0].merge(*partial[1:])
+        shard_ids = list(session.execute_chooser(orm_context))
+
+        ordered_merge = None
+        if orm_context.is_select and len(shard_ids) > 1:
+            ordered_merge = _ordered_merge(
+                orm_context.statement,
+                _default_nulls_first(session, shard_ids),
+                orm_context.execution_options.get("python_ordering", False),
+            )
+
+        if ordered_merge is not None:
+            shard_statement, merge_kw = ordered_merge
+        else:
+            shard_statement, merge_kw = None, {}
+
+        if (
+            session.parallel_execution
+            and orm_context.is_select
+            and len(shard_ids) > 1
+        ):
+            partial = _execute_concurrently(
+                orm_context, session, shard_ids, shard_statement
+            )
+        else:
+            partial = []
+            for shard_id in shard_ids:
+                result_ = iter_for_shard(shard_id, shard_statement)
+                partial.append(result_)
+
+        if merge_kw:
+            return MergedResult(partial[0]._metadata, partial, **merge_kw)
+        else:
+            return partial[0].merge(*partial[1:])
+
+
+def _default_nulls_first(
+    session: ShardedSession, shard_ids: List[ShardIdentifier]
+) -> Optional[bool]:
+    """Return the :attr:`.Dialect.default_nulls_first` setting shared by
+    the binds of the given shards, or None if it's not known or the
+    shards don't agree.
+
+    """
+    settings = {
+        session.get_bind(shard_id=shard_id).dialect.default_nulls_first
+        for shard_id in shard_ids
+    }
+    if len(settings) == 1:
+        return settings.pop()
+    else:
+        return None
+
+
+def _ordered_merge(
+    statement: Executable,
+    default_nulls_first: Optional[bool],
+    python_ordering: bool = False,
+) -> Optional[Tuple[Executable, Dict[str, Any]]]:
+    """Given a SELECT statement to be executed against multiple shards,
+    return the statement to execute against each shard, along with the
+    arguments for a :class:`.MergedResult` that will merge the results of
+    each shard by the statement's ORDER BY, applying its LIMIT / OFFSET
+    across the merged rows.
+
+    Returns None if the statement has neither ORDER BY nor LIMIT / OFFSET,
+    or if its ORDER BY or LIMIT / OFFSET can't be applied to the merged
+    rows, in which case the results of each shard are concatenated.
+    This includes an ORDER BY expression which may be NULL where neither
+    NULLS FIRST / NULLS LAST nor ``default_nulls_first`` indicate where
+    the database orders NULL, as well as a string expression, which the
+    database orders by collation rather than as Python would, unless
+    ``python_ordering`` is set.
+
+    """
+    if (
+        not isinstance(statement, Select)
+        or statement._fetch_clause is not None
+    ):
+        return None
+
+    merge_kw: Dict[str, Any] = {}
+
+    if statement._order_by_clauses:
+        descriptions = statement.column_descriptions
+        orderings = []
+        for clause in statement._order_by_clauses:
+            elem, descending, nulls_first = sql_util.unwrap_ordering(clause)
+            if not python_ordering and _is_collated(elem, descriptions):
+                return None
+            if nulls_first is None and default_nulls_first is None:
+                if not _not_nullable(elem):
+                    return None
+                # no NULLs to be ordered
+                nulls_first = False
+            getter = _ordering_getter(elem, descriptions)
+            if getter is None:
+                return None
+            orderings.append((getter, descending, nulls_first))
+        merge_kw["sort_key"] = _merge_sort_key(
+            orderings, default_nulls_first
+        )
+
+    limit_clause = statement._limit_clause
+    offset_clause = statement._offset_clause
+    if limit_clause is not None or offset_clause is not None:
+        if (
+            limit_clause is not None
+            and not statement._simple_int_clause(limit_clause)
+        ) or (
+            offset_clause is not None
+            and not statement._simple_int_clause(offset_clause)
+        ):
+            return None
+
+        limit = statement._limit
+        offset = statement._offset or 0
+
+        # each shard returns up to LIMIT + OFFSET rows; OFFSET is then
+        # applied to the merged rows
+        statement = statement.limit(
+            limit + offset if limit is not None else None
+        ).offset(None)
+        merge_kw["limit"] = limit
+        merge_kw["offset"] = offset
+
+    if not merge_kw:
+        return None
+
+    return statement, merge_kw
+
+
+def _is_collated(elem: Any, descriptions: List[Dict[str, Any]]) -> bool:
+    """Return True if the database orders the given ORDER BY expression
+    by collation, being a string expression or one with an explicit
+    COLLATE."""
+
+    if isinstance(elem, str):
+        type_ = None
+        for description in descriptions:
+            if description["name"] == elem:
+                type_ = description["type"]
+                break
+        return isinstance(type_, sqltypes.String)
+
+    if isinstance(elem, Label):
+        elem = elem.element
+    if (
+        isinstance(elem, BinaryExpression)
+        and elem.operator is operators.collate
+    ):
+        return True
+    return isinstance(getattr(elem, "type", None), sqltypes.String)
+
+
+def _not_nullable(elem: Any) -> bool:
+    if isinstance(elem, Label):
+        elem = elem.element
+    return getattr(elem, "nullable", True) is False
+
+
+def _ordering_getter(
+    elem: Any, descriptions: List[Dict[str, Any]]
+) -> Optional[Callable[[Row[Unpack[TupleAny]]], Any]]:
+    """Return a callable that will retrieve the value of an ORDER BY
+    expression from a row, given the column descriptions of the
+    statement, or None if the expression is not available from the row.
+
+    """
+    if isinstance(elem, str):
+        for idx, description in enumerate(descriptions):
+            if description["name"] == elem:
+                return operator.itemgetter(idx)
+        return None
+
+    for idx, description in enumerate(descriptions):
+        expr = description["expr"]
+        entity = description["entity"]
+        if entity is not None and expr is entity:
+            # a full entity; the ORDER BY may refer to one of its
+            # column attributes, which is retrieved from the object
+            insp = inspect(entity)
+            if elem._annotations.get("parententity") is insp:
+                key = elem._annotations.get("proxy_key")
+            elif insp.is_aliased_class:
+                continue
+            else:
+                try:
+                    key = insp.mapper.get_property_by_column(elem).key
+                except exc.UnmappedColumnError:
+                    continue
+
+            prop = insp.mapper.attrs.get(key) if key else None
+            if not isinstance(prop, ColumnProperty) or prop.deferred:
+                continue
+
+            get_entity = operator.itemgetter(idx)
+            get_value = operator.attrgetter(key)
+            return lambda row: get_value(get_entity(row))
+        elif isinstance(expr, ClauseElement) or hasattr(
+            expr, "__clause_element__"
+        ):
+            column = coercions.expect(roles.ColumnsClauseRole, expr)
+            if column.compare(elem):
+                return operator.itemgetter(idx)
+
+    return None
+
+
+_ShardOutcome = Tuple[
+    ShardIdentifier,
+    Optional["Result[Unpack[TupleAny]]"],
+    Optional[Exception],
+]
+
+
+def _execute_concurrently(
+    orm_context: ORMExecuteState,
+    session: ShardedSession,
+    shard_ids: List[ShardIdentifier],
+    statement: Optional[Executable],
+) -> List[Result[Unpack[TupleAny]]]:
+    # procure each shard's connection up front, in the calling thread, so
+    # that the session's transactional state is not modified concurrently.
+    # shards that share a DBAPI connection are run within the same task.
+    groups: Dict[int, Tuple[List[Connection], List[ShardIdentifier]]] = {}
+    for shard_id in shard_ids:
+        conn = session.connection(bind_arguments={"shard_id": shard_id})
+        conns, group_ids = groups.setdefault(
+            id(conn.connection.dbapi_connection), ([], [])
+        )
+        if conn not in conns:
+            conns.append(conn)
+        group_ids.append(shard_id)
+
+    # autoflush once, ahead of time, rather than within each task
+    load_options = orm_context.load_options
+    if load_options._autoflush:
+        session._autoflush()
+
+    def run_group(group_ids: List[ShardIdentifier]) -> List[_ShardOutcome]:
+        outcomes: List[_ShardOutcome] = []
+        for shard_id in group_ids:
+            bind_arguments = dict(orm_context.bind_arguments)
+            bind_arguments["shard_id"] = shard_id
+            try:
+                result = orm_context.invoke_statement(
+                    statement,
+                    execution_options={
+                        "identity_token": shard_id,
+                        "autoflush": False,
+                    },
+                    bind_arguments=bind_arguments,
+                )
+            except Exception as err:
+                outcomes.append((shard_id, None, err))
+            else:
+                outcomes.append((shard_id, result, None))
+        return outcomes
+
+    group_list = list(groups.values())
+    timeout = session.shard_timeout
+
+    timed_out: Dict[int, Future[List[_ShardOutcome]]]
+    if any(conns[0].dialect.is_async for conns, _ in group_list):
+        group_outcomes = await_(
+            _gather_async(run_group, group_list, timeout)
+        )
+        timed_out = {}
+    else:
+        group_outcomes, timed_out = _gather_threaded(
+            session.shard_executor, run_group, group_list, timeout
+        )
+
+    results: Dict[ShardIdentifier, List[Result[Unpack[TupleAny]]]] = {}
+    all_results: List[Result[Unpack[TupleAny]]] = []
+    errors: List[Tuple[ShardIdentifier, Exception]] = []
+    for idx, ((conns, group_ids), outcomes) in enumerate(
+        zip(group_list, group_outcomes)
+    ):
+        if outcomes is None:
+            # the group timed out; its connection may still be in use
+            # by the statement, so it can't be used any further
+            outcomes = [
+                (
+                    shard_id,
+                    None,
+                    ShardTimeoutError(
+                        "Statement for shard %r did not complete within "
+                        "%s seconds" % (shard_id, timeout)
+                    ),
+                )
+                for shard_id in group_ids
+            ]
+            timeout_err = outcomes[0][2]
+            assert timeout_err is not None
+            if idx in timed_out:
+                _invalidate_on_completion(conns, timed_out[idx], timeout_err)
+            else:
+                # the task was cancelled, so the connection is no longer
+                # in use
+                for conn in conns:
+                    conn.invalidate(timeout_err)
+        for shard_id, result, err in outcomes:
+            if err is not None:
+                errors.append((shard_id, err))
+            else:
+                assert result is not None
+                results.setdefault(shard_id, []).append(result)
+                all_results.append(result)
+
+    # merge in the order given by the execute_chooser
+    partial = [
+        results[shard_id].pop(0)
+        for shard_id in shard_ids
+        if results.get(shard_id)
+    ]
+
+    if errors:
+        if not session.partial_results or not partial:
+            for result in all_results:
+                result.close()
+            raise errors[0][1]
+        for shard_id, err in errors:
+            util.warn(
+                "Shard %r is omitted from the results of this statement, "
+                "due to error: %s" % (shard_id, err)
+            )
+
+    return partial
+
+
+def _invalidate_on_completion(
+    conns: List[Connection],
+    future: Future[List[_ShardOutcome]],
+    err: Exception,
+) -> None:
+    """Invalidate the connections of a group of shards which timed out
+    while their statements were run in a worker thread.
+
+    The :class:`_engine.Connection` objects are invalidated right away, so
+    that they aren't used again within the session's transaction; the
+    DBAPI connections are invalidated, which closes them, only once the
+    worker thread is no longer using them, at which point any results the
+    worker produced are also closed.
+
+    """
+    pool_connections = []
+    for conn in conns:
+        pool_connections.append(conn.connection)
+        conn._dbapi_connection = None
+
+    def on_completion(future: Future[List[_ShardOutcome]]) -> None:
+        if not future.cancelled() and future.exception() is None:
+            for _, result, _ in future.result():
+                if result is not None:
+                    result.close()
+        for pool_connection in pool_connections:
+            pool_connection.invalidate(err)
+
+    future.add_done_callback(on_completion)
+
+
+def _gather_threaded(
+    executor: Optional[Executor],
+    run_group: Callable[[List[ShardIdentifier]], List[_ShardOutcome]],
+    group_list: List[Tuple[List[Connection], List[ShardIdentifier]]],
+    timeout: Optional[float],
+) -> Tuple[
+    List[Optional[List[_ShardOutcome]]],
+    Dict[int, Future[List[_ShardOutcome]]],
+]:
+    if executor is None:
+        _executor: Executor = ThreadPoolExecutor(
+            max_workers=len(group_list),
+            thread_name_prefix="sqlalchemy-shard",
+        )
+    else:
+        _executor = executor
+
+    try:
+        futures = [
+            _executor.submit(run_group, group_ids)
+            for _, group_ids in group_list
+        ]
+        if timeout is not None:
+            deadline = time.monotonic() + timeout
+
+        group_outcomes: List[Optional[List[_ShardOutcome]]] = []
+        timed_out: Dict[int, Future[List[_ShardOutcome]]] = {}
+        for idx, future in enumerate(futures):
+            try:
+                if timeout is None:
+                    group_outcomes.append(future.result())
+                else:
+                    group_outcomes.append(
+                        future.result(max(0, deadline - time.monotonic()))
+                    )
+            except _FutureTimeoutError:
+                future.cancel()
+                group_outcomes.append(None)
+                timed_out[idx] = future
+        return group_outcomes, timed_out
+    finally:
+        if executor is None:
+            # don't wait for statements which timed out
+            _executor.shutdown(wait=False)
+
+
+async def _gather_async(
+    run_group: Callable[[List[ShardIdentifier]], List[_ShardOutcome]],
+    group_list: List[Tuple[List[Connection], List[ShardIdentifier]]],
+    timeout: Optional[float],
+) -> List[Optional[List[_ShardOutcome]]]:
+    async def run(
+        group_ids: List[ShardIdentifier],
+    ) -> Optional[List[_ShardOutcome]]:
+        if timeout is None:
+            return await greenlet_spawn(run_group, group_ids)
+        try:
+            return await asyncio.wait_for(
+                greenlet_spawn(run_group, group_ids), timeout
+            )
+        except asyncio.TimeoutError:
+            return None
+
+    return list(
+        await asyncio.gather(*[run(group_ids) for _, group_ids in group_list])
+    )
+
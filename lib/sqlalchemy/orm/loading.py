@@ -308,6 +308,10 @@ def merge_frozen_result(session, statement, frozen_result, load=True):
 
     See the section :ref:`do_orm_execute_re_executing` for an example.
 
+    The given frozen result may also be a
+    :class:`_engine.ColumnarFrozenResult`, such as one loaded from shared
+    memory using :meth:`_engine.ColumnarFrozenResult.loads`.
+
     .. seealso::
 
         :ref:`do_orm_execute_re_executing`
@@ -316,6 +320,8 @@ def merge_frozen_result(session, statement, frozen_result, load=True):
 
         :class:`_engine.FrozenResult`
 
+        :class:`_engine.ColumnarFrozenResult`
+
     """
     querycontext = util.preloaded.orm_context
 
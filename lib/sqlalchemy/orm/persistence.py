@@ -788,7 +788,7 @@ def _emit_update_statements(
             rec[7],  # has all pks
         ),
     ):
-        rows = 0
+        results = []
         records = list(records)
 
         statement = cached_stmt
@@ -867,7 +867,7 @@ def _emit_update_statements(
                         True,
                         c.returned_defaults,
                     )
-                rows += c.rowcount
+                results.append(c)
                 check_rowcount = enable_check_rowcount and assert_singlerow
         else:
             if not allow_executemany:
@@ -900,7 +900,7 @@ def _emit_update_statements(
                             True,
                             c.returned_defaults,
                         )
-                    rows += c.rowcount
+                    results.append(c)
             else:
                 multiparams = [rec[2] for rec in records]
 
@@ -913,7 +913,7 @@ def _emit_update_statements(
                     statement, multiparams, execution_options=execution_options
                 )
 
-                rows += c.rowcount
+                results.append(c)
 
                 for (
                     state,
@@ -944,12 +944,9 @@ def _emit_update_statements(
                         )
 
         if check_rowcount:
-            if rows != len(records):
-                raise orm_exc.StaleDataError(
-                    "UPDATE statement on table '%s' expected to "
-                    "update %d row(s); %d were matched."
-                    % (table.description, len(records), rows)
-                )
+            connection._defer_to_pipeline_sync(
+                _check_update_rowcount, table, len(records), results
+            )
 
         elif needs_version_id:
             util.warn(
@@ -997,6 +994,12 @@ def _emit_insert_statements(
     else:
         execution_options = exec_opt
 
+    # when rows are delivered using COPY, a bulk INSERT that doesn't need
+    # newly generated primary key values back can leave them out
+    insert_copy = not bookkeeping and execution_options.get(
+        "insert_copy", False
+    )
+
     return_result = None
 
     for (
@@ -1035,7 +1038,7 @@ def _emit_insert_statements(
                 )
             )
             and not returning_is_required_anyway
-            and has_all_pks
+            and (has_all_pks or insert_copy)
             and not hasvalue
         ):
             # the "we don't need newly generated values back" section.
@@ -1330,7 +1333,7 @@ def _emit_post_update_statements(
         update,
         lambda rec: (rec[3], set(rec[4])),  # connection  # parameter keys
     ):
-        rows = 0
+        results = []
 
         records = list(records)
         connection = key[0]
@@ -1358,7 +1361,7 @@ def _emit_post_update_statements(
                     c,
                     c.context.compiled_parameters[0],
                 )
-                rows += c.rowcount
+                results.append(c)
         else:
             multiparams = [
                 params
@@ -1373,7 +1376,7 @@ def _emit_post_update_statements(
                 statement, multiparams, execution_options=execution_options
             )
 
-            rows += c.rowcount
+            results.append(c)
             for state, state_dict, mapper_rec, connection, params in records:
                 _postfetch_post_update(
                     mapper_rec,
@@ -1386,12 +1389,9 @@ def _emit_post_update_statements(
                 )
 
         if check_rowcount:
-            if rows != len(records):
-                raise orm_exc.StaleDataError(
-                    "UPDATE statement on table '%s' expected to "
-                    "update %d row(s); %d were matched."
-                    % (table.description, len(records), rows)
-                )
+            connection._defer_to_pipeline_sync(
+                _check_update_rowcount, table, len(records), results
+            )
 
         elif needs_version_id:
             util.warn(
@@ -1436,7 +1436,7 @@ def _emit_delete_statements(
 
         execution_options = {"compiled_cache": base_mapper._compiled_cache}
         expected = len(del_objects)
-        rows_matched = -1
+        results = []
         only_warn = False
 
         if (
@@ -1444,14 +1444,13 @@ def _emit_delete_statements(
             and not connection.dialect.supports_sane_multi_rowcount
         ):
             if connection.dialect.supports_sane_rowcount:
-                rows_matched = 0
                 # execute deletes individually so that versioned
                 # rows can be verified
                 for params in del_objects:
                     c = connection.execute(
                         statement, params, execution_options=execution_options
                     )
-                    rows_matched += c.rowcount
+                    results.append(c)
             else:
                 util.warn(
                     "Dialect %s does not support deleted rowcount "
@@ -1469,35 +1468,52 @@ def _emit_delete_statements(
             if not need_version_id:
                 only_warn = True
 
-            rows_matched = c.rowcount
+            results.append(c)
 
         if (
             base_mapper.confirm_deleted_rows
-            and rows_matched > -1
-            and expected != rows_matched
+            and results
             and (
                 connection.dialect.supports_sane_multi_rowcount
                 or len(del_objects) == 1
             )
         ):
-            # TODO: why does this "only warn" if versioning is turned off,
-            # whereas the UPDATE raises?
-            if only_warn:
-                util.warn(
-                    "DELETE statement on table '%s' expected to "
-                    "delete %d row(s); %d were matched.  Please set "
-                    "confirm_deleted_rows=False within the mapper "
-                    "configuration to prevent this warning."
-                    % (table.description, expected, rows_matched)
-                )
-            else:
-                raise orm_exc.StaleDataError(
-                    "DELETE statement on table '%s' expected to "
-                    "delete %d row(s); %d were matched.  Please set "
-                    "confirm_deleted_rows=False within the mapper "
-                    "configuration to prevent this warning."
-                    % (table.description, expected, rows_matched)
-                )
+            connection._defer_to_pipeline_sync(
+                _check_delete_rowcount, table, expected, results, only_warn
+            )
+
+
+def _check_update_rowcount(table, expected, results):
+    rows = sum(c.rowcount for c in results)
+    if rows != expected:
+        raise orm_exc.StaleDataError(
+            "UPDATE statement on table '%s' expected to "
+            "update %d row(s); %d were matched."
+            % (table.description, expected, rows)
+        )
+
+
+def _check_delete_rowcount(table, expected, results, only_warn):
+    rows_matched = sum(c.rowcount for c in results)
+    if rows_matched > -1 and expected != rows_matched:
+        # TODO: why does this "only warn" if versioning is turned off,
+        # whereas the UPDATE raises?
+        if only_warn:
+            util.warn(
+                "DELETE statement on table '%s' expected to "
+                "delete %d row(s); %d were matched.  Please set "
+                "confirm_deleted_rows=False within the mapper "
+                "configuration to prevent this warning."
+                % (table.description, expected, rows_matched)
+            )
+        else:
+            raise orm_exc.StaleDataError(
+                "DELETE statement on table '%s' expected to "
+                "delete %d row(s); %d were matched.  Please set "
+                "confirm_deleted_rows=False within the mapper "
+                "configuration to prevent this warning."
+                % (table.description, expected, rows_matched)
+            )
 
 
 def _finalize_insert_update_commands(base_mapper, uowtransaction, states):
@@ -1751,11 +1767,13 @@ def _connections_for_states(base_mapper, uowtransaction, states):
         connection_callable = uowtransaction.session.connection_callable
     else:
         connection = uowtransaction.transaction.connection(base_mapper)
+        uowtransaction._enter_pipeline(connection)
         connection_callable = None
 
     for state in _sort_states(base_mapper, states):
         if connection_callable:
             connection = connection_callable(base_mapper, state.obj())
+            uowtransaction._enter_pipeline(connection)
 
         mapper = state.manager.mapper
 
@@ -1727,8 +1727,11 @@ class Query(
         no_parameters: bool = False,
         stream_results: bool = False,
         max_row_buffer: int = ...,
+        max_buffer_bytes: int = ...,
+        prefetch: int = ...,
         yield_per: int = ...,
         insertmanyvalues_page_size: int = ...,
+        insert_copy: bool = False,
         schema_translate_map: Optional[SchemaTranslateMapType] = ...,
         populate_existing: bool = False,
         autoflush: bool = False,
@@ -1487,6 +1487,7 @@ class Session(_SessionClassMethods, EventTarget):
     autoflush: bool
     expire_on_commit: bool
     enable_baked_queries: bool
+    flush_pipeline: bool
     twophase: bool
     join_transaction_mode: JoinTransactionMode
     _query_cls: Type[Query[Any]]
@@ -1508,6 +1509,7 @@ class Session(_SessionClassMethods, EventTarget):
         autocommit: Literal[False] = False,
         join_transaction_mode: JoinTransactionMode = "conditional_savepoint",
         close_resets_only: Union[bool, _NoArg] = _NoArg.NO_ARG,
+        flush_pipeline: bool = False,
     ):
         r"""Construct a new :class:`_orm.Session`.
 
@@ -1608,6 +1610,22 @@ class Session(_SessionClassMethods, EventTarget):
 
                 :ref:`session_committing`
 
+        :param flush_pipeline: Defaults to ``False``.  When ``True``, the
+           UPDATE and DELETE statements emitted by :meth:`_orm.Session.flush`
+           are sent within a pipeline, as established by
+           :meth:`_engine.Connection.pipeline`, for those dialects which
+           support it, so that statements are sent to the database without
+           waiting for the result of each one.  Rowcount checks which may
+           raise :class:`.StaleDataError` are deferred until the pipeline is
+           synced at the end of the flush.   Dialects that don't support
+           pipelining are not affected.
+
+           .. versionadded:: 2.1
+
+           .. seealso::
+
+               :ref:`pipeline_mode`
+
         :param future: Deprecated; this flag is always True.
 
           .. seealso::
@@ -1760,6 +1778,7 @@ class Session(_SessionClassMethods, EventTarget):
         self.autoflush = autoflush
         self.expire_on_commit = expire_on_commit
         self.enable_baked_queries = enable_baked_queries
+        self.flush_pipeline = flush_pipeline
 
         # the idea is that at some point NO_ARG will warn that in the future
         # the default will switch to close_resets_only=False.
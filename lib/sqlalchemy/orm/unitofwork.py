@@ -17,6 +17,7 @@ organizes them in order of dependency, and executes.
 
 from __future__ import annotations
 
+import contextlib
 from typing import Any
 from typing import Dict
 from typing import Optional
@@ -38,6 +39,7 @@ if TYPE_CHECKING:
     from .session import Session
     from .session import SessionTransaction
     from .state import InstanceState
+    from ..engine import Connection
 
 
 def track_cascade_events(descriptor, prop):
@@ -206,6 +208,10 @@ class UOWTransaction:
         # columns which should be included in the update.
         self.post_update_states = util.defaultdict(lambda: (set(), set()))
 
+        # connections placed into pipeline mode for the duration of
+        # execute(), when Session.flush_pipeline is set
+        self._pipelines: Optional[contextlib.ExitStack] = None
+
     @property
     def has_work(self):
         return bool(self.states)
@@ -453,17 +459,39 @@ class UOWTransaction:
         # print "\nCOUNT OF POSTSORT ACTIONS", len(postsort_actions)
 
         # execute
-        if self.cycles:
-            for subset in topological.sort_as_subsets(
-                self.dependencies, postsort_actions
-            ):
-                set_ = set(subset)
-                while set_:
-                    n = set_.pop()
-                    n.execute_aggregate(self, set_)
-        else:
-            for rec in topological.sort(self.dependencies, postsort_actions):
-                rec.execute(self)
+        with contextlib.ExitStack() as self._pipelines:
+            try:
+                if self.cycles:
+                    for subset in topological.sort_as_subsets(
+                        self.dependencies, postsort_actions
+                    ):
+                        set_ = set(subset)
+                        while set_:
+                            n = set_.pop()
+                            n.execute_aggregate(self, set_)
+                else:
+                    for rec in topological.sort(
+                        self.dependencies, postsort_actions
+                    ):
+                        rec.execute(self)
+            finally:
+                self._pipelines = None
+
+    def _enter_pipeline(self, connection: Connection) -> None:
+        """Place the given connection into pipeline mode for the
+        remainder of execute(), if the session and dialect support it.
+
+        Pipelines are synced when execute() completes, at which point
+        deferred rowcount checks are also run.
+
+        """
+        if (
+            self._pipelines is not None
+            and self.session.flush_pipeline
+            and connection.dialect.supports_pipeline
+            and connection._pipeline is None
+        ):
+            self._pipelines.enter_context(connection.pipeline())
 
     def finalize_flush_changes(self) -> None:
         """Mark processed objects as clean / deleted after a successful
@@ -36,6 +36,10 @@ from .base import reset_rollback as reset_rollback
 from .impl import AssertionPool as AssertionPool
 from .impl import AsyncAdaptedQueuePool as AsyncAdaptedQueuePool
 from .impl import NullPool as NullPool
+from .impl import PoolEndpoint as PoolEndpoint
 from .impl import QueuePool as QueuePool
+from .impl import RoutingPool as RoutingPool
 from .impl import SingletonThreadPool as SingletonThreadPool
 from .impl import StaticPool as StaticPool
+from .metrics import PoolHistogram as PoolHistogram
+from .metrics import PoolMetrics as PoolMetrics
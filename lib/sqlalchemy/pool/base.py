@@ -31,6 +31,7 @@ from typing import TYPE_CHECKING
 from typing import Union
 import weakref
 
+from .metrics import PoolMetrics
 from .. import event
 from .. import exc
 from .. import log
@@ -165,6 +166,9 @@ class Pool(log.Identified, event.EventTarget):
     _creator_arg: Union[_CreatorFnType, _CreatorWRecFnType]
     _invoke_creator: _CreatorWRecFnType
     _invalidate_time: float
+    _pre_ping_idle_threshold: Optional[float] = None
+    _record_checkin_time: bool = False
+    _metrics: Optional[PoolMetrics] = None
 
     def __init__(
         self,
@@ -176,7 +180,10 @@ class Pool(log.Identified, event.EventTarget):
         events: Optional[List[Tuple[_ListenerFnType, str]]] = None,
         dialect: Optional[Union[_ConnDialect, Dialect]] = None,
         pre_ping: bool = False,
+        pre_ping_idle_threshold: Optional[float] = None,
+        collect_metrics: bool = False,
         _dispatch: Optional[_DispatchCommon[Pool]] = None,
+        _metrics: Optional[PoolMetrics] = None,
     ):
         """
         Construct a Pool.
@@ -273,6 +280,37 @@ class Pool(log.Identified, event.EventTarget):
 
          .. versionadded:: 1.2
 
+        :param pre_ping_idle_threshold: when used with
+         :paramref:`_pool.Pool.pre_ping`, a number of seconds; the "ping" is
+         only emitted upon checkout if the connection has been idle in the
+         pool for longer than this period, or if an error was raised the
+         last time the connection was used.   Connections that were
+         returned to the pool more recently are assumed to be alive and are
+         returned without a ping.   Defaults to ``None``, meaning a ping is
+         emitted on every checkout.
+
+         When :paramref:`_pool.Pool.collect_metrics` is set, the number of
+         pings performed and skipped are available from the
+         :attr:`.PoolMetrics.pre_pings` and
+         :attr:`.PoolMetrics.pre_pings_skipped` counters.
+
+         .. versionadded:: 2.1
+
+         .. seealso::
+
+            :ref:`pool_disconnects_pessimistic_idle`
+
+        :param collect_metrics: if True, the pool will record counts and
+         timings of its activity, such as the time spent waiting to check
+         out connections and the number of checkout timeouts, which are
+         available from the :attr:`_pool.Pool.metrics` attribute.
+
+         .. versionadded:: 2.1
+
+         .. seealso::
+
+            :ref:`pool_metrics`
+
         """
         if logging_name:
             self.logging_name = self._orig_logging_name = logging_name
@@ -284,6 +322,9 @@ class Pool(log.Identified, event.EventTarget):
         self._recycle = recycle
         self._invalidate_time = 0
         self._pre_ping = pre_ping
+        if pre_ping_idle_threshold is not None:
+            self._pre_ping_idle_threshold = pre_ping_idle_threshold
+            self._record_checkin_time = True
         self._reset_on_return = util.parse_user_argument_for_enum(
             reset_on_return,
             {
@@ -296,6 +337,13 @@ class Pool(log.Identified, event.EventTarget):
 
         self.echo = echo
 
+        if _metrics is not None:
+            # carry over metrics from a pool that was recreated
+            self._metrics = _metrics
+            _metrics._set_pool(self)
+        elif collect_metrics:
+            self._metrics = PoolMetrics(self)
+
         if _dispatch:
             self.dispatch._update(_dispatch, only_propagate=False)
         if dialect:
@@ -308,6 +356,26 @@ class Pool(log.Identified, event.EventTarget):
     def _is_asyncio(self) -> bool:
         return self._dialect.is_async
 
+    @property
+    def metrics(self) -> Optional[PoolMetrics]:
+        """The :class:`.PoolMetrics` collected for this pool, or ``None``
+        if the :paramref:`_pool.Pool.collect_metrics` parameter was not
+        set.
+
+        The same :class:`.PoolMetrics` object continues to be used when
+        the pool is replaced using :meth:`_pool.Pool.recreate`, such as
+        when :meth:`_engine.Engine.dispose` is called.
+
+        .. versionadded:: 2.1
+
+        """
+        return self._metrics
+
+    def _metrics_gauges(self) -> Dict[str, int]:
+        """Return current pool state for :meth:`.PoolMetrics.gauges`."""
+
+        return {}
+
     @property
     def _creator(self) -> Union[_CreatorFnType, _CreatorWRecFnType]:
         return self._creator_arg
@@ -389,6 +457,11 @@ class Pool(log.Identified, event.EventTarget):
 
         return _ConnectionRecord(self)
 
+    def _do_ping(self, dbapi_connection: DBAPIConnection) -> bool:
+        """Called on checkout to pre-ping a DBAPI connection."""
+
+        return self._dialect._do_ping_w_event(dbapi_connection)
+
     def _invalidate(
         self,
         connection: PoolProxiedConnection,
@@ -438,15 +511,34 @@ class Pool(log.Identified, event.EventTarget):
 
         raise NotImplementedError()
 
-    def connect(self) -> PoolProxiedConnection:
+    def connect(
+        self, deadline: Optional[float] = None
+    ) -> PoolProxiedConnection:
         """Return a DBAPI connection from the pool.
 
         The connection is instrumented such that when its
         ``close()`` method is called, the connection will be returned to
         the pool.
 
+        :param deadline: optional point in time, as a value of
+         ``time.monotonic()``, after which the connection is no longer
+         wanted.  If the deadline has already passed, :class:`.TimeoutError`
+         is raised without checking out a connection; otherwise, a pool
+         that waits for connections to become available, such as
+         :class:`.QueuePool`, waits no later than the deadline.
+
+         .. versionadded:: 2.1
+
         """
-        return _ConnectionFairy._checkout(self)
+        return _ConnectionFairy._checkout(self, deadline=deadline)
+
+    def _connect_route(
+        self, route: str, deadline: Optional[float]
+    ) -> PoolProxiedConnection:
+        """Return a connection for the ``pool_route`` execution option;
+        pools other than :class:`.RoutingPool` have only one route."""
+
+        return self.connect(deadline=deadline)
 
     def _return_conn(self, record: ConnectionPoolEntry) -> None:
         """Given a _ConnectionRecord, return it to the :class:`_pool.Pool`.
@@ -462,6 +554,25 @@ class Pool(log.Identified, event.EventTarget):
 
         raise NotImplementedError()
 
+    def _do_get_deadline(self, deadline: float) -> ConnectionPoolEntry:
+        """Implementation for :meth:`get` given a deadline; subclasses
+        which wait for connections limit the wait to the deadline."""
+
+        self._deadline_remaining(deadline)
+        return self._do_get()
+
+    def _deadline_remaining(self, deadline: float) -> float:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            if self._metrics is not None:
+                self._metrics.timeouts += 1
+            raise exc.TimeoutError(
+                "Connection checkout deadline passed %0.2f seconds ago"
+                % -remaining,
+                code="3o7r",
+            )
+        return remaining
+
     def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
         """Implementation for :meth:`return_conn`, supplied by subclasses."""
 
@@ -696,6 +807,17 @@ class _ConnectionRecord(ConnectionPoolEntry):
 
     _soft_invalidate_time: float = 0
 
+    # perf_counter() value at checkout, when pool metrics are collected
+    _checkout_time: float = 0
+
+    # time.time() value at checkin, when pre-ping is limited to idle
+    # connections or idle connections are closed by pool maintenance
+    _checkin_time: float = 0
+
+    # set when an error was raised while the connection was in use, so that
+    # a pre-ping limited to idle connections will ping it regardless
+    _requires_ping: bool = False
+
     @util.ro_memoized_property
     def info(self) -> _InfoType:
         return {}
@@ -705,11 +827,19 @@ class _ConnectionRecord(ConnectionPoolEntry):
         return {}
 
     @classmethod
-    def checkout(cls, pool: Pool) -> _ConnectionFairy:
+    def checkout(
+        cls, pool: Pool, deadline: Optional[float] = None
+    ) -> _ConnectionFairy:
+        metrics = pool._metrics
+        if metrics is not None:
+            start = time.perf_counter()
+
         if TYPE_CHECKING:
             rec = cast(_ConnectionRecord, pool._do_get())
-        else:
+        elif deadline is None:
             rec = pool._do_get()
+        else:
+            rec = pool._do_get_deadline(deadline)
 
         try:
             dbapi_connection = rec.get_connection()
@@ -720,6 +850,11 @@ class _ConnectionRecord(ConnectionPoolEntry):
             # not reached, for code linters only
             raise
 
+        if metrics is not None:
+            rec._checkout_time = now = time.perf_counter()
+            metrics.checkout_wait.observe(now - start)
+            metrics.checkouts += 1
+
         echo = pool._should_log_debug()
         fairy = _ConnectionFairy(pool, dbapi_connection, rec, echo)
 
@@ -762,6 +897,18 @@ class _ConnectionRecord(ConnectionPoolEntry):
         self.fairy_ref = None
         connection = self.dbapi_connection
         pool = self.__pool
+
+        metrics = pool._metrics
+        if metrics is not None and self._checkout_time:
+            metrics.checkout_held.observe(
+                time.perf_counter() - self._checkout_time
+            )
+            metrics.checkins += 1
+            self._checkout_time = 0
+
+        if pool._record_checkin_time:
+            self._checkin_time = time.time()
+
         while self.finalize_callback:
             finalizer = self.finalize_callback.pop()
             if connection is not None:
@@ -789,6 +936,8 @@ class _ConnectionRecord(ConnectionPoolEntry):
         # already invalidated
         if self.dbapi_connection is None:
             return
+        if self.__pool._metrics is not None:
+            self.__pool._metrics.invalidations += 1
         if soft:
             self.__pool.dispatch.soft_invalidate(
                 self.dbapi_connection, self, e
@@ -860,6 +1009,8 @@ class _ConnectionRecord(ConnectionPoolEntry):
             recycle = True
 
         if recycle:
+            if self.__pool._metrics is not None:
+                self.__pool._metrics.recycles += 1
             self.__close(terminate=True)
             self.info.clear()
 
@@ -868,6 +1019,14 @@ class _ConnectionRecord(ConnectionPoolEntry):
         assert self.dbapi_connection is not None
         return self.dbapi_connection
 
+    def _skip_pre_ping(self, pool: Pool) -> bool:
+        threshold = pool._pre_ping_idle_threshold
+        return (
+            threshold is not None
+            and not self._requires_ping
+            and time.time() - self._checkin_time < threshold
+        )
+
     def _is_hard_or_soft_invalidated(self) -> bool:
         return (
             self.dbapi_connection is None
@@ -891,13 +1050,22 @@ class _ConnectionRecord(ConnectionPoolEntry):
         # ensure any existing connection is removed, so that if
         # creator fails, this attribute stays None
         self.dbapi_connection = None
+        metrics = pool._metrics
+        self._requires_ping = False
         try:
             self.starttime = time.time()
+            if metrics is not None:
+                start = time.perf_counter()
             self.dbapi_connection = connection = pool._invoke_creator(self)
+            if metrics is not None:
+                metrics.connect_time.observe(time.perf_counter() - start)
+                metrics.connects += 1
             pool.logger.debug("Created new connection %r", connection)
             self.fresh = True
         except BaseException as e:
             with util.safe_reraise():
+                if metrics is not None:
+                    metrics.connect_errors += 1
                 pool.logger.debug("Error on connect(): %s", e)
         else:
             # in SQLAlchemy 1.4 the first_connect event is not used by
@@ -1123,6 +1291,11 @@ class PoolProxiedConnection(ManagesConnection):
         """
         raise NotImplementedError()
 
+    def _set_requires_ping(self) -> None:
+        """Indicate that an error was raised while using this connection,
+        so that it is pinged on next checkout when
+        :paramref:`_pool.Pool.pre_ping_idle_threshold` is in use."""
+
 
 class _AdhocProxiedConnection(PoolProxiedConnection):
     """provides the :class:`.PoolProxiedConnection` interface for cases where
@@ -1258,9 +1431,10 @@ class _ConnectionFairy(PoolProxiedConnection):
         pool: Pool,
         threadconns: Optional[threading.local] = None,
         fairy: Optional[_ConnectionFairy] = None,
+        deadline: Optional[float] = None,
     ) -> _ConnectionFairy:
         if not fairy:
-            fairy = _ConnectionRecord.checkout(pool)
+            fairy = _ConnectionRecord.checkout(pool, deadline)
 
             if threadconns is not None:
                 threadconns.current = weakref.ref(fairy)
@@ -1291,16 +1465,36 @@ class _ConnectionFairy(PoolProxiedConnection):
             fairy._connection_record.fresh = False
             try:
                 if pool._pre_ping:
-                    if not connection_is_fresh:
+                    if connection_is_fresh:
+                        if pool._metrics is not None:
+                            pool._metrics.pre_pings_skipped += 1
+                        if fairy._echo:
+                            pool.logger.debug(
+                                "Connection %s is fresh, skipping pre-ping",
+                                fairy.dbapi_connection,
+                            )
+                    elif fairy._connection_record._skip_pre_ping(pool):
+                        if pool._metrics is not None:
+                            pool._metrics.pre_pings_skipped += 1
+                        if fairy._echo:
+                            pool.logger.debug(
+                                "Connection %s was recently used, "
+                                "skipping pre-ping",
+                                fairy.dbapi_connection,
+                            )
+                    else:
                         if fairy._echo:
                             pool.logger.debug(
                                 "Pool pre-ping on connection %s",
                                 fairy.dbapi_connection,
                             )
-                        result = pool._dialect._do_ping_w_event(
-                            fairy.dbapi_connection
-                        )
+                        fairy._connection_record._requires_ping = False
+                        if pool._metrics is not None:
+                            pool._metrics.pre_pings += 1
+                        result = pool._do_ping(fairy.dbapi_connection)
                         if not result:
+                            if pool._metrics is not None:
+                                pool._metrics.pre_ping_failures += 1
                             if fairy._echo:
                                 pool.logger.debug(
                                     "Pool pre-ping on connection %s failed, "
@@ -1308,11 +1502,6 @@ class _ConnectionFairy(PoolProxiedConnection):
                                     fairy.dbapi_connection,
                                 )
                             raise exc.InvalidatePoolError()
-                    elif fairy._echo:
-                        pool.logger.debug(
-                            "Connection %s is fresh, skipping pre-ping",
-                            fairy.dbapi_connection,
-                        )
 
                 pool.dispatch.checkout(
                     fairy.dbapi_connection, fairy._connection_record, fairy
@@ -1378,6 +1567,10 @@ class _ConnectionFairy(PoolProxiedConnection):
         fairy.invalidate()
         raise exc.InvalidRequestError("This connection is closed")
 
+    def _set_requires_ping(self) -> None:
+        if self._connection_record is not None:
+            self._connection_record._requires_ping = True
+
     def _checkout_existing(self) -> _ConnectionFairy:
         return _ConnectionFairy._checkout(self._pool, fairy=self)
 
@@ -66,6 +66,7 @@ from .expression import (
 )
 from .expression import lambda_stmt as lambda_stmt
 from .expression import LambdaElement as LambdaElement
+from .expression import load_lambda_analysis as load_lambda_analysis
 from .expression import lateral as lateral
 from .expression import literal as literal
 from .expression import literal_column as literal_column
@@ -81,6 +82,7 @@ from .expression import outerjoin as outerjoin
 from .expression import outparam as outparam
 from .expression import over as over
 from .expression import quoted_name as quoted_name
+from .expression import save_lambda_analysis as save_lambda_analysis
 from .expression import Select as Select
 from .expression import select as select
 from .expression import Selectable as Selectable
@@ -106,6 +106,15 @@ class anon_map(
         self_dict[key] = val
         return val
 
+    def update_from(self: anon_map, other: anon_map, /) -> None:
+        """Update this map with the keys of another :class:`.anon_map`,
+        continuing the sequence from where the other map left off.
+
+        """
+        self_dict: dict = self  # type: ignore[type-arg]
+        self_dict.update(other)
+        self._index = other._index
+
     def get_anon(self: anon_map, obj: object, /) -> Tuple[int, bool]:
         self_dict: dict = self  # type: ignore[type-arg]
 
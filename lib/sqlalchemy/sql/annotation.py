@@ -363,8 +363,13 @@ class Annotated(SupportsAnnotations):
             clone.__dict__.update(self.__dict__)
             return self.__class__(clone, self._annotations)
 
-    def __reduce__(self) -> Tuple[Type[Annotated], Tuple[Any, ...]]:
-        return self.__class__, (self.__element, self._annotations)
+    def __reduce__(self) -> Tuple[Callable[..., Annotated], Tuple[Any, ...]]:
+        # annotated classes are generated on demand, so the class may not
+        # yet exist in the process where this object is unpickled
+        return Annotated._as_annotated_instance, (
+            self.__element,
+            self._annotations,
+        )
 
     def __hash__(self) -> int:
         return self._hash
@@ -253,11 +253,13 @@ def _select_iterables(
     )
 
 
-_SelfGenerativeType = TypeVar("_SelfGenerativeType", bound="_GenerativeType")
-
-
-class _GenerativeType(Protocol):
-    def _generate(self) -> Self: ...
+_inline_generative = util.inline_decorator(
+    """\
+%(self)s = %(self)s._generate()
+x = %(fn)s(%(apply)s)
+assert x is %(self)s, "generative methods must return self"
+return %(self)s"""
+)
 
 
 def _generative(fn: _Fn) -> _Fn:
@@ -266,20 +268,14 @@ def _generative(fn: _Fn) -> _Fn:
     This is basically the legacy decorator that copies the object and
     runs a method on the new copy.
 
-    """
+    As generative methods are typically invoked many times in a chain
+    when building up a statement, the copy and call are inlined into
+    the generated method itself, rather than being invoked through an
+    additional wrapper function.
 
-    @util.decorator
-    def _generative(
-        fn: _Fn, self: _SelfGenerativeType, *args: Any, **kw: Any
-    ) -> _SelfGenerativeType:
-        """Mark a method as generative."""
-
-        self = self._generate()
-        x = fn(self, *args, **kw)
-        assert x is self, "generative methods must return self"
-        return self
+    """
 
-    decorated = _generative(fn)
+    decorated = _inline_generative(fn)
     decorated.non_generative = fn  # type: ignore
     return decorated
 
@@ -1156,8 +1152,11 @@ class Executable(roles.StatementRole):
         no_parameters: bool = False,
         stream_results: bool = False,
         max_row_buffer: int = ...,
+        max_buffer_bytes: int = ...,
+        prefetch: int = ...,
         yield_per: int = ...,
         insertmanyvalues_page_size: int = ...,
+        insert_copy: bool = False,
         schema_translate_map: Optional[SchemaTranslateMapType] = ...,
         populate_existing: bool = False,
         autoflush: bool = False,
@@ -608,6 +608,60 @@ def _ad_hoc_cache_key_from_args(
     return tup
 
 
+def _find_uncacheable_element(
+    element: HasCacheKey,
+) -> Optional[Tuple[HasCacheKey, str]]:
+    """Locate the element within a structure that prevents it from
+    producing a cache key.
+
+    Returns the innermost element that can't produce a cache key along
+    with a description of why, or None if the structure produces a cache
+    key.   Each element along the path is keyed individually, so this is
+    for diagnostic use only; see :class:`.CacheProfiler`.
+
+    """
+    if HasCacheKey._generate_cache_key_for_object(element) is not None:
+        return None
+
+    while True:
+        children: List[Any] = list(getattr(element, "_with_options", ()))
+        if isinstance(element, HasTraverseInternals):
+            children.extend(element.get_children())
+        for child in children:
+            if (
+                isinstance(child, HasCacheKey)
+                and HasCacheKey._generate_cache_key_for_object(child) is None
+            ):
+                element = child
+                break
+        else:
+            break
+
+    cls = element.__class__
+    type_ = getattr(element, "type", None)
+    if cls.__dict__.get("_generated_cache_key_traversal", None) is NO_CACHE:
+        if cls.__dict__.get("inherit_cache", None) is None:
+            reason = (
+                "class %s does not set the 'inherit_cache' attribute to True"
+                % cls.__name__
+            )
+        else:
+            reason = "class %s has caching disabled" % cls.__name__
+    elif type_ is not None and type_._static_cache_key is NO_CACHE:
+        if hasattr(type_, "cache_ok"):
+            reason = (
+                "type %s does not set the 'cache_ok' attribute to True"
+                % type_.__class__.__name__
+            )
+        else:
+            reason = "type %s does not produce a cache key" % (
+                type_.__class__.__name__
+            )
+    else:
+        reason = "%s does not produce a cache key" % cls.__name__
+    return element, reason
+
+
 class _CacheKeyTraversal(HasTraversalDispatch):
     # very common elements are inlined into the main _get_cache_key() method
     # to produce a dramatic savings in Python function call overhead
@@ -116,6 +116,7 @@ if typing.TYPE_CHECKING:
     from .selectable import ReturnsRows
     from .selectable import Select
     from .selectable import SelectState
+    from .selectable import TableClause
     from .type_api import _BindProcessorType
     from ..engine.cursor import CursorResultMetaData
     from ..engine.interfaces import _CoreSingleExecuteParams
@@ -614,6 +615,29 @@ class _InsertManyValuesBatch(NamedTuple):
     is_downgraded: bool
 
 
+class _CopyInsert(NamedTuple):
+    """represents an INSERT statement whose parameter sets may instead be
+    delivered using a bulk copy facility, such as PostgreSQL's
+    ``COPY FROM STDIN``.
+
+    The primary consumer of this object is the
+    :meth:`.Dialect.do_copy_insert` method.
+
+    .. versionadded:: 2.1
+
+    """
+
+    table: TableClause
+    """The table that's the target of the INSERT."""
+
+    columns: List[ColumnElement[Any]]
+    """The columns that receive a value from each parameter set."""
+
+    keys: List[str]
+    """The bound parameter names that supply the value for each of
+    :attr:`._CopyInsert.columns`, in the same order."""
+
+
 class InsertmanyvaluesSentinelOpts(FastIntFlag):
     """bitflag enum indicating styles of PK defaults
     which can work as implicit sentinel columns
@@ -826,6 +850,35 @@ class Compiled:
     """Generation time of this :class:`.Compiled`, used for reporting
     cache stats."""
 
+    _compile_time: float
+    """Time taken to compile this :class:`.Compiled`, used by
+    :class:`.CompiledCache` to weigh the cost of evicting it."""
+
+    _execution_count: int = 0
+    """Number of times this :class:`.Compiled` was executed from a compiled
+    cache, tracked when the
+    :paramref:`_sa.create_engine.prepared_statement_threshold` parameter is
+    in use."""
+
+    _cache_evicted: bool = False
+    """Set when this :class:`.Compiled` is evicted from a
+    :class:`.CompiledCache`, after which it's no longer considered for
+    server-side preparation."""
+
+    def _use_prepared(self, threshold: int) -> bool:
+        """Count an execution of this :class:`.Compiled` from a compiled
+        cache, returning True if it has been executed often enough that it
+        should use a server-side prepared statement.
+
+        The count is not synchronized, so may be approximate under
+        concurrency.
+
+        """
+        if self._cache_evicted:
+            return False
+        self._execution_count = count = self._execution_count + 1
+        return count >= threshold
+
     def __init__(
         self,
         dialect: Dialect,
@@ -852,6 +905,7 @@ class Compiled:
 
 
         """
+        start = perf_counter()
         self.dialect = dialect
         self.preparer = self.dialect.identifier_preparer
         if schema_translate_map:
@@ -881,6 +935,7 @@ class Compiled:
             self.state = CompilerState.NO_STATEMENT
 
         self._gen_time = perf_counter()
+        self._compile_time = self._gen_time - start
 
     def __init_subclass__(cls) -> None:
         cls._init_compiler_cls()
@@ -1241,10 +1296,20 @@ class SQLCompiler(Compiled):
 
     _pre_expanded_positiontup: Optional[List[str]] = None
 
+    _expanded_cache_size = 100
+    """Maximum number of entries memoized per compiled object for each of
+    the expanding parameter and expanded statement caches.
+
+    .. versionadded:: 2.1
+
+    """
+
     _insertmanyvalues: Optional[_InsertManyValues] = None
 
     _insert_crud_params: Optional[crud._CrudParamSequence] = None
 
+    _copy_insert: Optional[_CopyInsert] = None
+
     literal_execute_params: FrozenSet[BindParameter[Any]] = frozenset()
     """bindparameter objects that are rendered as literal values at statement
     execution time.
@@ -2047,6 +2112,12 @@ class SQLCompiler(Compiled):
         replacement_expressions: Dict[str, Any] = {}
         to_update_sets: Dict[str, Any] = {}
 
+        # the expanded statement string is memoized based on the
+        # replacement expressions, as long as none of them are rendered
+        # literal values
+        memoize_statement = True
+        pad_in_clause = self.dialect.in_clause_padding
+
         # notes:
         # *unescaped* parameter names in:
         # self.bind_names, self.binds, self._bind_processors, self.positiontup
@@ -2069,6 +2140,7 @@ class SQLCompiler(Compiled):
             parameter = self.binds[name]
 
             if parameter in self.literal_execute_params:
+                memoize_statement = False
                 if escaped_name not in replacement_expressions:
                     replacement_expressions[escaped_name] = (
                         self.render_literal_bindparam(
@@ -2096,6 +2168,11 @@ class SQLCompiler(Compiled):
                     # in the escaped_bind_names dictionary.
                     values = parameters.pop(name)
 
+                    if parameter.literal_execute:
+                        memoize_statement = False
+                    elif pad_in_clause and values:
+                        values = self._pad_in_clause_values(values)
+
                     leep_res = self._literal_execute_expanding_parameter(
                         escaped_name, parameter, values
                     )
@@ -2139,37 +2216,39 @@ class SQLCompiler(Compiled):
             elif new_positiontup is not None:
                 new_positiontup.append(name)
 
-        def process_expanding(m):
-            key = m.group(1)
-            expr = replacement_expressions[key]
+        statement_key: Optional[Tuple[Any, ...]]
+        if memoize_statement:
+            statement_key = tuple(replacement_expressions.values())
+            statement = self._expanded_statement_cache.get(statement_key)
+        else:
+            statement_key = statement = None
 
-            # if POSTCOMPILE included a bind_expression, render that
-            # around each element
-            if m.group(2):
-                tok = m.group(2).split("~~")
-                be_left, be_right = tok[1], tok[3]
-                expr = ", ".join(
-                    "%s%s%s" % (be_left, exp, be_right)
-                    for exp in expr.split(", ")
+        if statement is None:
+            statement = self._render_post_compile_template(
+                replacement_expressions
+            )
+
+            if numeric_positiontup is not None:
+                param_pos = {
+                    key: f"{self._numeric_binds_identifier_char}{num}"
+                    for num, key in enumerate(
+                        numeric_positiontup, self.next_numeric_pos
+                    )
+                }
+                # Can't use format here since % chars are not escaped.
+                statement = self._pyformat_pattern.sub(
+                    lambda m: param_pos[m.group(1)], statement
                 )
-            return expr
 
-        statement = re.sub(
-            self._post_compile_pattern, process_expanding, pre_expanded_string
-        )
+            if (
+                statement_key is not None
+                and len(self._expanded_statement_cache)
+                < self._expanded_cache_size
+            ):
+                self._expanded_statement_cache[statement_key] = statement
 
         if numeric_positiontup is not None:
             assert new_positiontup is not None
-            param_pos = {
-                key: f"{self._numeric_binds_identifier_char}{num}"
-                for num, key in enumerate(
-                    numeric_positiontup, self.next_numeric_pos
-                )
-            }
-            # Can't use format here since % chars are not escaped.
-            statement = self._pyformat_pattern.sub(
-                lambda m: param_pos[m.group(1)], statement
-            )
             new_positiontup.extend(numeric_positiontup)
 
         expanded_state = ExpandedState(
@@ -2196,6 +2275,62 @@ class SQLCompiler(Compiled):
 
         return expanded_state
 
+    @util.memoized_property
+    def _expanded_statement_cache(self) -> Dict[Tuple[Any, ...], str]:
+        return {}
+
+    @util.memoized_property
+    def _expanding_parameter_cache(
+        self,
+    ) -> Dict[Tuple[str, int], Tuple[List[str], str]]:
+        return {}
+
+    @util.memoized_property
+    def _post_compile_template(
+        self,
+    ) -> Tuple[List[str], List[Tuple[str, Optional[Tuple[str, str]]]]]:
+        """The pre-expanded SQL string split into literal segments
+        and the POSTCOMPILE tokens between them, so that expanded forms
+        of the statement can be rendered using a join.
+
+        """
+        pre_expanded_string = self._pre_expanded_string
+        if pre_expanded_string is None:
+            pre_expanded_string = self.string
+
+        split = self._post_compile_pattern.split(pre_expanded_string)
+
+        segments = split[0::3]
+        tokens: List[Tuple[str, Optional[Tuple[str, str]]]] = []
+        for key, bind_expression in zip(split[1::3], split[2::3]):
+            if bind_expression:
+                tok = bind_expression.split("~~")
+                tokens.append((key, (tok[1], tok[3])))
+            else:
+                tokens.append((key, None))
+        return segments, tokens
+
+    def _render_post_compile_template(
+        self, replacement_expressions: Mapping[str, str]
+    ) -> str:
+        segments, tokens = self._post_compile_template
+
+        rendered = [segments[0]]
+        for (key, bind_expression), segment in zip(tokens, segments[1:]):
+            expr = replacement_expressions[key]
+
+            # if POSTCOMPILE included a bind_expression, render that
+            # around each element
+            if bind_expression is not None:
+                be_left, be_right = bind_expression
+                expr = ", ".join(
+                    "%s%s%s" % (be_left, exp, be_right)
+                    for exp in expr.split(", ")
+                )
+            rendered.append(expr)
+            rendered.append(segment)
+        return "".join(rendered)
+
     @util.preload_module("sqlalchemy.engine.cursor")
     def _create_result_map(self):
         """utility method used for unit tests only."""
@@ -3279,6 +3414,17 @@ class SQLCompiler(Compiled):
 
         return (), replacement_expression
 
+    def _pad_in_clause_values(self, values: Sequence[Any]) -> List[Any]:
+        """pad a list of expanding parameter values to the next power of
+        two in length by repeating the last value, for the
+        :paramref:`_sa.create_engine.in_clause_padding` feature.
+
+        """
+        values = list(values)
+        padded_length = 1 << (len(values) - 1).bit_length()
+        values.extend([values[-1]] * (padded_length - len(values)))
+        return values
+
     def _literal_execute_expanding_parameter(self, name, parameter, values):
         if parameter.literal_execute:
             return self._literal_execute_expanding_parameter_literal_binds(
@@ -3348,13 +3494,22 @@ class SQLCompiler(Compiled):
                 for i, tuple_element in enumerate(values)
             )
         else:
-            to_update = [
-                ("%s_%s" % (name, i), value)
-                for i, value in enumerate(values, 1)
-            ]
-            replacement_expression = ", ".join(
-                _render_bindtemplate(key) for key, value in to_update
-            )
+            cache_key = (name, len(values))
+            cached = self._expanding_parameter_cache.get(cache_key)
+            if cached is None:
+                keys = ["%s_%s" % (name, i) for i in range(1, len(values) + 1)]
+                cached = (
+                    keys,
+                    ", ".join(_render_bindtemplate(key) for key in keys),
+                )
+                if (
+                    len(self._expanding_parameter_cache)
+                    < self._expanded_cache_size
+                ):
+                    self._expanding_parameter_cache[cache_key] = cached
+
+            keys, replacement_expression = cached
+            to_update = list(zip(keys, values))
 
         return to_update, replacement_expression
 
@@ -5741,6 +5896,38 @@ class SQLCompiler(Compiled):
             )
             batchnum += 1
 
+    def _get_copy_insert(
+        self,
+        insert_stmt: Insert,
+        crud_params: List[crud._CrudParamElementStr],
+    ) -> Optional[_CopyInsert]:
+        """Return a :class:`._CopyInsert` for the given INSERT, if each of
+        the values it inserts is a plain bound parameter, else None.
+
+        """
+        if not crud_params:
+            return None
+
+        columns = []
+        keys = []
+        for col, _, value, bind_names in crud_params:
+            names = list(bind_names)
+            if len(names) != 1:
+                # SQL expression, or a server side default such as a
+                # sequence rendered inline
+                return None
+            name = names[0]
+            bindparam = self.binds[name]
+            if value != self.bindparam_string(
+                name, bindparam_type=bindparam.type
+            ):
+                # SQL expression or bind expression wrapping a parameter
+                return None
+            columns.append(col)
+            keys.append(name)
+
+        return _CopyInsert(insert_stmt.table, columns, keys)
+
     def visit_insert(
         self, insert_stmt, visited_bindparam=None, visiting_cte=None, **kw
     ):
@@ -6087,6 +6274,23 @@ class SQLCompiler(Compiled):
             else:
                 text += f" VALUES ({insert_single_values_expr})"
 
+            if (
+                self.dialect.supports_copy_insert
+                and toplevel
+                and not returning_cols
+                and not insert_stmt._prefixes
+                and not insert_stmt._hints
+                and insert_stmt._post_values_clause is None
+                and not self.ctes
+            ):
+                self._copy_insert = self._get_copy_insert(
+                    insert_stmt,
+                    cast(
+                        "List[crud._CrudParamElementStr]",
+                        crud_params_single,
+                    ),
+                )
+
         if insert_stmt._post_values_clause is not None:
             post_values_clause = self.process(
                 insert_stmt._post_values_clause, **kw
@@ -113,6 +113,8 @@ from .functions import FunctionElement as FunctionElement
 from .functions import modifier as modifier
 from .lambdas import lambda_stmt as lambda_stmt
 from .lambdas import LambdaElement as LambdaElement
+from .lambdas import load_lambda_analysis as load_lambda_analysis
+from .lambdas import save_lambda_analysis as save_lambda_analysis
 from .lambdas import StatementLambdaElement as StatementLambdaElement
 from .operators import ColumnOperators as ColumnOperators
 from .operators import custom_op as custom_op
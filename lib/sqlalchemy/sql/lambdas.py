@@ -9,15 +9,19 @@
 from __future__ import annotations
 
 import collections.abc as collections_abc
+import hashlib
 import inspect
 import itertools
 import operator
+import pickle
 import threading
 import types
 from types import CodeType
 from typing import Any
 from typing import Callable
 from typing import cast
+from typing import Dict
+from typing import IO
 from typing import List
 from typing import MutableMapping
 from typing import Optional
@@ -151,6 +155,124 @@ def lambda_stmt(
     )
 
 
+_ANALYSIS_MAGIC = b"SALA"
+_ANALYSIS_VERSION = 1
+
+
+def save_lambda_analysis(file: Union[str, IO[bytes]]) -> int:
+    """Write the analysis of each lambda used with :func:`_sql.lambda_stmt`
+    and related constructs in the current process to a file, so that a new
+    process may skip analyzing them using :func:`_sql.load_lambda_analysis`.
+
+    The first time a particular lambda is used in a process, its code and
+    closure are inspected in order to determine which closure and global
+    variables produce bound parameters and which are part of the cache key,
+    and the lambda is invoked with instrumented variables.   An application
+    making use of a large number of lambdas, particularly one with many
+    worker processes, may save this analysis once warmed up::
+
+        from sqlalchemy.sql import save_lambda_analysis
+
+        save_lambda_analysis("/var/cache/myapp/lambdas.bin")
+
+    Lambdas are identified by the filename, line number and bytecode of
+    their code object, so that a file saved by one version of an
+    application is not used for lambdas that have since changed.  The file
+    is specific to the SQLAlchemy version in use.
+
+    .. versionadded:: 2.1
+
+    :param file: filename or binary file object to write to.
+
+    :return: number of lambdas written to the file.
+
+    .. seealso::
+
+        :ref:`engine_lambda_caching`
+
+    """
+    with AnalyzedCode._generation_mutex:
+        entries = dict(AnalyzedCode._preloaded)
+        for code, analyzed in list(AnalyzedCode._fns.items()):
+            entries[_code_key(code)] = analyzed._record()
+
+    from .. import __version__
+
+    data = {
+        "version": _ANALYSIS_VERSION,
+        "sqlalchemy": __version__,
+        "entries": entries,
+    }
+
+    if isinstance(file, str):
+        with open(file, "wb") as file_:
+            file_.write(_ANALYSIS_MAGIC)
+            pickle.dump(data, file_, pickle.HIGHEST_PROTOCOL)
+    else:
+        file.write(_ANALYSIS_MAGIC)
+        pickle.dump(data, file, pickle.HIGHEST_PROTOCOL)
+    return len(entries)
+
+
+def load_lambda_analysis(file: Union[str, IO[bytes]]) -> int:
+    """Load lambda analysis written by :func:`_sql.save_lambda_analysis`.
+
+    Each lambda present in the file is then set up from its saved analysis
+    the first time it is used, rather than being analyzed and invoked with
+    instrumented variables.   This is typically called at application
+    startup, or in a worker process after it's been forked::
+
+        from sqlalchemy.sql import load_lambda_analysis
+
+        load_lambda_analysis("/var/cache/myapp/lambdas.bin")
+
+    Analysis is only used for a lambda whose code object matches that of
+    the lambda that was saved, and which is used with the same tracking
+    options.  Lambdas which were already analyzed in the current process
+    are not affected.
+
+    .. warning:: The file is loaded using ``pickle``, so should only be
+       loaded from a trusted source.
+
+    .. versionadded:: 2.1
+
+    :param file: filename or binary file object to read from.
+
+    :return: number of lambdas loaded, or zero if the file was written by a
+     different version of SQLAlchemy.
+
+    """
+    if isinstance(file, str):
+        with open(file, "rb") as file_:
+            return _load_lambda_analysis(file_)
+    else:
+        return _load_lambda_analysis(file)
+
+
+def _load_lambda_analysis(file: IO[bytes]) -> int:
+    if file.read(len(_ANALYSIS_MAGIC)) != _ANALYSIS_MAGIC:
+        raise exc.ArgumentError("File does not contain lambda analysis")
+    data = pickle.load(file)
+
+    from .. import __version__
+
+    if (
+        data["version"] != _ANALYSIS_VERSION
+        or data["sqlalchemy"] != __version__
+    ):
+        util.warn(
+            "Lambda analysis was saved using SQLAlchemy %s, which does not "
+            "match the current SQLAlchemy %s; the analysis will not be loaded"
+            % (data["sqlalchemy"], __version__)
+        )
+        return 0
+
+    entries = data["entries"]
+    with AnalyzedCode._generation_mutex:
+        AnalyzedCode._preloaded.update(entries)
+    return len(entries)
+
+
 class LambdaElement(elements.ClauseElement):
     """A SQL construct where the state is stored as an un-invoked lambda.
 
@@ -728,6 +850,19 @@ class LinkedLambdaElement(StatementLambdaElement):
         return fn(self.parent_lambda._resolved)
 
 
+def _code_key(code: CodeType) -> Tuple[Any, ...]:
+    """Identify a code object across processes."""
+
+    return (
+        code.co_filename,
+        code.co_firstlineno,
+        code.co_name,
+        code.co_names,
+        code.co_freevars,
+        hashlib.sha1(code.co_code).hexdigest(),
+    )
+
+
 class AnalyzedCode:
     __slots__ = (
         "track_closure_variables",
@@ -735,11 +870,17 @@ class AnalyzedCode:
         "bindparam_trackers",
         "closure_trackers",
         "build_py_wrappers",
+        "opts_key",
+        "tracker_specs",
     )
     _fns: weakref.WeakKeyDictionary[CodeType, AnalyzedCode] = (
         weakref.WeakKeyDictionary()
     )
 
+    # analysis records loaded by load_lambda_analysis(), keyed on
+    # _code_key()
+    _preloaded: Dict[Tuple[Any, ...], Tuple[Any, ...]] = {}
+
     _generation_mutex = threading.RLock()
 
     @classmethod
@@ -755,12 +896,78 @@ class AnalyzedCode:
             if fn.__code__ in cls._fns:
                 return cls._fns[fn.__code__]
 
-            analyzed: AnalyzedCode
-            cls._fns[fn.__code__] = analyzed = AnalyzedCode(
-                fn, lambda_element, lambda_kw, **kw
-            )
+            analyzed: Optional[AnalyzedCode] = None
+            if cls._preloaded:
+                record = cls._preloaded.get(_code_key(fn.__code__))
+                if record is not None:
+                    analyzed = cls._from_record(fn, lambda_kw, record)
+
+            if analyzed is None:
+                analyzed = AnalyzedCode(fn, lambda_element, lambda_kw, **kw)
+            cls._fns[fn.__code__] = analyzed
             return analyzed
 
+    @classmethod
+    def _opts_key(cls, opts):
+        track_on = opts.track_on
+        return (
+            opts.enable_tracking,
+            opts.track_closure_variables,
+            opts.track_bound_values,
+            opts.global_track_bound_values,
+            (
+                tuple(cls._track_on_kind(elem) for elem in track_on)
+                if track_on
+                else None
+            ),
+        )
+
+    @classmethod
+    def _from_record(cls, fn, opts, record):
+        """Re-create an :class:`.AnalyzedCode` from a record produced by
+        :meth:`.AnalyzedCode._record` in this or another process, without
+        analyzing or invoking the lambda.
+
+        Returns None if the record was produced for different options.
+
+        """
+        (
+            opts_key,
+            build_py_wrappers,
+            track_closure_variables,
+            track_bound_values,
+            tracker_specs,
+        ) = record
+
+        if opts_key != cls._opts_key(opts):
+            return None
+
+        self = cls.__new__(cls)
+        self.opts_key = opts_key
+        self.track_closure_variables = track_closure_variables
+        self.track_bound_values = track_bound_values
+        self.build_py_wrappers = list(build_py_wrappers)
+        self.bindparam_trackers = []
+        self.closure_trackers = []
+        self.tracker_specs = []
+        for spec in tracker_specs:
+            self._add_tracker(fn, spec)
+        return self
+
+    def _record(self):
+        """Return a record of this :class:`.AnalyzedCode` consisting only of
+        plain Python data, which may be passed to
+        :meth:`.AnalyzedCode._from_record`.
+
+        """
+        return (
+            self.opts_key,
+            tuple(self.build_py_wrappers),
+            self.track_closure_variables,
+            self.track_bound_values,
+            tuple(self.tracker_specs),
+        )
+
     def __init__(self, fn, lambda_element, opts):
         if inspect.ismethod(fn):
             raise exc.ArgumentError(
@@ -768,6 +975,8 @@ class AnalyzedCode:
             )
         closure = fn.__closure__
 
+        self.opts_key = self._opts_key(opts)
+
         self.track_bound_values = (
             opts.track_bound_values and opts.global_track_bound_values
         )
@@ -787,11 +996,15 @@ class AnalyzedCode:
         # based on what's inside its closure variables.
         self.closure_trackers = []
 
+        # the specs from which each of the above callables were generated,
+        # so that the analysis may be re-created in another process
+        self.tracker_specs = []
+
         self.build_py_wrappers = []
 
         if enable_tracking:
             if track_on:
-                self._init_track_on(track_on)
+                self._init_track_on(fn, track_on)
 
             self._init_globals(fn)
 
@@ -800,15 +1013,42 @@ class AnalyzedCode:
 
         self._setup_additional_closure_trackers(fn, lambda_element, opts)
 
-    def _init_track_on(self, track_on):
-        self.closure_trackers.extend(
-            self._cache_key_getter_track_on(idx, elem)
-            for idx, elem in enumerate(track_on)
-        )
+    def _add_tracker(self, fn, spec):
+        """Generate a bound parameter or cache key getter from a spec
+        tuple, which consists of a kind followed by arguments to the
+        corresponding _bound_parameter_getter_* or _cache_key_getter_*
+        function.
+
+        """
+        kind = spec[0]
+        if kind == "globals":
+            self.bindparam_trackers.append(
+                self._bound_parameter_getter_func_globals(*spec[1:])
+            )
+        elif kind == "closure":
+            self.bindparam_trackers.append(
+                self._bound_parameter_getter_func_closure(*spec[1:])
+            )
+        elif kind == "track_on":
+            self.closure_trackers.append(
+                self._cache_key_getter_track_on(*spec[1:])
+            )
+        elif kind == "closure_variable":
+            self.closure_trackers.append(
+                self._cache_key_getter_closure_variable(fn, *spec[1:])
+            )
+        else:
+            assert False, "unknown tracker spec %r" % (spec,)
+        self.tracker_specs.append(spec)
+
+    def _init_track_on(self, fn, track_on):
+        for idx, elem in enumerate(track_on):
+            self._add_tracker(
+                fn, ("track_on", idx, self._track_on_kind(elem))
+            )
 
     def _init_globals(self, fn):
         build_py_wrappers = self.build_py_wrappers
-        bindparam_trackers = self.bindparam_trackers
         track_bound_values = self.track_bound_values
 
         for name in fn.__code__.co_names:
@@ -820,9 +1060,7 @@ class AnalyzedCode:
             if coercions._deep_is_literal(_bound_value):
                 build_py_wrappers.append((name, None))
                 if track_bound_values:
-                    bindparam_trackers.append(
-                        self._bound_parameter_getter_func_globals(name)
-                    )
+                    self._add_tracker(fn, ("globals", name))
 
     def _init_closure(self, fn):
         build_py_wrappers = self.build_py_wrappers
@@ -830,8 +1068,6 @@ class AnalyzedCode:
 
         track_bound_values = self.track_bound_values
         track_closure_variables = self.track_closure_variables
-        bindparam_trackers = self.bindparam_trackers
-        closure_trackers = self.closure_trackers
 
         for closure_index, (fv, cell) in enumerate(
             zip(fn.__code__.co_freevars, closure)
@@ -841,11 +1077,7 @@ class AnalyzedCode:
             if coercions._deep_is_literal(_bound_value):
                 build_py_wrappers.append((fv, closure_index))
                 if track_bound_values:
-                    bindparam_trackers.append(
-                        self._bound_parameter_getter_func_closure(
-                            fv, closure_index
-                        )
-                    )
+                    self._add_tracker(fn, ("closure", fv, closure_index))
             else:
                 # for normal cell contents, add them to a list that
                 # we can compare later when we get new lambdas.  if
@@ -853,10 +1085,11 @@ class AnalyzedCode:
                 # recalculate the whole lambda and run it again.
 
                 if track_closure_variables:
-                    closure_trackers.append(
-                        self._cache_key_getter_closure_variable(
+                    self._add_tracker(
+                        fn,
+                        self._closure_variable_spec(
                             fn, fv, closure_index, cell.cell_contents
-                        )
+                        ),
                     )
 
     def _setup_additional_closure_trackers(self, fn, lambda_element, opts):
@@ -873,12 +1106,10 @@ class AnalyzedCode:
             fn,
         )
 
-        closure_trackers = self.closure_trackers
-
         for pywrapper in analyzed_function.closure_pywrappers:
             if not pywrapper._sa__has_param:
-                closure_trackers.append(
-                    self._cache_key_getter_tracked_literal(fn, pywrapper)
+                self._add_tracker(
+                    fn, self._tracked_literal_spec(fn, pywrapper)
                 )
 
     @classmethod
@@ -943,13 +1174,22 @@ class AnalyzedCode:
 
         return extract_parameter_value
 
-    def _cache_key_getter_track_on(self, idx, elem):
+    @classmethod
+    def _track_on_kind(cls, elem):
+        if isinstance(elem, tuple):
+            return "tuple"
+        elif isinstance(elem, _cache_key.HasCacheKey):
+            return "cache_key"
+        else:
+            return "value"
+
+    def _cache_key_getter_track_on(self, idx, kind):
         """Return a getter that will extend a cache key with new entries
         from the "track_on" parameter passed to a :class:`.LambdaElement`.
 
         """
 
-        if isinstance(elem, tuple):
+        if kind == "tuple":
             # tuple must contain hascachekey elements
             def get(closure, opts, anon_map, bindparams):
                 return tuple(
@@ -957,7 +1197,7 @@ class AnalyzedCode:
                     for tup_elem in opts.track_on[idx]
                 )
 
-        elif isinstance(elem, _cache_key.HasCacheKey):
+        elif kind == "cache_key":
 
             def get(closure, opts, anon_map, bindparams):
                 return opts.track_on[idx]._gen_cache_key(anon_map, bindparams)
@@ -969,7 +1209,7 @@ class AnalyzedCode:
 
         return get
 
-    def _cache_key_getter_closure_variable(
+    def _closure_variable_spec(
         self,
         fn,
         variable_name,
@@ -977,13 +1217,70 @@ class AnalyzedCode:
         cell_contents,
         use_clause_element=False,
         use_inspect=False,
+    ):
+        """Return a spec for a getter that will extend a cache key with new
+        entries from the ``__closure__`` collection of a particular lambda,
+        based on the current contents of the closure variable.
+
+        """
+
+        if isinstance(cell_contents, _cache_key.HasCacheKey):
+            kind = "cache_key"
+        elif isinstance(cell_contents, types.FunctionType):
+            kind = "function"
+        elif isinstance(cell_contents, collections_abc.Sequence):
+            kind = "sequence"
+        else:
+            # if the object is a mapped class or aliased class, or some
+            # other object in the ORM realm of things like that, imitate
+            # the logic used in coercions.expect() to roll it down to the
+            # SQL element
+            element = cell_contents
+            is_clause_element = False
+            while hasattr(element, "__clause_element__"):
+                is_clause_element = True
+                if not getattr(element, "is_clause_element", False):
+                    element = element.__clause_element__()
+                else:
+                    break
+
+            if not is_clause_element:
+                insp = inspection.inspect(element, raiseerr=False)
+                if insp is not None:
+                    return self._closure_variable_spec(
+                        fn, variable_name, idx, insp, use_inspect=True
+                    )
+            else:
+                return self._closure_variable_spec(
+                    fn, variable_name, idx, element, use_clause_element=True
+                )
+
+            self._raise_for_uncacheable_closure_variable(variable_name, fn)
+
+        return (
+            "closure_variable",
+            variable_name,
+            idx,
+            kind,
+            use_clause_element,
+            use_inspect,
+        )
+
+    def _cache_key_getter_closure_variable(
+        self,
+        fn,
+        variable_name,
+        idx,
+        kind,
+        use_clause_element=False,
+        use_inspect=False,
     ):
         """Return a getter that will extend a cache key with new entries
         from the ``__closure__`` collection of a particular lambda.
 
         """
 
-        if isinstance(cell_contents, _cache_key.HasCacheKey):
+        if kind == "cache_key":
 
             def get(closure, opts, anon_map, bindparams):
                 obj = closure[idx].cell_contents
@@ -996,12 +1293,13 @@ class AnalyzedCode:
 
                 return obj._gen_cache_key(anon_map, bindparams)
 
-        elif isinstance(cell_contents, types.FunctionType):
+        elif kind == "function":
 
             def get(closure, opts, anon_map, bindparams):
                 return closure[idx].cell_contents.__code__
 
-        elif isinstance(cell_contents, collections_abc.Sequence):
+        else:
+            assert kind == "sequence"
 
             def get(closure, opts, anon_map, bindparams):
                 contents = closure[idx].cell_contents
@@ -1016,33 +1314,6 @@ class AnalyzedCode:
                         variable_name, fn, from_=ae
                     )
 
-        else:
-            # if the object is a mapped class or aliased class, or some
-            # other object in the ORM realm of things like that, imitate
-            # the logic used in coercions.expect() to roll it down to the
-            # SQL element
-            element = cell_contents
-            is_clause_element = False
-            while hasattr(element, "__clause_element__"):
-                is_clause_element = True
-                if not getattr(element, "is_clause_element", False):
-                    element = element.__clause_element__()
-                else:
-                    break
-
-            if not is_clause_element:
-                insp = inspection.inspect(element, raiseerr=False)
-                if insp is not None:
-                    return self._cache_key_getter_closure_variable(
-                        fn, variable_name, idx, insp, use_inspect=True
-                    )
-            else:
-                return self._cache_key_getter_closure_variable(
-                    fn, variable_name, idx, element, use_clause_element=True
-                )
-
-            self._raise_for_uncacheable_closure_variable(variable_name, fn)
-
         return get
 
     def _raise_for_uncacheable_closure_variable(
@@ -1064,11 +1335,11 @@ class AnalyzedCode:
             % (variable_name, fn.__code__),
         ) from from_
 
-    def _cache_key_getter_tracked_literal(self, fn, pytracker):
-        """Return a getter that will extend a cache key with new entries
-        from the ``__closure__`` collection of a particular lambda.
+    def _tracked_literal_spec(self, fn, pytracker):
+        """Return a spec for a getter that will extend a cache key with new
+        entries from the ``__closure__`` collection of a particular lambda.
 
-        this getter differs from _cache_key_getter_closure_variable
+        this getter differs from that of _closure_variable_spec
         in that these are detected after the function is run, and PyWrapper
         objects have recorded that a particular literal value is in fact
         not being interpreted as a bound parameter.
@@ -1079,7 +1350,7 @@ class AnalyzedCode:
         closure_index = pytracker._sa__closure_index
         variable_name = pytracker._sa__name
 
-        return self._cache_key_getter_closure_variable(
+        return self._closure_variable_spec(
             fn, variable_name, closure_index, elem
         )
 
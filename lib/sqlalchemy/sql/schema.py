@@ -57,6 +57,7 @@ from typing import TypedDict
 from typing import TypeVar
 from typing import Union
 
+from . import cache_key
 from . import coercions
 from . import ddl
 from . import roles
@@ -2440,6 +2441,73 @@ class Column(DialectKWArgs, SchemaItem, ColumnClause[_T]):
                     if fk.link_to_name is link_to_name:
                         fn(fk)
 
+    def _gen_cache_key(
+        self, anon_map: anon_map, bindparams: List[BindParameter[Any]]
+    ) -> Optional[Tuple[Any, ...]]:
+        memoized = self.__dict__.get("_cache_key_tail")
+        if memoized is None or memoized[0] != id(self):
+            memoized = self._memoize_cache_key_tail()
+
+        tail = memoized[4]
+        if tail is None:
+            return super()._gen_cache_key(anon_map, bindparams)
+
+        cls = self.__class__
+        id_, found = anon_map.get_anon(self)
+        if found:
+            return (id_, cls)
+
+        if (
+            memoized[1] is not self.table
+            or memoized[2] is not self.type
+            or memoized[3] is not self.name
+        ):
+            tail = self._memoize_cache_key_tail()[4]
+            if tail is None:
+                # the new type of the column doesn't support caching
+                anon_map[cache_key.NO_CACHE] = True
+                return None
+
+        return (id_, cls) + tail
+
+    def _memoize_cache_key_tail(
+        self,
+    ) -> Tuple[Any, Any, Any, Any, Optional[Tuple[Any, ...]]]:
+        """memoize the cache key of this :class:`.Column` that follows its
+        anonymous identifier.
+
+        For a :class:`.Column` that isn't annotated and belongs to a
+        :class:`.Table`, this portion of the key is the same within any
+        statement, as long as generating it didn't make use of the
+        anon_map.  The attributes it's derived from
+        are memoized along with it, as these may be replaced, as is the
+        case for the type of a foreign key column.
+
+        """
+        cls = self.__class__
+        table = self.table
+        tail: Optional[Tuple[Any, ...]] = None
+
+        if (
+            not self._annotations
+            and (table is None or isinstance(table, Table))
+            and cls._traverse_internals is Column._traverse_internals
+            and cls._cache_key_traversal is Column._cache_key_traversal
+        ):
+            local_anon_map = visitors.anon_map()
+            key = super()._gen_cache_key(local_anon_map, [])
+            if key is not None and len(local_anon_map) == 1:
+                tail = key[2:]
+
+        memoized = self.__dict__["_cache_key_tail"] = (
+            id(self),
+            table,
+            self.type,
+            self.name,
+            tail,
+        )
+        return memoized
+
     def _on_table_attach(self, fn: Callable[..., Any]) -> None:
         if self.table is not None:
             fn(self, self.table)
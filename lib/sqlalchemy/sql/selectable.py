@@ -149,6 +149,7 @@ if TYPE_CHECKING:
     from .sqltypes import TableValueType
     from .type_api import TypeEngine
     from .visitors import _CloneCallableType
+    from .visitors import anon_map
 
 
 _ColumnsClauseElement = Union["FromClause", ColumnElement[Any], "TextClause"]
@@ -5060,6 +5061,22 @@ class _MemoizedSelectEntities(
             select_stmt._setup_joins = select_stmt._with_options = ()
 
 
+class _SelectCacheKeyState(NamedTuple):
+    """State of a statement-level cache key traversal of a :class:`.Select`
+    following its last WHERE criteria element.
+
+    """
+
+    select_id: int
+    cls: Type[Select[Unpack[TupleAny]]]
+    attrs: Tuple[Any, ...]
+    where_criteria: Tuple[ColumnElement[Any], ...]
+    key: Tuple[Any, ...]
+    where_keys: Tuple[Any, ...]
+    anon_map: anon_map
+    bindparams: List[BindParameter[Any]]
+
+
 class Select(
     HasPrefixes,
     HasSuffixes,
@@ -5134,12 +5151,120 @@ class Select(
         + Executable._executable_traverse_internals
     )
 
-    _cache_key_traversal: _CacheKeyTraversalType = _traverse_internals + [
-        ("_compile_options", InternalTraversal.dp_has_cache_key)
+    # the WHERE criteria is traversed last, so that the cache key of a
+    # Select generated from another using where() can continue from the
+    # state of the other Select's traversal; see Select._gen_cache_key()
+    _cache_key_traversal: _CacheKeyTraversalType = [
+        elem for elem in _traverse_internals if elem[0] != "_where_criteria"
+    ] + [
+        ("_compile_options", InternalTraversal.dp_has_cache_key),
+        ("_where_criteria", InternalTraversal.dp_clauseelement_tuple),
     ]
 
+    _cache_key_state_attrs = tuple(
+        [name for name, _ in _cache_key_traversal[:-1]]
+    )
+
+    _cache_key_state: Optional[_SelectCacheKeyState] = None
+
     _compile_state_factory: Type[SelectState]
 
+    def _gen_cache_key(
+        self, anon_map: anon_map, bindparams: List[BindParameter[Any]]
+    ) -> Optional[Tuple[Any, ...]]:
+        """generate the cache key for this :class:`.Select`.
+
+        When generating a statement-level cache key, the state of the
+        traversal following the WHERE criteria is retained.  A
+        :class:`.Select` generated from this one, which shares all of its
+        elements except for additional WHERE criteria, as is the case when
+        using :meth:`.Select.where`, continues from this state rather than
+        traversing the whole statement again.
+
+        """
+        if (
+            anon_map
+            or bindparams
+            or self.__class__._cache_key_traversal
+            is not Select._cache_key_traversal
+        ):
+            return super()._gen_cache_key(anon_map, bindparams)
+
+        where_criteria = self._where_criteria
+        state = self._cache_key_state
+
+        key: Optional[Tuple[Any, ...]]
+        if state is not None and self._continues_cache_key_state(state):
+            anon_map.update_from(state.anon_map)
+            if state.select_id != id(self):
+                del anon_map[state.select_id]
+                anon_map[id(self)] = 0
+            bindparams.extend(state.bindparams)
+
+            attrs = state.attrs
+            state_key = state.key
+            where_keys = state.where_keys + tuple(
+                [
+                    elem._gen_cache_key(anon_map, bindparams)
+                    for elem in where_criteria[len(state.where_criteria) :]
+                ]
+            )
+            if where_keys:
+                key = state_key + ("_where_criteria", where_keys)
+            else:
+                key = state_key
+        else:
+            key = super()._gen_cache_key(anon_map, bindparams)
+            if key is None or cache_key.NO_CACHE in anon_map:
+                return key
+
+            attrs = tuple(
+                [getattr(self, name) for name in self._cache_key_state_attrs]
+            )
+            if where_criteria:
+                assert key[-2] == "_where_criteria"
+                state_key, where_keys = key[:-2], key[-1]
+            else:
+                state_key, where_keys = key, ()
+
+        if cache_key.NO_CACHE not in anon_map:
+            retained_anon_map = visitors.anon_map()
+            retained_anon_map.update_from(anon_map)
+            self.__dict__["_cache_key_state"] = _SelectCacheKeyState(
+                id(self),
+                self.__class__,
+                attrs,
+                where_criteria,
+                state_key,
+                where_keys,
+                retained_anon_map,
+                list(bindparams),
+            )
+        return key
+
+    def _continues_cache_key_state(self, state: _SelectCacheKeyState) -> bool:
+        if state.cls is not self.__class__:
+            return False
+
+        where_criteria = self._where_criteria
+        if len(where_criteria) < len(state.where_criteria):
+            return False
+
+        for elem, existing in zip(where_criteria, state.where_criteria):
+            if elem is not existing:
+                return False
+
+        for name, existing in zip(self._cache_key_state_attrs, state.attrs):
+            if getattr(self, name) is not existing:
+                return False
+
+        return True
+
+    def __getstate__(self) -> Dict[str, Any]:
+        d = super().__getstate__()
+        d.pop("_cache_key_state", None)
+        return d
+
     @classmethod
     def _create_raw_select(cls, **kw: Any) -> Select[Unpack[TupleAny]]:
         """Create a :class:`.Select` using raw ``__new__`` with no coercions.
@@ -415,6 +415,42 @@ def unwrap_order_by(clause: Any) -> Any:
     return result
 
 
+def unwrap_ordering(
+    clause: Any,
+) -> Tuple[Any, bool, Optional[bool]]:
+    """Break up a single 'order by' expression into a tuple of the
+    expression without ASC/DESC/NULLS FIRST/NULLS LAST, whether or not the
+    ordering is descending, and whether NULLS FIRST (``True``) or NULLS LAST
+    (``False``) was given, or ``None`` if neither.
+
+    Label references are unwrapped to the expression they refer to;
+    a textual label reference, as generated for a plain string, is returned
+    as the string name of the label.
+
+    """
+    descending = False
+    nulls_first: Optional[bool] = None
+
+    while isinstance(clause, UnaryExpression) and (
+        operators.is_ordering_modifier(clause.modifier)  # type: ignore
+    ):
+        if clause.modifier is operators.desc_op:
+            descending = True
+        elif nulls_first is None:
+            if clause.modifier is operators.nulls_first_op:
+                nulls_first = True
+            elif clause.modifier is operators.nulls_last_op:
+                nulls_first = False
+        clause = clause.element
+
+    if isinstance(clause, _label_reference):
+        clause = clause.element
+    if isinstance(clause, _textual_label_reference):
+        clause = clause.element
+
+    return clause, descending, nulls_first
+
+
 def unwrap_label_reference(element):
     def replace(
         element: ExternallyTraversible, **kw: Any
@@ -118,6 +118,7 @@ from .langhelpers import (
 from .langhelpers import hybridmethod as hybridmethod
 from .langhelpers import hybridproperty as hybridproperty
 from .langhelpers import inject_docstring_text as inject_docstring_text
+from .langhelpers import inline_decorator as inline_decorator
 from .langhelpers import iterate_attributes as iterate_attributes
 from .langhelpers import map_bits as map_bits
 from .langhelpers import md5_hex as md5_hex
@@ -312,6 +312,70 @@ def decorator(target: Callable[..., Any]) -> Callable[[_Fn], _Fn]:
     return update_wrapper(decorate, target)  # type: ignore[return-value]
 
 
+def inline_decorator(body: str) -> Callable[[_Fn], _Fn]:
+    """A signature-matching decorator factory which inlines the given
+    code into the decorated function.
+
+    Where :func:`.decorator` produces a function that calls upon a
+    separate target function, here the given ``body`` is placed directly
+    into the generated function, saving a function call for decorators
+    which are invoked very frequently.
+
+    ``body`` is a code template which may refer to ``%(fn)s``, the
+    original function, ``%(self)s``, the name of the function's first
+    argument, and ``%(apply)s``, the full argument list as it would be
+    passed along to the original function.
+
+    """
+
+    def decorate(fn: _Fn) -> _Fn:
+        if not inspect.isfunction(fn):
+            raise Exception("not a decoratable function")
+
+        spec = compat.inspect_getfullargspec(fn)
+        env: Dict[str, Any] = {}
+
+        spec = _update_argspec_defaults_into_env(spec, env)
+
+        names = (
+            tuple(cast("Tuple[str, ...]", spec[0]))
+            + cast("Tuple[str, ...]", spec[1:3])
+            + (fn.__name__,)
+        )
+        (fn_name,) = _unique_symbols(names, "fn")
+
+        metadata: Dict[str, Optional[str]] = dict(
+            fn=fn_name, self=spec[0][0]
+        )
+        metadata.update(format_argspec_plus(spec, grouped=False))
+        metadata["name"] = fn.__name__
+
+        # see decorator() regarding __ positional arguments
+        if "__" in repr(spec[0]):
+            metadata["apply"] = metadata["apply_pos"]
+        else:
+            metadata["apply"] = metadata["apply_kw"]
+
+        code = "def %(name)s%(grouped_args)s:\n" % metadata + "".join(
+            "    %s\n" % line for line in (body % metadata).splitlines()
+        )
+
+        mod = sys.modules[fn.__module__]
+        env.update(vars(mod))
+        env.update({fn_name: fn, "__name__": fn.__module__})
+
+        decorated = cast(
+            types.FunctionType,
+            _exec_code_in_env(code, env, fn.__name__),
+        )
+        decorated.__defaults__ = fn.__defaults__
+
+        decorated.__wrapped__ = fn  # type: ignore[attr-defined]
+        return update_wrapper(decorated, fn)  # type: ignore[return-value]
+
+    return decorate
+
+
 def _update_argspec_defaults_into_env(spec, env):
     """given a FullArgSpec, convert defaults to be symbol names in an env."""
 
@@ -22,11 +22,14 @@ from __future__ import annotations
 
 import asyncio
 from collections import deque
+import itertools
 import threading
 from time import time as _time
 from typing import Any
+from typing import Callable
 from typing import Deque
 from typing import Generic
+from typing import List
 from typing import Optional
 from typing import TypeVar
 
@@ -35,7 +38,7 @@ from .langhelpers import memoized_property
 
 
 _T = TypeVar("_T", bound=Any)
-__all__ = ["Empty", "Full", "Queue"]
+__all__ = ["Empty", "Full", "Queue", "FairQueue", "ShardedQueue"]
 
 
 class Empty(Exception):
@@ -79,6 +82,12 @@ class QueueCommon(Generic[_T]):
     def get(self, block: bool = True, timeout: Optional[float] = None) -> _T:
         raise NotImplementedError()
 
+    def get_matching(self, predicate: Callable[[_T], bool]) -> _T:
+        raise NotImplementedError()
+
+    def snapshot(self) -> List[_T]:
+        raise NotImplementedError()
+
 
 class Queue(QueueCommon[_T]):
     queue: Deque[_T]
@@ -209,6 +218,28 @@ class Queue(QueueCommon[_T]):
 
         return self.get(False)
 
+    def get_matching(self, predicate: Callable[[_T], bool]) -> _T:
+        """Remove and return the item that was put into the queue least
+        recently for which ``predicate`` returns True, without blocking.
+
+        Raise the ``Empty`` exception if there is no such item.
+        """
+
+        with self.not_empty:
+            for item in self.queue:
+                if predicate(item):
+                    self.queue.remove(item)
+                    self.not_full.notify()
+                    return item
+            raise Empty
+
+    def snapshot(self) -> List[_T]:
+        """Return a list of the items in the queue, in the order in which
+        they were put (not reliable!)."""
+
+        with self.mutex:
+            return list(self.queue)
+
     def _init(self, maxsize: int) -> None:
         self.maxsize = maxsize
         self.queue = deque()
@@ -234,6 +265,271 @@ class Queue(QueueCommon[_T]):
             return self.queue.popleft()
 
 
+class _FairWaiter:
+    __slots__ = ("condition", "endtime", "item", "assigned")
+
+    def __init__(
+        self, condition: threading.Condition, endtime: Optional[float]
+    ):
+        self.condition = condition
+        self.endtime = endtime
+        self.assigned = False
+
+
+class FairQueue(Queue[_T]):
+    """A :class:`.Queue` which gives items to waiting threads in the order
+    in which they began waiting.
+
+    With :class:`.Queue`, a thread calling ``get()`` may take an item ahead
+    of threads that are already waiting for one, and waiting threads are
+    woken in no guaranteed order.  Here, an item put into the queue while
+    threads are waiting is assigned directly to the thread that has waited
+    the longest, skipping threads whose timeout has already passed, and
+    ``get()`` waits behind any existing waiters.
+
+    """
+
+    _waiters: Deque[_FairWaiter]
+
+    def __init__(self, maxsize: int = 0, use_lifo: bool = False):
+        super().__init__(maxsize, use_lifo)
+        self._waiters = deque()
+
+    def put(
+        self, item: _T, block: bool = True, timeout: Optional[float] = None
+    ) -> None:
+        """Put an item into the queue, or give it to the thread that has
+        waited the longest for an item.
+
+        The ``block`` and ``timeout`` arguments are as for
+        :meth:`.Queue.put`.
+        """
+
+        with self.mutex:
+            now = None
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                if waiter.endtime is not None:
+                    if now is None:
+                        now = _time()
+                    if waiter.endtime <= now:
+                        # will raise Empty when it wakes up
+                        continue
+                waiter.item = item
+                waiter.assigned = True
+                waiter.condition.notify()
+                return
+            super().put(item, block, timeout)
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> _T:
+        """Remove and return an item from the queue.
+
+        The ``block`` and ``timeout`` arguments are as for
+        :meth:`.Queue.get`; an item is only returned immediately if no
+        other threads are waiting.
+
+        """
+        with self.mutex:
+            if not self._waiters and not self._empty():
+                item = self._get()
+                self.not_full.notify()
+                return item
+            if not block:
+                raise Empty
+
+            if timeout is None:
+                endtime = None
+            else:
+                if timeout < 0:
+                    raise ValueError("'timeout' must be a positive number")
+                endtime = _time() + timeout
+
+            waiter = _FairWaiter(threading.Condition(self.mutex), endtime)
+            self._waiters.append(waiter)
+            while not waiter.assigned:
+                if endtime is None:
+                    waiter.condition.wait()
+                else:
+                    remaining = endtime - _time()
+                    if remaining <= 0.0:
+                        try:
+                            self._waiters.remove(waiter)
+                        except ValueError:
+                            pass
+                        raise Empty
+                    waiter.condition.wait(remaining)
+            return waiter.item  # type: ignore[no-any-return]
+
+
+class ShardedQueue(QueueCommon[_T]):
+    """A queue which distributes items among several shards, each a
+    ``deque``, in order to reduce lock contention among many threads.
+
+    Items are put into, and retrieved first from, a shard associated with
+    the calling thread, using the atomic ``append()`` and ``pop()``
+    methods of ``deque`` without acquiring a lock.  A thread which finds
+    its own shard empty takes the oldest item from another shard.   A lock
+    is used only for threads which need to wait for an item to become
+    available.
+
+    Ordering of items is maintained within each shard only, so ``use_lifo``
+    applies per-shard.  The ``maxsize`` limit is checked without locking
+    and may be briefly exceeded by concurrent calls to ``put()``.
+
+    """
+
+    _shards: List[Deque[_T]]
+
+    def __init__(
+        self, maxsize: int = 0, use_lifo: bool = False, shards: int = 8
+    ):
+        if shards < 1:
+            raise ValueError("'shards' must be a positive number")
+        self.maxsize = maxsize
+        self.use_lifo = use_lifo
+        self._shards = [deque() for _ in range(shards)]
+        self._local = threading.local()
+        self._next_shard = itertools.count()
+        self._waiters = 0
+        self.not_empty = threading.Condition(threading.RLock())
+
+    def _home(self) -> int:
+        try:
+            return self._local.shard  # type: ignore[no-any-return]
+        except AttributeError:
+            shard = self._local.shard = next(self._next_shard) % len(
+                self._shards
+            )
+            return shard
+
+    def qsize(self) -> int:
+        """Return the approximate size of the queue (not reliable!)."""
+
+        return sum(len(shard) for shard in self._shards)
+
+    def empty(self) -> bool:
+        """Return True if the queue is empty, False otherwise (not
+        reliable!)."""
+
+        return not any(self._shards)
+
+    def full(self) -> bool:
+        """Return True if the queue is full, False otherwise (not
+        reliable!)."""
+
+        return self.maxsize > 0 and self.qsize() >= self.maxsize
+
+    def put(
+        self, item: _T, block: bool = True, timeout: Optional[float] = None
+    ) -> None:
+        """Put an item into the queue.
+
+        If the queue is full, raise the ``Full`` exception; ``block`` and
+        ``timeout`` are accepted for compatibility, however waiting for a
+        free slot is not supported.
+        """
+
+        if self.maxsize > 0 and self.qsize() >= self.maxsize:
+            raise Full
+        self._shards[self._home()].append(item)
+        if self._waiters:
+            with self.not_empty:
+                self.not_empty.notify()
+
+    def put_nowait(self, item: _T) -> None:
+        return self.put(item, False)
+
+    def _get_nowait(self) -> _T:
+        shards = self._shards
+        home = self._home()
+        try:
+            if self.use_lifo:
+                return shards[home].pop()
+            else:
+                return shards[home].popleft()
+        except IndexError:
+            pass
+
+        num = len(shards)
+        for idx in range(home + 1, home + num):
+            try:
+                return shards[idx % num].popleft()
+            except IndexError:
+                pass
+        raise Empty
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> _T:
+        """Remove and return an item from the queue.
+
+        If optional args `block` is True and `timeout` is None (the
+        default), block if necessary until an item is available. If
+        `timeout` is a positive number, it blocks at most `timeout`
+        seconds and raises the ``Empty`` exception if no item was
+        available within that time.  Otherwise (`block` is false),
+        return an item if one is immediately available, else raise the
+        ``Empty`` exception (`timeout` is ignored in that case).
+
+        """
+        try:
+            return self._get_nowait()
+        except Empty:
+            if not block:
+                raise
+
+        if timeout is not None:
+            if timeout < 0:
+                raise ValueError("'timeout' must be a positive number")
+            endtime = _time() + timeout
+
+        with self.not_empty:
+            # waiters are counted before checking for an item again, so that
+            # a put() either makes its item visible to the check below or
+            # notifies us once we wait
+            self._waiters += 1
+            try:
+                while True:
+                    try:
+                        return self._get_nowait()
+                    except Empty:
+                        pass
+                    if timeout is None:
+                        self.not_empty.wait()
+                    else:
+                        remaining = endtime - _time()
+                        if remaining <= 0.0:
+                            raise Empty
+                        self.not_empty.wait(remaining)
+            finally:
+                self._waiters -= 1
+
+    def get_nowait(self) -> _T:
+        return self.get(False)
+
+    def get_matching(self, predicate: Callable[[_T], bool]) -> _T:
+        """Remove and return an item for which ``predicate`` returns True,
+        without blocking; the oldest matching item in each shard is
+        considered first.
+
+        Raise the ``Empty`` exception if there is no such item.
+        """
+
+        for shard in self._shards:
+            for item in list(shard):
+                if predicate(item):
+                    try:
+                        shard.remove(item)
+                    except ValueError:
+                        # taken by another thread
+                        continue
+                    return item
+        raise Empty
+
+    def snapshot(self) -> List[_T]:
+        """Return a list of the items in the queue (not reliable!)."""
+
+        return [item for shard in self._shards for item in list(shard)]
+
+
 class AsyncAdaptedQueue(QueueCommon[_T]):
     def __init__(self, maxsize: int = 0, use_lifo: bool = False):
         self.use_lifo = use_lifo
@@ -302,3 +598,33 @@ class AsyncAdaptedQueue(QueueCommon[_T]):
                 return await_(self._queue.get())
         except (asyncio.QueueEmpty, asyncio.TimeoutError) as err:
             raise Empty() from err
+
+    def _drain(self) -> List[_T]:
+        # remove all items in the order they were put; as this doesn't
+        # await, no other task can access the queue in the meantime
+        items = []
+        while not self._queue.empty():
+            items.append(self._queue.get_nowait())
+        if self.use_lifo:
+            items.reverse()
+        return items
+
+    def _restore(self, items: List[_T]) -> None:
+        for item in items:
+            self._queue.put_nowait(item)
+
+    def get_matching(self, predicate: Callable[[_T], bool]) -> _T:
+        items = self._drain()
+        try:
+            for idx, item in enumerate(items):
+                if predicate(item):
+                    del items[idx]
+                    return item
+            raise Empty()
+        finally:
+            self._restore(items)
+
+    def snapshot(self) -> List[_T]:
+        items = self._drain()
+        self._restore(items)
+        return items
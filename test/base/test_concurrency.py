@@ -3,6 +3,7 @@ import contextvars
 from multiprocessing import get_context
 import random
 import threading
+import time
 
 from sqlalchemy import exc
 from sqlalchemy import testing
@@ -11,6 +12,7 @@ from sqlalchemy.testing import eq_
 from sqlalchemy.testing import expect_raises
 from sqlalchemy.testing import expect_raises_message
 from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_false
 from sqlalchemy.testing import is_true
 from sqlalchemy.testing.config import combinations
 from sqlalchemy.util import await_
@@ -244,6 +246,207 @@ class TestAsyncAdaptedQueue(fixtures.TestBase):
         is_true(run[0])
 
 
+class QueueGetMatchingTest(fixtures.TestBase):
+    @combinations(
+        (queue.Queue, False),
+        (queue.Queue, True),
+        (queue.AsyncAdaptedQueue, False),
+        (queue.AsyncAdaptedQueue, True),
+        (queue.ShardedQueue, False),
+        (queue.ShardedQueue, True),
+        (queue.FairQueue, False),
+        (queue.FairQueue, True),
+        argnames="queue_cls, use_lifo",
+    )
+    def test_get_matching(self, queue_cls, use_lifo):
+        q = queue_cls(5, use_lifo=use_lifo)
+        for i in range(1, 6):
+            q.put_nowait(i)
+
+        eq_(q.snapshot(), [1, 2, 3, 4, 5])
+
+        # the least recently put matching item is returned
+        eq_(q.get_matching(lambda i: i % 2 == 0), 2)
+        eq_(q.get_matching(lambda i: i > 3), 4)
+        with expect_raises(queue.Empty):
+            q.get_matching(lambda i: i > 5)
+
+        eq_(q.snapshot(), [1, 3, 5])
+        eq_(q.qsize(), 3)
+
+        # ordering of the remaining items is maintained
+        q.put_nowait(6)
+        if use_lifo:
+            eq_([q.get_nowait() for i in range(4)], [6, 5, 3, 1])
+        else:
+            eq_([q.get_nowait() for i in range(4)], [1, 3, 5, 6])
+
+
+class ShardedQueueTest(fixtures.TestBase):
+    def test_shards_argument(self):
+        with expect_raises_message(ValueError, "'shards' must be a positive"):
+            queue.ShardedQueue(5, shards=0)
+
+    def test_full(self):
+        q = queue.ShardedQueue(2, shards=4)
+        q.put(1)
+        q.put(2)
+        is_true(q.full())
+        with expect_raises(queue.Full):
+            q.put_nowait(3)
+        eq_(q.qsize(), 2)
+
+    def test_get_timeout(self):
+        q = queue.ShardedQueue(2, shards=4)
+        with expect_raises(queue.Empty):
+            q.get_nowait()
+        with expect_raises(queue.Empty):
+            q.get(timeout=0.05)
+
+    def _in_thread(self, fn):
+        result = []
+        t = threading.Thread(target=lambda: result.append(fn()))
+        t.start()
+        t.join(10)
+        return result[0]
+
+    def test_threads_use_own_shard(self):
+        q = queue.ShardedQueue(10, shards=4)
+        q.put("main")
+
+        def put_and_get():
+            q.put("thread")
+            return q.get_nowait()
+
+        # the thread receives the item in its own shard, rather than
+        # the item put by the main thread
+        eq_(self._in_thread(put_and_get), "thread")
+        eq_([len(shard) for shard in q._shards], [1, 0, 0, 0])
+        eq_(q.get_nowait(), "main")
+
+    def test_get_from_other_shard(self):
+        q = queue.ShardedQueue(10, shards=4)
+        for i in range(3):
+            self._in_thread(lambda: q.put(i))
+
+        eq_(sorted(q.get_nowait() for i in range(3)), [0, 1, 2])
+        is_true(q.empty())
+
+    def test_blocking_get_woken_by_put(self):
+        q = queue.ShardedQueue(10, shards=4)
+
+        def put():
+            time.sleep(0.1)
+            q.put("item")
+
+        t = threading.Thread(target=put)
+        t.start()
+        eq_(q.get(timeout=10), "item")
+        t.join(10)
+        eq_(q._waiters, 0)
+
+    def test_many_threads(self):
+        q = queue.ShardedQueue(5, shards=3)
+        for i in range(5):
+            q.put(i)
+
+        errors = []
+
+        def worker():
+            try:
+                for i in range(200):
+                    item = q.get(timeout=10)
+                    q.put(item)
+            except Exception as err:
+                errors.append(err)
+
+        threads = [threading.Thread(target=worker) for i in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(30)
+
+        eq_(errors, [])
+        eq_(sorted(q.snapshot()), [0, 1, 2, 3, 4])
+
+
+class FairQueueTest(fixtures.TestBase):
+    def _start_waiters(self, q, names, received, timeout=10):
+        threads = []
+        for name in names:
+
+            def get(name=name):
+                try:
+                    received.append((name, q.get(timeout=timeout)))
+                except queue.Empty:
+                    received.append((name, None))
+
+            t = threading.Thread(target=get)
+            t.start()
+            threads.append(t)
+
+            # ensure each thread is waiting before starting the next one
+            deadline = time.monotonic() + 10
+            while len(q._waiters) < len(threads):
+                assert time.monotonic() < deadline
+                time.sleep(0.005)
+        return threads
+
+    def test_waiters_receive_items_in_order(self):
+        q = queue.FairQueue(5)
+        received = []
+        threads = self._start_waiters(q, ["a", "b", "c"], received)
+
+        for i in range(3):
+            q.put(i)
+        for t in threads:
+            t.join(10)
+
+        eq_(sorted(received), [("a", 0), ("b", 1), ("c", 2)])
+        eq_(q.qsize(), 0)
+
+    def test_get_does_not_pass_waiters(self):
+        q = queue.FairQueue(5)
+        received = []
+        threads = self._start_waiters(q, ["a"], received)
+
+        with expect_raises(queue.Empty):
+            q.get_nowait()
+
+        q.put(1)
+        threads[0].join(10)
+
+        # nobody waiting, so the item is queued
+        q.put(2)
+        eq_(q.get_nowait(), 2)
+        eq_(received, [("a", 1)])
+
+    def test_expired_waiter_skipped(self):
+        q = queue.FairQueue(5)
+        received = []
+        threads = self._start_waiters(q, ["a"], received)
+
+        # a waiter whose timeout has passed, but which hasn't yet woken
+        # up to remove itself
+        expired = queue._FairWaiter(
+            threading.Condition(q.mutex), time.time() - 1
+        )
+        q._waiters.appendleft(expired)
+
+        q.put(1)
+        threads[0].join(10)
+
+        eq_(received, [("a", 1)])
+        is_false(expired.assigned)
+        eq_(len(q._waiters), 0)
+
+    def test_get_timeout(self):
+        q = queue.FairQueue(5)
+        with expect_raises(queue.Empty):
+            q.get(timeout=0.05)
+        eq_(len(q._waiters), 0)
+
+
 class GreenletImportTests(fixtures.TestBase):
     def _run_in_process(self, fn):
         ctx = get_context("spawn")
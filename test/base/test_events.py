@@ -1180,6 +1180,23 @@ class JoinTest(TearDownLocalEventsFixture, fixtures.TestBase):
             [call(element, 1), call(element, 2), call(element, 3)],
         )
 
+    def test_exec_w_sync_on_first_run(self):
+        l1 = Mock()
+        l2 = Mock()
+        factory = self.TargetFactory()
+
+        event.listen(factory, "event_one", l1)
+        element = factory.create()
+        event.listen(element, "event_one", l2)
+
+        for arg in (1, 2):
+            element.dispatch.event_one.for_modify(
+                element.dispatch
+            )._exec_w_sync_on_first_run(element, arg)
+
+        eq_(l1.mock_calls, [call(element, 1), call(element, 2)])
+        eq_(l2.mock_calls, [call(element, 1), call(element, 2)])
+
 
 class DisableClsPropagateTest(TearDownLocalEventsFixture, fixtures.TestBase):
     def setup_test(self):
@@ -1,8 +1,13 @@
+import array
+import mmap
 import operator
 import sys
+from unittest import mock
 
 from sqlalchemy import exc
+from sqlalchemy import sql
 from sqlalchemy import testing
+from sqlalchemy.engine import processors
 from sqlalchemy.engine import result
 from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_message
@@ -12,6 +17,7 @@ from sqlalchemy.testing import is_false
 from sqlalchemy.testing import is_true
 from sqlalchemy.testing.assertions import expect_deprecated
 from sqlalchemy.testing.assertions import expect_raises
+from sqlalchemy.testing.assertions import expect_raises_message
 from sqlalchemy.testing.util import picklers
 from sqlalchemy.util import compat
 from sqlalchemy.util.langhelpers import load_uncompiled_module
@@ -593,6 +599,117 @@ class ResultTest(fixtures.TestBase):
         # scalars
         eq_(s.all(), [2, 1, 4])
 
+    @testing.combinations("all", "iterate", "many", "one", argnames="method")
+    def test_scalars_no_rows_created(self, method):
+        """scalar values are retrieved from raw rows without creating
+        Row objects"""
+
+        with mock.patch.object(
+            result, "Row", mock.Mock(side_effect=AssertionError("Row"))
+        ):
+            if method == "all":
+                eq_(self._fixture().scalars(1).all(), [1, 1, 3, 1])
+            elif method == "iterate":
+                eq_(list(self._fixture().scalars(1)), [1, 1, 3, 1])
+            elif method == "many":
+                eq_(self._fixture().scalars(1).fetchmany(3), [1, 1, 3])
+            elif method == "one":
+                eq_(self._fixture(num_rows=1).scalars(2).one(), 1)
+
+    def test_scalars_processors(self):
+        r1 = self._fixture()
+        r1._metadata._processors = [None, str, None]
+
+        eq_(r1.scalars(1).all(), ["1", "1", "3", "1"])
+
+        r2 = self._fixture()
+        r2._metadata._processors = [None, str, None]
+
+        eq_(r2.columns("c", "b").scalars(1).all(), ["1", "1", "3", "1"])
+
+    @testing.fixture
+    def batch_fixture(self):
+        calls = []
+
+        def batch(values):
+            calls.append(list(values))
+            return [str(value) for value in values]
+
+        def single(value):
+            raise AssertionError("per-value processor called")
+
+        with mock.patch.dict(processors._batch_processors, {single: batch}):
+            r1 = self._fixture()
+            r1._metadata._processors = [None, single, int.__neg__]
+            yield r1, calls
+
+    @testing.combinations(
+        "all", "many", "many_unique", "partitions", argnames="method"
+    )
+    def test_batch_processors_rows(self, batch_fixture, method):
+        r1, calls = batch_fixture
+
+        if method == "all":
+            eq_(
+                r1.all(),
+                [(1, "1", -1), (2, "1", -2), (1, "3", -2), (4, "1", -2)],
+            )
+            eq_(calls, [[1, 1, 3, 1]])
+        elif method == "many":
+            eq_(r1.fetchmany(3), [(1, "1", -1), (2, "1", -2), (1, "3", -2)])
+            eq_(r1.fetchmany(3), [(4, "1", -2)])
+            eq_(r1.fetchmany(3), [])
+            eq_(calls, [[1, 1, 3], [1]])
+        elif method == "many_unique":
+            r1 = r1.unique(lambda row: row[1])
+            eq_(r1.fetchmany(3), [(1, "1", -1), (1, "3", -2)])
+            eq_(calls, [[1, 1, 3], [1]])
+        elif method == "partitions":
+            eq_(
+                list(r1.partitions(2)),
+                [
+                    [(1, "1", -1), (2, "1", -2)],
+                    [(1, "3", -2), (4, "1", -2)],
+                ],
+            )
+            eq_(calls, [[1, 1], [3, 1]])
+
+    def test_batch_processors_columns(self, batch_fixture):
+        r1, calls = batch_fixture
+
+        rows = r1.columns("b", "a").all()
+        eq_(rows, [("1", 1), ("1", 2), ("3", 1), ("1", 4)])
+        eq_(rows[0]._mapping, {"b": "1", "a": 1})
+        eq_(calls, [[1, 1, 3, 1]])
+
+    def test_batch_processors_scalars(self, batch_fixture):
+        r1, calls = batch_fixture
+
+        eq_(r1.scalars(1).all(), ["1", "1", "3", "1"])
+        eq_(calls, [[1, 1, 3, 1]])
+
+    def test_batch_processors_mappings(self, batch_fixture):
+        r1, calls = batch_fixture
+
+        eq_(
+            r1.mappings().fetchmany(2),
+            [{"a": 1, "b": "1", "c": -1}, {"a": 2, "b": "1", "c": -2}],
+        )
+        eq_(calls, [[1, 1]])
+
+    def test_scalars_row_logging(self):
+        r1 = self._fixture()
+        logged = []
+
+        def log_row(row):
+            logged.append(row)
+            return row
+
+        r1._row_logging_fn = log_row
+
+        eq_(r1.scalars(1).all(), [1, 1, 3, 1])
+        eq_(logged, [(1,), (1,), (3,), (1,)])
+
     def test_first(self):
         result = self._fixture()
 
@@ -754,6 +871,96 @@ class ResultTest(fixtures.TestBase):
 
         eq_(result.all(), [])
 
+    def test_columns_as_arrays(self):
+        result = self._fixture(
+            data=[(1, 1.5, "x"), (2, 2.5, None), (3, 3.5, "z")]
+        )
+
+        a, b, c = result.columns_as_arrays()
+        eq_(a, array.array("q", [1, 2, 3]))
+        eq_(b, array.array("d", [1.5, 2.5, 3.5]))
+        eq_(c, ["x", None, "z"])
+
+        eq_(result.columns_as_arrays(), ([], [], []))
+
+    def test_columns_as_arrays_empty(self):
+        result = self._fixture(data=[])
+
+        eq_(result.columns_as_arrays(), ([], [], []))
+
+    def test_columns_as_arrays_not_primitive(self):
+        result = self._fixture(
+            data=[(1, True, 2**70), (None, False, 5), (3, 1, 6)]
+        )
+
+        a, b, c = result.columns_as_arrays()
+        eq_(a, [1, None, 3])
+        eq_(b, [True, False, 1])
+        eq_(c, [2**70, 5, 6])
+
+    def test_fetch_columnar_yield_per(self):
+        result = self._fixture()
+
+        r = []
+        result = result.yield_per(3)
+        while True:
+            chunk = result.fetch_columnar()
+            if chunk is None:
+                break
+            r.append([list(col) for col in chunk])
+        eq_(r, [[[1, 2, 1], [1, 1, 3], [1, 2, 2]], [[4], [1], [2]]])
+
+        eq_(result.fetch_columnar(), None)
+
+    def test_fetch_columnar_size(self):
+        result = self._fixture()
+
+        eq_(
+            result.fetch_columnar(1),
+            (array.array("q", [1]),) * 3,
+        )
+        eq_(
+            [list(col) for col in result.fetch_columnar(5)],
+            [[2, 1, 4], [1, 3, 1], [2, 2, 2]],
+        )
+
+    def test_fetch_columnar_with_columns(self):
+        result = self._fixture()
+
+        result = result.columns("c", "a")
+        eq_(
+            [list(col) for col in result.columns_as_arrays()],
+            [[1, 2, 2, 2], [1, 2, 1, 4]],
+        )
+
+    def test_fetch_columnar_scalars_source(self):
+        result = self._fixture(data=[1, 2, 3])
+        result._source_supports_scalars = True
+
+        eq_(result.columns_as_arrays(), (array.array("q", [1, 2, 3]),))
+
+    def test_fetch_columnar_processors(self):
+        result = result_ = self._fixture()
+        result_._metadata._processors = [None, str, None]
+
+        eq_(
+            result.columns_as_arrays(),
+            (
+                array.array("q", [1, 2, 1, 4]),
+                ["1", "1", "3", "1"],
+                array.array("q", [1, 2, 2, 2]),
+            ),
+        )
+
+    def test_fetch_columnar_no_unique(self):
+        result = self._fixture().unique()
+
+        assert_raises_message(
+            exc.InvalidRequestError,
+            r"Columnar fetching can't be combined with Result.unique\(\)",
+            result.fetch_columnar,
+        )
+
     def test_columns(self):
         result = self._fixture()
 
@@ -982,6 +1189,113 @@ class ResultTest(fixtures.TestBase):
         r2 = frozen().scalars(1).unique()
         eq_(r2.fetchall(), [1, 3])
 
+    @testing.fixture
+    def columnar_fixture(self):
+        def go():
+            r1 = self._fixture(data=[(1, 1.5, "a"), (2, 2.5, None)])
+            return result.ColumnarFrozenResult(r1)
+
+        return go
+
+    def test_columnar_freeze(self, columnar_fixture):
+        frozen = columnar_fixture()
+
+        eq_(
+            frozen._columns,
+            [
+                array.array("q", [1, 2]),
+                array.array("d", [1.5, 2.5]),
+                ["a", None],
+            ],
+        )
+        eq_(frozen().fetchall(), [(1, 1.5, "a"), (2, 2.5, None)])
+        eq_(frozen().scalars(2).all(), ["a", None])
+        eq_(frozen().mappings().first(), {"a": 1, "b": 1.5, "c": "a"})
+        eq_(frozen.data, [(1, 1.5, "a"), (2, 2.5, None)])
+        eq_(frozen.rewrite_rows(), [[1, 1.5, "a"], [2, 2.5, None]])
+
+    def test_columnar_freeze_unique(self):
+        r1 = self._fixture().columns("b", "c").unique()
+
+        frozen = result.ColumnarFrozenResult(r1)
+        eq_(frozen().fetchall(), [(1, 1), (1, 2), (3, 2)])
+
+    def test_columnar_freeze_scalars_source(self):
+        r1 = self._fixture(data=[1, 2, 3])
+        r1._source_supports_scalars = True
+
+        frozen = result.ColumnarFrozenResult(r1)
+        eq_(frozen._columns, [array.array("q", [1, 2, 3])])
+        eq_(frozen().scalars().all(), [1, 2, 3])
+        eq_(frozen.rewrite_rows(), [[1], [2], [3]])
+
+        loaded = result.ColumnarFrozenResult.loads(frozen.dumps())
+        eq_(loaded().scalars().all(), [1, 2, 3])
+
+    def test_columnar_freeze_empty(self):
+        r1 = self._fixture(data=[])
+
+        frozen = result.ColumnarFrozenResult(r1)
+        loaded = result.ColumnarFrozenResult.loads(frozen.dumps())
+        eq_(loaded().all(), [])
+        eq_(list(loaded().keys()), ["a", "b", "c"])
+
+    @testing.combinations("bytes", "mmap", "memoryview", argnames="kind")
+    def test_columnar_dumps_loads(self, columnar_fixture, kind):
+        data = columnar_fixture().dumps()
+
+        if kind == "mmap":
+            buf = mmap.mmap(-1, len(data))
+            buf.write(data)
+        elif kind == "memoryview":
+            buf = memoryview(bytearray(data))
+        else:
+            buf = data
+
+        loaded = result.ColumnarFrozenResult.loads(buf)
+
+        # packed columns refer to the buffer
+        is_true(isinstance(loaded._columns[0], memoryview))
+        is_true(isinstance(loaded._columns[1], memoryview))
+
+        eq_(loaded().fetchall(), [(1, 1.5, "a"), (2, 2.5, None)])
+        eq_(
+            result.ColumnarFrozenResult.loads(loaded.dumps())().fetchall(),
+            [(1, 1.5, "a"), (2, 2.5, None)],
+        )
+
+        del loaded
+        if kind == "mmap":
+            buf.close()
+
+    def test_columnar_loads_other_byteorder(self, columnar_fixture):
+        frozen = columnar_fixture()
+
+        other = "big" if sys.byteorder == "little" else "little"
+        for col in frozen._columns[0:2]:
+            col.byteswap()
+
+        with mock.patch.object(result.sys, "byteorder", other):
+            data = frozen.dumps()
+
+        loaded = result.ColumnarFrozenResult.loads(data)
+        eq_(loaded().fetchall(), [(1, 1.5, "a"), (2, 2.5, None)])
+
+    def test_columnar_pickle(self, columnar_fixture):
+        for loads, dumps in picklers():
+            loaded = loads(dumps(columnar_fixture()))
+
+            is_true(isinstance(loaded, result.ColumnarFrozenResult))
+            eq_(loaded().fetchall(), [(1, 1.5, "a"), (2, 2.5, None)])
+
+    @testing.combinations(b"", b"not a result", argnames="data")
+    def test_columnar_loads_invalid(self, data):
+        with expect_raises_message(
+            exc.ArgumentError,
+            "Buffer does not contain a serialized ColumnarFrozenResult",
+        ):
+            result.ColumnarFrozenResult.loads(data)
+
 
 class MergeResultTest(fixtures.TestBase):
     @testing.fixture
@@ -1093,6 +1407,125 @@ class MergeResultTest(fixtures.TestBase):
         # unique takes place
         eq_(result.scalars("y").all(), [2, 1, 3])
 
+    @testing.fixture
+    def ordered_fixture(self):
+        def go(*row_lists):
+            return [
+                result.IteratorResult(
+                    result.SimpleResultMetaData(["x", "y"]), iter(rows)
+                )
+                for rows in row_lists
+            ]
+
+        return go
+
+    def test_merge_order_by(self, ordered_fixture):
+        r1, r2, r3 = ordered_fixture(
+            [(1, "a"), (4, "b"), (7, "c")],
+            [(2, "d"), (3, "e")],
+            [(5, "f"), (6, "g"), (8, "h")],
+        )
+
+        result = r1.merge(r2, r3, order_by=["x"])
+        eq_(result.scalars("y").all(), list("adebfgch"))
+
+    def test_merge_order_by_multiple(self, ordered_fixture):
+        r1, r2 = ordered_fixture(
+            [(1, "c"), (1, "a"), (2, "b")],
+            [(1, "b"), (2, "c"), (2, "a")],
+        )
+
+        result = r1.merge(r2, order_by=["x", sql.desc("y")])
+        eq_(
+            result.all(),
+            [(1, "c"), (1, "b"), (1, "a"), (2, "c"), (2, "b"), (2, "a")],
+        )
+
+    @testing.combinations(
+        (sql.nulls_first("x"), [None, 1, 3], [None, 1, 2, 3]),
+        (sql.nulls_last("x"), [1, 3, None], [1, 2, 3, None]),
+        (sql.desc("x").nulls_last(), [3, 1, None], [3, 2, 1, None]),
+        (sql.desc("x").nulls_first(), [None, 3, 1], [None, 3, 2, 1]),
+        argnames="order_by, values, expected",
+    )
+    def test_merge_order_by_nulls(
+        self, ordered_fixture, order_by, values, expected
+    ):
+        r1, r2 = ordered_fixture([(x, "a") for x in values], [(2, "b")])
+
+        result = r1.merge(r2, order_by=[order_by])
+        eq_(result.scalars("x").all(), expected)
+
+    @testing.combinations(
+        (True, "x", [None, 1, 3], [None, 1, 2, 3]),
+        (True, sql.desc("x"), [3, 1, None], [3, 2, 1, None]),
+        (False, "x", [1, 3, None], [1, 2, 3, None]),
+        (False, sql.desc("x"), [None, 3, 1], [None, 3, 2, 1]),
+        (False, sql.nulls_first("x"), [None, 1, 3], [None, 1, 2, 3]),
+        argnames="default_nulls_first, order_by, values, expected",
+    )
+    def test_merge_order_by_default_nulls(
+        self, ordered_fixture, default_nulls_first, order_by, values, expected
+    ):
+        r1, r2 = ordered_fixture([(x, "a") for x in values], [(2, "b")])
+        r1._default_nulls_first = default_nulls_first
+
+        result = r1.merge(r2, order_by=[order_by])
+        eq_(result.scalars("x").all(), expected)
+
+    def test_merge_order_by_unknown_nulls(self, ordered_fixture):
+        r1, r2 = ordered_fixture([(1, "a"), (3, "b")], [(2, "c"), (4, "d")])
+
+        result = r1.merge(r2, order_by=["x"])
+        eq_(result.scalars("x").all(), [1, 2, 3, 4])
+
+        r1, r2 = ordered_fixture([(1, "a"), (3, "b")], [(2, "c"), (None, "d")])
+
+        result = r1.merge(r2, order_by=["x"])
+        with expect_raises_message(
+            exc.InvalidRequestError,
+            "Can't merge rows ordered by a NULL value without knowing",
+        ):
+            result.all()
+
+    @testing.combinations(
+        (2, None, [1, 2]),
+        (3, 2, [3, 4, 5]),
+        (None, 6, [7, 8]),
+        (10, 0, [1, 2, 3, 4, 5, 6, 7, 8]),
+        argnames="limit, offset, expected",
+    )
+    def test_merge_limit_offset(
+        self, ordered_fixture, limit, offset, expected
+    ):
+        r1, r2 = ordered_fixture(
+            [(1, "a"), (4, "b"), (5, "c"), (8, "d")],
+            [(2, "e"), (3, "f"), (6, "g"), (7, "h")],
+        )
+
+        result = r1.merge(r2, order_by=["x"], limit=limit, offset=offset)
+        eq_(result.scalars("x").all(), expected)
+
+    def test_merge_limit_stops_early(self, ordered_fixture):
+        consumed = []
+
+        def rows(values):
+            for value in values:
+                consumed.append(value)
+                yield (value, "x")
+
+        r1, r2 = ordered_fixture(rows([1, 3, 5, 7]), rows([2, 4, 6, 8]))
+
+        result = r1.merge(r2, order_by=["x"], limit=3)
+        eq_(result.scalars("x").all(), [1, 2, 3])
+        eq_(sorted(consumed), [1, 2, 3, 4])
+
+    def test_merge_limit_no_order_by(self, merge_fixture):
+        r1, r2, r3, r4 = merge_fixture
+
+        result = r1.merge(r2, r3, r4, limit=2, offset=2)
+        eq_(result.scalars(0).all(), [9, 10])
+
 
 class OnlyScalarsTest(fixtures.TestBase):
     """the chunkediterator supports "non tuple mode", where we bypass
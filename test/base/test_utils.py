@@ -665,6 +665,48 @@ class WrapCallableTest(fixtures.TestBase):
         eq_(c(), 5)
 
 
+class InlineDecoratorTest(fixtures.TestBase):
+    @testing.fixture
+    def doubler(self):
+        return util.inline_decorator("return %(fn)s(%(apply)s) * 2")
+
+    def test_body_inlined(self, doubler):
+        @doubler
+        def go(a, *args, d=7, **kw):
+            return (a, args, d, kw)
+
+        eq_(go(1), (1, (), 7, {}) * 2)
+        eq_(go(1, 2, 3, d=8, e=9), (1, (2, 3), 8, {"e": 9}) * 2)
+        eq_(go.__name__, "go")
+        eq_(list(inspect.signature(go).parameters), ["a", "args", "d", "kw"])
+
+    def test_self_symbol(self):
+        dec = util.inline_decorator(
+            "%(self)s = %(self)s + 1\nreturn %(fn)s(%(apply)s)"
+        )
+
+        @dec
+        def go(x, y):
+            return x, y
+
+        eq_(go(1, 2), (2, 2))
+
+    def test_fn_symbol_unique(self, doubler):
+        @doubler
+        def go(fn, y):
+            return fn + y
+
+        eq_(go(1, 2), 6)
+
+    def test_positional_only_convention(self, doubler):
+        @doubler
+        def go(__a, b=2):
+            return __a + b
+
+        eq_(go(1), 6)
+        eq_(go(1, 3), 8)
+
+
 class ToListTest(fixtures.TestBase):
     def test_from_string(self):
         eq_(util.to_list("xyz"), ["xyz"])
@@ -1,6 +1,7 @@
 import asyncio
 import dataclasses
 import datetime
+import decimal
 import logging
 import logging.handlers
 import re
@@ -370,6 +371,31 @@ $$ LANGUAGE plpgsql;"""
 
         eq_(dialect.is_disconnect("not an error", None, None), False)
 
+    @testing.combinations(
+        (None, False, {}),
+        (True, False, {"prepare": True}),
+        (False, False, {"prepare": False}),
+        (True, True, {}),
+        (False, True, {}),
+        argnames="prepare_statement, server_side, expected",
+    )
+    def test_prepare_argument(self, prepare_statement, server_side, expected):
+        dialect = psycopg_dialect.dialect()
+        context = mock.Mock(
+            prepare_statement=prepare_statement, _is_server_side=server_side
+        )
+        cursor = mock.Mock()
+
+        dialect.do_execute(cursor, "stmt", {"x": 5}, context)
+        dialect.do_execute_no_params(cursor, "stmt", context)
+        eq_(
+            cursor.execute.mock_calls,
+            [
+                mock.call("stmt", {"x": 5}, **expected),
+                mock.call("stmt", **expected),
+            ],
+        )
+
 
 class MultiHostConnectTest(fixtures.TestBase):
     def working_combinations():
@@ -1755,3 +1781,86 @@ class Psycopg3Test(fixtures.TestBase):
                 is_true(isinstance(cursor, AsyncClientCursor))
 
         await engine.dispose()
+
+    @testing.combinations((None,), (1,), argnames="threshold")
+    def test_server_side_cursor_prepare_threshold(
+        self, testing_engine, threshold
+    ):
+        """test the "prepare" argument isn't passed to a named cursor"""
+
+        engine = testing_engine(
+            options={"prepared_statement_threshold": threshold}
+        )
+        stmt = select(func.generate_series(1, 5))
+
+        with engine.connect() as conn:
+            for i in range(3):
+                result = conn.execution_options(stream_results=True).execute(
+                    stmt
+                )
+                is_true(result.context._is_server_side)
+                eq_(result.scalars().all(), [1, 2, 3, 4, 5])
+
+            result = conn.execute(stmt)
+            is_false(result.context._is_server_side)
+            eq_(result.scalars().all(), [1, 2, 3, 4, 5])
+
+
+class InsertCopyTest(fixtures.TablesTest):
+    __only_on__ = ("postgresql+psycopg", "postgresql+asyncpg")
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "data",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("x", String(50)),
+            Column("q", Numeric(10, 2)),
+            Column("d", DateTime),
+            Column("j", JSONB),
+            Column("z", Integer, server_default="5"),
+        )
+
+    def test_copy(self, connection):
+        t = self.tables.data
+
+        data = [
+            {
+                "x": "x%d" % i,
+                "q": decimal.Decimal("%d.25" % i),
+                "d": datetime.datetime(2020, 1, 1, 12, i),
+                "j": {"k": i},
+            }
+            for i in range(1, 20)
+        ]
+
+        canary = mock.Mock(wraps=connection.dialect.do_copy_insert)
+        with mock.patch.object(connection.dialect, "do_copy_insert", canary):
+            result = connection.execute(
+                t.insert().execution_options(insert_copy=True), data
+            )
+        eq_(result.rowcount, 19)
+        eq_(len(canary.mock_calls), 1)
+
+        eq_(
+            connection.execute(
+                select(t.c.x, t.c.q, t.c.d, t.c.j, t.c.z).order_by(t.c.id)
+            ).all(),
+            [(row["x"], row["q"], row["d"], row["j"], 5) for row in data],
+        )
+
+    def test_returning_not_copied(self, connection):
+        t = self.tables.data
+
+        canary = mock.Mock(wraps=connection.dialect.do_copy_insert)
+        with mock.patch.object(connection.dialect, "do_copy_insert", canary):
+            result = connection.execute(
+                t.insert()
+                .returning(t.c.x)
+                .execution_options(insert_copy=True),
+                [{"x": "x1"}, {"x": "x2"}],
+            )
+        eq_(result.all(), [("x1",), ("x2",)])
+        eq_(canary.mock_calls, [])
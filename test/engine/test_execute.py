@@ -2,6 +2,7 @@ import collections.abc as collections_abc
 from contextlib import contextmanager
 from contextlib import nullcontext
 import copy
+from io import BytesIO
 from io import StringIO
 import re
 import threading
@@ -31,13 +32,17 @@ from sqlalchemy import TypeDecorator
 from sqlalchemy import util
 from sqlalchemy import VARCHAR
 from sqlalchemy.engine import BindTyping
+from sqlalchemy.engine import CacheProfiler
+from sqlalchemy.engine import CompiledCache
 from sqlalchemy.engine import default
 from sqlalchemy.engine.base import Connection
 from sqlalchemy.engine.base import Engine
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.pool import NullPool
 from sqlalchemy.pool import QueuePool
 from sqlalchemy.sql import column
+from sqlalchemy.sql import ColumnElement
 from sqlalchemy.sql import literal
 from sqlalchemy.sql.elements import literal_column
 from sqlalchemy.testing import assert_raises
@@ -46,6 +51,7 @@ from sqlalchemy.testing import config
 from sqlalchemy.testing import engines
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import expect_raises_message
+from sqlalchemy.testing import expect_warnings
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
 from sqlalchemy.testing import is_false
@@ -1226,6 +1232,543 @@ class CompiledCacheTest(fixtures.TestBase):
         )
         eq_(conn.scalar(stmt), 1)
 
+    def test_engine_query_cache_stats(self, metadata):
+        eng = engines.testing_engine(options={"query_cache_size": 10})
+        t = Table("t", metadata, Column("q", Integer))
+
+        with eng.begin() as conn:
+            metadata.create_all(conn)
+            eq_(eng.query_cache_stats(), (0, 0, 0, 0, 0))
+
+            for i in range(3):
+                conn.execute(t.insert(), {"q": i})
+            eq_(conn.scalar(select(func.count(t.c.q))), 3)
+
+        stats = eng.query_cache_stats()
+        eq_(
+            (stats.hits, stats.misses, stats.evictions, stats.entries),
+            (2, 2, 0, 2),
+        )
+        is_true(stats.memory > 0)
+
+        is_(eng.query_cache, eng._compiled_cache)
+        entries = eng.query_cache.entry_stats()
+        eq_(
+            sorted((entry.statement, entry.hits) for entry in entries),
+            [
+                ("INSERT INTO t (q) VALUES (?)", 2),
+                ("SELECT count(t.q) AS count_1 \nFROM t", 0),
+            ],
+        )
+        for entry in entries:
+            is_true(entry.compile_time > 0)
+            is_true(entry.memory > 0)
+
+        eng.clear_compiled_cache()
+        eq_(eng.query_cache_stats().entries, 0)
+        eq_(eng.query_cache_stats().memory, 0)
+
+    def test_engine_custom_query_cache(self):
+        cache = CompiledCache(5, max_memory=10000)
+        eng = create_engine("sqlite://", query_cache=cache)
+        is_(eng.query_cache, cache)
+        is_(eng.execution_options(foo="bar").query_cache, cache)
+
+        with eng.connect() as conn:
+            conn.scalar(select(literal(1)))
+        eq_(cache.stats().misses, 1)
+        eq_(len(cache), 1)
+
+    def test_engine_query_cache_no_stats(self):
+        cache = {}
+        eng = create_engine("sqlite://", query_cache=cache)
+        is_(eng.query_cache, cache)
+        is_(eng.query_cache_stats(), None)
+
+        with eng.connect() as conn:
+            conn.scalar(select(literal(1)))
+        eq_(len(cache), 1)
+
+        eng = create_engine("sqlite://", query_cache_size=0)
+        is_(eng.query_cache, None)
+        is_(eng.query_cache_stats(), None)
+
+    def _snapshot_fixture(self):
+        m = MetaData()
+        t = Table("t", m, Column("q", Integer), Column("data", String(50)))
+        return m, t
+
+    def _save_snapshot_fixture(self):
+        m, t = self._snapshot_fixture()
+        eng = create_engine("sqlite://")
+        with eng.begin() as conn:
+            m.create_all(conn)
+            conn.execute(t.insert(), {"q": 1, "data": "some secret"})
+            conn.execute(select(t.c.data).where(t.c.q == 12345)).all()
+
+        buf = BytesIO()
+        eq_(eng.save_query_cache(buf), 2)
+        return buf.getvalue()
+
+    def test_query_cache_snapshot_round_trip(self):
+        data = self._save_snapshot_fixture()
+
+        # parameter values are not persisted
+        is_false(b"some secret" in data)
+        is_false(b"12345" in data)
+
+        # a new set of Table objects, as would be the case in a new
+        # process
+        m, t = self._snapshot_fixture()
+        eng = create_engine("sqlite://")
+        eq_(eng.load_query_cache(BytesIO(data), m), 2)
+        eq_(eng.query_cache_stats().entries, 2)
+
+        with eng.begin() as conn:
+            m.create_all(conn)
+            conn.execute(t.insert(), {"q": 2, "data": "d2"})
+            eq_(
+                conn.execute(select(t.c.data).where(t.c.q == 2)).all(),
+                [("d2",)],
+            )
+
+        stats = eng.query_cache_stats()
+        eq_((stats.hits, stats.misses, stats.entries), (2, 0, 2))
+
+    def test_query_cache_snapshot_missing_table(self):
+        data = self._save_snapshot_fixture()
+
+        eng = create_engine("sqlite://")
+        eq_(eng.load_query_cache(BytesIO(data), MetaData()), 0)
+        eq_(eng.query_cache_stats().entries, 0)
+
+    def test_query_cache_snapshot_changed_table(self):
+        data = self._save_snapshot_fixture()
+
+        m = MetaData()
+        Table("t", m, Column("q", Integer), Column("x", String(50)))
+
+        eng = create_engine("sqlite://")
+
+        # both statements refer to a column that's no longer present
+        eq_(eng.load_query_cache(BytesIO(data), [m]), 0)
+
+    def test_query_cache_snapshot_version_mismatch(self):
+        data = self._save_snapshot_fixture()
+        m, t = self._snapshot_fixture()
+
+        eng = create_engine("sqlite://")
+        with eng.connect():
+            pass
+        eng.dialect.server_version_info = (1, 0, 0)
+
+        with expect_warnings(
+            "Query cache snapshot was created using SQLAlchemy .* "
+            "which does not match"
+        ):
+            eq_(eng.load_query_cache(BytesIO(data), m), 0)
+        eq_(eng.query_cache_stats().entries, 0)
+
+    def test_query_cache_snapshot_not_a_snapshot(self):
+        eng = create_engine("sqlite://")
+        with expect_raises_message(
+            tsa.exc.ArgumentError,
+            "File does not contain a query cache snapshot",
+        ):
+            eng.load_query_cache(BytesIO(b"some data"), MetaData())
+
+    def test_query_cache_snapshot_cache_disabled(self):
+        eng = create_engine("sqlite://", query_cache_size=0)
+        with expect_raises_message(
+            tsa.exc.InvalidRequestError,
+            "Compiled cache is disabled for this Engine",
+        ):
+            eng.save_query_cache(BytesIO())
+        with expect_raises_message(
+            tsa.exc.InvalidRequestError,
+            "Compiled cache is disabled for this Engine",
+        ):
+            eng.load_query_cache(BytesIO(), MetaData())
+
+
+class CompiledCacheEvictionTest(fixtures.TestBase):
+    class FakeCompiled:
+        def __init__(self, string, compile_time, size=0):
+            self.string = string
+            self._compile_time = compile_time
+            self.binds = dict.fromkeys(range(size))
+            self._result_columns = []
+
+    def test_prune_by_count(self):
+        cache = CompiledCache(4, threshold=0.5)
+
+        for i in range(6):
+            cache[i] = self.FakeCompiled("s%d" % i, 0.001)
+
+        cache.get(0)
+        cache.get(1)
+        cache[6] = self.FakeCompiled("s6", 0.001)
+
+        # recently hit entries stay; of the rest, the least recently used
+        # are evicted
+        eq_(sorted(cache), [0, 1, 5, 6])
+        eq_(cache.stats().evictions, 3)
+
+    def test_prune_by_cost(self):
+        cache = CompiledCache(4, threshold=0.5)
+
+        cache["expensive"] = self.FakeCompiled("expensive", 0.1)
+        for i in range(6):
+            cache[i] = self.FakeCompiled("s%d" % i, 0.001)
+
+        # expensive statement is retained even though least recently used
+        assert "expensive" in cache
+        eq_(sorted(k for k in cache if k != "expensive"), [3, 4, 5])
+
+    def test_prune_by_memory(self):
+        small = CompiledCache().estimate_memory(self.FakeCompiled("s", 0.001))
+        cache = CompiledCache(100, max_memory=small * 20, threshold=0.5)
+
+        for i in range(10):
+            cache[i] = self.FakeCompiled("s%d" % i, 0.001)
+        for i in range(10):
+            for _ in range(5):
+                cache.get(i)
+
+        # a very large statement that is more expensive to compile, but
+        # has not been used more than once, is evicted ahead of the hot
+        # small statements
+        cache["report"] = self.FakeCompiled("report", 0.01, size=100)
+        eq_(sorted(cache), list(range(10)))
+        eq_(cache.stats().evictions, 1)
+        is_true(cache.stats().memory <= cache.max_memory)
+
+    def test_stats(self):
+        cache = CompiledCache(10)
+        v1 = self.FakeCompiled("s1", 0.001)
+        cache["k1"] = v1
+
+        is_(cache.get("k1"), v1)
+        is_(cache["k1"], v1)
+        is_(cache.get("k2"), None)
+        assert_raises(KeyError, lambda: cache["k2"])
+
+        # containment checks don't count towards stats
+        assert "k1" in cache
+        assert "k2" not in cache
+
+        eq_(cache.stats(), (2, 2, 0, 1, cache.estimate_memory(v1)))
+
+        eq_(
+            cache.entry_stats(),
+            [("s1", 0.001, cache.estimate_memory(v1), 2)],
+        )
+
+        cache.reset_stats()
+        eq_(cache.stats(), (0, 0, 0, 1, cache.estimate_memory(v1)))
+
+    def test_replace_and_delete_track_memory(self):
+        cache = CompiledCache(10)
+        v1 = self.FakeCompiled("s1", 0.001)
+        v2 = self.FakeCompiled("s2", 0.001, size=10)
+
+        cache["k1"] = v1
+        cache["k1"] = v2
+        eq_(cache.stats().memory, cache.estimate_memory(v2))
+        is_(cache["k1"], v2)
+
+        del cache["k1"]
+        eq_(cache.stats().memory, 0)
+        eq_(len(cache), 0)
+
+    def test_arbitrary_values(self):
+        cache = CompiledCache(2, threshold=0)
+        cache["a"] = "foo"
+        cache["b"] = "bar"
+        cache["c"] = "bat"
+        eq_(sorted(cache), ["b", "c"])
+
+    def test_size_alert(self):
+        alert = Mock()
+        cache = CompiledCache(2, threshold=0.5, size_alert=alert)
+        for i in range(3):
+            cache[i] = self.FakeCompiled("s%d" % i, 0.001)
+        eq_(alert.mock_calls, [])
+
+        cache[4] = self.FakeCompiled("s4", 0.001)
+        eq_(alert.mock_calls, [call(cache)])
+        eq_(len(cache), 2)
+
+    def test_evicted_compiled_marked(self):
+        cache = CompiledCache(2, threshold=0)
+        compiled = [select(literal(i)).compile() for i in range(5)]
+
+        for i in range(3):
+            cache[i] = compiled[i]
+        eq_(
+            [c._cache_evicted for c in compiled[0:3]],
+            [c not in cache.values() for c in compiled[0:3]],
+        )
+        eq_(len(cache), 2)
+
+    def test_removed_compiled_marked(self):
+        cache = CompiledCache(10)
+        compiled = [select(literal(i)).compile() for i in range(4)]
+
+        for i in range(3):
+            cache[i] = compiled[i]
+
+        # replaced
+        cache[0] = compiled[3]
+        is_true(compiled[0]._cache_evicted)
+
+        # set again with the same value
+        cache[0] = compiled[3]
+        is_false(compiled[3]._cache_evicted)
+
+        del cache[1]
+        is_true(compiled[1]._cache_evicted)
+        is_false(compiled[2]._cache_evicted)
+
+        cache.clear()
+        is_true(compiled[2]._cache_evicted)
+        is_true(compiled[3]._cache_evicted)
+
+
+class CacheProfilerTest(fixtures.TestBase):
+    __only_on__ = "sqlite"
+    __backend__ = True
+
+    @testing.fixture
+    def profiled_engine(self):
+        return engines.testing_engine(options={"cache_profiling": True})
+
+    def test_not_enabled(self):
+        eng = engines.testing_engine()
+        is_(eng.cache_profiler, None)
+        is_(eng.cache_profile_report(), None)
+
+        with eng.connect() as conn:
+            conn.scalar(select(literal(1)))
+
+    def test_cached_statement(self, profiled_engine, metadata):
+        t = Table("t", metadata, Column("q", Integer))
+
+        is_true(isinstance(profiled_engine.cache_profiler, CacheProfiler))
+        is_(
+            profiled_engine.execution_options(foo="bar").cache_profiler,
+            profiled_engine.cache_profiler,
+        )
+
+        with profiled_engine.begin() as conn:
+            metadata.create_all(conn)
+            for i in range(3):
+                conn.execute(select(t.c.q).where(t.c.q == i))
+
+        (profile,) = profiled_engine.cache_profile_report()
+        eq_(
+            profile[0:4] + profile[6:],
+            (
+                "SELECT t.q \nFROM t \nWHERE t.q = ?",
+                3,
+                2,
+                1,
+                tsa.engine.interfaces.CacheStats.CACHE_HIT,
+                None,
+                None,
+            ),
+        )
+        is_true(profile.cache_key_time > 0)
+        is_true(profile.compile_time > 0)
+
+        profiled_engine.cache_profiler.reset()
+        eq_(profiled_engine.cache_profile_report(), [])
+
+    def test_uncacheable_element(self, profiled_engine):
+        class MyThing(ColumnElement):
+            _traverse_internals = []
+
+        class SubThing(MyThing):
+            pass
+
+        @compiles(SubThing)
+        def visit_thing(element, compiler, **kw):
+            return "1"
+
+        with expect_warnings(
+            "Class SubThing will not make use of SQL compilation caching"
+        ):
+            with profiled_engine.connect() as conn:
+                for i in range(2):
+                    conn.execute(
+                        select(literal_column("2")).where(
+                            literal(1) != SubThing()
+                        )
+                    )
+
+        (profile,) = profiled_engine.cache_profile_report()
+        eq_(profile.executions, 2)
+        eq_((profile.cache_hits, profile.cache_misses), (0, 0))
+        eq_(
+            profile.cache_status,
+            tsa.engine.interfaces.CacheStats.NO_CACHE_KEY,
+        )
+        eq_(profile.uncacheable_element, f"{__name__}.{SubThing.__qualname__}")
+        eq_(
+            profile.cache_disable_reason,
+            "class SubThing does not set the 'inherit_cache' "
+            "attribute to True",
+        )
+        is_true(profile.compile_time > 0)
+
+    def test_uncacheable_type(self, profiled_engine, metadata):
+        class MyType(TypeDecorator):
+            impl = Integer
+
+        t = Table("t", metadata, Column("q", MyType))
+
+        with expect_warnings(
+            "TypeDecorator MyType.* will not produce a cache"
+        ):
+            with profiled_engine.begin() as conn:
+                metadata.create_all(conn)
+                conn.execute(select(literal(1)).where(t.c.q == 5))
+
+        (profile,) = profiled_engine.cache_profile_report()
+        eq_(profile.uncacheable_element, "sqlalchemy.sql.schema.Column")
+        eq_(
+            profile.cache_disable_reason,
+            "type MyType does not set the 'cache_ok' attribute to True",
+        )
+
+    def test_caching_disabled(self, profiled_engine):
+        with profiled_engine.connect() as conn:
+            conn.execution_options(compiled_cache=None)
+            conn.scalar(select(literal_column("1")))
+
+        (profile,) = profiled_engine.cache_profile_report()
+        eq_(
+            profile.cache_status,
+            tsa.engine.interfaces.CacheStats.CACHING_DISABLED,
+        )
+        eq_(profile.cache_key_time, 0)
+        is_(profile.uncacheable_element, None)
+        eq_(profile.cache_disable_reason, "compiled cache is not in use")
+
+    def test_max_statements(self, profiled_engine):
+        profiled_engine.cache_profiler.max_statements = 2
+
+        with profiled_engine.connect() as conn:
+            for i in range(4):
+                for j in range(i + 1):
+                    conn.scalar(select(literal_column(str(i))))
+
+        eq_(
+            sorted(
+                (profile.statement, profile.executions)
+                for profile in profiled_engine.cache_profile_report()
+            ),
+            [("SELECT 0", 1), ("SELECT 1", 2)],
+        )
+
+
+class PreparedStatementThresholdTest(fixtures.TestBase):
+    __only_on__ = "sqlite"
+
+    @testing.fixture
+    def prepare_engine(self, testing_engine):
+        with mock.patch.object(
+            testing.db.dialect.__class__, "supports_server_side_prepare", True
+        ):
+
+            def go(threshold=3, **kw):
+                eng = testing_engine(
+                    options={"prepared_statement_threshold": threshold, **kw}
+                )
+                canary = Mock()
+
+                @event.listens_for(eng, "do_execute")
+                def do_execute(cursor, statement, parameters, context):
+                    canary(context.prepare_statement)
+
+                return eng, canary
+
+            yield go
+
+    def _prepared(self, canary):
+        return [c.args[0] for c in canary.mock_calls]
+
+    def test_threshold(self, prepare_engine):
+        eng, canary = prepare_engine(threshold=3)
+        stmt = select(literal(1))
+
+        with eng.connect() as conn:
+            for i in range(4):
+                conn.execute(stmt)
+            conn.execute(select(literal(1), literal(2)))
+
+        eq_(self._prepared(canary), [False, False, True, True, False])
+
+    def test_counted_across_connections(self, prepare_engine):
+        eng, canary = prepare_engine(threshold=2)
+        stmt = select(literal(1))
+
+        for i in range(3):
+            with eng.connect() as conn:
+                conn.execute(stmt)
+
+        eq_(self._prepared(canary), [False, True, True])
+
+    def test_not_cached(self, prepare_engine):
+        eng, canary = prepare_engine(threshold=1)
+        stmt = select(literal(1))
+
+        with eng.connect() as conn:
+            conn.execute(stmt)
+            conn.execute(stmt, execution_options={"compiled_cache": None})
+            conn.execute(stmt)
+
+        eq_(self._prepared(canary), [True, False, True])
+
+    def test_evicted(self, prepare_engine):
+        eng, canary = prepare_engine(threshold=2)
+        stmt = select(literal(1))
+
+        with eng.connect() as conn:
+            conn.execute(stmt)
+            result = conn.execute(stmt)
+            compiled = result.context.compiled
+
+            eng.clear_compiled_cache()
+            is_true(compiled._cache_evicted)
+
+            # statement is compiled again, and counted from zero
+            result = conn.execute(stmt)
+            is_not(result.context.compiled, compiled)
+            conn.execute(stmt)
+
+        eq_(self._prepared(canary), [False, True, False, True])
+
+    def test_default(self, connection):
+        is_(connection.dialect.prepared_statement_threshold, None)
+        result = connection.execute(select(literal(1)))
+        is_(result.context.prepare_statement, None)
+
+    def test_not_supported(self, testing_engine):
+        is_false(testing.db.dialect.supports_server_side_prepare)
+        with expect_raises_message(
+            tsa.exc.ArgumentError,
+            "Dialect .* does not support prepared_statement_threshold",
+        ):
+            testing_engine(options={"prepared_statement_threshold": 5})
+
+    def test_invalid_threshold(self, prepare_engine):
+        with expect_raises_message(
+            tsa.exc.ArgumentError,
+            "prepared_statement_threshold must be at least 1",
+        ):
+            prepare_engine(threshold=0)
+
 
 class MockStrategyTest(fixtures.TestBase):
     def _engine_fixture(self):
@@ -4268,3 +4811,236 @@ class DialectDoesntSupportCachingTest(fixtures.TestBase):
                 (2,),
             ],
         )
+
+
+class PipelineTest(fixtures.TablesTest):
+    """test Connection.pipeline() using a mock pipeline in front of a
+    real DBAPI connection, which executes statements immediately."""
+
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "users",
+            metadata,
+            Column("user_id", INT, primary_key=True, autoincrement=False),
+            Column("user_name", VARCHAR(20)),
+        )
+
+    @classmethod
+    def insert_data(cls, connection):
+        connection.execute(
+            cls.tables.users.insert(),
+            [
+                {"user_id": 1, "user_name": "jack"},
+                {"user_id": 2, "user_name": "ed"},
+                {"user_id": 3, "user_name": "wendy"},
+            ],
+        )
+
+    @testing.fixture
+    def pipeline_engine(self):
+        eng = testing.db
+        canary = Mock()
+
+        @contextmanager
+        def do_pipeline(dbapi_connection):
+            canary.enter(dbapi_connection)
+            yield canary.pipeline
+            canary.exit()
+
+        with mock.patch.object(
+            eng.dialect, "supports_pipeline", True
+        ), mock.patch.object(eng.dialect, "do_pipeline", do_pipeline):
+            yield eng, canary
+
+    def test_not_supported(self, connection):
+        users = self.tables.users
+
+        is_false(connection.dialect.supports_pipeline)
+        with connection.pipeline() as conn:
+            is_(conn, connection)
+            is_(conn._pipeline, None)
+            result = conn.execute(
+                users.update().values(user_name="x"),
+            )
+            is_false(result.context._pipeline_deferred)
+            eq_(result.rowcount, 3)
+
+    def test_dml_deferred(self, pipeline_engine):
+        eng, canary = pipeline_engine
+        users = self.tables.users
+
+        with eng.begin() as conn:
+            with conn.pipeline():
+                dbapi_conn = conn.connection.dbapi_connection
+                eq_(canary.mock_calls, [call.enter(dbapi_conn)])
+
+                r1 = conn.execute(
+                    users.update()
+                    .where(users.c.user_id < 3)
+                    .values(user_name="x")
+                )
+                r2 = conn.execute(users.delete().where(users.c.user_id == 3))
+                is_true(r1.context._pipeline_deferred)
+                is_true(r2.context._pipeline_deferred)
+                eq_(len(conn._pipeline.pending), 2)
+                eq_(canary.pipeline.sync.mock_calls, [])
+
+            eq_(
+                canary.mock_calls,
+                [call.enter(dbapi_conn), call.pipeline.sync(), call.exit()],
+            )
+            is_(conn._pipeline, None)
+            is_false(r1.context._pipeline_deferred)
+            eq_(r1.rowcount, 2)
+            eq_(r2.rowcount, 1)
+            is_true(r1._soft_closed)
+
+    def test_rowcount_syncs(self, pipeline_engine):
+        eng, canary = pipeline_engine
+        users = self.tables.users
+
+        with eng.begin() as conn:
+            with conn.pipeline():
+                result = conn.execute(users.update().values(user_name="x"))
+                eq_(canary.pipeline.sync.mock_calls, [])
+
+                eq_(result.rowcount, 3)
+                eq_(canary.pipeline.sync.mock_calls, [call()])
+                eq_(conn._pipeline.pending, [])
+
+    def test_rows_sync(self, pipeline_engine):
+        eng, canary = pipeline_engine
+        users = self.tables.users
+
+        with eng.begin() as conn:
+            with conn.pipeline():
+                r1 = conn.execute(
+                    users.update()
+                    .where(users.c.user_id == 1)
+                    .values(user_name="x")
+                )
+                eq_(canary.pipeline.sync.mock_calls, [])
+
+                r2 = conn.execute(
+                    select(users.c.user_name).order_by(users.c.user_id)
+                )
+                eq_(canary.pipeline.sync.mock_calls, [call()])
+                is_false(r1.context._pipeline_deferred)
+                eq_(r2.scalars().all(), ["x", "ed", "wendy"])
+
+    @testing.requires.insert_returning
+    def test_returning_not_deferred(self, pipeline_engine):
+        eng, canary = pipeline_engine
+        users = self.tables.users
+
+        with eng.begin() as conn:
+            with conn.pipeline():
+                result = conn.execute(
+                    users.insert().returning(users.c.user_id),
+                    {"user_id": 4, "user_name": "fred"},
+                )
+                is_false(result.context._pipeline_deferred)
+                eq_(canary.pipeline.sync.mock_calls, [call()])
+                eq_(result.scalar(), 4)
+
+    def test_commit_syncs(self, pipeline_engine):
+        eng, canary = pipeline_engine
+        users = self.tables.users
+        callback = Mock()
+
+        with eng.connect() as conn:
+            with conn.pipeline():
+                result = conn.execute(users.update().values(user_name="x"))
+                conn._defer_to_pipeline_sync(callback, 5)
+                eq_(callback.mock_calls, [])
+
+                conn.commit()
+                eq_(canary.pipeline.sync.mock_calls, [call()])
+                eq_(callback.mock_calls, [call(5)])
+                eq_(result.rowcount, 3)
+
+    def test_rollback_discards(self, pipeline_engine):
+        eng, canary = pipeline_engine
+        users = self.tables.users
+        callback = Mock()
+
+        with eng.connect() as conn:
+            with conn.pipeline():
+                result = conn.execute(users.update().values(user_name="x"))
+                conn._defer_to_pipeline_sync(callback)
+
+                conn.rollback()
+                eq_(result.rowcount, -1)
+                is_true(result._soft_closed)
+
+        eq_(callback.mock_calls, [])
+
+    def test_callback_without_pipeline(self, connection):
+        callback = Mock()
+        connection._defer_to_pipeline_sync(callback, 1, 2)
+        eq_(callback.mock_calls, [call(1, 2)])
+
+    def test_nested_pipeline(self, pipeline_engine):
+        eng, canary = pipeline_engine
+
+        with eng.connect() as conn:
+            with conn.pipeline():
+                state = conn._pipeline
+                with conn.pipeline():
+                    is_(conn._pipeline, state)
+                is_(conn._pipeline, state)
+            is_(conn._pipeline, None)
+
+        eq_(
+            canary.mock_calls,
+            [call.enter(mock.ANY), call.pipeline.sync(), call.exit()],
+        )
+
+    def test_sync_error(self, pipeline_engine):
+        eng, canary = pipeline_engine
+        users = self.tables.users
+        callback = Mock()
+
+        canary.pipeline.sync.side_effect = eng.dialect.loaded_dbapi.Error(
+            "pipeline failed"
+        )
+
+        with eng.connect() as conn:
+            with expect_raises_message(tsa.exc.DBAPIError, "pipeline failed"):
+                with conn.pipeline():
+                    result = conn.execute(
+                        users.update().values(user_name="x")
+                    )
+                    conn._defer_to_pipeline_sync(callback)
+
+            is_(conn._pipeline, None)
+            eq_(result.rowcount, -1)
+            eq_(callback.mock_calls, [])
+            conn.rollback()
+
+        # the context manager was exited with the error
+        eq_(canary.mock_calls[-1], call.pipeline.sync())
+
+    def test_error_in_block(self, pipeline_engine):
+        eng, canary = pipeline_engine
+        users = self.tables.users
+        callback = Mock()
+
+        with eng.connect() as conn:
+            with expect_raises_message(SomeException, "oops"):
+                with conn.pipeline():
+                    result = conn.execute(
+                        users.update().values(user_name="x")
+                    )
+                    conn._defer_to_pipeline_sync(callback)
+                    raise SomeException("oops")
+
+            is_(conn._pipeline, None)
+            eq_(result.rowcount, -1)
+            conn.rollback()
+
+        eq_(callback.mock_calls, [])
+        eq_(canary.pipeline.sync.mock_calls, [])
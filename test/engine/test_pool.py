@@ -23,14 +23,18 @@ from sqlalchemy.testing import assert_raises_context_ok
 from sqlalchemy.testing import assert_warns_message
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import expect_raises
+from sqlalchemy.testing import expect_raises_message
 from sqlalchemy.testing import expect_warnings
 from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import in_
+from sqlalchemy.testing import is_false
 from sqlalchemy.testing import is_
 from sqlalchemy.testing import is_none
 from sqlalchemy.testing import is_not
 from sqlalchemy.testing import is_not_none
 from sqlalchemy.testing import is_true
 from sqlalchemy.testing import mock
+from sqlalchemy.testing import not_in
 from sqlalchemy.testing.engines import testing_engine
 from sqlalchemy.testing.util import gc_collect
 from sqlalchemy.testing.util import lazy_gc
@@ -235,6 +239,12 @@ class PoolTest(PoolTestBase):
             pool.QueuePool,
             dict(pool_size=8, max_overflow=10, timeout=25, use_lifo=True),
         ),
+        (
+            pool.QueuePool,
+            dict(min_idle=2, idle_timeout=60, maintenance_interval=10),
+        ),
+        (pool.QueuePool, dict(queue_shards=4, use_lifo=True)),
+        (pool.QueuePool, dict(fair_queue=True)),
         (pool.QueuePool, {}),
         (pool.NullPool, {}),
         (pool.SingletonThreadPool, {}),
@@ -249,6 +259,7 @@ class PoolTest(PoolTestBase):
         pool_args["logging_name"] = "somepool"
         pool_args["dialect"] = default.DefaultDialect()
         pool_args["echo"] = "debug"
+        pool_args["collect_metrics"] = True
 
         p1 = pool_cls(creator=creator, **pool_args)
 
@@ -282,6 +293,14 @@ class PoolTest(PoolTestBase):
 
         if "use_lifo" in pool_args:
             eq_(p1._pool.use_lifo, p2._pool.use_lifo)
+        if "queue_shards" in pool_args:
+            eq_(len(p1._pool._shards), len(p2._pool._shards))
+        if "queue_shards" in pool_args or "fair_queue" in pool_args:
+            is_(type(p1._pool), type(p2._pool))
+
+        is_not_none(p1.metrics)
+        is_(p1.metrics, p2.metrics)
+        is_(p2.metrics._pool_ref(), p2)
 
     @testing.combinations(
         (pool.QueuePool, False),
@@ -2006,6 +2025,1088 @@ class QueuePoolTest(PoolTestBase):
         pc1.close()
 
 
+class PoolMetricsTest(PoolTestBase):
+    def test_metrics_not_collected_by_default(self):
+        p = self._queuepool_fixture()
+        is_none(p.metrics)
+
+        c1 = p.connect()
+        c1.close()
+        is_none(p.metrics)
+
+    def test_checkout_checkin(self):
+        p = self._queuepool_fixture(
+            pool_size=2, max_overflow=0, collect_metrics=True
+        )
+        metrics = p.metrics
+        is_not_none(metrics)
+
+        c1 = p.connect()
+        c2 = p.connect()
+        eq_(
+            metrics.gauges(),
+            dict(size=2, checkedin=0, checkedout=2, overflow=0),
+        )
+        c1.close()
+        c2.close()
+        c3 = p.connect()
+
+        eq_(
+            (
+                metrics.checkouts,
+                metrics.checkins,
+                metrics.connects,
+                metrics.connect_errors,
+                metrics.overflow_created,
+                metrics.timeouts,
+            ),
+            (3, 2, 2, 0, 0, 0),
+        )
+        eq_(metrics.checkout_wait.count, 3)
+        eq_(metrics.checkout_held.count, 2)
+        eq_(metrics.connect_time.count, 2)
+        is_true(metrics.checkout_held.sum > 0)
+
+        c3.close()
+        eq_(metrics.checkins, 3)
+
+    def test_overflow_and_timeout(self):
+        p = self._queuepool_fixture(
+            pool_size=1, max_overflow=1, timeout=0.05, collect_metrics=True
+        )
+        metrics = p.metrics
+
+        c1 = p.connect()
+        c2 = p.connect()
+        eq_(metrics.overflow_created, 1)
+        eq_(metrics.gauges()["overflow"], 1)
+
+        with expect_raises(tsa.exc.TimeoutError):
+            p.connect()
+        eq_(metrics.timeouts, 1)
+        eq_(metrics.checkouts, 2)
+
+        c1.close()
+        c2.close()
+
+    def test_connect_error(self):
+        dbapi, p = self._queuepool_dbapi_fixture(collect_metrics=True)
+        dbapi.shutdown(True)
+
+        with expect_raises_message(Exception, "connect failed"):
+            p.connect()
+
+        eq_(p.metrics.connect_errors, 1)
+        eq_(p.metrics.connects, 0)
+        eq_(p.metrics.checkouts, 0)
+        eq_(p.metrics.gauges()["checkedout"], 0)
+
+    def test_recycle_and_invalidate(self):
+        p = self._queuepool_fixture(
+            pool_size=1, max_overflow=0, recycle=30, collect_metrics=True
+        )
+        metrics = p.metrics
+
+        c1 = p.connect()
+        c1.invalidate()
+        eq_(metrics.invalidations, 1)
+
+        c1 = p.connect()
+        c1.close()
+        eq_(metrics.recycles, 0)
+
+        with mock.patch(
+            "sqlalchemy.pool.base.time.time",
+            return_value=time.time() + 35,
+        ):
+            c1 = p.connect()
+            c1.close()
+        eq_(metrics.recycles, 1)
+        eq_(metrics.connects, 3)
+
+    def test_pre_ping_failure(self):
+        dialect = default.DefaultDialect()
+        dialect._do_ping_w_event = Mock(side_effect=[False, True])
+        p = self._queuepool_fixture(
+            pool_size=1,
+            max_overflow=0,
+            pre_ping=True,
+            dialect=dialect,
+            collect_metrics=True,
+        )
+
+        c1 = p.connect()
+        c1.close()
+        eq_(p.metrics.pre_ping_failures, 0)
+
+        c1 = p.connect()
+        c1.close()
+        eq_(p.metrics.pre_ping_failures, 1)
+        eq_(p.metrics.connects, 2)
+
+    def test_reset(self):
+        p = self._queuepool_fixture(collect_metrics=True)
+        p.connect().close()
+
+        p.metrics.reset()
+        eq_(p.metrics.checkouts, 0)
+        eq_(p.metrics.checkout_wait.count, 0)
+        eq_(p.metrics.checkout_wait.sum, 0)
+        eq_(
+            p.metrics.checkout_wait.cumulative_counts()[-1],
+            (float("inf"), 0),
+        )
+
+    def test_histogram(self):
+        h = pool.PoolHistogram((1, 0.1, 10))
+        eq_(h.buckets, (0.1, 1, 10))
+        for value in (0.05, 0.1, 0.5, 5, 50):
+            h.observe(value)
+
+        eq_(
+            h.cumulative_counts(),
+            [(0.1, 2), (1, 3), (10, 4), (float("inf"), 5)],
+        )
+        eq_(
+            h.as_dict(),
+            {
+                "count": 5,
+                "sum": 55.65,
+                "buckets": {0.1: 2, 1: 3, 10: 4, float("inf"): 5},
+            },
+        )
+
+    def test_as_dict(self):
+        p = self._queuepool_fixture(pool_size=3, collect_metrics=True)
+        p.connect().close()
+
+        d = p.metrics.as_dict()
+        eq_(
+            set(d),
+            {
+                "checkouts",
+                "checkins",
+                "connects",
+                "connect_errors",
+                "overflow_created",
+                "timeouts",
+                "recycles",
+                "invalidations",
+                "pre_pings",
+                "pre_pings_skipped",
+                "pre_ping_failures",
+                "checkout_wait",
+                "checkout_held",
+                "connect_time",
+                "size",
+                "checkedin",
+                "checkedout",
+                "overflow",
+            },
+        )
+        eq_(d["checkouts"], 1)
+        eq_(d["size"], 3)
+        eq_(d["checkedin"], 1)
+        eq_(d["checkout_wait"]["count"], 1)
+
+    def test_to_prometheus(self):
+        metrics = pool.PoolMetrics(buckets=(0.5, 1))
+        metrics.checkouts = 5
+        metrics.connect_time.observe(0.25)
+        metrics.connect_time.observe(2)
+
+        text = metrics.to_prometheus(labels={"db": 'my "db"'})
+        lines = text.splitlines()
+
+        for line in [
+            "# TYPE sqlalchemy_pool_checkouts_total counter",
+            'sqlalchemy_pool_checkouts_total{db="my \\"db\\""} 5',
+            "# TYPE sqlalchemy_pool_connect_time_seconds histogram",
+            "sqlalchemy_pool_connect_time_seconds_bucket"
+            '{db="my \\"db\\"",le="0.5"} 1',
+            "sqlalchemy_pool_connect_time_seconds_bucket"
+            '{db="my \\"db\\"",le="1"} 1',
+            "sqlalchemy_pool_connect_time_seconds_bucket"
+            '{db="my \\"db\\"",le="+Inf"} 2',
+            "sqlalchemy_pool_connect_time_seconds_sum"
+            '{db="my \\"db\\""} 2.25',
+            "sqlalchemy_pool_connect_time_seconds_count"
+            '{db="my \\"db\\""} 2',
+        ]:
+            in_(line, lines)
+
+        # no pool, no gauges
+        not_in("gauge", text)
+
+    def test_to_prometheus_gauges(self):
+        p = self._queuepool_fixture(pool_size=3, collect_metrics=True)
+        c1 = p.connect()
+
+        lines = p.metrics.to_prometheus(prefix="myapp_pool").splitlines()
+        for line in [
+            "myapp_pool_checkouts_total 1",
+            "# TYPE myapp_pool_size gauge",
+            "myapp_pool_size 3",
+            "myapp_pool_checkedout 1",
+        ]:
+            in_(line, lines)
+        c1.close()
+
+    def test_create_engine_param(self):
+        e = create_engine("sqlite://", pool_collect_metrics=True)
+        with e.connect():
+            pass
+        eq_(e.pool.metrics.checkouts, 1)
+
+        metrics = e.pool.metrics
+        e.dispose()
+        is_(e.pool.metrics, metrics)
+
+        with e.connect():
+            pass
+        eq_(metrics.checkouts, 2)
+
+
+class PrePingIdleThresholdTest(PoolTestBase):
+    def _fixture(self, **kw):
+        dialect = default.DefaultDialect()
+        dialect._do_ping_w_event = Mock(return_value=True)
+        p = self._queuepool_fixture(
+            pool_size=1,
+            max_overflow=0,
+            pre_ping=True,
+            dialect=dialect,
+            collect_metrics=True,
+            **kw,
+        )
+        return dialect._do_ping_w_event, p
+
+    def test_no_threshold(self):
+        ping, p = self._fixture()
+
+        for i in range(3):
+            p.connect().close()
+
+        # first connection is fresh and isn't pinged
+        eq_(ping.call_count, 2)
+        eq_((p.metrics.pre_pings, p.metrics.pre_pings_skipped), (2, 1))
+
+    def test_threshold(self):
+        ping, p = self._fixture(pre_ping_idle_threshold=10)
+
+        now = time.time()
+        with mock.patch("sqlalchemy.pool.base.time.time", return_value=now):
+            p.connect().close()
+            p.connect().close()
+            eq_(ping.call_count, 0)
+
+        with mock.patch(
+            "sqlalchemy.pool.base.time.time", return_value=now + 9
+        ):
+            p.connect().close()
+            eq_(ping.call_count, 0)
+
+        # idle time is measured from the most recent checkin
+        with mock.patch(
+            "sqlalchemy.pool.base.time.time", return_value=now + 18
+        ):
+            p.connect().close()
+            eq_(ping.call_count, 0)
+
+        with mock.patch(
+            "sqlalchemy.pool.base.time.time", return_value=now + 30
+        ):
+            p.connect().close()
+            eq_(ping.call_count, 1)
+
+        eq_((p.metrics.pre_pings, p.metrics.pre_pings_skipped), (1, 4))
+
+    def test_threshold_error_on_last_use(self):
+        ping, p = self._fixture(pre_ping_idle_threshold=10)
+
+        c1 = p.connect()
+        c1._set_requires_ping()
+        c1.close()
+
+        p.connect().close()
+        eq_(ping.call_count, 1)
+
+        # flag is reset by the ping
+        p.connect().close()
+        eq_(ping.call_count, 1)
+
+    def test_threshold_failed_ping(self):
+        ping, p = self._fixture(pre_ping_idle_threshold=10)
+        ping.side_effect = [False]
+
+        c1 = p.connect()
+        dbapi_conn = c1.dbapi_connection
+        c1._set_requires_ping()
+        c1.close()
+
+        c1 = p.connect()
+        is_not(c1.dbapi_connection, dbapi_conn)
+        eq_(p.metrics.pre_ping_failures, 1)
+        c1.close()
+
+        # new connection was not marked
+        p.connect().close()
+        eq_(ping.call_count, 1)
+
+    def test_recreate(self):
+        ping, p = self._fixture(pre_ping_idle_threshold=10)
+        eq_(p.recreate()._pre_ping_idle_threshold, 10)
+
+    @testing.requires.sqlite
+    def test_engine_error_requires_ping(self):
+        e = testing_engine(
+            options=dict(
+                pool_pre_ping=True,
+                pool_pre_ping_idle_threshold=60,
+                pool_collect_metrics=True,
+            )
+        )
+        metrics = e.pool.metrics
+
+        with e.connect() as conn:
+            conn.exec_driver_sql("select 1")
+        with e.connect() as conn:
+            conn.exec_driver_sql("select 1")
+        eq_(metrics.pre_pings, 0)
+
+        with e.connect() as conn:
+            with expect_raises(tsa.exc.DBAPIError):
+                conn.exec_driver_sql("select * from nonexistent_table")
+
+        with e.connect() as conn:
+            conn.exec_driver_sql("select 1")
+        eq_(metrics.pre_pings, 1)
+
+        with e.connect() as conn:
+            conn.exec_driver_sql("select 1")
+        eq_(metrics.pre_pings, 1)
+
+
+class ShardedQueuePoolTest(PoolTestBase):
+    def test_checkout_checkin(self):
+        p = self._queuepool_fixture(
+            pool_size=3, max_overflow=1, queue_shards=4
+        )
+        conns = [p.connect() for i in range(4)]
+        eq_(p.checkedout(), 4)
+        eq_(p.overflow(), 1)
+        dbapi_conns = {conn.dbapi_connection for conn in conns}
+
+        for conn in conns:
+            conn.close()
+        eq_(p.checkedout(), 0)
+        eq_(p.checkedin(), 3)
+        eq_(p.overflow(), 0)
+
+        c1 = p.connect()
+        in_(c1.dbapi_connection, dbapi_conns)
+        c1.close()
+
+    def test_not_supported_asyncio(self):
+        with expect_raises_message(
+            tsa.exc.ArgumentError,
+            "queue_shards is not supported by AsyncAdaptedQueuePool",
+        ):
+            pool.AsyncAdaptedQueuePool(creator=Mock(), queue_shards=4)
+
+    @testing.requires.timing_intensive
+    def test_timeout(self):
+        p = self._queuepool_fixture(
+            pool_size=1, max_overflow=0, timeout=0.5, queue_shards=4
+        )
+        c1 = p.connect()  # noqa
+        with expect_raises(tsa.exc.TimeoutError):
+            now = time.time()
+            c2 = p.connect()  # noqa
+        assert 0.3 <= time.time() - now <= 0.7, "Pool timeout not respected"
+
+    @testing.requires.threading_with_mock
+    def test_wait_for_checkin_from_other_thread(self):
+        p = self._queuepool_fixture(
+            pool_size=1, max_overflow=0, timeout=10, queue_shards=4
+        )
+        c1 = p.connect()
+
+        def checkin():
+            time.sleep(0.1)
+            c1.close()
+
+        th = threading.Thread(target=checkin)
+        th.start()
+
+        now = time.time()
+        c2 = p.connect()
+        assert time.time() - now < 5
+        th.join(join_timeout)
+        c2.close()
+
+    @testing.requires.threading_with_mock
+    @testing.requires.timing_intensive
+    def test_overflow(self):
+        reaper = testing.engines.ConnectionKiller()
+        dbapi = MockDBAPI()
+        mutex = threading.Lock()
+
+        def creator():
+            time.sleep(0.01)
+            with mutex:
+                return dbapi.connect()
+
+        p = pool.QueuePool(
+            creator=creator,
+            pool_size=3,
+            timeout=2,
+            max_overflow=2,
+            queue_shards=4,
+        )
+        reaper.add_pool(p)
+        peaks = []
+
+        def whammy():
+            for i in range(20):
+                try:
+                    con = p.connect()
+                    time.sleep(0.002)
+                    peaks.append(p.overflow())
+                    con.close()
+                    del con
+                except tsa.exc.TimeoutError:
+                    pass
+
+        threads = []
+        for i in range(20):
+            th = threading.Thread(target=whammy)
+            th.start()
+            threads.append(th)
+        for th in threads:
+            th.join(join_timeout)
+
+        self.assert_(max(peaks) <= 2)
+        eq_(p.checkedout(), 0)
+        eq_(p.checkedin(), 3)
+
+        reaper.assert_all_closed()
+
+
+class CheckoutDeadlineTest(PoolTestBase):
+    @testing.combinations(
+        (pool.QueuePool, {}),
+        (pool.QueuePool, {"fair_queue": True}),
+        (pool.NullPool, {}),
+        (pool.SingletonThreadPool, {}),
+        (pool.StaticPool, {}),
+        argnames="pool_cls, kw",
+    )
+    def test_deadline_passed(self, pool_cls, kw):
+        dbapi = MockDBAPI()
+        p = pool_cls(
+            creator=lambda: dbapi.connect("foo.db"),
+            collect_metrics=True,
+            **kw,
+        )
+
+        with expect_raises_message(
+            tsa.exc.TimeoutError, "Connection checkout deadline passed"
+        ):
+            p.connect(deadline=time.monotonic() - 1)
+        eq_(dbapi.connect.call_count, 0)
+        eq_(p.metrics.timeouts, 1)
+
+        c1 = p.connect(deadline=time.monotonic() + 10)
+        c1.close()
+        eq_(dbapi.connect.call_count, 1)
+
+    def test_deadline_limits_wait(self):
+        p = self._queuepool_fixture(pool_size=1, max_overflow=0, timeout=30)
+        c1 = p.connect()
+
+        now = time.monotonic()
+        with expect_raises_message(
+            tsa.exc.TimeoutError, "connection timed out, timeout 0.2"
+        ):
+            p.connect(deadline=now + 0.25)
+        assert time.monotonic() - now < 5
+
+        c1.close()
+
+    def test_engine_connect_deadline(self):
+        e = testing_engine(
+            options={"poolclass": pool.QueuePool, "pool_size": 1}
+        )
+        with expect_raises(tsa.exc.TimeoutError):
+            e.connect(deadline=time.monotonic() - 1)
+        with expect_raises(tsa.exc.TimeoutError):
+            e.raw_connection(deadline=time.monotonic() - 1)
+        eq_(e.pool.checkedout(), 0)
+
+        with e.connect(deadline=time.monotonic() + 10) as conn:
+            eq_(conn.exec_driver_sql("select 1").scalar(), 1)
+        e.dispose()
+
+
+class FairQueuePoolTest(PoolTestBase):
+    def test_arguments(self):
+        with expect_raises_message(
+            tsa.exc.ArgumentError,
+            "queue_shards can't be combined with fair_queue",
+        ):
+            pool.QueuePool(creator=Mock(), queue_shards=4, fair_queue=True)
+
+        with expect_raises_message(
+            tsa.exc.ArgumentError,
+            "fair_queue is not supported by AsyncAdaptedQueuePool",
+        ):
+            pool.AsyncAdaptedQueuePool(creator=Mock(), fair_queue=True)
+
+    @testing.requires.threading_with_mock
+    def test_waiters_served_in_order(self):
+        p = self._queuepool_fixture(
+            pool_size=1, max_overflow=0, timeout=10, fair_queue=True
+        )
+        c1 = p.connect()
+
+        received = []
+        threads = []
+        for name in ["a", "b", "c"]:
+
+            def checkout(name=name):
+                conn = p.connect()
+                received.append(name)
+                conn.close()
+
+            th = threading.Thread(target=checkout)
+            th.start()
+            threads.append(th)
+
+            deadline = time.monotonic() + join_timeout
+            while len(p._pool._waiters) < len(threads):
+                assert time.monotonic() < deadline
+                time.sleep(0.005)
+
+        c1.close()
+        for th in threads:
+            th.join(join_timeout)
+
+        eq_(received, ["a", "b", "c"])
+        eq_(p.checkedin(), 1)
+
+
+class RoutingPoolTest(PoolTestBase):
+    def _fixture(self, num_replicas=2, **kw):
+        primary = MockDBAPI()
+        replicas = [MockDBAPI() for i in range(num_replicas)]
+        p = pool.RoutingPool(
+            creator=lambda: primary.connect("primary"),
+            replicas=[
+                (lambda dbapi=dbapi: dbapi.connect("replica"))
+                for dbapi in replicas
+            ],
+            **kw,
+        )
+        return primary, replicas, p
+
+    def test_routes(self):
+        primary, (r0,), p = self._fixture(num_replicas=1)
+
+        c1 = p.connect()
+        c2 = p.connect(route="write")
+        c3 = p.connect(route="read")
+
+        eq_(primary.connect.call_count, 2)
+        eq_(r0.connect.call_count, 1)
+        eq_(p.primary.in_flight, 2)
+        eq_(p.replicas[0].in_flight, 1)
+        eq_(p.checkedout(), 3)
+
+        with expect_raises_message(
+            tsa.exc.ArgumentError, "Unknown pool route 'foo'"
+        ):
+            p.connect(route="foo")
+
+        for conn in (c1, c2, c3):
+            conn.close()
+        eq_(p.checkedout(), 0)
+
+    def test_no_replicas(self):
+        primary, replicas, p = self._fixture(num_replicas=0)
+        c1 = p.connect(route="read")
+        eq_(primary.connect.call_count, 1)
+        c1.close()
+
+    def test_balance_in_flight(self):
+        primary, (r0, r1), p = self._fixture()
+        for ep in p.replicas:
+            # equal latencies which aren't changed by the time taken
+            # to connect
+            ep.latency = 0.1
+            ep.pool._latency_weight = 0
+
+        conns = [p.connect(route="read") for i in range(4)]
+        eq_([ep.in_flight for ep in p.replicas], [2, 2])
+        eq_(primary.connect.call_count, 0)
+
+        for conn in conns:
+            conn.close()
+
+    def test_balance_latency(self):
+        primary, (r0, r1), p = self._fixture()
+        ep0, ep1 = p.replicas
+
+        c1 = p.connect(route="read")
+        c1.close()
+        is_not_none(ep0.latency)
+        is_none(ep1.latency)
+
+        # a replica which responds more slowly receives a smaller share
+        ep0.latency = 0.5
+        ep1.latency = 0.125
+        for ep in p.replicas:
+            # keep the latencies as given while connecting
+            ep.pool._latency_weight = 0
+        conns = [p.connect(route="read") for i in range(6)]
+        eq_([ep.in_flight for ep in p.replicas], [1, 5])
+
+        for conn in conns:
+            conn.close()
+
+    def test_latency_round_trip(self):
+        primary, (r0,), p = self._fixture(num_replicas=1, pre_ping=True)
+        ep0 = p.replicas[0]
+        now = [100.0]
+        delays = {"connect": 0.4, "ping": 0.4}
+
+        def slow_connect(*arg, **kw):
+            now[0] += delays["connect"]
+            return r0.connect.return_value
+
+        def slow_ping(dbapi_connection):
+            now[0] += delays["ping"]
+            return True
+
+        with mock.patch(
+            "sqlalchemy.pool.impl.time.perf_counter", lambda: now[0]
+        ), mock.patch.object(
+            r0, "connect", side_effect=slow_connect
+        ), mock.patch.object(
+            pool.QueuePool, "_do_ping", side_effect=slow_ping
+        ):
+            # time taken to connect
+            c1 = p.connect(route="read")
+            c1.close()
+            eq_(round(ep0.latency, 6), 0.4)
+
+            # time taken to pre-ping; the time for which the connection
+            # is held is not counted
+            c1 = p.connect(route="read")
+            now[0] += 10
+            c1.close()
+            eq_(round(ep0.latency, 6), 0.4)
+
+            delays["ping"] = 0.1
+            c1 = p.connect(route="read")
+            c1.close()
+            eq_(round(ep0.latency, 6), 0.34)
+
+    def test_eject_on_connect_failure(self):
+        primary, (r0, r1), p = self._fixture(ejection_time=30)
+        ep0, ep1 = p.replicas
+        r0.shutdown(True)
+
+        c1 = p.connect(route="read")
+        eq_(r1.connect.call_count, 1)
+        is_true(ep0.ejected)
+        is_false(ep1.ejected)
+        eq_(ep0.errors, 1)
+        eq_(
+            p.status(),
+            "RoutingPool primary: checked out 0, "
+            "replica_0: checked out 0 (ejected), replica_1: checked out 1",
+        )
+
+        # all replicas unavailable; the primary is used
+        r1.shutdown(True)
+        c2 = p.connect(route="read")
+        eq_(primary.connect.call_count, 1)
+        is_true(ep1.ejected)
+
+        # an ejected replica is used again once the ejection time passes
+        r0.shutdown(False)
+        ep0.ejected_until = time.monotonic() - 1
+        c3 = p.connect(route="read")
+        eq_(r0.connect.call_count, 1)
+        is_false(ep0.ejected)
+
+        for conn in (c1, c2, c3):
+            conn.close()
+
+    def test_eject_on_pre_ping_failure(self):
+        dialect = default.DefaultDialect()
+        dialect._do_ping_w_event = Mock(return_value=True)
+        primary, (r0,), p = self._fixture(
+            num_replicas=1, pre_ping=True, dialect=dialect
+        )
+        ep0 = p.replicas[0]
+
+        c1 = p.connect(route="read")
+        c1.close()
+        is_false(ep0.ejected)
+
+        # the replica goes down
+        dialect._do_ping_w_event.return_value = False
+        r0.shutdown(True)
+
+        c2 = p.connect(route="read")
+        is_true(ep0.ejected)
+        eq_(primary.connect.call_count, 1)
+        c2.close()
+
+    def test_primary_failure_raises(self):
+        primary, replicas, p = self._fixture()
+        primary.shutdown(True)
+        with expect_raises_message(Exception, "connect failed"):
+            p.connect()
+        is_false(p.primary.ejected)
+
+    def test_events_apply_to_endpoints(self):
+        primary, (r0, r1), p = self._fixture()
+        canary = Mock()
+        event.listen(p, "connect", canary.connect)
+        event.listen(p, "checkout", canary.checkout)
+        event.listen(
+            p, "connect", canary.first_connect, _once_unless_exception=True
+        )
+
+        c1 = p.connect()
+        c2 = p.connect(route="read")
+        c3 = p.connect(route="read")
+
+        eq_(canary.connect.call_count, 3)
+        eq_(canary.checkout.call_count, 3)
+        eq_(canary.first_connect.call_count, 1)
+
+        for conn in (c1, c2, c3):
+            conn.close()
+
+    def test_invalidate(self):
+        primary, (r0,), p = self._fixture(num_replicas=1)
+        c1 = p.connect(route="read")
+        rec = c1._connection_record
+        p._invalidate(c1)
+        is_not(p.replicas[0].pool._invalidate_time, 0)
+        eq_(p.primary.pool._invalidate_time, 0)
+        is_none(rec.dbapi_connection)
+
+    def test_recreate_dispose(self):
+        canary = Mock()
+        primary, (r0, r1), p = self._fixture(
+            pool_size=3, max_overflow=1, ejection_time=5, pre_ping=True
+        )
+        event.listen(p, "connect", canary)
+
+        c1 = p.connect(route="read")
+        c1.close()
+        eq_(p.replicas[0].pool.checkedin(), 1)
+        p.dispose()
+        eq_(p.replicas[0].pool.checkedin(), 0)
+
+        p2 = p.recreate()
+        eq_(len(p2.replicas), 2)
+        eq_(p2._ejection_time, 5)
+        for ep in p2.endpoints:
+            eq_(ep.pool._pool.maxsize, 3)
+            eq_(ep.pool._max_overflow, 1)
+            is_true(ep.pool._pre_ping)
+
+        c2 = p2.connect(route="read")
+        eq_(canary.call_count, 2)
+        c2.close()
+
+    def test_engine_pool_route(self):
+        e = testing_engine(
+            options={
+                "poolclass": pool.RoutingPool,
+                "pool_replicas": [testing.db.url],
+                "pool_ejection_time": 5,
+            }
+        )
+        eq_(e.pool._ejection_time, 5)
+        reader = e.execution_options(pool_route="read")
+
+        with reader.connect() as conn:
+            eq_(conn.exec_driver_sql("select 1").scalar(), 1)
+            eq_(e.pool.replicas[0].in_flight, 1)
+            eq_(e.pool.primary.in_flight, 0)
+
+        with e.connect() as conn:
+            eq_(e.pool.replicas[0].in_flight, 0)
+            eq_(e.pool.primary.in_flight, 1)
+        e.dispose()
+
+    def test_engine_pool_route_ignored(self):
+        e = testing_engine(options={"poolclass": pool.QueuePool})
+        reader = e.execution_options(pool_route="read")
+        with reader.connect() as conn:
+            eq_(conn.exec_driver_sql("select 1").scalar(), 1)
+        e.dispose()
+
+
+class QueuePoolMaintenanceTest(PoolTestBase):
+    def _fixture(self, **kw):
+        kw.setdefault("pool_size", 5)
+        kw.setdefault("max_overflow", 5)
+        return self._queuepool_dbapi_fixture(**kw)
+
+    def _live_conns(self, p):
+        return [
+            rec.dbapi_connection
+            for rec in p._pool.snapshot()
+            if rec.dbapi_connection is not None
+        ]
+
+    def test_min_idle_greater_than_pool_size(self):
+        with expect_raises_message(
+            tsa.exc.ArgumentError,
+            "min_idle may not be greater than pool_size",
+        ):
+            self._fixture(pool_size=2, min_idle=3)
+
+    def test_no_maintenance_by_default(self):
+        dbapi, p = self._fixture()
+        p.connect().close()
+        is_none(p._maintenance)
+
+        p.run_maintenance()
+        eq_(dbapi.connect.call_count, 1)
+
+    def test_min_idle(self):
+        dbapi, p = self._fixture(min_idle=3)
+
+        p.run_maintenance()
+        eq_(dbapi.connect.call_count, 3)
+        eq_(p.checkedin(), 3)
+        eq_(p.checkedout(), 0)
+
+        c1 = p.connect()
+        eq_(dbapi.connect.call_count, 3)
+
+        p.run_maintenance()
+        eq_(dbapi.connect.call_count, 4)
+        eq_(p.checkedin(), 3)
+
+        c1.close()
+        p.run_maintenance()
+        eq_(dbapi.connect.call_count, 4)
+        eq_(p.checkedin(), 4)
+
+    def test_min_idle_within_pool_size(self):
+        dbapi, p = self._fixture(pool_size=3, min_idle=3)
+
+        conns = [p.connect() for i in range(5)]
+        p.run_maintenance()
+
+        # pool is at capacity, overflow isn't used for idle connections
+        eq_(dbapi.connect.call_count, 5)
+        eq_(p.checkedin(), 0)
+
+        for conn in conns:
+            conn.close()
+        eq_(p.checkedin(), 3)
+
+    def test_min_idle_connects_invalidated(self):
+        dbapi, p = self._fixture(min_idle=1)
+        p.run_maintenance()
+
+        c1 = p.connect()
+        c1.invalidate()
+        c1.close()
+        eq_(len(self._live_conns(p)), 0)
+
+        p.run_maintenance()
+        eq_(len(self._live_conns(p)), 1)
+        eq_(dbapi.connect.call_count, 2)
+        eq_(p.checkedin(), 1)
+
+    def test_min_idle_connect_error(self):
+        dbapi, p = self._fixture(min_idle=2)
+        dbapi.shutdown(True)
+
+        p.run_maintenance()
+        eq_(p.checkedin(), 0)
+        eq_(p.checkedout(), 0)
+
+        dbapi.shutdown(False)
+        p.run_maintenance()
+        eq_(p.checkedin(), 2)
+
+    def test_recycle_ahead_of_checkout(self):
+        dbapi, p = self._fixture(recycle=30, maintenance_interval=10)
+        # don't start the thread
+        p._maintenance = Mock()
+
+        c1 = p.connect()
+        dbapi_conn = c1.dbapi_connection
+        c1.close()
+
+        now = time.time()
+        with patch("sqlalchemy.pool.base.time.time", return_value=now + 15):
+            with patch("sqlalchemy.pool.impl.time.time") as impl_time:
+                impl_time.return_value = now + 15
+                p.run_maintenance()
+        eq_(dbapi.connect.call_count, 1)
+
+        # would expire before next run
+        with patch("sqlalchemy.pool.base.time.time", return_value=now + 25):
+            with patch("sqlalchemy.pool.impl.time.time") as impl_time:
+                impl_time.return_value = now + 25
+                p.run_maintenance()
+        eq_(dbapi.connect.call_count, 2)
+        is_true(dbapi_conn.close.called)
+        eq_(p.checkedin(), 1)
+
+        with patch("sqlalchemy.pool.base.time.time", return_value=now + 35):
+            c1 = p.connect()
+            is_not(c1.dbapi_connection, dbapi_conn)
+            c1.close()
+        eq_(dbapi.connect.call_count, 2)
+
+    def test_refresh_pool_invalidated(self):
+        dbapi, p = self._fixture()
+
+        now = time.time()
+        with patch("sqlalchemy.pool.base.time.time", return_value=now):
+            c1 = p.connect()
+            c2 = p.connect()
+            c2.close()
+
+        with patch(
+            "sqlalchemy.pool.base.time.time", return_value=now + 1
+        ):
+            c1.invalidate()
+            p._invalidate(c1)
+            c1.close()
+
+        eq_(dbapi.connect.call_count, 2)
+        p.run_maintenance()
+        eq_(dbapi.connect.call_count, 3)
+        eq_(len(self._live_conns(p)), 1)
+
+    def test_idle_timeout(self):
+        dbapi, p = self._fixture(min_idle=1, idle_timeout=60)
+
+        now = time.time()
+        with patch("sqlalchemy.pool.base.time.time", return_value=now):
+            conns = [p.connect() for i in range(3)]
+            for conn in conns:
+                conn.close()
+        eq_(p.checkedin(), 3)
+
+        with patch("sqlalchemy.pool.impl.time.time", return_value=now + 30):
+            p.run_maintenance()
+        eq_(p.checkedin(), 3)
+
+        with patch("sqlalchemy.pool.impl.time.time", return_value=now + 90):
+            p.run_maintenance()
+        eq_(p.checkedin(), 1)
+        eq_(p.checkedout(), 0)
+        eq_(len(self._live_conns(p)), 1)
+
+        # pool can grow again
+        conns = [p.connect() for i in range(5)]
+        eq_(p.checkedout(), 5)
+        eq_(dbapi.connect.call_count, 7)
+        for conn in conns:
+            conn.close()
+
+    def test_idle_timeout_closes_oldest(self):
+        dbapi, p = self._fixture(idle_timeout=60)
+
+        now = time.time()
+        c1 = p.connect()
+        c2 = p.connect()
+        c1_dbapi = c1.dbapi_connection
+        with patch("sqlalchemy.pool.base.time.time", return_value=now):
+            c1.close()
+        with patch(
+            "sqlalchemy.pool.base.time.time", return_value=now + 50
+        ):
+            c2.close()
+
+        with patch("sqlalchemy.pool.impl.time.time", return_value=now + 90):
+            p.run_maintenance()
+        eq_(p.checkedin(), 1)
+        is_true(c1_dbapi.close.called)
+
+    def test_metrics(self):
+        dbapi, p = self._fixture(
+            min_idle=2, recycle=30, collect_metrics=True
+        )
+        p.run_maintenance()
+        eq_(p.metrics.connects, 2)
+
+        with patch(
+            "sqlalchemy.pool.impl.time.time", return_value=time.time() + 60
+        ):
+            p.run_maintenance()
+        eq_(p.metrics.recycles, 2)
+        eq_(p.metrics.connects, 4)
+
+    def test_background_thread(self):
+        dbapi, p = self._fixture(min_idle=2, maintenance_interval=0.02)
+        is_none(p._maintenance)
+
+        p.connect().close()
+        stop = p._maintenance
+        is_not_none(stop)
+
+        for i in range(250):
+            if p.checkedin() == 2:
+                break
+            time.sleep(0.02)
+        eq_(p.checkedin(), 2)
+
+        p.dispose()
+        is_none(p._maintenance)
+        is_true(stop.is_set())
+
+    def test_background_thread_pool_gc(self):
+        dbapi, p = self._fixture(min_idle=2, maintenance_interval=0.02)
+        p.connect().close()
+
+        threads = [
+            t
+            for t in threading.enumerate()
+            if t.name == "sqlalchemy-pool-maintenance"
+        ]
+        eq_(len(threads), 1)
+
+        del p
+        gc_collect()
+
+        threads[0].join(join_timeout)
+        is_true(not threads[0].is_alive())
+
+    def test_create_engine_params(self):
+        e = testing_engine(
+            "sqlite:///file.db",
+            options=dict(
+                pool_min_idle=2,
+                pool_idle_timeout=60,
+                pool_maintenance_interval=10,
+            ),
+        )
+        p = e.pool
+        eq_(
+            (p._min_idle, p._idle_timeout, p._maintenance_interval),
+            (2, 60, 10),
+        )
+        e.dispose()
+
+
 class ResetOnReturnTest(PoolTestBase):
     def _fixture(self, **kw):
         dbapi = Mock()
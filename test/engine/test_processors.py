@@ -140,6 +140,106 @@ class CyDateProcessorTest(_DateProcessorTest):
         cls.module = _processors_cy
 
 
+class _BatchProcessorTest(fixtures.TestBase):
+    @combinations(
+        ("int_to_boolean", [0, None, 1, -4, 12]),
+        ("to_str", [None, 1, "x", 5.5]),
+        ("to_float", [1, None, "2.5", 3.0]),
+        (
+            "str_to_datetime",
+            ["2022-04-03 17:12:34.353", None, "2022-04-03 17:12:34"],
+        ),
+        ("str_to_time", ["17:12:34.353123", None, "17:12:34"]),
+        ("str_to_date", [None, "2022-04-03"]),
+        argnames="name, values",
+    )
+    def test_batch_matches_single(self, name, values):
+        single = getattr(self.module, name)
+        batch = getattr(self.module, f"{name}_batch")
+
+        eq_(batch(values), [single(value) for value in values])
+        eq_(batch(tuple(values)), [single(value) for value in values])
+        eq_(batch(()), [])
+
+    def test_decimal_batch(self):
+        import decimal
+
+        proc = self.module.to_decimal_processor_factory(decimal.Decimal, 3)
+        values = [1.5, None, 2, 3.14159]
+
+        eq_(
+            proc.process_batch(values),
+            [
+                decimal.Decimal("1.500"),
+                None,
+                decimal.Decimal("2.000"),
+                decimal.Decimal("3.142"),
+            ],
+        )
+
+    @combinations("str_to_datetime", "str_to_time", "str_to_date")
+    def test_batch_invalid_string(self, meth):
+        with expect_raises_message(
+            ValueError, "Invalid isoformat string: '5:a'"
+        ):
+            fn = getattr(self.module, f"{meth}_batch")
+            fn([None, "5:a"])
+
+
+class PyBatchProcessorTest(_BatchProcessorTest):
+    @classmethod
+    def setup_test_class(cls):
+        from sqlalchemy.engine import _processors_cy
+        from sqlalchemy.util.langhelpers import load_uncompiled_module
+
+        cls.module = load_uncompiled_module(_processors_cy)
+
+
+class CyBatchProcessorTest(_BatchProcessorTest):
+    __requires__ = ("cextensions",)
+
+    @classmethod
+    def setup_test_class(cls):
+        from sqlalchemy.engine import _processors_cy
+
+        assert _processors_cy._is_compiled()
+        cls.module = _processors_cy
+
+
+class BatchProcessorLookupTest(fixtures.TestBase):
+    @combinations(
+        ("int_to_boolean",),
+        ("to_str",),
+        ("to_float",),
+        ("str_to_datetime",),
+        ("str_to_time",),
+        ("str_to_date",),
+        argnames="name",
+    )
+    def test_lookup(self, name):
+        eq_(
+            processors.batch_processor(getattr(processors, name)),
+            getattr(processors, f"{name}_batch"),
+        )
+
+    def test_lookup_decimal(self):
+        import decimal
+
+        proc = processors.to_decimal_processor_factory(decimal.Decimal, 2)
+        eq_(processors.batch_processor(proc)([1]), [decimal.Decimal("1.00")])
+
+    def test_lookup_none(self):
+        is_none(processors.batch_processor(lambda value: value))
+
+        class Unhashable:
+            __hash__ = None
+
+            def __call__(self, value):
+                return value
+
+        is_none(processors.batch_processor(Unhashable()))
+
+
 class _DistillArgsTest(fixtures.TestBase):
     def test_distill_20_none(self):
         eq_(self.module._distill_params_20(None), ())
@@ -644,6 +644,35 @@ class AsyncEngineTest(EngineFixture):
             eq_(async_engine.pool.checkedin(), 0)
         is_not(p1, async_engine.pool)
 
+    @testing.requires.queue_pool
+    @async_test
+    async def test_pool_maintenance_task(self, async_testing_engine):
+        e = async_testing_engine(
+            options={
+                "poolclass": AsyncAdaptedQueuePool,
+                "pool_min_idle": 2,
+                "pool_maintenance_interval": 0.02,
+            }
+        )
+        p1 = e.pool
+
+        async with e.connect() as conn:
+            await conn.scalar(select(1))
+
+        task = p1._maintenance
+        is_true(isinstance(task, asyncio.Task))
+
+        for i in range(250):
+            if p1.checkedin() == 2:
+                break
+            await asyncio.sleep(0.02)
+        eq_(p1.checkedin(), 2)
+
+        await e.dispose()
+        is_(p1._maintenance, None)
+        await asyncio.wait([task], timeout=5)
+        is_true(task.cancelled())
+
     @testing.requires.independent_connections
     @async_test
     async def test_init_once_concurrency(self, async_engine):
@@ -1209,9 +1238,10 @@ class AsyncResultTest(EngineFixture):
     )
     @testing.combinations(None, 2, 5, 10, argnames="yield_per")
     @testing.combinations("method", "opt", argnames="yield_per_type")
+    @testing.variation("read_ahead", [True, False])
     @async_test
     async def test_partitions(
-        self, async_engine, filter_, yield_per, yield_per_type
+        self, async_engine, filter_, yield_per, yield_per_type, read_ahead
     ):
         users = self.tables.users
         async with async_engine.connect() as conn:
@@ -1241,13 +1271,17 @@ class AsyncResultTest(EngineFixture):
 
                 eq_(result._real_result.cursor_strategy._bufsize, yield_per)
 
-                async for partition in result.partitions():
+                async for partition in result.partitions(
+                    read_ahead=bool(read_ahead)
+                ):
                     check_result.append(partition)
             else:
                 eq_(result._real_result.cursor_strategy._bufsize, 5)
 
                 partition_size = 5
-                async for partition in result.partitions(partition_size):
+                async for partition in result.partitions(
+                    partition_size, read_ahead=bool(read_ahead)
+                ):
                     check_result.append(partition)
 
             ranges = [
@@ -1280,6 +1314,67 @@ class AsyncResultTest(EngineFixture):
                     ],
                 )
 
+    @async_test
+    async def test_partitions_read_ahead_abandoned(self, async_engine):
+        users = self.tables.users
+        async with async_engine.connect() as conn:
+            result = await conn.stream(
+                select(users).order_by(users.c.user_id)
+            )
+
+            partitions = result.partitions(5, read_ahead=True)
+            eq_(
+                await partitions.__anext__(),
+                [(i, "name%d" % i) for i in range(1, 6)],
+            )
+            await partitions.aclose()
+
+            # the read-ahead partition has been consumed by the
+            # abandoned iterator; fetching resumes after it
+            eq_(
+                await result.fetchmany(2),
+                [(i, "name%d" % i) for i in range(11, 13)],
+            )
+            await result.close()
+
+            eq_(await conn.scalar(select(func.count(users.c.user_id))), 19)
+
+    @testing.combinations(
+        (None,), ("scalars",), ("mappings",), argnames="filter_"
+    )
+    @async_test
+    async def test_iterate_buffered_rows_no_greenlet(
+        self, async_engine, filter_
+    ):
+        users = self.tables.users
+        async with async_engine.connect() as conn:
+            result = await conn.stream(
+                select(users)
+                .order_by(users.c.user_id)
+                .execution_options(yield_per=5)
+            )
+
+            if filter_ == "mappings":
+                result = result.mappings()
+            elif filter_ == "scalars":
+                result = result.scalars()
+
+            with mock.patch(
+                "sqlalchemy.ext.asyncio.result.greenlet_spawn",
+                side_effect=greenlet_spawn,
+            ) as spawn:
+                rows = [row async for row in result]
+
+            eq_(len(rows), 19)
+
+            # one context switch per buffer of five rows, plus the
+            # fetch that finds the cursor exhausted, rather than one
+            # per row
+            eq_(
+                [c[0][0] for c in spawn.call_args_list],
+                [result._onerow_getter] * 5,
+            )
+
     @testing.combinations(
         (None,), ("scalars",), ("mappings",), argnames="filter_"
     )
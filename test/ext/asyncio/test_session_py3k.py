@@ -47,6 +47,7 @@ from sqlalchemy.testing.assertions import not_in
 from sqlalchemy.testing.entities import ComparableEntity
 from sqlalchemy.testing.provision import normalize_sequence
 from sqlalchemy.testing.schema import Column
+from sqlalchemy.util import greenlet_spawn
 from .test_engine_py3k import AsyncFixture as _AsyncFixture
 from ...orm import _fixtures
 
@@ -312,6 +313,35 @@ class AsyncSessionQueryTest(AsyncFixture):
             ],
         )
 
+    @testing.combinations(None, 2, argnames="yield_per")
+    @async_test
+    async def test_stream_buffered_rows_no_greenlet(
+        self, async_session, yield_per
+    ):
+        User = self.classes.User
+
+        stmt = select(User).order_by(User.id)
+        if yield_per:
+            stmt = stmt.execution_options(yield_per=yield_per)
+
+        result = (await async_session.stream(stmt)).scalars()
+
+        with mock.patch(
+            "sqlalchemy.ext.asyncio.result.greenlet_spawn",
+            side_effect=greenlet_spawn,
+        ) as spawn:
+            users = [user async for user in result]
+
+        eq_([user.id for user in users], [7, 8, 9, 10])
+
+        # one context switch per chunk of objects loaded, plus the
+        # fetch that finds the cursor exhausted, rather than one per
+        # object
+        eq_(
+            [c[0][0] for c in spawn.call_args_list],
+            [result._onerow_getter] * (3 if yield_per else 2),
+        )
+
     @testing.combinations("statement", "execute", argnames="location")
     @async_test
     @testing.requires.server_side_cursors
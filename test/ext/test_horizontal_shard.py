@@ -1,5 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
 import datetime
 import os
+import sqlite3
+import threading
 
 from sqlalchemy import Column
 from sqlalchemy import DateTime
@@ -20,9 +23,11 @@ from sqlalchemy import update
 from sqlalchemy import util
 from sqlalchemy.ext.horizontal_shard import set_shard_id
 from sqlalchemy.ext.horizontal_shard import ShardedSession
+from sqlalchemy.ext.horizontal_shard import ShardTimeoutError
 from sqlalchemy.orm import clear_mappers
 from sqlalchemy.orm import defer
 from sqlalchemy.orm import deferred
+from sqlalchemy.orm import joinedload
 from sqlalchemy.orm import lazyload
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm import selectinload
@@ -33,8 +38,10 @@ from sqlalchemy.sql import operators
 from sqlalchemy.sql import Select
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import expect_deprecated
+from sqlalchemy.testing import expect_warnings
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
+from sqlalchemy.testing import mock
 from sqlalchemy.testing import provision
 from sqlalchemy.testing.assertions import expect_raises_message
 from sqlalchemy.testing.engines import testing_engine
@@ -658,6 +665,110 @@ class ShardTest:
             {75.0},
         )
 
+    @testing.variation("stmt_type", ["entity", "columns", "label", "legacy"])
+    def test_ordered_merge(self, stmt_type):
+        sess = self._fixture_data()
+
+        if stmt_type.entity:
+            eq_(
+                [
+                    w.id
+                    for w in sess.scalars(
+                        select(WeatherLocation).order_by(
+                            WeatherLocation.id.desc()
+                        )
+                    )
+                ],
+                [7, 6, 5, 4, 3, 2, 1],
+            )
+        elif stmt_type.columns:
+            eq_(
+                sess.execute(
+                    select(WeatherLocation.continent, WeatherLocation.id)
+                    .order_by(
+                        WeatherLocation.continent, WeatherLocation.id.desc()
+                    )
+                    .execution_options(python_ordering=True)
+                ).all(),
+                [
+                    ("Asia", 1),
+                    ("Europe", 5),
+                    ("Europe", 4),
+                    ("North America", 3),
+                    ("North America", 2),
+                    ("South America", 7),
+                    ("South America", 6),
+                ],
+            )
+        elif stmt_type.label:
+            eq_(
+                sess.scalars(
+                    select(WeatherLocation.id.label("wid")).order_by(
+                        sql.desc("wid")
+                    )
+                ).all(),
+                [7, 6, 5, 4, 3, 2, 1],
+            )
+        elif stmt_type.legacy:
+            eq_(
+                [
+                    w.id
+                    for w in sess.query(WeatherLocation).order_by(
+                        WeatherLocation.id
+                    )
+                ],
+                [1, 2, 3, 4, 5, 6, 7],
+            )
+        else:
+            stmt_type.fail()
+
+    def test_ordered_merge_limit_offset(self):
+        sess = self._fixture_data()
+
+        eq_(
+            [
+                w.id
+                for w in sess.scalars(
+                    select(WeatherLocation)
+                    .order_by(WeatherLocation.id)
+                    .limit(3)
+                    .offset(2)
+                )
+            ],
+            [3, 4, 5],
+        )
+        eq_(
+            sess.scalars(
+                select(WeatherLocation.id)
+                .order_by(WeatherLocation.id.desc())
+                .offset(5)
+            ).all(),
+            [2, 1],
+        )
+        eq_(
+            len(sess.scalars(select(WeatherLocation.id).limit(3)).all()),
+            3,
+        )
+
+    def test_ordered_merge_limit_joinedload(self):
+        sess = self._fixture_data()
+
+        result = (
+            sess.scalars(
+                select(WeatherLocation)
+                .options(joinedload(WeatherLocation.reports))
+                .order_by(WeatherLocation.id.desc())
+                .limit(2)
+                .offset(1)
+            )
+            .unique()
+            .all()
+        )
+        eq_(
+            [(w.id, [r.temperature for r in w.reports]) for w in result],
+            [(6, []), (5, [])],
+        )
+
 
 class DistinctEngineShardTest(ShardTest, fixtures.MappedTest):
     def _init_dbs(self):
@@ -683,6 +794,139 @@ class DistinctEngineShardTest(ShardTest, fixtures.MappedTest):
         for i in range(1, 5):
             os.remove("shard%d_%s.db" % (i, provision.FOLLOWER_IDENT))
 
+    def test_ordered_merge_limit_pushdown(self):
+        sess = self._fixture_data()
+        params = []
+
+        for db in self.dbs:
+
+            @event.listens_for(db, "before_cursor_execute")
+            def before_cursor_execute(
+                conn, cursor, stmt, parameters, context, executemany
+            ):
+                params.append(parameters)
+
+        eq_(
+            sess.scalars(
+                select(WeatherLocation.id)
+                .order_by(WeatherLocation.id)
+                .limit(2)
+                .offset(3)
+            ).all(),
+            [4, 5],
+        )
+
+        # each shard is asked for LIMIT + OFFSET rows, without an OFFSET
+        eq_(params, [(5, 0)] * 4)
+
+    def test_ordered_merge_strings(self):
+        sess = self._fixture_data()
+        sess.add_all(
+            [
+                WeatherLocation("Asia", "osaka"),
+                WeatherLocation("Europe", "amsterdam"),
+            ]
+        )
+        sess.commit()
+
+        params = []
+
+        for db in self.dbs:
+
+            @event.listens_for(db, "before_cursor_execute")
+            def before_cursor_execute(
+                conn, cursor, stmt, parameters, context, executemany
+            ):
+                params.append(parameters)
+
+        stmt = (
+            select(WeatherLocation.city)
+            .order_by(WeatherLocation.city)
+            .limit(2)
+        )
+
+        # the database may order strings differently than Python, such
+        # as case insensitively; the rows of each shard are concatenated,
+        # with each shard applying its own LIMIT
+        eq_(
+            sess.scalars(stmt).all(),
+            [
+                "New York",
+                "Toronto",
+                "Tokyo",
+                "osaka",
+                "Dublin",
+                "London",
+                "Brasilia",
+                "Quito",
+            ],
+        )
+        eq_(params, [(2, 0)] * 4)
+
+        # ordering of SQLite's BINARY collation is the same as Python's
+        params[:] = []
+        eq_(
+            sess.scalars(stmt.execution_options(python_ordering=True)).all(),
+            ["Brasilia", "Dublin"],
+        )
+        eq_(params, [(2, 0)] * 4)
+        eq_(
+            sess.scalars(
+                stmt.offset(7).execution_options(python_ordering=True)
+            ).all(),
+            ["amsterdam", "osaka"],
+        )
+
+    def test_ordered_merge_nullable(self):
+        sess = self._fixture_data()
+        for location_id in (4, 6):
+            location = sess.get(WeatherLocation, location_id)
+            location.reports.append(Report(None))
+        sess.commit()
+
+        params = []
+
+        for db in self.dbs:
+
+            @event.listens_for(db, "before_cursor_execute")
+            def before_cursor_execute(
+                conn, cursor, stmt, parameters, context, executemany
+            ):
+                params.append(parameters)
+
+        def go(order_by):
+            params[:] = []
+            return sess.scalars(
+                select(Report.temperature).order_by(order_by).limit(3)
+            ).all()
+
+        # SQLite orders NULL first
+        eq_(go(Report.temperature), [None, None, 75.0])
+        eq_(go(Report.temperature.desc()), [85.0, 80.0, 75.0])
+        eq_(go(Report.temperature.nulls_last()), [75.0, 80.0, 85.0])
+        eq_(params, [(3, 0)] * 4)
+
+        with mock.patch.object(
+            type(db1.dialect), "default_nulls_first", None
+        ):
+            # NULL ordering is not known; results are concatenated,
+            # with each shard applying its own LIMIT
+            eq_(
+                sorted(go(Report.temperature), key=lambda t: t or 0),
+                [None, None, 75.0, 80.0, 85.0],
+            )
+            eq_(params, [(3, 0)] * 4)
+
+            eq_(go(Report.temperature.nulls_first()), [None, None, 75.0])
+
+            # the primary key is not nullable
+            eq_(
+                sess.scalars(
+                    select(Report.id).order_by(Report.id.desc()).limit(1)
+                ).all(),
+                [2],
+            )
+
     def test_plain_core_textual_lookup_w_shard(self):
         sess = self._fixture_data()
 
@@ -767,6 +1011,222 @@ class LegacyAPIShardTest(DistinctEngineShardTest):
                 return sm()
 
 
+class ParallelShardTest(DistinctEngineShardTest):
+    """Run the shard tests with parallel execution enabled, using
+    distinct file databases which may be used from multiple threads."""
+
+    @classmethod
+    def setup_session(cls):
+        super().setup_session()
+        sharded_session.configure(parallel_execution=True)
+
+    def _thread_names(self):
+        names = set()
+
+        for db in self.dbs:
+
+            @event.listens_for(db, "before_cursor_execute")
+            def before_cursor_execute(conn, cursor, stmt, *arg):
+                names.add(threading.current_thread().name)
+
+        return names
+
+    def _block_shard(self, db):
+        unblock = threading.Event()
+
+        @event.listens_for(db, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, stmt, *arg):
+            unblock.wait(5)
+
+        return unblock
+
+    def test_parallel_threads(self):
+        sess = self._fixture_data()
+        names = self._thread_names()
+
+        eq_(
+            set(sess.scalars(select(WeatherLocation.city))),
+            {
+                "Tokyo",
+                "New York",
+                "Toronto",
+                "London",
+                "Dublin",
+                "Brasilia",
+                "Quito",
+            },
+        )
+        assert names
+        assert threading.current_thread().name not in names
+
+    def test_shard_executor(self):
+        sess = self._fixture_data()
+        names = self._thread_names()
+
+        with ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="test_shard"
+        ) as executor:
+            sess = sharded_session(shard_executor=executor)
+            eq_(len(sess.scalars(select(WeatherLocation)).all()), 7)
+
+        assert names
+        assert all(name.startswith("test_shard") for name in names)
+
+    def test_single_shard_not_threaded(self):
+        sess = self._fixture_data()
+        names = self._thread_names()
+
+        eq_(
+            sess.scalars(
+                select(WeatherLocation.city).where(
+                    WeatherLocation.continent == "Asia"
+                )
+            ).all(),
+            ["Tokyo"],
+        )
+        eq_(names, {threading.current_thread().name})
+
+    def test_autoflush(self):
+        sess = self._fixture_data()
+        sess.add(WeatherLocation("Europe", "Paris"))
+
+        eq_(
+            {
+                c.city
+                for c in sess.scalars(
+                    select(WeatherLocation).where(
+                        WeatherLocation.continent.in_(["Europe", "Asia"])
+                    )
+                )
+            },
+            {"Tokyo", "London", "Dublin", "Paris"},
+        )
+
+    def test_error_raises(self):
+        sess = self._fixture_data()
+
+        @event.listens_for(db3, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, stmt, *arg):
+            raise exc.InvalidRequestError("europe is down")
+
+        with expect_raises_message(exc.InvalidRequestError, "europe is down"):
+            sess.scalars(select(WeatherLocation)).all()
+
+    def test_error_closes_results(self):
+        sess = self._fixture_data()
+        cursors = []
+
+        for db in self.dbs:
+
+            @event.listens_for(db, "after_cursor_execute")
+            def after_cursor_execute(conn, cursor, *arg):
+                cursors.append(cursor)
+
+        @event.listens_for(db3, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, stmt, *arg):
+            raise exc.InvalidRequestError("europe is down")
+
+        with expect_raises_message(exc.InvalidRequestError, "europe is down"):
+            sess.scalars(select(WeatherLocation)).all()
+
+        # results of the other shards were closed
+        eq_(len(cursors), 3)
+        for cursor in cursors:
+            with expect_raises_message(
+                sqlite3.ProgrammingError, "closed cursor"
+            ):
+                cursor.fetchone()
+
+    def test_error_partial_results(self):
+        sess = self._fixture_data()
+        sess = sharded_session(partial_results=True)
+
+        @event.listens_for(db3, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, stmt, *arg):
+            raise exc.InvalidRequestError("europe is down")
+
+        with expect_warnings(
+            "Shard 'europe' is omitted from the results of this statement, "
+            "due to error: europe is down"
+        ):
+            result = sess.scalars(select(WeatherLocation.city)).all()
+
+        eq_(set(result), {"Tokyo", "New York", "Toronto", "Brasilia", "Quito"})
+
+    def test_error_all_shards_partial_results(self):
+        sess = self._fixture_data()
+        sess = sharded_session(partial_results=True)
+
+        for db in self.dbs:
+
+            @event.listens_for(db, "before_cursor_execute")
+            def before_cursor_execute(conn, cursor, stmt, *arg):
+                raise exc.InvalidRequestError("shard is down")
+
+        with expect_raises_message(exc.InvalidRequestError, "shard is down"):
+            sess.scalars(select(WeatherLocation)).all()
+
+    def test_timeout(self):
+        sess = self._fixture_data()
+        sess = sharded_session(shard_timeout=0.2)
+        unblock = self._block_shard(db2)
+        invalidated = threading.Event()
+
+        @event.listens_for(db2.pool, "invalidate")
+        def invalidate(dbapi_connection, connection_record, exception):
+            assert unblock.is_set()
+            assert isinstance(exception, ShardTimeoutError)
+            invalidated.set()
+
+        try:
+            with expect_raises_message(
+                ShardTimeoutError,
+                r"Statement for shard 'asia' did not complete within "
+                r"0.2 seconds",
+            ):
+                sess.scalars(select(WeatherLocation)).all()
+
+            # the DBAPI connection is not invalidated while the statement
+            # is still in progress
+            assert not invalidated.is_set()
+        finally:
+            unblock.set()
+
+        assert invalidated.wait(5)
+        assert not issubclass(ShardTimeoutError, exc.TimeoutError)
+
+        # the connection for the shard which timed out was invalidated
+        with expect_raises_message(
+            exc.PendingRollbackError, "Can't reconnect until invalid"
+        ):
+            sess.connection(bind_arguments={"shard_id": "asia"}).execute(
+                select(1)
+            )
+        sess.rollback()
+
+        eq_(len(sess.scalars(select(WeatherLocation)).all()), 7)
+
+    def test_timeout_partial_results(self):
+        sess = self._fixture_data()
+        sess = sharded_session(shard_timeout=0.2, partial_results=True)
+        unblock = self._block_shard(db2)
+
+        try:
+            with expect_warnings(
+                "Shard 'asia' is omitted from the results of this "
+                "statement, due to error: Statement for shard 'asia' did "
+                "not complete within 0.2 seconds"
+            ):
+                result = sess.scalars(select(WeatherLocation.city)).all()
+        finally:
+            unblock.set()
+
+        eq_(
+            set(result),
+            {"New York", "Toronto", "London", "Dublin", "Brasilia", "Quito"},
+        )
+
+
 class AttachedFileShardTest(ShardTest, fixtures.MappedTest):
     """Use modern schema conventions along with SQLite ATTACH."""
 
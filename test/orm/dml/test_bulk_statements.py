@@ -225,6 +225,57 @@ class InsertStmtTest(testing.AssertsExecutionResults, fixtures.TestBase):
             [("d3", 5), ("d4", 6)],
         )
 
+    @testing.only_on("sqlite")
+    @testing.variation("returning", [True, False])
+    def test_insert_copy(self, decl_base, returning):
+        class A(decl_base):
+            __tablename__ = "a"
+            id: Mapped[int] = mapped_column(Identity(), primary_key=True)
+            data: Mapped[str]
+            x: Mapped[Optional[int]] = mapped_column("xcol")
+
+        decl_base.metadata.create_all(testing.db)
+        s = fixture_session()
+
+        copies = []
+
+        def do_copy_insert(cursor, table, columns, rows, context):
+            copies.append(([col.name for col in columns], list(rows)))
+            cursor.executemany(
+                "INSERT INTO a (data, xcol) VALUES (?, ?)", rows
+            )
+
+        stmt = insert(A).execution_options(insert_copy=True)
+        if returning:
+            stmt = stmt.returning(A.data)
+
+        with (
+            mock.patch.object(
+                testing.db.dialect, "supports_copy_insert", True
+            ),
+            mock.patch.object(
+                testing.db.dialect, "do_copy_insert", do_copy_insert
+            ),
+        ):
+            result = s.execute(
+                stmt,
+                [
+                    {"data": "d3", "x": 5},
+                    {"data": "d4", "x": 6},
+                ],
+            )
+
+        if returning:
+            eq_(result.all(), [("d3",), ("d4",)])
+            eq_(copies, [])
+        else:
+            eq_(copies, [(["data", "xcol"], [("d3", 5), ("d4", 6)])])
+
+        eq_(
+            s.execute(select(A.data, A.x).order_by(A.id)).all(),
+            [("d3", 5), ("d4", 6)],
+        )
+
     @testing.requires.insert_returning
     def test_insert_returning_cols_dont_give_me_defaults(self, decl_base):
         """test #9685"""
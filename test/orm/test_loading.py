@@ -1,3 +1,6 @@
+import pickle
+
+from sqlalchemy import ColumnarFrozenResult
 from sqlalchemy import delete
 from sqlalchemy import exc
 from sqlalchemy import insert
@@ -270,3 +273,49 @@ class MergeResultTest(_fixtures.FixtureTest):
         it = list(it())
         eq_([(x.id, y) for x, y in it], [(7, 7), (8, 8), (9, 9)])
         eq_(list(it[0]._mapping.keys()), ["User", "id"])
+
+    def test_single_entity_columnar_frozen(self):
+        s = fixture_session()
+        User = self.classes.User
+
+        stmt = select(User).where(User.id.in_([7, 8, 9])).order_by(User.id)
+        frozen = ColumnarFrozenResult(s.execute(stmt))
+        s.close()
+
+        s = fixture_session()
+        it = loading.merge_frozen_result(s, stmt, frozen, load=False)
+        users = it().scalars().all()
+        eq_([x.id for x in users], [7, 8, 9])
+        is_true(all(u in s for u in users))
+
+    def test_entity_col_mix_columnar_frozen(self):
+        s = fixture_session()
+        User = self.classes.User
+
+        stmt = (
+            select(User, User.id)
+            .where(User.id.in_([7, 8, 9]))
+            .order_by(User.id)
+        )
+        frozen = ColumnarFrozenResult(s.execute(stmt))
+
+        it = loading.merge_frozen_result(s, stmt, frozen)
+        it = list(it())
+        eq_([(x.id, y) for x, y in it], [(7, 7), (8, 8), (9, 9)])
+        eq_(list(it[0]._mapping.keys()), ["User", "id"])
+
+    def test_columns_columnar_frozen_serialized(self):
+        s = fixture_session()
+        User = self.classes.User
+
+        stmt = (
+            select(User.id, User.name)
+            .where(User.id.in_([7, 8, 9]))
+            .order_by(User.id)
+        )
+        frozen = ColumnarFrozenResult(s.execute(stmt))
+        frozen = pickle.loads(pickle.dumps(frozen))
+
+        it = loading.merge_frozen_result(s, stmt, frozen)
+        eq_(it().all(), [(7, "jack"), (8, "ed"), (9, "fred")])
+        eq_(it().mappings().first(), {"id": 7, "name": "jack"})
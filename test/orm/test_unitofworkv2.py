@@ -1,3 +1,5 @@
+from contextlib import contextmanager
+from unittest import mock
 from unittest.mock import Mock
 from unittest.mock import patch
 import uuid
@@ -2062,6 +2064,132 @@ class BasicStaleChecksTest(fixtures.MappedTest):
         sess.flush()
 
 
+class FlushPipelineTest(fixtures.MappedTest):
+    """test Session.flush_pipeline using a mock pipeline in front of a
+    real DBAPI connection, which executes statements immediately."""
+
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "parent",
+            metadata,
+            Column("id", Integer, primary_key=True, autoincrement=False),
+            Column("data", Integer),
+        )
+
+    @classmethod
+    def setup_classes(cls):
+        class Parent(cls.Basic):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        cls.mapper_registry.map_imperatively(
+            cls.classes.Parent, cls.tables.parent
+        )
+
+    @testing.fixture
+    def canary(self):
+        canary = Mock()
+
+        @contextmanager
+        def do_pipeline(dbapi_connection):
+            canary.enter()
+            yield canary.pipeline
+            canary.exit()
+
+        with patch.object(
+            config.db.dialect, "supports_pipeline", True
+        ), patch.object(config.db.dialect, "do_pipeline", do_pipeline):
+            yield canary
+
+    def _persist(self, sess, count):
+        Parent = self.classes.Parent
+        objs = [Parent(id=i, data=i) for i in range(1, count + 1)]
+        sess.add_all(objs)
+        sess.flush()
+        return objs
+
+    def test_not_enabled(self, canary):
+        sess = fixture_session()
+        p1, p2 = self._persist(sess, 2)
+
+        p1.data = 10
+        sess.delete(p2)
+        sess.flush()
+
+        eq_(canary.mock_calls, [])
+
+    def test_update_delete(self, canary):
+        Parent = self.classes.Parent
+        sess = fixture_session(flush_pipeline=True)
+        p1, p2, p3 = self._persist(sess, 3)
+        canary.reset_mock()
+
+        p1.data = 10
+        p2.data = 20
+        sess.delete(p3)
+
+        with patch(
+            "sqlalchemy.orm.persistence._check_update_rowcount"
+        ) as check_update:
+            check_update.side_effect = lambda *arg: canary.check_update(
+                arg[1]
+            )
+            sess.flush()
+
+        eq_(
+            canary.mock_calls,
+            [
+                mock.call.enter(),
+                mock.call.pipeline.sync(),
+                mock.call.check_update(2),
+                mock.call.exit(),
+            ],
+        )
+        eq_(
+            sess.execute(
+                select(Parent.id, Parent.data).order_by(Parent.id)
+            ).all(),
+            [(1, 10), (2, 20)],
+        )
+
+    @testing.requires.sane_rowcount
+    def test_update_missing_raises_at_sync(self, canary):
+        sess = fixture_session(flush_pipeline=True)
+        (p1,) = self._persist(sess, 1)
+
+        sess.execute(self.tables.parent.delete())
+        canary.reset_mock()
+
+        p1.data = 3
+        assert_raises_message(
+            orm_exc.StaleDataError,
+            r"UPDATE statement on table 'parent' expected to "
+            r"update 1 row\(s\); 0 were matched.",
+            sess.flush,
+        )
+        eq_(canary.mock_calls, [mock.call.enter(), mock.call.pipeline.sync()])
+
+    @testing.requires.sane_multi_rowcount
+    def test_delete_missing_warns_at_sync(self, canary):
+        sess = fixture_session(flush_pipeline=True)
+        p1, p2 = self._persist(sess, 2)
+
+        sess.execute(self.tables.parent.delete())
+        sess.delete(p1)
+        sess.delete(p2)
+
+        assert_warns_message(
+            exc.SAWarning,
+            r"DELETE statement on table 'parent' expected to "
+            r"delete 2 row\(s\); 0 were matched.",
+            sess.flush,
+        )
+
+
 class BatchInsertsTest(fixtures.MappedTest, testing.AssertsExecutionResults):
     @classmethod
     def define_tables(cls, metadata):
@@ -36,6 +36,14 @@ class CacheKey(Case):
         ):
             cls.make_test_cases(name, cls.statements.__dict__[name])
 
+        for name, number in (
+            ("deep_where", 500),
+            ("many_types_where", 10_000),
+        ):
+            cls.make_generative_test_cases(
+                name, cls.statements.__dict__[name], number
+            )
+
         oracle = OracleDialect()
         oracle.server_version_info = (21, 0, 0)
         for name, stmt, num in (
@@ -120,6 +128,29 @@ class CacheKey(Case):
         go.__name__ = name
         setattr(cls, name, test_case(go, number=number))
 
+    @classmethod
+    def make_generative_test_cases(cls, name, obj, number):
+        # a statement generated from obj using where(), when obj either has
+        # or has not yet generated its own cache key
+
+        def go_fresh(self):
+            obj.__dict__.pop("_cache_key_state", None)
+            assert self.impl(obj.where(cls.objects.parent.c.id == 5))
+
+        def go_generative(self):
+            if "_cache_key_state" not in obj.__dict__:
+                self.impl(obj)
+            assert self.impl(obj.where(cls.objects.parent.c.id == 5))
+
+        go_fresh.__name__ = name + "_fresh"
+        go_generative.__name__ = name + "_generative"
+        setattr(cls, go_fresh.__name__, test_case(go_fresh, number=number))
+        setattr(
+            cls,
+            go_generative.__name__,
+            test_case(go_generative, number=number),
+        )
+
     @test_case
     def check_not_caching(self):
         c1 = self.impl(self.statements.parent_table)
@@ -240,4 +271,24 @@ def setup_statements(setup: SimpleNamespace):
         setup.many_types.c.col_Boolean
     )
 
+    deep_where = (
+        sa.select(setup.parent)
+        .where(
+            sa.and_(
+                *[
+                    sa.or_(
+                        setup.parent.c.id == i,
+                        setup.parent.c.data.like(f"data {i}%"),
+                    )
+                    for i in range(200)
+                ]
+            )
+        )
+        .order_by(setup.parent.c.id)
+    )
+
+    many_types_where = sa.select(setup.many_types).where(
+        *[col.is_not(None) for col in setup.many_types.c]
+    )
+
     return SimpleNamespace(**locals())
@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from itertools import product
 from operator import itemgetter
+import tracemalloc
 from typing import Callable
 from typing import Optional
 
@@ -150,6 +151,18 @@ class _CommonResult(Case):
                 test_case(go_scalar_many, number=number),
             )
 
+            def go_scalar_idx_iter(self):
+                result = self.impl(*init_args())
+                rs = result.scalars(1)
+                for _ in rs:
+                    pass
+
+            setattr(
+                cls,
+                name + "_sc_idx_iter",
+                test_case(go_scalar_idx_iter, number=number),
+            )
+
         for (def_name, definition), (data_name, data) in product(
             all_defs, all_data
         ):
@@ -251,6 +264,82 @@ class CursorResult(_CommonResult):
         return context.args_for_new_cursor_result
 
 
+class ScalarsFromRows(Case):
+    """Compare retrieving single column values by creating Row objects
+    then indexing them, against ScalarResult which retrieves values
+    from the raw rows directly."""
+
+    NUMBER = 1_000
+
+    @staticmethod
+    def rows():
+        def go(res, index):
+            return [row[index] for row in res]
+
+        return go
+
+    @staticmethod
+    def scalars():
+        def go(res, index):
+            return list(res.scalars(index))
+
+        return go
+
+    IMPLEMENTATIONS = {"rows": rows.__func__, "scalars": scalars.__func__}
+
+    @classmethod
+    def init_class(cls):
+        cols = [f"c_{i}" for i in range(21)]
+        cls.meta = result.SimpleResultMetaData(cols)
+        cls.meta_proc = result.SimpleResultMetaData(
+            cols, _processors=[None, str, None] * 7
+        )
+        cls.data = [(i, i + i, i - 1) * 7 for i in range(1000)]
+
+    @classmethod
+    def update_results(cls, results):
+        cls._divide_results(results, "scalars", "rows", "scalars / rows")
+
+        # timings don't show the Row objects created and thrown away for
+        # each row, so also report the bytes allocated per row by the
+        # objects that each implementation iterates over
+        fetch = {
+            "rows": lambda res, index: list(res),
+            "scalars": lambda res, index: list(res.scalars(index)),
+        }
+        for name in ("rows", "scalars"):
+            if name in results:
+                results[f"{name} bytes/row"] = {
+                    m: cls._bytes_per_row(fetch[name], m)
+                    for m in results[name]
+                }
+
+    @classmethod
+    def _bytes_per_row(cls, fetch, method):
+        kept = []
+        case = cls(lambda res, index: kept.append(fetch(res, index)))
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            getattr(case, method)()
+            after = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        return (after - before) / len(cls.data)
+
+    @test_case
+    def first_col(self):
+        self.impl(result.IteratorResult(self.meta, iter(self.data)), 0)
+
+    @test_case
+    def mid_col(self):
+        self.impl(result.IteratorResult(self.meta, iter(self.data)), 10)
+
+    @test_case
+    def mid_col_proc(self):
+        self.impl(result.IteratorResult(self.meta_proc, iter(self.data)), 10)
+
+
 class _MockCursor:
     def __init__(self, rows: list[tuple], compiled):
         self._rows = list(rows)
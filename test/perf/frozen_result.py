@@ -0,0 +1,101 @@
+"""Compare pickling a FrozenResult with the serialized form of
+ColumnarFrozenResult, for a result with a mix of integer, float and string
+columns.
+
+Reports the time taken to serialize and load each form, the size of the
+serialized data, and the memory allocated by loading it.  The columnar
+form is loaded from an anonymous memory map, as a result shared among
+worker processes would be.
+
+"""
+
+from argparse import ArgumentDefaultsHelpFormatter
+from argparse import ArgumentParser
+import mmap
+import pickle
+import time
+import tracemalloc
+
+import sqlalchemy as sa
+from sqlalchemy.engine import ColumnarFrozenResult
+
+
+def make_result(num_rows):
+    metadata = sa.engine.result.SimpleResultMetaData(
+        ["id", "x", "y", "price", "name"]
+    )
+    data = [
+        (i, i * 7, i % 13, i * 1.5, f"name {i}") for i in range(num_rows)
+    ]
+    return lambda: sa.engine.IteratorResult(metadata, iter(data))
+
+
+def measure(name, dumps, loads, consume):
+    now = time.perf_counter()
+    data = dumps()
+    dumps_time = time.perf_counter() - now
+
+    tracemalloc.start()
+    now = time.perf_counter()
+    loaded = loads(data)
+    loads_time = time.perf_counter() - now
+    loaded_mem = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    now = time.perf_counter()
+    consume(loaded)
+    consume_time = time.perf_counter() - now
+
+    print(
+        f"{name:<10} size: {len(data) / 1024 / 1024:8.2f}MB  "
+        f"dumps: {dumps_time:.4f}s  loads: {loads_time:.4f}s  "
+        f"loaded memory: {loaded_mem / 1024 / 1024:8.2f}MB  "
+        f"consume all(): {consume_time:.4f}s"
+    )
+
+
+def main(num_rows):
+    make = make_result(num_rows)
+
+    print(f"{num_rows} rows")
+
+    frozen = make().freeze()
+    measure(
+        "pickle",
+        lambda: pickle.dumps(frozen, pickle.HIGHEST_PROTOCOL),
+        pickle.loads,
+        lambda fr: fr().all(),
+    )
+
+    def to_mmap(columnar):
+        def go():
+            data = columnar.dumps()
+            buf = mmap.mmap(-1, len(data))
+            buf.write(data)
+            return buf
+
+        return go
+
+    measure(
+        "columnar",
+        to_mmap(ColumnarFrozenResult(make())),
+        ColumnarFrozenResult.loads,
+        lambda fr: fr().all(),
+    )
+
+    # only numeric columns; these are not copied when loaded
+    measure(
+        "numeric",
+        to_mmap(ColumnarFrozenResult(make().columns("id", "x", "y", "price"))),
+        ColumnarFrozenResult.loads,
+        lambda fr: fr().all(),
+    )
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(formatter_class=ArgumentDefaultsHelpFormatter)
+    parser.add_argument(
+        "--rows", type=int, default=100_000, help="number of rows"
+    )
+    args = parser.parse_args()
+    main(args.rows)
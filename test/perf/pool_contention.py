@@ -0,0 +1,99 @@
+"""Compare the checkout throughput of QueuePool using its default queue
+with that of the sharded queue enabled by the ``queue_shards`` parameter,
+when many threads check out and return connections concurrently.
+
+Connections are mock objects, so that the figures reflect only the
+overhead of the pool itself.
+
+"""
+
+from argparse import ArgumentDefaultsHelpFormatter
+from argparse import ArgumentParser
+import threading
+import time
+from unittest.mock import Mock
+
+from sqlalchemy import pool
+
+
+def run(name, threads, duration, **pool_kw):
+    p = pool.QueuePool(creator=Mock, timeout=60, **pool_kw)
+    stop = threading.Event()
+    counts = [0] * threads
+
+    def worker(idx):
+        count = 0
+        while not stop.is_set():
+            conn = p.connect()
+            conn.close()
+            count += 1
+        counts[idx] = count
+
+    workers = [
+        threading.Thread(target=worker, args=(idx,)) for idx in range(threads)
+    ]
+    now = time.perf_counter()
+    for t in workers:
+        t.start()
+    time.sleep(duration)
+    stop.set()
+    for t in workers:
+        t.join()
+    elapsed = time.perf_counter() - now
+    p.dispose()
+
+    total = sum(counts)
+    print(
+        f"{name:<12} checkouts: {total:10d}  "
+        f"per second: {total / elapsed:12.1f}  "
+        f"min/max per thread: {min(counts)}/{max(counts)}"
+    )
+
+
+def main(threads, pool_size, max_overflow, shards, duration):
+    print(
+        f"{threads} threads, pool_size={pool_size}, "
+        f"max_overflow={max_overflow}"
+    )
+    run(
+        "default",
+        threads,
+        duration,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+    )
+    run(
+        f"shards={shards}",
+        threads,
+        duration,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        queue_shards=shards,
+    )
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(formatter_class=ArgumentDefaultsHelpFormatter)
+    parser.add_argument(
+        "--threads", type=int, default=32, help="number of threads"
+    )
+    parser.add_argument(
+        "--pool-size", type=int, default=16, help="size of the pool"
+    )
+    parser.add_argument(
+        "--max-overflow", type=int, default=16, help="pool max_overflow"
+    )
+    parser.add_argument(
+        "--shards", type=int, default=8, help="number of queue shards"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=3.0, help="seconds per run"
+    )
+    args = parser.parse_args()
+    main(
+        args.threads,
+        args.pool_size,
+        args.max_overflow,
+        args.shards,
+        args.duration,
+    )
@@ -1,5 +1,6 @@
 import importlib
 import itertools
+import pickle
 import random
 
 from sqlalchemy import and_
@@ -44,6 +45,7 @@ from sqlalchemy.sql import True_
 from sqlalchemy.sql import type_coerce
 from sqlalchemy.sql import visitors
 from sqlalchemy.sql.base import HasCacheKey
+from sqlalchemy.sql.cache_key import _find_uncacheable_element
 from sqlalchemy.sql.elements import _label_reference
 from sqlalchemy.sql.elements import _textual_label_reference
 from sqlalchemy.sql.elements import Annotated
@@ -77,6 +79,7 @@ from sqlalchemy.testing import is_
 from sqlalchemy.testing import is_false
 from sqlalchemy.testing import is_not
 from sqlalchemy.testing import is_true
+from sqlalchemy.testing import mock
 from sqlalchemy.testing import ne_
 from sqlalchemy.testing.assertions import expect_warnings
 from sqlalchemy.testing.util import random_choices
@@ -1282,6 +1285,64 @@ class CacheKeyTest(fixtures.CacheKeyFixture, CoreFixtures, fixtures.TestBase):
         # warning is memoized, won't happen the second time
         eq_(s1._generate_cache_key(), None)
 
+    def test_find_uncacheable_element_cacheable(self):
+        t1 = table("t1", column("a"), column("b"))
+        is_(_find_uncacheable_element(select(t1).where(t1.c.a == 5)), None)
+
+    def test_find_uncacheable_element_no_inherit_cache(self):
+        class Foobar(ColumnElement):
+            _traverse_internals = []
+
+        class SubFoobar(Foobar):
+            pass
+
+        t1 = table("t1", column("a"), column("b"))
+        elem = SubFoobar()
+        stmt = (
+            select(t1)
+            .where(t1.c.a == 5)
+            .where(or_(t1.c.b == 7, t1.c.a.in_(select(t1.c.b).where(elem))))
+        )
+
+        with expect_warnings(
+            "Class SubFoobar will not make use of SQL compilation caching"
+        ):
+            element, reason = _find_uncacheable_element(stmt)
+        is_(element, elem)
+        eq_(
+            reason,
+            "class SubFoobar does not set the 'inherit_cache' "
+            "attribute to True",
+        )
+
+    def test_find_uncacheable_element_caching_disabled(self):
+        class Foobar(ColumnElement):
+            inherit_cache = False
+
+        elem = Foobar()
+        element, reason = _find_uncacheable_element(
+            select(column("q")).where(elem)
+        )
+        is_(element, elem)
+        eq_(reason, "class Foobar has caching disabled")
+
+    def test_find_uncacheable_element_type(self):
+        class MyType(TypeDecorator):
+            impl = Integer
+
+        t1 = Table("t1", MetaData(), Column("a", Integer), Column("b", MyType))
+
+        with expect_warnings(
+            "TypeDecorator MyType.* will not produce a cache"
+        ):
+            element, reason = _find_uncacheable_element(
+                select(t1.c.a).where(t1.c.b == 5)
+            )
+        is_(element, t1.c.b)
+        eq_(
+            reason, "type MyType does not set the 'cache_ok' attribute to True"
+        )
+
     def test_get_children_no_method(self):
         class Foobar1(ClauseElement):
             pass
@@ -1345,6 +1406,122 @@ class CacheKeyTest(fixtures.CacheKeyFixture, CoreFixtures, fixtures.TestBase):
         is_not(ck1, None)
         is_not(ck3, None)
 
+    @testing.combinations(
+        (lambda stmt: stmt.where(table_a.c.a == 10), True),
+        (
+            lambda stmt: stmt.where(table_a.c.a == 10).where(
+                table_a.c.b.in_(["x", "y"])
+            ),
+            True,
+        ),
+        (
+            lambda stmt: stmt.where(
+                table_a.c.a.in_(
+                    stmt.with_only_columns(table_a.c.a).scalar_subquery()
+                )
+            ),
+            True,
+        ),
+        (lambda stmt: stmt.where(table_a.c.a == 10).limit(5), False),
+        (lambda stmt: stmt.where(table_a.c.a == 10).order_by(None), False),
+        (
+            lambda stmt: stmt.order_by(table_a.c.b).where(table_a.c.a > 5),
+            False,
+        ),
+        (lambda stmt: stmt.join(table_b, table_a.c.a == table_b.c.a), False),
+        (lambda stmt: stmt.filter_by(b="q"), True),
+        argnames="fn, continues",
+    )
+    @testing.variation("base_where", [True, False])
+    def test_generative_where_continues_cache_key(
+        self, fn, continues, base_where
+    ):
+        def base():
+            stmt = select(table_a).order_by(table_a.c.a)
+            if base_where:
+                stmt = stmt.where(
+                    or_(table_a.c.a == 5, table_a.c.b.like("foo%"))
+                )
+            return stmt
+
+        # generate a statement from one that has its cache key,
+        # and again from one that does not
+        s1 = base()
+        s1._generate_cache_key()
+        s1 = fn(s1)
+
+        s2 = fn(base())
+
+        continued = []
+        continues_cache_key_state = Select._continues_cache_key_state
+
+        def _continues_cache_key_state(stmt, state):
+            result = continues_cache_key_state(stmt, state)
+            continued.append(result)
+            return result
+
+        with mock.patch.object(
+            Select, "_continues_cache_key_state", _continues_cache_key_state
+        ):
+            ck1 = s1._generate_cache_key()
+        eq_(continued, [continues])
+
+        ck2 = s2._generate_cache_key()
+        is_not(ck1, None)
+        eq_(ck1, ck2)
+        eq_(
+            [bp.value for bp in ck1.bindparams],
+            [bp.value for bp in ck2.bindparams],
+        )
+
+    def test_generative_where_cache_key_distinct(self):
+        s1 = select(table_a).where(table_a.c.a == 5)
+        s1._generate_cache_key()
+
+        s2 = s1.where(table_a.c.b == "x")
+        s3 = s1.where(table_a.c.b.in_(["x"]))
+        s4 = s1.where(table_a.c.a.in_(s1.scalar_subquery()))
+        s5 = s1.where(table_a.c.a.in_(select(table_a).scalar_subquery()))
+
+        keys = [s._generate_cache_key() for s in (s1, s2, s3, s4, s5)]
+        for ck1, ck2 in itertools.combinations(keys, 2):
+            ne_(ck1, ck2)
+
+    def test_generative_where_cache_key_state_not_pickled(self):
+        s1 = select(table_a).where(table_a.c.a == 5)
+        s1._generate_cache_key()
+        assert "_cache_key_state" in s1.__dict__
+
+        s2 = pickle.loads(pickle.dumps(s1))
+        assert "_cache_key_state" not in s2.__dict__
+
+    def test_column_cache_key_type_replaced(self):
+        t1 = Table("t1", MetaData(), Column("a", Integer), Column("b", String))
+
+        ck1 = select(t1.c.a)._generate_cache_key()
+        t1.c.a.type = String()
+        ck2 = select(t1.c.a)._generate_cache_key()
+        t1.c.a.type = PickleType()
+        ck3 = select(t1.c.a)._generate_cache_key()
+
+        ne_(ck1, ck2)
+        ne_(ck2, ck3)
+        eq_(ck3, select(t1.c.a)._generate_cache_key())
+
+    def test_column_cache_key_type_replaced_no_cache(self):
+        class MyType(TypeDecorator):
+            impl = String
+
+        t1 = Table("t1", MetaData(), Column("a", Integer))
+
+        is_not(select(t1.c.a)._generate_cache_key(), None)
+
+        t1.c.a.type = MyType()
+        with expect_warnings(
+            "TypeDecorator MyType.* will not produce a cache"
+        ):
+            is_(select(t1.c.a)._generate_cache_key(), None)
+
 
 class CompareAndCopyTest(CoreFixtures, fixtures.TestBase):
     @classmethod
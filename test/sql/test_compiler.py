@@ -4880,6 +4880,160 @@ class BindParameterTest(AssertsCompiledSQL, fixtures.TestBase):
             checkparams={"foo_1": 1, "foo_2": 2, "foo_3": 3},
         )
 
+    def test_expanding_parameter_memoized(self):
+        stmt = select(table1.c.myid).where(
+            table1.c.myid.in_(bindparam("foo", expanding=True)),
+            table1.c.name.in_(bindparam("bar", expanding=True)),
+        )
+        compiled = stmt.compile(dialect=sqlite.dialect())
+
+        first = compiled._process_parameters_for_postcompile(
+            {"foo": [1, 2, 3], "bar": ["x"]}
+        )
+        second = compiled._process_parameters_for_postcompile(
+            {"foo": [4, 5, 6], "bar": ["y"]}
+        )
+        third = compiled._process_parameters_for_postcompile(
+            {"foo": [7, 8], "bar": ["z"]}
+        )
+
+        eq_ignore_whitespace(
+            first.statement,
+            "SELECT mytable.myid FROM mytable WHERE mytable.myid "
+            "IN (?, ?, ?) AND mytable.name IN (?)",
+        )
+        is_(first.statement, second.statement)
+        eq_ignore_whitespace(
+            third.statement,
+            "SELECT mytable.myid FROM mytable WHERE mytable.myid "
+            "IN (?, ?) AND mytable.name IN (?)",
+        )
+        eq_(second.positiontup, ["foo_1", "foo_2", "foo_3", "bar_1"])
+        eq_(
+            second.parameters,
+            {"foo_1": 4, "foo_2": 5, "foo_3": 6, "bar_1": "y"},
+        )
+        eq_(len(compiled._expanded_statement_cache), 2)
+
+    def test_expanding_parameter_memoized_limit(self):
+        stmt = select(table1.c.myid).where(
+            table1.c.myid.in_(bindparam("foo", expanding=True))
+        )
+        compiled = stmt.compile(dialect=sqlite.dialect())
+        compiled._expanded_cache_size = 3
+
+        for i in range(1, 6):
+            eq_ignore_whitespace(
+                compiled._process_parameters_for_postcompile(
+                    {"foo": list(range(i))}
+                ).statement,
+                "SELECT mytable.myid FROM mytable WHERE mytable.myid "
+                "IN (%s)" % ", ".join(["?"] * i),
+            )
+        eq_(len(compiled._expanded_statement_cache), 3)
+        eq_(len(compiled._expanding_parameter_cache), 3)
+
+    def test_expanding_parameter_literal_execute_not_memoized(self):
+        stmt = select(table1.c.myid).where(
+            table1.c.myid.in_(
+                bindparam("foo", expanding=True, literal_execute=True)
+            )
+        )
+        compiled = stmt.compile(dialect=sqlite.dialect())
+
+        eq_ignore_whitespace(
+            compiled._process_parameters_for_postcompile(
+                {"foo": [1, 2]}
+            ).statement,
+            "SELECT mytable.myid FROM mytable WHERE mytable.myid IN (1, 2)",
+        )
+        eq_ignore_whitespace(
+            compiled._process_parameters_for_postcompile(
+                {"foo": [3, 4]}
+            ).statement,
+            "SELECT mytable.myid FROM mytable WHERE mytable.myid IN (3, 4)",
+        )
+        eq_(len(compiled._expanded_statement_cache), 0)
+
+    @testing.combinations(
+        ([1], "(:foo_1)", {"foo_1": 1}),
+        ([1, 2], "(:foo_1, :foo_2)", {"foo_1": 1, "foo_2": 2}),
+        (
+            [1, 2, 3],
+            "(:foo_1, :foo_2, :foo_3, :foo_4)",
+            {"foo_1": 1, "foo_2": 2, "foo_3": 3, "foo_4": 3},
+        ),
+        (
+            [1, 2, 3, 4, 5],
+            "(:foo_1, :foo_2, :foo_3, :foo_4, "
+            ":foo_5, :foo_6, :foo_7, :foo_8)",
+            {
+                "foo_1": 1,
+                "foo_2": 2,
+                "foo_3": 3,
+                "foo_4": 4,
+                "foo_5": 5,
+                "foo_6": 5,
+                "foo_7": 5,
+                "foo_8": 5,
+            },
+        ),
+        ([], "(NULL) AND (1 != 1)", {}),
+        argnames="values, expected, checkparams",
+    )
+    def test_expanding_parameter_padding(self, values, expected, checkparams):
+        self.assert_compile(
+            select(table1.c.myid).where(
+                table1.c.myid.in_(bindparam("foo", values, expanding=True))
+            ),
+            "SELECT mytable.myid FROM mytable WHERE mytable.myid IN "
+            + expected,
+            render_postcompile=True,
+            checkparams=checkparams,
+            dialect=default.StrCompileDialect(in_clause_padding=True),
+        )
+
+    def test_expanding_tuple_parameter_padding(self):
+        self.assert_compile(
+            select(table1.c.myid).where(
+                tuple_(table1.c.myid, table1.c.name).in_(
+                    bindparam(
+                        "foo", [(1, "a"), (2, "b"), (3, "c")], expanding=True
+                    )
+                )
+            ),
+            "SELECT mytable.myid FROM mytable WHERE "
+            "(mytable.myid, mytable.name) IN "
+            "((:foo_1_1, :foo_1_2), (:foo_2_1, :foo_2_2), "
+            "(:foo_3_1, :foo_3_2), (:foo_4_1, :foo_4_2))",
+            render_postcompile=True,
+            checkparams={
+                "foo_1_1": 1,
+                "foo_1_2": "a",
+                "foo_2_1": 2,
+                "foo_2_2": "b",
+                "foo_3_1": 3,
+                "foo_3_2": "c",
+                "foo_4_1": 3,
+                "foo_4_2": "c",
+            },
+            dialect=default.StrCompileDialect(in_clause_padding=True),
+        )
+
+    def test_expanding_parameter_literal_execute_no_padding(self):
+        self.assert_compile(
+            select(table1.c.myid).where(
+                table1.c.myid.in_(
+                    bindparam(
+                        "foo", [1, 2, 3], expanding=True, literal_execute=True
+                    )
+                )
+            ),
+            "SELECT mytable.myid FROM mytable WHERE mytable.myid IN (1, 2, 3)",
+            render_postcompile=True,
+            dialect=default.StrCompileDialect(in_clause_padding=True),
+        )
+
     @testing.combinations(
         (
             select(table1.c.myid).where(
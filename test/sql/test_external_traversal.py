@@ -898,10 +898,12 @@ class ClauseTest(fixtures.TestBase, AssertsCompiledSQL):
         params = {"xb": 42, "yb": 33}
         sel = select(Y).select_from(jj).params(params)
 
+        # Select traverses its WHERE criteria last for cache key purposes,
+        # so the parameter inside the join's subquery comes first
         eq_(
             [
-                eq_clause_element(bindparam("yb", value=33)),
                 eq_clause_element(bindparam("xb", value=42)),
+                eq_clause_element(bindparam("yb", value=33)),
             ],
             sel._generate_cache_key()[1],
         )
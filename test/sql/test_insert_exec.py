@@ -1199,6 +1199,181 @@ class InsertManyValuesTest(fixtures.RemovesEvents, fixtures.TablesTest):
                 conn.execute(stmt.returning(t.c.id), data)
 
 
+class InsertCopyTest(fixtures.TablesTest):
+    __only_on__ = "sqlite"
+
+    @classmethod
+    def define_tables(cls, metadata):
+        class UpperString(TypeDecorator):
+            impl = String(50)
+            cache_ok = True
+
+            def process_bind_param(self, value, dialect):
+                return value.upper() if value is not None else None
+
+        Table(
+            "data",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("x", UpperString),
+            Column("y", Integer, default=10),
+            Column("z", Integer, server_default="5"),
+        )
+
+    @testing.fixture
+    def copies(self, connection):
+        """patch the dialect to deliver rows to a stand-in for a bulk
+        copy, which INSERTs them using executemany()."""
+
+        copies = []
+
+        def do_copy_insert(cursor, table, columns, rows, context):
+            copies.append((table, [col.key for col in columns], list(rows)))
+            cursor.executemany(
+                "INSERT INTO %s (%s) VALUES (%s)"
+                % (
+                    table.name,
+                    ", ".join(col.name for col in columns),
+                    ", ".join("?" for col in columns),
+                ),
+                rows,
+            )
+
+        with (
+            mock.patch.object(
+                connection.dialect, "supports_copy_insert", True
+            ),
+            mock.patch.object(
+                connection.dialect, "do_copy_insert", do_copy_insert
+            ),
+        ):
+            connection.execution_options(compiled_cache={})
+            yield copies
+
+    def test_copy(self, connection, copies):
+        t = self.tables.data
+
+        result = connection.execute(
+            t.insert().execution_options(insert_copy=True),
+            [{"x": "a"}, {"x": "b"}, {"x": None}],
+        )
+        eq_(result.rowcount, 3)
+
+        eq_(
+            copies,
+            [(t, ["x", "y"], [("A", 10), ("B", 10), (None, 10)])],
+        )
+        eq_(
+            connection.execute(t.select().order_by(t.c.id)).all(),
+            [(1, "A", 10, 5), (2, "B", 10, 5), (3, None, 10, 5)],
+        )
+
+    def test_copy_connection_option(self, connection, copies):
+        t = self.tables.data
+
+        connection.execution_options(insert_copy=True)
+        connection.execute(
+            t.insert(), [{"id": 5, "x": "a"}, {"id": 6, "x": "b"}]
+        )
+        eq_(copies, [(t, ["id", "x", "y"], [(5, "A", 10), (6, "B", 10)])])
+
+    @testing.variation(
+        "style",
+        [
+            "no_option",
+            "single_row",
+            "returning",
+            "sql_expression",
+            "not_supported",
+        ],
+    )
+    def test_no_copy(self, connection, copies, style):
+        t = self.tables.data
+
+        stmt = t.insert()
+        data = [{"x": "a"}, {"x": "b"}]
+
+        if style.no_option:
+            pass
+        elif style.single_row:
+            data = data[0:1]
+        elif style.returning:
+            stmt = stmt.returning(t.c.id)
+        elif style.sql_expression:
+            stmt = stmt.values(y=func.abs(bindparam("yval")))
+            data = [{"x": "a", "yval": -1}, {"x": "b", "yval": -2}]
+        elif style.not_supported:
+            connection.dialect.supports_copy_insert = False
+        else:
+            style.fail()
+
+        if not style.no_option:
+            stmt = stmt.execution_options(insert_copy=True)
+
+        connection.execute(stmt, data)
+
+        eq_(copies, [])
+        eq_(
+            connection.execute(select(t.c.x).order_by(t.c.id)).all(),
+            [("A",), ("B",)][0 : len(data)],
+        )
+
+    def test_events(self, connection, copies):
+        t = self.tables.data
+
+        canary = mock.Mock()
+        event.listen(connection, "before_cursor_execute", canary.before)
+        event.listen(connection, "after_cursor_execute", canary.after)
+
+        connection.execute(
+            t.insert().execution_options(insert_copy=True),
+            [{"x": "a"}, {"x": "b"}],
+        )
+
+        stmt = "INSERT INTO data (x, y) VALUES (?, ?)"
+        eq_(
+            canary.mock_calls,
+            [
+                mock.call.before(
+                    connection,
+                    mock.ANY,
+                    stmt,
+                    [("A", 10), ("B", 10)],
+                    mock.ANY,
+                    True,
+                ),
+                mock.call.after(
+                    connection,
+                    mock.ANY,
+                    stmt,
+                    [("A", 10), ("B", 10)],
+                    mock.ANY,
+                    True,
+                ),
+            ],
+        )
+
+    def test_compiled(self, connection, copies):
+        t = self.tables.data
+
+        compiled = t.insert().compile(
+            dialect=connection.dialect,
+            column_keys=["id", "x"],
+            for_executemany=True,
+        )
+        copy_insert = compiled._copy_insert
+        is_(copy_insert.table, t)
+        eq_(copy_insert.columns, [t.c.id, t.c.x, t.c.y])
+        eq_(copy_insert.keys, ["id", "x", "y"])
+
+        compiled = (
+            t.insert()
+            .values(x=func.lower(bindparam("x")))
+            .compile(dialect=connection.dialect, for_executemany=True)
+        )
+        is_(compiled._copy_insert, None)
+
+
 class IMVSentinelTest(fixtures.TestBase):
     __backend__ = True
 
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import io
+import pickle
 import threading
 import time
 from typing import List
 from typing import Optional
+from unittest import mock
+import weakref
 
 from sqlalchemy import exc
 from sqlalchemy import testing
+from sqlalchemy import util
 from sqlalchemy.future import select as future_select
 from sqlalchemy.schema import Column
 from sqlalchemy.schema import ForeignKey
@@ -20,8 +25,10 @@ from sqlalchemy.sql import join
 from sqlalchemy.sql import lambda_stmt
 from sqlalchemy.sql import lambdas
 from sqlalchemy.sql import literal
+from sqlalchemy.sql import load_lambda_analysis
 from sqlalchemy.sql import null
 from sqlalchemy.sql import roles
+from sqlalchemy.sql import save_lambda_analysis
 from sqlalchemy.sql import select
 from sqlalchemy.sql import table
 from sqlalchemy.sql import util as sql_util
@@ -30,6 +37,7 @@ from sqlalchemy.sql.cache_key import HasCacheKey
 from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import AssertsCompiledSQL
 from sqlalchemy.testing import eq_
+from sqlalchemy.testing import expect_warnings
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
 from sqlalchemy.testing import ne_
@@ -2087,6 +2095,218 @@ class DeferredLambdaElementTest(
         eq_(e32key[0], e3key[0])
 
 
+GLOBAL_LIMIT = 10
+
+
+class LambdaAnalysisTest(fixtures.TestBase, AssertsCompiledSQL):
+    __dialect__ = "default"
+
+    @testing.fixture
+    def new_process(self):
+        """Simulate a new process, in which no lambdas have been analyzed
+        and no lambda analysis has been loaded.
+
+        """
+
+        def go():
+            patches = [
+                mock.patch.object(
+                    lambdas.AnalyzedCode, "_fns", weakref.WeakKeyDictionary()
+                ),
+                mock.patch.object(lambdas.AnalyzedCode, "_preloaded", {}),
+                mock.patch.object(
+                    lambdas, "_closure_per_cache_key", util.LRUCache(1000)
+                ),
+            ]
+            for patch in patches:
+                patch.start()
+                cleanups.append(patch.stop)
+
+        cleanups = []
+        go()
+        yield go
+        for cleanup in reversed(cleanups):
+            cleanup()
+
+    @testing.fixture
+    def analysis_counter(self):
+        analyze = lambdas.AnalyzedCode.__init__
+        calls = []
+
+        def init(self, fn, lambda_element, opts):
+            calls.append(fn.__code__)
+            analyze(self, fn, lambda_element, opts)
+
+        with mock.patch.object(lambdas.AnalyzedCode, "__init__", init):
+            yield calls
+
+    def _statement_fixture(self):
+        def foo(expr):
+            return func.foo(expr)
+
+        def bar(expr):
+            return func.bar(expr)
+
+        t1 = table("t1", column("q"), column("p"))
+        t2 = table("t2", column("q"), column("p"))
+
+        def go(tab, x, y, names, fn):
+            stmt = lambda_stmt(lambda: select(tab.c.q).where(tab.c.p == x))
+            stmt += lambda s: s.where(tab.c.q.in_(names))
+            stmt += lambda s: s.where(fn(tab.c.p) > y).limit(GLOBAL_LIMIT)
+            stmt = stmt.add_criteria(
+                lambda s: s.order_by(tab.c.q), track_on=[tab]
+            )
+            return stmt
+
+        return t1, t2, go, foo, bar
+
+    def test_round_trip(self, new_process, analysis_counter):
+        t1, t2, go, foo, bar = self._statement_fixture()
+
+        s1 = go(t1, 5, 10, ["a", "b"], foo)
+        eq_(len(analysis_counter), 4)
+
+        buf = io.BytesIO()
+        eq_(save_lambda_analysis(buf), 4)
+
+        new_process()
+        buf.seek(0)
+        eq_(load_lambda_analysis(buf), 4)
+        analysis_counter[:] = []
+
+        s2 = go(t1, 7, 12, ["c", "d"], foo)
+        s3 = go(t2, 8, 14, ["e"], bar)
+        eq_(analysis_counter, [])
+
+        eq_(s1._generate_cache_key(), s2._generate_cache_key())
+        ne_(s2._generate_cache_key(), s3._generate_cache_key())
+
+        self.assert_compile(
+            s2,
+            "SELECT t1.q FROM t1 WHERE t1.p = :x_1 AND t1.q IN "
+            "(__[POSTCOMPILE_names_1]) AND foo(t1.p) > :y_1 "
+            "ORDER BY t1.q LIMIT :GLOBAL_LIMIT_1",
+            checkparams={
+                "x_1": 7,
+                "names_1": ["c", "d"],
+                "y_1": 12,
+                "GLOBAL_LIMIT_1": 10,
+            },
+        )
+        self.assert_compile(
+            s3,
+            "SELECT t2.q FROM t2 WHERE t2.p = :x_1 AND t2.q IN "
+            "(__[POSTCOMPILE_names_1]) AND bar(t2.p) > :y_1 "
+            "ORDER BY t2.q LIMIT :GLOBAL_LIMIT_1",
+            checkparams={
+                "x_1": 8,
+                "names_1": ["e"],
+                "y_1": 14,
+                "GLOBAL_LIMIT_1": 10,
+            },
+        )
+
+    def test_save_includes_loaded(self, new_process):
+        t1, t2, go, foo, bar = self._statement_fixture()
+
+        go(t1, 5, 10, ["a", "b"], foo)
+        buf = io.BytesIO()
+        save_lambda_analysis(buf)
+
+        new_process()
+        buf.seek(0)
+        load_lambda_analysis(buf)
+
+        # loaded analysis that's not yet used is saved again
+        eq_(save_lambda_analysis(io.BytesIO()), 4)
+
+    def test_different_options_analyzed(self, new_process, analysis_counter):
+        t1 = table("t1", column("q"), column("p"))
+
+        def go(x, track_bound_values):
+            return lambda_stmt(
+                lambda: select(t1).where(t1.c.q == x),
+                track_bound_values=track_bound_values,
+            )
+
+        go(5, True)
+        buf = io.BytesIO()
+        save_lambda_analysis(buf)
+
+        new_process()
+        buf.seek(0)
+        load_lambda_analysis(buf)
+        analysis_counter[:] = []
+
+        s1 = go(7, False)
+        eq_(len(analysis_counter), 1)
+        self.assert_compile(
+            s1,
+            "SELECT t1.q, t1.p FROM t1 WHERE t1.q = :x_1",
+            checkparams={"x_1": 7},
+        )
+
+    def test_changed_code_analyzed(self, new_process, analysis_counter):
+        t1 = table("t1", column("q"), column("p"))
+
+        def go(x):
+            return lambda_stmt(lambda: select(t1).where(t1.c.q == x))
+
+        go(5)
+        buf = io.BytesIO()
+        save_lambda_analysis(buf)
+
+        new_process()
+        buf.seek(0)
+        load_lambda_analysis(buf)
+        analysis_counter[:] = []
+
+        def go(x):
+            return lambda_stmt(lambda: select(t1).where(t1.c.p == x))
+
+        self.assert_compile(
+            go(7),
+            "SELECT t1.q, t1.p FROM t1 WHERE t1.p = :x_1",
+            checkparams={"x_1": 7},
+        )
+        eq_(len(analysis_counter), 1)
+
+    def test_version_mismatch(self, new_process):
+        buf = io.BytesIO()
+        buf.write(lambdas._ANALYSIS_MAGIC)
+        pickle.dump(
+            {
+                "version": lambdas._ANALYSIS_VERSION,
+                "sqlalchemy": "0.1.0",
+                "entries": {("x",): ()},
+            },
+            buf,
+        )
+        buf.seek(0)
+
+        with expect_warnings(
+            "Lambda analysis was saved using SQLAlchemy 0.1.0"
+        ):
+            eq_(load_lambda_analysis(buf), 0)
+        eq_(lambdas.AnalyzedCode._preloaded, {})
+
+    def test_not_lambda_analysis(self):
+        with expect_raises_message(
+            exc.ArgumentError, "File does not contain lambda analysis"
+        ):
+            load_lambda_analysis(io.BytesIO(b"some other file"))
+
+    def test_filename(self, new_process, tmp_path):
+        t1, t2, go, foo, bar = self._statement_fixture()
+        go(t1, 5, 10, ["a", "b"], foo)
+
+        fname = str(tmp_path / "lambdas.bin")
+        eq_(save_lambda_analysis(fname), 4)
+        new_process()
+        eq_(load_lambda_analysis(fname), 4)
+
+
 class ConcurrencyTest(fixtures.TestBase):
     """test for #8098 and #9461"""
 
@@ -32,6 +32,7 @@ from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
+from sqlalchemy.testing import mock
 from sqlalchemy.testing.schema import Column
 from sqlalchemy.testing.schema import Table
 from sqlalchemy.testing.util import resolve_lambda
@@ -778,6 +779,40 @@ class QueryTest(fixtures.TablesTest):
             [(7, "jack"), (8, "fred")],
         )
 
+    @testing.variation("operator", ["in_", "not_in"])
+    def test_expanding_in_padding(self, connection, operator):
+        users = self.tables.users
+        connection.execute(
+            users.insert(),
+            [
+                dict(user_id=7, user_name="jack"),
+                dict(user_id=8, user_name="fred"),
+                dict(user_id=9, user_name="ed"),
+            ],
+        )
+
+        if operator.in_:
+            criteria = users.c.user_name.in_(
+                bindparam("uname", expanding=True)
+            )
+            expected = [(7, "jack"), (8, "fred"), (9, "ed")]
+        elif operator.not_in:
+            criteria = users.c.user_name.not_in(
+                bindparam("uname", expanding=True)
+            )
+            expected = []
+        else:
+            operator.fail()
+
+        stmt = select(users).where(criteria).order_by(users.c.user_id)
+
+        with mock.patch.object(connection.dialect, "in_clause_padding", True):
+            result = connection.execute(
+                stmt, {"uname": ["jack", "fred", "ed"]}
+            )
+            eq_(result.fetchall(), expected)
+            eq_(len(result.context.compiled_parameters[0]), 4)
+
     def test_expanding_in_dont_alter_compiled(self, connection):
         """test for issue #5048"""
 
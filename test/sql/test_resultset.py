@@ -1,7 +1,9 @@
+import array
 from collections import defaultdict
 import collections.abc as collections_abc
 from contextlib import contextmanager
 import csv
+import datetime
 from io import StringIO
 import operator
 import os
@@ -14,6 +16,8 @@ from unittest.mock import patch
 
 from sqlalchemy import CHAR
 from sqlalchemy import column
+from sqlalchemy import DateTime
+from sqlalchemy import event
 from sqlalchemy import exc
 from sqlalchemy import exc as sa_exc
 from sqlalchemy import ForeignKey
@@ -36,6 +40,7 @@ from sqlalchemy import TypeDecorator
 from sqlalchemy import VARCHAR
 from sqlalchemy.engine import cursor as _cursor
 from sqlalchemy.engine import default
+from sqlalchemy.engine import processors
 from sqlalchemy.engine import Row
 from sqlalchemy.engine.result import SimpleResultMetaData
 from sqlalchemy.ext.compiler import compiles
@@ -3352,6 +3357,90 @@ class AlternateCursorResultTest(fixtures.TablesTest):
         for lp in lens[0:-1]:
             eq_(lp, 180)
 
+    @testing.combinations(
+        ("narrow", 10, None),
+        ("wide", 2000, None),
+        ("narrow_row_limit", 10, 50),
+        argnames="width,max_row_buffer",
+        id_="iaa",
+    )
+    def test_adaptive_buffer_by_bytes(self, connection, width, max_row_buffer):
+        table = self.tables.test
+
+        connection.execute(
+            table.insert(),
+            [{"x": i, "y": "y" * width} for i in range(15, 3000)],
+        )
+
+        opts = {"stream_results": True, "max_buffer_bytes": 100000}
+        if max_row_buffer:
+            opts["max_row_buffer"] = max_row_buffer
+
+        canary = mock.Mock()
+        event.listen(connection, "row_buffer_resize", canary)
+
+        result = connection.execution_options(**opts).execute(
+            table.select().where(table.c.x >= 15)
+        )
+        assert isinstance(
+            result.cursor_strategy,
+            _cursor.AdaptiveBufferedRowCursorFetchStrategy,
+        )
+
+        count = 0
+        for row in result:
+            count += 1
+            le_(
+                _cursor._approximate_rows_bytes(
+                    list(result.cursor_strategy._rowbuffer)
+                ),
+                100000,
+            )
+        eq_(count, 2985)
+
+        sizes = {c.args[5] for c in canary.mock_calls}
+        eq_(
+            sum(c.args[3] for c in canary.mock_calls),
+            2984,
+        )
+        for c in canary.mock_calls:
+            conn, cursor, context, rows, nbytes, new_size = c.args
+            is_(conn, connection)
+            le_(nbytes, 100000 + nbytes // rows)
+
+        if width == 2000:
+            # each row is over 2K in size
+            le_(max(sizes), 50)
+        elif max_row_buffer:
+            eq_(sizes, {50})
+        else:
+            # each row is under 200 bytes in size
+            le_(500, min(sizes))
+
+    def test_adaptive_buffer_yield_per(self, connection):
+        table = self.tables.test
+
+        result = connection.execution_options(
+            stream_results=True, max_buffer_bytes=100000
+        ).execute(table.select())
+        assert isinstance(
+            result.cursor_strategy,
+            _cursor.AdaptiveBufferedRowCursorFetchStrategy,
+        )
+        result = result.yield_per(3)
+
+        canary = mock.Mock()
+        event.listen(connection, "row_buffer_resize", canary)
+
+        # first row was pre-buffered
+        result.fetchone()
+        eq_(len(result.cursor_strategy._rowbuffer), 0)
+
+        result.fetchone()
+        eq_(len(result.cursor_strategy._rowbuffer), 2)
+        eq_(len(result.all()), 9)
+        eq_(canary.mock_calls, [])
+
     def test_buffered_fetchmany_yield_per(self, connection):
         table = self.tables.test
 
@@ -3588,6 +3677,276 @@ class AlternateCursorResultTest(fixtures.TablesTest):
                     r.first()
                 r.close()
 
+    @testing.combinations(
+        _cursor.CursorFetchStrategy,
+        _cursor.BufferedRowCursorFetchStrategy,
+        _cursor.FullyBufferedCursorFetchStrategy,
+        argnames="strategy_cls",
+    )
+    def test_columns_as_arrays(self, strategy_cls):
+        class MyType(TypeDecorator):
+            impl = String()
+            cache_ok = True
+
+            def process_result_value(self, value, dialect):
+                return "HI " + value
+
+        table = self.tables.test
+        stmt = select(
+            table.c.x,
+            type_coerce(table.c.y, MyType()),
+        ).order_by(table.c.x)
+
+        with self._proxy_fixture(strategy_cls):
+            with self.engine.connect() as conn:
+                r = conn.execute(stmt)
+                assert isinstance(r.cursor_strategy, strategy_cls)
+
+                x, y = r.columns_as_arrays()
+                eq_(x, array.array("q", range(1, 12)))
+                eq_(y, ["HI t_%d" % i for i in range(1, 12)])
+
+                r = conn.execute(stmt)
+                y, x = r.columns("y", "x").columns_as_arrays()
+                eq_(x, array.array("q", range(1, 12)))
+                eq_(y, ["HI t_%d" % i for i in range(1, 12)])
+
+    @testing.combinations(
+        "stream_results", "yield_per", "size", argnames="optname"
+    )
+    def test_fetch_columnar_chunks(self, optname):
+        table = self.tables.test
+
+        if optname == "stream_results":
+            opts = {"stream_results": True, "max_row_buffer": 4}
+        elif optname == "yield_per":
+            opts = {"yield_per": 4}
+        else:
+            opts = {}
+
+        with self.engine.connect() as conn:
+            r = conn.execution_options(**opts).execute(
+                select(table.c.x).order_by(table.c.x)
+            )
+
+            chunks = []
+            while True:
+                chunk = r.fetch_columnar(4 if optname == "size" else None)
+                if chunk is None:
+                    break
+                chunks.append(list(chunk[0]))
+
+            if optname == "stream_results":
+                # without yield_per, BufferedRowCursorFetchStrategy delivers
+                # everything remaining for fetchmany(None)
+                eq_(chunks, [list(range(1, 12))])
+            else:
+                eq_(
+                    chunks,
+                    [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11]],
+                )
+            eq_(r.fetch_columnar(), None)
+
+    @testing.combinations(
+        _cursor.CursorFetchStrategy,
+        _cursor.BufferedRowCursorFetchStrategy,
+        _cursor.FullyBufferedCursorFetchStrategy,
+        argnames="strategy_cls",
+    )
+    def test_batch_processors(self, strategy_cls):
+        table = self.tables.test
+        stmt = select(
+            table.c.x,
+            type_coerce(
+                literal_column("'2022-04-03 17:12:34'"), DateTime()
+            ).label("d"),
+        ).order_by(table.c.x)
+
+        batch = mock.Mock(side_effect=processors.str_to_datetime_batch)
+        dt = datetime.datetime(2022, 4, 3, 17, 12, 34)
+
+        with mock.patch.dict(
+            processors._batch_processors,
+            {processors.str_to_datetime: batch},
+        ), self._proxy_fixture(strategy_cls):
+            with self.engine.connect() as conn:
+                r = conn.execute(stmt)
+                assert isinstance(r.cursor_strategy, strategy_cls)
+
+                eq_(r.fetchmany(5), [(i, dt) for i in range(1, 6)])
+                eq_(r.all(), [(i, dt) for i in range(6, 12)])
+                eq_(batch.call_count, 2)
+
+                r = conn.execute(stmt)
+                eq_(r.scalars("d").fetchmany(5), [dt] * 5)
+                eq_(batch.call_count, 3)
+
+    @testing.combinations(
+        (_cursor.CursorFetchStrategy, [False] * 12),
+        (
+            _cursor.BufferedRowCursorFetchStrategy,
+            [True, False] + [True] * 4 + [False] + [True] * 4 + [False],
+        ),
+        (_cursor.FullyBufferedCursorFetchStrategy, [True] * 11 + [False]),
+        argnames="strategy_cls, expected",
+    )
+    def test_has_buffered_rows(self, strategy_cls, expected):
+        table = self.tables.test
+        with self._proxy_fixture(strategy_cls):
+            with self.engine.connect() as conn:
+                r = conn.execute(select(table.c.x).order_by(table.c.x))
+                assert isinstance(r.cursor_strategy, strategy_cls)
+
+                buffered = []
+                for _ in range(12):
+                    buffered.append(r._has_buffered_rows())
+                    r.fetchone()
+                eq_(buffered, expected)
+
+
+class PrefetchCursorResultTest(fixtures.TablesTest):
+    __requires__ = ("sqlite",)
+
+    @classmethod
+    def setup_bind(cls):
+        cls.engine = engine = engines.testing_engine(
+            "sqlite://",
+            options={
+                "scope": "class",
+                "connect_args": {"check_same_thread": False},
+            },
+        )
+        engine.dialect.supports_threaded_cursor_fetch = True
+        return engine
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "test",
+            metadata,
+            Column("x", Integer, primary_key=True),
+            Column("y", String(50)),
+        )
+
+    @classmethod
+    def insert_data(cls, connection):
+        connection.execute(
+            cls.tables.test.insert(),
+            [{"x": i, "y": "t_%d" % i} for i in range(1, 101)],
+        )
+
+    @testing.combinations(
+        "iterate", "fetchone", "fetchmany", "fetchall", argnames="method"
+    )
+    def test_fetch(self, connection, method):
+        table = self.tables.test
+
+        result = connection.execution_options(
+            prefetch=2, max_row_buffer=7
+        ).execute(select(table).order_by(table.c.x))
+        strategy = result.cursor_strategy
+        assert isinstance(strategy, _cursor.PrefetchCursorFetchStrategy)
+
+        if method == "iterate":
+            rows = list(result)
+        elif method == "fetchone":
+            rows = []
+            while True:
+                row = result.fetchone()
+                if row is None:
+                    break
+                rows.append(row)
+        elif method == "fetchmany":
+            rows = []
+            while True:
+                chunk = result.fetchmany(10)
+                if not chunk:
+                    break
+                le_(len(chunk), 10)
+                rows.extend(chunk)
+        elif method == "fetchall":
+            eq_(result.fetchone(), (1, "t_1"))
+            rows = [(1, "t_1")] + result.fetchall()
+        else:
+            assert False
+
+        eq_(rows, [(i, "t_%d" % i) for i in range(1, 101)])
+        is_(strategy._thread, None)
+        is_true(result._soft_closed)
+
+    def test_yield_per(self, connection):
+        table = self.tables.test
+
+        result = connection.execution_options(
+            prefetch=1, yield_per=15
+        ).execute(select(table).order_by(table.c.x))
+        eq_(result.cursor_strategy._batch_size, 15)
+
+        eq_(
+            [len(partition) for partition in result.partitions()],
+            [15] * 6 + [10],
+        )
+
+    def test_close_during_fetch(self, connection):
+        table = self.tables.test
+
+        result = connection.execution_options(
+            prefetch=1, max_row_buffer=5
+        ).execute(select(table).order_by(table.c.x))
+        strategy = result.cursor_strategy
+
+        eq_(result.fetchmany(3), [(i, "t_%d" % i) for i in range(1, 4)])
+        thread = strategy._thread
+        is_true(thread.is_alive())
+
+        result.close()
+
+        is_false(thread.is_alive())
+        is_(strategy._thread, None)
+        assert_raises_message(
+            sa_exc.ResourceClosedError, "object is closed", result.fetchone
+        )
+
+        # connection continues to be usable
+        eq_(connection.scalar(select(func.count(table.c.x))), 100)
+
+    def test_handle_error_in_fetch(self, connection):
+        class cursor:
+            def fetchmany(self, num=None):
+                raise OSError("random non-DBAPI error during cursor operation")
+
+            def close(self):
+                pass
+
+        table = self.tables.test
+        result = connection.execution_options(prefetch=2).execute(
+            select(table)
+        )
+        with mock.patch.object(result, "cursor", cursor()):
+            with testing.expect_raises_message(IOError, "random non-DBAPI"):
+                result.fetchone()
+
+        is_(result.cursor_strategy._thread, None)
+        result.close()
+
+    def test_dialect_not_supported(self, connection):
+        table = self.tables.test
+
+        with mock.patch.object(
+            connection.dialect, "supports_threaded_cursor_fetch", False
+        ):
+            with expect_raises_message(
+                exc.ArgumentError,
+                "Dialect sqlite does not support fetching rows from a "
+                "background thread",
+            ):
+                connection.execution_options(prefetch=2).execute(
+                    select(table)
+                )
+
+        # the connection remains usable
+        eq_(len(connection.execute(select(table)).all()), 100)
+
 
 class MergeCursorResultTest(fixtures.TablesTest):
     __backend__ = True
@@ -1,6 +1,7 @@
 """Test various algorithmic properties of selectables."""
 
 from itertools import zip_longest
+import pickle
 
 from sqlalchemy import and_
 from sqlalchemy import bindparam
@@ -2997,6 +2998,26 @@ class AnnotationsTest(fixtures.TestBase):
             annot = obj._annotate({})
             ne_({obj}, {annot})
 
+    def test_pickle_annotated_class_generated_on_demand(self):
+        """annotated classes not yet generated in the receiving
+        process are regenerated when unpickling."""
+
+        t = table("t", column("x"))
+        stmt = update(t)._annotate({"foo": "bar"})
+        cls = type(stmt)
+        eq_(cls.__name__, "AnnotatedUpdate")
+
+        data = pickle.dumps(stmt)
+
+        del annotation.annotated_classes[update(t).__class__]
+        try:
+            loaded = pickle.loads(data)
+            eq_(loaded._annotations, {"foo": "bar"})
+            eq_(type(loaded).__name__, "AnnotatedUpdate")
+            eq_(str(loaded), str(stmt))
+        finally:
+            annotation.annotated_classes[update(t).__class__] = cls
+
     def test_replacement_traverse_preserve(self):
         """test that replacement traverse that hits an unannotated column
         does not use it when replacing an annotated column.